@@ -471,6 +471,7 @@ _EXPORT_TARGETS: dict[str, str] = {
     "EventReplayError": "ornata.definitions.errors:EventReplayError",
     "EventSubscriptionError": "ornata.definitions.errors:EventSubscriptionError",
     "EventQueueOverflowError": "ornata.definitions.errors:EventQueueOverflowError",
+    "CellAttribute": "ornata.definitions.flags:CellAttribute",
     "RenderCapability": "ornata.definitions.flags:RenderCapability",
     "PlatformEventHandler": "ornata.definitions.protocols:PlatformEventHandler",
     "RenderCallback": "ornata.definitions.protocols:RenderCallback",
@@ -491,6 +492,7 @@ _EXPORT_TARGETS: dict[str, str] = {
     "SubsystemRegistry": "ornata.definitions.protocols:SubsystemRegistry",
     "HostObjectProtocol": "ornata.definitions.protocols:HostObjectProtocol",
     "ComponentFactory": "ornata.definitions.protocols:ComponentFactory",
+    "RowProvider": "ornata.definitions.protocols:RowProvider",
     "Vector2": "ornata.definitions.type_alias:Vector2",
     "Vector3": "ornata.definitions.type_alias:Vector3",
     "Vector4": "ornata.definitions.type_alias:Vector4",
@@ -499,6 +499,7 @@ from ornata.definitions.errors import VDOMError as VDOMError
 from ornata.definitions.errors import VDOMReconciliationError as VDOMReconciliationError
 from ornata.definitions.errors import VersionCompatibilityError as VersionCompatibilityError
 from ornata.definitions.errors import WindowCreationError as WindowCreationError
+from ornata.definitions.flags import CellAttribute as CellAttribute
 from ornata.definitions.flags import RenderCapability as RenderCapability
 from ornata.definitions.protocols import BackendSelector as BackendSelector
 from ornata.definitions.protocols import BootstrapPhase as BootstrapPhase
@@ -517,6 +518,7 @@ from ornata.definitions.protocols import PluginLoader as PluginLoader
 from ornata.definitions.protocols import RenderCallback as RenderCallback
 from ornata.definitions.protocols import ResolvedStyleProtocol as ResolvedStyleProtocol
 from ornata.definitions.protocols import ResponsiveBreakpoint as ResponsiveBreakpoint
+from ornata.definitions.protocols import RowProvider as RowProvider
 from ornata.definitions.protocols import SubsystemRegistry as SubsystemRegistry
 from ornata.definitions.protocols import WindowManagerProtocol as WindowManagerProtocol
 from ornata.definitions.type_alias import AlignItems as AlignItems
@@ -1018,6 +1020,7 @@ __all__ = [
     "EventReplayError",
     "EventSubscriptionError",
     "EventQueueOverflowError",
+    "CellAttribute",
     "RenderCapability",
     "PlatformEventHandler",
     "RenderCallback",
@@ -1038,6 +1041,7 @@ __all__ = [
     "SubsystemRegistry",
     "HostObjectProtocol",
     "ComponentFactory",
+    "RowProvider",
     "Vector2",
     "Vector3",
     "Vector4",
@@ -47,6 +47,10 @@ _EXPORT_TARGETS: dict[str, str] = {
     "ease_out_quart": "ornata.effects.animation.easing:ease_out_quart",
     "ease_out_sine": "ornata.effects.animation.easing:ease_out_sine",
     "linear_easing": "ornata.effects.animation.easing:linear_easing",
+    "EASING_LUT_SIZE": "ornata.effects.animation.easing:EASING_LUT_SIZE",
+    "easing_lut": "ornata.effects.animation.easing:easing_lut",
+    "easing_table": "ornata.effects.animation.easing:easing_table",
+    "sample_lut": "ornata.effects.animation.easing:sample_lut",
     "FadeInAnimation": "ornata.effects.animation.effects:FadeInAnimation",
     "GradientPulseAnimation": "ornata.effects.animation.effects:GradientPulseAnimation",
     "ParticleTrailAnimation": "ornata.effects.animation.effects:ParticleTrailAnimation",
@@ -76,6 +80,7 @@ _EXPORT_TARGETS: dict[str, str] = {
     "AnimationOptimizer": "ornata.effects.animation.optimization:AnimationOptimizer",
     "AnimationScheduler": "ornata.effects.animation.timeline:AnimationScheduler",
     "ScheduledCallback": "ornata.effects.animation.timeline:ScheduledCallback",
+    "AnimationTracks": "ornata.effects.animation.tracks:AnimationTracks",
     "emitter": "ornata.effects.particles:emitter",
     "physics": "ornata.effects.particles:physics",
     "ParticleSystemConfig": "ornata.effects.particles.config:ParticleSystemConfig",
@@ -94,6 +99,11 @@ _EXPORT_TARGETS: dict[str, str] = {
     "ParticleOptimization": "ornata.effects.particles.optimization:ParticleOptimization",
     "ParticlePhysics": "ornata.effects.particles.physics:ParticlePhysics",
     "ParticleRenderer": "ornata.effects.particles.renderer:ParticleRenderer",
+    "GridStats": "ornata.effects.particles.spatial:GridStats",
+    "SpatialHashGrid": "ornata.effects.particles.spatial:SpatialHashGrid",
+    "ParticleStore": "ornata.effects.particles.store:ParticleStore",
+    "ParticleSimulationWorker": "ornata.effects.particles.worker:ParticleSimulationWorker",
+    "ParticleSnapshot": "ornata.effects.particles.worker:ParticleSnapshot",
     "FrameCache": "ornata.effects.timeline:FrameCache",
     "BaseTimeline": "ornata.effects.timeline:BaseTimeline",
     "_lerp": "ornata.effects.transitions:_lerp",
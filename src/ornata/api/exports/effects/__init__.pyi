@@ -13,6 +13,7 @@ from ornata.effects.animation import keyframes as keyframes
 from ornata.effects.animation import timeline as timeline
 from ornata.effects.animation.coordinator import AnimationCoordinator as AnimationCoordinator
 from ornata.effects.animation.coordinator import AnimationSequence as AnimationSequence
+from ornata.effects.animation.easing import EASING_LUT_SIZE as EASING_LUT_SIZE
 from ornata.effects.animation.easing import ease_in_back as ease_in_back
 from ornata.effects.animation.easing import ease_in_bounce as ease_in_bounce
 from ornata.effects.animation.easing import ease_in_circ as ease_in_circ
@@ -40,7 +41,10 @@ from ornata.effects.animation.easing import ease_out_expo as ease_out_expo
 from ornata.effects.animation.easing import ease_out_quad as ease_out_quad
 from ornata.effects.animation.easing import ease_out_quart as ease_out_quart
 from ornata.effects.animation.easing import ease_out_sine as ease_out_sine
+from ornata.effects.animation.easing import easing_lut as easing_lut
+from ornata.effects.animation.easing import easing_table as easing_table
 from ornata.effects.animation.easing import linear_easing as linear_easing
+from ornata.effects.animation.easing import sample_lut as sample_lut
 from ornata.effects.animation.effects import FadeInAnimation as FadeInAnimation
 from ornata.effects.animation.effects import GradientPulseAnimation as GradientPulseAnimation
 from ornata.effects.animation.effects import ParticleTrailAnimation as ParticleTrailAnimation
@@ -70,6 +74,7 @@ from ornata.effects.animation.optimization import AnimationBatcher as AnimationB
 from ornata.effects.animation.optimization import AnimationOptimizer as AnimationOptimizer
 from ornata.effects.animation.timeline import AnimationScheduler as AnimationScheduler
 from ornata.effects.animation.timeline import ScheduledCallback as ScheduledCallback
+from ornata.effects.animation.tracks import AnimationTracks as AnimationTracks
 from ornata.effects.particles import emitter as emitter
 from ornata.effects.particles import physics as physics
 from ornata.effects.particles.config import ParticleSystemConfig as ParticleSystemConfig
@@ -88,12 +93,18 @@ from ornata.effects.particles.interfaces import update_particles as update_parti
 from ornata.effects.particles.optimization import ParticleOptimization as ParticleOptimization
 from ornata.effects.particles.physics import ParticlePhysics as ParticlePhysics
 from ornata.effects.particles.renderer import ParticleRenderer as ParticleRenderer
+from ornata.effects.particles.spatial import GridStats as GridStats
+from ornata.effects.particles.spatial import SpatialHashGrid as SpatialHashGrid
+from ornata.effects.particles.store import ParticleStore as ParticleStore
+from ornata.effects.particles.worker import ParticleSimulationWorker as ParticleSimulationWorker
+from ornata.effects.particles.worker import ParticleSnapshot as ParticleSnapshot
 from ornata.effects.timeline import BaseTimeline as BaseTimeline
 from ornata.effects.timeline import FrameCache as FrameCache
 from ornata.effects.transitions import _lerp as _lerp  #type: ignore
 from ornata.effects.transitions import ease_in_out as ease_in_out
 
 __all__ = [
+    "EASING_LUT_SIZE",
     "AnimationBatcher",
     "AnimationCoordinator",
     "AnimationDirection",
@@ -105,9 +116,11 @@ __all__ = [
     "AnimationScheduler",
     "AnimationSequence",
     "AnimationState",
+    "AnimationTracks",
     "FadeInAnimation",
     "FrameCache",
     "GradientPulseAnimation",
+    "GridStats",
     "Particle",
     "ParticleEffects",
     "ParticleEmitter",
@@ -115,11 +128,15 @@ __all__ = [
     "ParticleOptimization",
     "ParticlePhysics",
     "ParticleRenderer",
+    "ParticleSimulationWorker",
+    "ParticleSnapshot",
+    "ParticleStore",
     "ParticleSystemConfig",
     "ParticleTrailAnimation",
     "PulseAnimation",
     "ScheduledCallback",
     "ShakeAnimation",
+    "SpatialHashGrid",
     "BaseTimeline",
     "Timeline",
     "TypewriterAnimation",
@@ -162,6 +179,8 @@ __all__ = [
     "ease_out_quart",
     "ease_out_sine",
     "easing",
+    "easing_lut",
+    "easing_table",
     "emitter",
     "get_active_animations",
     "get_active_particle_systems",
@@ -178,6 +197,7 @@ __all__ = [
     "physics",
     "render_particles",
     "resume_animation",
+    "sample_lut",
     "start_animation",
     "stop_animation",
     "timeline",
@@ -45,8 +45,10 @@ _EXPORT_TARGETS: dict[str, str] = {
     "AbsoluteLayout": "ornata.layout.algorithms.absolute:AbsoluteLayout",
     "FlexLayout": "ornata.layout.algorithms.flex:FlexLayout",
     "GridLayout": "ornata.layout.algorithms.grid:GridLayout",
+    "LayoutCache": "ornata.layout.engine.engine:LayoutCache",
     "LayoutEngine": "ornata.layout.engine.engine:LayoutEngine",
     "LayoutNode": "ornata.layout.engine.engine:LayoutNode",
+    "LayoutPassStats": "ornata.layout.engine.engine:LayoutPassStats",
     "LayoutResult": "ornata.layout.engine.engine:LayoutResult",
     "LayoutStyle": "ornata.layout.engine.engine:LayoutStyle",
     "_calculate_grid_track_sizes": "ornata.layout.engine.engine:_calculate_grid_track_sizes",
@@ -58,7 +60,10 @@ _EXPORT_TARGETS: dict[str, str] = {
     "compute_grid_layout": "ornata.layout.engine.engine:compute_grid_layout",
     "compute_layout": "ornata.layout.engine.engine:compute_layout",
     "compute_relative_layout": "ornata.layout.engine.engine:compute_relative_layout",
+    "layout_fingerprint": "ornata.layout.engine.engine:layout_fingerprint",
     "measure_leaf": "ornata.layout.engine.engine:measure_leaf",
+    "relayout": "ornata.layout.engine.engine:relayout",
+    "sync_layout_node": "ornata.layout.engine.engine:sync_layout_node",
     "DirtyRectangleContext": "ornata.layout.geometry.dirty_rectangles:DirtyRectangleContext",
     "DirtyRectangleRenderer": "ornata.layout.geometry.dirty_rectangles:DirtyRectangleRenderer",
     "RenderBatch": "ornata.layout.geometry.dirty_rectangles:RenderBatch",
@@ -68,7 +73,13 @@ _EXPORT_TARGETS: dict[str, str] = {
     "VirtualScrollContainer": "ornata.layout.scrolling.virtual_scrolling:VirtualScrollContainer",
     "VirtualScrollState": "ornata.layout.scrolling.virtual_scrolling:VirtualScrollState",
     "create_simple_item_renderer": "ornata.layout.scrolling.virtual_scrolling:create_simple_item_renderer",
-    "create_virtual_scroll_node": "ornata.layout.scrolling.virtual_scrolling:create_virtual_scroll_node"
+    "create_virtual_scroll_node": "ornata.layout.scrolling.virtual_scrolling:create_virtual_scroll_node",
+    "virtual_table": "ornata.layout.scrolling:virtual_table",
+    "height_index": "ornata.layout.scrolling:height_index",
+    "HeightIndex": "ornata.layout.scrolling.height_index:HeightIndex",
+    "TableRowSource": "ornata.layout.scrolling.virtual_table:TableRowSource",
+    "VirtualTable": "ornata.layout.scrolling.virtual_table:VirtualTable",
+    "format_table_row": "ornata.layout.scrolling.virtual_table:format_table_row"
 }
 
 _RESOLVED_EXPORTS: dict[str, object] = {}
@@ -35,8 +35,10 @@ from ornata.layout.diagnostics import debug as debug
 from ornata.layout.diagnostics.debug import LayoutDebugger as LayoutDebugger
 from ornata.layout.diagnostics.debug import LayoutDebugInfo as LayoutDebugInfo
 from ornata.layout.diagnostics.debug import get_layout_debugger as get_layout_debugger
+from ornata.layout.engine.engine import LayoutCache as LayoutCache
 from ornata.layout.engine.engine import LayoutEngine as LayoutEngine
 from ornata.layout.engine.engine import LayoutNode as LayoutNode
+from ornata.layout.engine.engine import LayoutPassStats as LayoutPassStats
 from ornata.layout.engine.engine import LayoutResult as LayoutResult
 from ornata.layout.engine.engine import LayoutStyle as LayoutStyle
 from ornata.layout.engine.engine import _calculate_grid_track_sizes as _calculate_grid_track_sizes  #type: ignore
@@ -48,19 +50,28 @@ from ornata.layout.engine.engine import compute_grid as compute_grid
 from ornata.layout.engine.engine import compute_grid_layout as compute_grid_layout
 from ornata.layout.engine.engine import compute_layout as compute_layout
 from ornata.layout.engine.engine import compute_relative_layout as compute_relative_layout
+from ornata.layout.engine.engine import layout_fingerprint as layout_fingerprint
 from ornata.layout.engine.engine import measure_leaf as measure_leaf
+from ornata.layout.engine.engine import relayout as relayout
+from ornata.layout.engine.engine import sync_layout_node as sync_layout_node
 from ornata.layout.geometry.dirty_rectangles import DirtyRectangleContext as DirtyRectangleContext
 from ornata.layout.geometry.dirty_rectangles import DirtyRectangleRenderer as DirtyRectangleRenderer
 from ornata.layout.geometry.dirty_rectangles import RenderBatch as RenderBatch
 from ornata.layout.geometry.dirty_rectangles import RenderCallback as RenderCallback
 from ornata.layout.geometry.dirty_rectangles import dirty_rectangles as dirty_rectangles
 from ornata.layout.geometry.dirty_rectangles import get_dirty_renderer as get_dirty_renderer
+from ornata.layout.scrolling import height_index as height_index
 from ornata.layout.scrolling import virtual_scrolling as virtual_scrolling
+from ornata.layout.scrolling import virtual_table as virtual_table
+from ornata.layout.scrolling.height_index import HeightIndex as HeightIndex
 from ornata.layout.scrolling.virtual_scrolling import VirtualScrollConfig as VirtualScrollConfig
 from ornata.layout.scrolling.virtual_scrolling import VirtualScrollContainer as VirtualScrollContainer
 from ornata.layout.scrolling.virtual_scrolling import VirtualScrollState as VirtualScrollState
 from ornata.layout.scrolling.virtual_scrolling import create_simple_item_renderer as create_simple_item_renderer
 from ornata.layout.scrolling.virtual_scrolling import create_virtual_scroll_node as create_virtual_scroll_node
+from ornata.layout.scrolling.virtual_table import TableRowSource as TableRowSource
+from ornata.layout.scrolling.virtual_table import VirtualTable as VirtualTable
+from ornata.layout.scrolling.virtual_table import format_table_row as format_table_row
 
 __all__ = [
     "AspectRatioConstraint",
@@ -69,10 +80,13 @@ __all__ = [
     "ContainerFitConstraint",
     "DirtyRectangleContext",
     "DirtyRectangleRenderer",
+    "HeightIndex",
     "LayoutDebugInfo",
     "LayoutDebugger",
+    "LayoutCache",
     "LayoutEngine",
     "LayoutNode",
+    "LayoutPassStats",
     "LayoutResult",
     "LayoutStyle",
     "MaxSizeConstraint",
@@ -82,10 +96,12 @@ __all__ = [
     "ResponsiveLayoutManager",
     "SpatialIndex",
     "SpatialIndexEntry",
+    "TableRowSource",
     "OSTSLayoutConverter",
     "VirtualScrollConfig",
     "VirtualScrollContainer",
     "VirtualScrollState",
+    "VirtualTable",
     "_calculate_grid_track_sizes",
     "_parse_grid_template",
     "absolute",
@@ -110,16 +126,22 @@ __all__ = [
     "dirty_rectangles",
     "engine",
     "flex",
+    "format_table_row",
     "geometry",
     "get_dirty_renderer",
     "get_layout_debugger",
     "get_responsive_manager",
     "get_osts_converter",
     "grid",
+    "height_index",
+    "layout_fingerprint",
     "measure_leaf",
+    "relayout",
     "responsive",
     "scrolling",
+    "sync_layout_node",
     "osts_converter",
     "osts_to_layout_style",
     "virtual_scrolling",
+    "virtual_table",
 ]
\ No newline at end of file
@@ -18,6 +18,7 @@ _EXPORT_TARGETS: dict[str, str] = {
     'session': 'ornata.rendering.backends.cli:session',
     'terminal': 'ornata.rendering.backends.cli:terminal',
     'terminal_app': 'ornata.rendering.backends.cli:terminal_app',
+    'colors': 'ornata.rendering.backends.cli.ansi:colors',
     'cursor': 'ornata.rendering.backends.cli.ansi:cursor',
     'palette': 'ornata.rendering.backends.cli.ansi:palette',
     'screen_buffer': 'ornata.rendering.backends.cli.ansi:screen_buffer',
@@ -40,6 +41,14 @@ _EXPORT_TARGETS: dict[str, str] = {
     'cursor_set_style': 'ornata.rendering.backends.cli.ansi.cursor:cursor_set_style',
     'cursor_show': 'ornata.rendering.backends.cli.ansi.cursor:cursor_show',
     'parse_cursor_position_response': 'ornata.rendering.backends.cli.ansi.cursor:parse_cursor_position_response',
+    'ANSI_16_PALETTE': 'ornata.rendering.backends.cli.ansi.colors:ANSI_16_PALETTE',
+    'ANSI_256_PALETTE': 'ornata.rendering.backends.cli.ansi.colors:ANSI_256_PALETTE',
+    'ansi_16_to_color': 'ornata.rendering.backends.cli.ansi.colors:ansi_16_to_color',
+    'ansi_256_to_color': 'ornata.rendering.backends.cli.ansi.colors:ansi_256_to_color',
+    'nearest_ansi_16': 'ornata.rendering.backends.cli.ansi.colors:nearest_ansi_16',
+    'nearest_ansi_256': 'ornata.rendering.backends.cli.ansi.colors:nearest_ansi_256',
+    'parse_ansi_color': 'ornata.rendering.backends.cli.ansi.colors:parse_ansi_color',
+    'quantize_color': 'ornata.rendering.backends.cli.ansi.colors:quantize_color',
     'ansi_16_background': 'ornata.rendering.backends.cli.ansi.palette:ansi_16_background',
     'ansi_16_by_name': 'ornata.rendering.backends.cli.ansi.palette:ansi_16_by_name',
     'ansi_16_foreground': 'ornata.rendering.backends.cli.ansi.palette:ansi_16_foreground',
@@ -106,6 +115,8 @@ _EXPORT_TARGETS: dict[str, str] = {
     'CLIInputPipeline': 'ornata.rendering.backends.cli.input:CLIInputPipeline',
     'create_cli_input_pipeline': 'ornata.rendering.backends.cli.input:create_cli_input_pipeline',
     'read_key': 'ornata.rendering.backends.cli.input:read_key',
+    'StdinReader': 'ornata.rendering.backends.cli.input:StdinReader',
+    'InputParser': 'ornata.rendering.backends.cli.input_parser:InputParser',
     'conhost': 'ornata.rendering.backends.cli.platform:conhost',
     'detector': 'ornata.rendering.backends.cli.platform:detector',
     'ConHostAdapter': 'ornata.rendering.backends.cli.platform.conhost:ConHostAdapter',
@@ -115,6 +126,8 @@ _EXPORT_TARGETS: dict[str, str] = {
     'detect_terminal_capabilities': 'ornata.rendering.backends.cli.platform.detector:detect_terminal_capabilities',
     'get_terminal_adapter': 'ornata.rendering.backends.cli.platform.detector:get_terminal_adapter',
     'ANSIRenderer': 'ornata.rendering.backends.cli.renderer:ANSIRenderer',
+    'FrameScheduler': 'ornata.rendering.backends.cli.scheduler:FrameScheduler',
+    'FrameSchedulerStats': 'ornata.rendering.backends.cli.scheduler:FrameSchedulerStats',
     'LiveSessionRenderer': 'ornata.rendering.backends.cli.session:LiveSessionRenderer',
     'TerminalRenderer': 'ornata.rendering.backends.cli.terminal:TerminalRenderer',
     'TerminalApp': 'ornata.rendering.backends.cli.terminal_app:TerminalApp',
@@ -146,6 +159,8 @@ _EXPORT_TARGETS: dict[str, str] = {
     'termios': 'ornata.rendering.backends.tty:termios',
     'vt100': 'ornata.rendering.backends.tty:vt100',
     'InputReader': 'ornata.rendering.backends.tty.input:InputReader',
+    'FrameOutputStats': 'ornata.rendering.backends.tty.output:FrameOutputStats',
+    'FrameWriter': 'ornata.rendering.backends.tty.output:FrameWriter',
     'parse_mouse_event': 'ornata.rendering.backends.tty.input:parse_mouse_event',
     'bsd': 'ornata.rendering.backends.tty.platform:bsd',
     'TTYRenderer': 'ornata.rendering.backends.tty.renderer:TTYRenderer',
@@ -12,10 +12,19 @@ from ornata.rendering.backends.cli import renderer as renderer
 from ornata.rendering.backends.cli import session as session
 from ornata.rendering.backends.cli import terminal as terminal
 from ornata.rendering.backends.cli import terminal_app as terminal_app
+from ornata.rendering.backends.cli.ansi import colors as colors
 from ornata.rendering.backends.cli.ansi import cursor as cursor
 from ornata.rendering.backends.cli.ansi import palette as palette
 from ornata.rendering.backends.cli.ansi import screen_buffer as screen_buffer
 from ornata.rendering.backends.cli.ansi import sgr as sgr
+from ornata.rendering.backends.cli.ansi.colors import ANSI_16_PALETTE as ANSI_16_PALETTE
+from ornata.rendering.backends.cli.ansi.colors import ANSI_256_PALETTE as ANSI_256_PALETTE
+from ornata.rendering.backends.cli.ansi.colors import ansi_16_to_color as ansi_16_to_color
+from ornata.rendering.backends.cli.ansi.colors import ansi_256_to_color as ansi_256_to_color
+from ornata.rendering.backends.cli.ansi.colors import nearest_ansi_16 as nearest_ansi_16
+from ornata.rendering.backends.cli.ansi.colors import nearest_ansi_256 as nearest_ansi_256
+from ornata.rendering.backends.cli.ansi.colors import parse_ansi_color as parse_ansi_color
+from ornata.rendering.backends.cli.ansi.colors import quantize_color as quantize_color
 from ornata.rendering.backends.cli.ansi.cursor import cursor_column as cursor_column
 from ornata.rendering.backends.cli.ansi.cursor import cursor_get_position as cursor_get_position
 from ornata.rendering.backends.cli.ansi.cursor import cursor_hide as cursor_hide
@@ -98,8 +107,10 @@ from ornata.rendering.backends.cli.ansi.sgr import superscript as superscript
 from ornata.rendering.backends.cli.ansi.sgr import underline as underline
 from ornata.rendering.backends.cli.ansi.sgr import underline_double as underline_double
 from ornata.rendering.backends.cli.input import CLIInputPipeline as CLIInputPipeline
+from ornata.rendering.backends.cli.input import StdinReader as StdinReader
 from ornata.rendering.backends.cli.input import create_cli_input_pipeline as create_cli_input_pipeline
 from ornata.rendering.backends.cli.input import read_key as read_key
+from ornata.rendering.backends.cli.input_parser import InputParser as InputParser
 from ornata.rendering.backends.cli.platform import conhost as conhost
 from ornata.rendering.backends.cli.platform import detector as detector
 from ornata.rendering.backends.cli.platform.conhost import ConHostAdapter as ConHostAdapter
@@ -109,6 +120,8 @@ from ornata.rendering.backends.cli.platform.conhost import is_conhost_available
 from ornata.rendering.backends.cli.platform.detector import detect_terminal_capabilities as detect_terminal_capabilities
 from ornata.rendering.backends.cli.platform.detector import get_terminal_adapter as get_terminal_adapter
 from ornata.rendering.backends.cli.renderer import ANSIRenderer as ANSIRenderer
+from ornata.rendering.backends.cli.scheduler import FrameScheduler as FrameScheduler
+from ornata.rendering.backends.cli.scheduler import FrameSchedulerStats as FrameSchedulerStats
 from ornata.rendering.backends.cli.session import LiveSessionRenderer as LiveSessionRenderer
 from ornata.rendering.backends.cli.terminal import TerminalRenderer as TerminalRenderer
 from ornata.rendering.backends.cli.terminal_app import TerminalApp as TerminalApp
@@ -144,6 +157,8 @@ from ornata.rendering.backends.tty.input import InputReader as InputReader
 from ornata.rendering.backends.tty.input import KeyEvent as KeyEvent
 from ornata.rendering.backends.tty.input import MouseEvent as MouseEvent
 from ornata.rendering.backends.tty.input import parse_mouse_event as parse_mouse_event
+from ornata.rendering.backends.tty.output import FrameOutputStats as FrameOutputStats
+from ornata.rendering.backends.tty.output import FrameWriter as FrameWriter
 from ornata.rendering.backends.tty.platform import bsd as bsd
 from ornata.rendering.backends.tty.renderer import TTYRenderer as TTYRenderer
 from ornata.rendering.backends.tty.termios import TerminalController as TerminalController
@@ -179,6 +194,8 @@ from ornata.rendering.core.render_signals import get_global_dispatcher as get_gl
 from ornata.rendering.core.render_signals import get_global_emitter as get_global_emitter
 
 __all__ = [
+    "ANSI_16_PALETTE",
+    "ANSI_256_PALETTE",
     "ANSIRenderer",
     "CLIInputPipeline",
     "read_key",
@@ -188,9 +205,14 @@ __all__ = [
     "EraseMode",
     "Frame",
     "FrameBuffer",
+    "FrameOutputStats",
+    "FrameScheduler",
+    "FrameSchedulerStats",
+    "FrameWriter",
     "GuiApplication",
     "GuiRuntime",
     "GuiStream",
+    "InputParser",
     "InputReader",
     "KeyEvent",
     "Layer",
@@ -206,6 +228,7 @@ __all__ = [
     "SignalDispatcher",
     "SignalEmitter",
     "SignalType",
+    "StdinReader",
     "Surface",
     "TTYRenderer",
     "TerminalApp",
@@ -227,8 +250,10 @@ __all__ = [
     "ansi_16_background",
     "ansi_16_by_name",
     "ansi_16_foreground",
+    "ansi_16_to_color",
     "ansi_256_background",
     "ansi_256_foreground",
+    "ansi_256_to_color",
     "app",
     "base_renderer",
     "bell",
@@ -243,6 +268,7 @@ __all__ = [
     "clear_screen_to_cursor",
     "color_background",
     "color_foreground",
+    "colors",
     "combine_styles",
     "compositor",
     "conhost",
@@ -303,11 +329,15 @@ __all__ = [
     "is_conhost_available",
     "is_terminal",
     "italic",
+    "nearest_ansi_16",
+    "nearest_ansi_256",
     "palette",
+    "parse_ansi_color",
     "parse_cursor_position_response",
     "parse_mouse_event",
     "platform",
     "rapid_blink",
+    "quantize_color",
     "register",
     "render_signals",
     "render_tree",
@@ -72,9 +72,11 @@ _EXPORT_TARGETS: dict[str, str] = {
     '_handle_transform': 'ornata.styling.language.cascade:_handle_transform',
     '_handle_width': 'ornata.styling.language.cascade:_handle_width',
     '_handle_word_spacing': 'ornata.styling.language.cascade:_handle_word_spacing',
-    '_matches_component': 'ornata.styling.language.cascade:_matches_component',
     '_resolve_color': 'ornata.styling.language.cascade:_resolve_color',
     '_split_tokens': 'ornata.styling.language.cascade:_split_tokens',
+    'CompiledBlock': 'ornata.styling.language.cascade:CompiledBlock',
+    'CompiledStylesheet': 'ornata.styling.language.cascade:CompiledStylesheet',
+    'compile_stylesheet': 'ornata.styling.language.cascade:compile_stylesheet',
     'resolve_stylesheet': 'ornata.styling.language.cascade:resolve_stylesheet',
     'clear': 'ornata.styling.language.diag:clear',
     'error': 'ornata.styling.language.diag:error',
@@ -90,6 +92,8 @@ _EXPORT_TARGETS: dict[str, str] = {
     'borders': 'ornata.styling.runtime:borders',
     'typography': 'ornata.styling.runtime:typography',
     'StylingBorders': 'ornata.styling.runtime.borders:StylingBorders',
+    'StyleCache': 'ornata.styling.language.cache:StyleCache',
+    'StyleBatchStats': 'ornata.styling.runtime.runtime:StyleBatchStats',
     'StylingRuntime': 'ornata.styling.runtime.runtime:StylingRuntime',
     'get_styling_runtime': 'ornata.styling.runtime.runtime:get_styling_runtime',
     'resolve_component_style': 'ornata.styling.runtime.runtime:resolve_component_style',
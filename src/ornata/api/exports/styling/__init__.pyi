@@ -40,6 +40,9 @@ from ornata.styling.language import cascade as cascade
 from ornata.styling.language import diag as diag
 from ornata.styling.language import engine as engine
 from ornata.styling.language import grammar as grammar
+from ornata.styling.language.cache import StyleCache as StyleCache
+from ornata.styling.language.cascade import CompiledBlock as CompiledBlock
+from ornata.styling.language.cascade import CompiledStylesheet as CompiledStylesheet
 from ornata.styling.language.cascade import _apply_block as _apply_block  # type: ignore
 from ornata.styling.language.cascade import _handle_background as _handle_background  # type: ignore
 from ornata.styling.language.cascade import _handle_background_image as _handle_background_image  # type: ignore
@@ -68,9 +71,9 @@ from ornata.styling.language.cascade import _handle_text_transform as _handle_te
 from ornata.styling.language.cascade import _handle_transform as _handle_transform  # type: ignore
 from ornata.styling.language.cascade import _handle_width as _handle_width  # type: ignore
 from ornata.styling.language.cascade import _handle_word_spacing as _handle_word_spacing  # type: ignore
-from ornata.styling.language.cascade import _matches_component as _matches_component  # type: ignore
 from ornata.styling.language.cascade import _resolve_color as _resolve_color  # type: ignore
 from ornata.styling.language.cascade import _split_tokens as _split_tokens  # type: ignore
+from ornata.styling.language.cascade import compile_stylesheet as compile_stylesheet
 from ornata.styling.language.cascade import resolve_stylesheet as resolve_stylesheet
 from ornata.styling.language.diag import clear as clear
 from ornata.styling.language.diag import error as error
@@ -87,6 +90,7 @@ from ornata.styling.language.grammar import parse_stylesheet as parse_stylesheet
 from ornata.styling.runtime import borders as borders
 from ornata.styling.runtime import typography as typography
 from ornata.styling.runtime.borders import StylingBorders as StylingBorders
+from ornata.styling.runtime.runtime import StyleBatchStats as StyleBatchStats
 from ornata.styling.runtime.runtime import StylingContext as StylingContext
 from ornata.styling.runtime.runtime import StylingRuntime as StylingRuntime
 from ornata.styling.runtime.runtime import get_styling_runtime as get_styling_runtime
@@ -113,6 +117,8 @@ __all__ = [
     "ColorResolver",
     "ColorSpaces",
     "ColorVisionSimulator",
+    "CompiledBlock",
+    "CompiledStylesheet",
     "ContrastAnalyzer",
     "GUIMapper",
     "GradientRenderer",
@@ -123,6 +129,8 @@ __all__ = [
     "StylingContext",
     "StylingBorders",
     "StylingRegistry",
+    "StyleBatchStats",
+    "StyleCache",
     "StylingRuntime",
     "TTYMapper",
     "ThemeManager",
@@ -159,7 +167,6 @@ __all__ = [
     "_handle_transform",
     "_handle_width",
     "_handle_word_spacing",
-    "_matches_component",
     "_merge_styles",
     "_resolve_color",
     "_safe_call",
@@ -186,6 +193,7 @@ __all__ = [
     "load_custom_theme",
     "parse_stylesheet",
     "resolve_component_style",
+    "compile_stylesheet",
     "resolve_stylesheet",
     "resolver",
     "runtime",
@@ -13,6 +13,7 @@ _EXPORT_TARGETS: dict[str, str] = {
     "lock": "ornata.utils:lock",
     "logging": "ornata.utils:logging",
     "memory": "ornata.utils:memory",
+    "unicode_width": "ornata.utils:unicode_width",
     "LFUCache": "ornata.utils.cache:LFUCache",
     "LRUCache": "ornata.utils.cache:LRUCache",
     "SimpleCache": "ornata.utils.cache:SimpleCache",
@@ -34,6 +35,12 @@ _EXPORT_TARGETS: dict[str, str] = {
     "ThreadSafeArenaAllocator": "ornata.utils.memory:ThreadSafeArenaAllocator",
     "ThreadSafeMemoryPool": "ornata.utils.memory:ThreadSafeMemoryPool",
     "ThreadSafeSlabAllocator": "ornata.utils.memory:ThreadSafeSlabAllocator",
+    "char_width": "ornata.utils.unicode_width:char_width",
+    "char_widths": "ornata.utils.unicode_width:char_widths",
+    "clip_to_width": "ornata.utils.unicode_width:clip_to_width",
+    "codepoint_width": "ornata.utils.unicode_width:codepoint_width",
+    "fit_to_width": "ornata.utils.unicode_width:fit_to_width",
+    "text_width": "ornata.utils.unicode_width:text_width",
 }
 
 _RESOLVED_EXPORTS: dict[str, object] = {}
@@ -6,6 +6,7 @@ from ornata.utils import cache as cache
 from ornata.utils import lock as lock
 from ornata.utils import logging as logging
 from ornata.utils import memory as memory
+from ornata.utils import unicode_width as unicode_width
 from ornata.utils.cache import LFUCache as LFUCache
 from ornata.utils.cache import LRUCache as LRUCache
 from ornata.utils.cache import SimpleCache as SimpleCache
@@ -27,6 +28,12 @@ from ornata.utils.memory import SlabAllocator as SlabAllocator
 from ornata.utils.memory import ThreadSafeArenaAllocator as ThreadSafeArenaAllocator
 from ornata.utils.memory import ThreadSafeMemoryPool as ThreadSafeMemoryPool
 from ornata.utils.memory import ThreadSafeSlabAllocator as ThreadSafeSlabAllocator
+from ornata.utils.unicode_width import char_width as char_width
+from ornata.utils.unicode_width import char_widths as char_widths
+from ornata.utils.unicode_width import clip_to_width as clip_to_width
+from ornata.utils.unicode_width import codepoint_width as codepoint_width
+from ornata.utils.unicode_width import fit_to_width as fit_to_width
+from ornata.utils.unicode_width import text_width as text_width
 
 __all__ = [
     "OrnataFormatter",
@@ -44,12 +51,19 @@ __all__ = [
     "get_logger",
     "logging",
     "memory",
+    "unicode_width",
     "ArenaAllocator",
     "MemoryPool",
     "SlabAllocator",
     "ThreadSafeArenaAllocator",
     "ThreadSafeMemoryPool",
     "ThreadSafeSlabAllocator",
+    "char_width",
+    "char_widths",
+    "clip_to_width",
+    "codepoint_width",
+    "fit_to_width",
+    "text_width",
     "Lock",
     "NoOpLock",
     "ReadWriteLock",
@@ -43,6 +43,7 @@ _EXPORT_TARGETS: dict[str, str] = {
     'PatchOptimizer': 'ornata.vdom.diffing.optimization:PatchOptimizer',
     'TreePatcher': 'ornata.vdom.diffing.patcher:TreePatcher',
     'TreeReconciler': 'ornata.vdom.diffing.reconciler:TreeReconciler',
+    'plan_keyed_moves': 'ornata.vdom.diffing.reconciler:plan_keyed_moves',
     'EffectScheduler': 'ornata.vdom.diffing.scheduler:EffectScheduler',
     'get_scheduler': 'ornata.vdom.diffing.scheduler:get_scheduler',
     'MemoryManager': 'ornata.vdom.memory.memory:MemoryManager',
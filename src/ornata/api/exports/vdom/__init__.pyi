@@ -38,6 +38,7 @@ from ornata.vdom.diffing.object_pool import pooled_patch as pooled_patch
 from ornata.vdom.diffing.optimization import PatchOptimizer as PatchOptimizer
 from ornata.vdom.diffing.patcher import TreePatcher as TreePatcher
 from ornata.vdom.diffing.reconciler import TreeReconciler as TreeReconciler
+from ornata.vdom.diffing.reconciler import plan_keyed_moves as plan_keyed_moves
 from ornata.vdom.diffing.scheduler import EffectScheduler as EffectScheduler
 from ornata.vdom.diffing.scheduler import get_scheduler as get_scheduler
 from ornata.vdom.memory.memory import MemoryManager as MemoryManager
@@ -75,6 +76,7 @@ __all__ = [
     "diff_vdom_trees",
     "get_patch_object_pool",
     "incremental",
+    "plan_keyed_moves",
     "pooled_patch",
     "EffectScheduler",
     "get_bindings_registry",
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from ornata.definitions.dataclasses.components import (
     Component,
@@ -12,6 +12,13 @@ from ornata.definitions.dataclasses.components import (
     ComponentRenderHints,
 )
 from ornata.definitions.enums import ComponentKind
+from ornata.layout.scrolling.virtual_table import VirtualTable
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+    from ornata.definitions.protocols import RowProvider
+    from ornata.layout.scrolling.virtual_table import RowFetcher
 
 
 class TableComponent(Component):
@@ -22,6 +29,10 @@ class TableComponent(Component):
         *,
         columns: list[str] | None = None,
         rows: list[list[Any]] | None = None,
+        row_source: RowProvider | VirtualTable | Sequence[Sequence[Any]] | Iterable[Sequence[Any]] | RowFetcher | None = None,
+        row_count: int | Callable[[], int] | None = None,
+        row_revision: int = 0,
+        viewport_rows: int = 20,
         selection: list[int] | None = None,
         selection_mode: str | None = "single",
         order: int | None = None,
@@ -35,7 +46,14 @@ class TableComponent(Component):
         render_hints: ComponentRenderHints | None = None,
         **kwargs: Any,
     ) -> None:
-        """Create a table component with ergonomic arguments."""
+        """Create a table component with ergonomic arguments.
+
+        Pass ``row_source`` instead of ``rows`` for large or streaming data: a
+        :class:`~ornata.definitions.protocols.RowProvider`, a sequence, an
+        iterator or a ``fetch(start, stop)`` callable (the latter two with
+        ``row_count``). Only the rows on screen are then fetched and rendered.
+        Bump ``row_revision`` after editing rows of the same source in place.
+        """
 
         content_payload = content or ComponentContent()
         placement_payload = placement or ComponentPlacement(order=order)
@@ -50,6 +68,11 @@ class TableComponent(Component):
             focusable=True,
             columns=columns or [],
             rows=rows or [],
+            virtual_rows=(
+                row_source
+                if row_source is None or isinstance(row_source, VirtualTable)
+                else VirtualTable(row_source, length=row_count, viewport_rows=viewport_rows, revision=row_revision)
+            ),
             selection=selection or [],
             selection_mode=selection_mode,
             content=content_payload,
@@ -23,6 +23,7 @@ if TYPE_CHECKING:
 
     from ornata.definitions.dataclasses.components import Component
     from ornata.definitions.dataclasses.rendering import GuiNode, RenderOutput
+    from ornata.rendering.backends.cli.cells import CellBuffer, PackedCellBuffer
     from ornata.rendering.core.base_renderer import Renderer
 
 if TYPE_CHECKING:
@@ -204,12 +205,14 @@ class Application:
         self._backend_instances: dict[BackendTarget, Renderer] = {}
         self._backend_contexts: dict[BackendTarget, Any] = {}
         self._last_output: RenderOutput | None = None
+        self._last_cli_buffer: CellBuffer | PackedCellBuffer | None = None
         self._loop_interval = 1.0 / 30.0
         self._loop_mode = False
         self._running = False
         self._event_subsystem: EventSubsystem | None = None
         self._cli_input_pipeline: CLIInputPipeline | None = None
         self._cli_terminal_session: Any = None
+        self._refresh_interval: float | None = None
         self._gui_driver: Any = None
         self._event_loop_started = False
         self._input_values: dict[str, str] = {}
@@ -256,7 +259,9 @@ class Application:
         self._backend_instances.clear()
         self._backend_contexts.clear()
         self._last_output = None
+        self._last_cli_buffer = None
         self._logger.info("Backend switched to %s", backend.value)
+        self.request_frame()
 
     def add_stylesheet(self, path: str) -> None:
         """
@@ -279,8 +284,9 @@ class Application:
             return
         self._config.stylesheets.append(path)
         self._runtime.load_stylesheet(path)
+        self.request_frame()
 
-    def mount(self, component_or_factory: Any) -> None:
+    def mount(self, component_or_factory: Any, *, refresh_interval: float | None = None) -> None:
         """
         Register a root component or factory for the application.
 
@@ -288,20 +294,50 @@ class Application:
         
         * **component_or_factory** (`Any`): 
           Root component instance or a factory function that returns the root component.
+        * **refresh_interval** (`float | None`, optional):
+          Seconds between redraws for factories whose output depends on time, such as
+          clocks or animations. `None` (the default) redraws only on input, resize and
+          `request_frame()`.
 
         ### Returns
         
         * `None`
 
+        ### Raises
+        
+        * `ValueError`: If `refresh_interval` is less than or equal to zero.
+
         ### See Also
         
         * `OrnataRuntime.run`
+        * `Application.request_frame`
         """
 
+        if refresh_interval is not None and refresh_interval <= 0:
+            raise ValueError("refresh_interval must be greater than zero")
         if callable(component_or_factory):
             self._builder = component_or_factory
         else:
             self._builder = lambda component=component_or_factory: component
+        self._refresh_interval = refresh_interval
+        self.request_frame()
+
+    def request_frame(self) -> None:
+        """
+        Schedule a redraw of the live CLI session.
+
+        Call this after changing state the mounted factory reads. Input and terminal
+        resizes request frames on their own; an idle session renders nothing. Safe to
+        call from any thread, and a no-op when no session is running.
+
+        ### Returns
+        
+        * `None`
+        """
+
+        session = self._cli_terminal_session
+        if session is not None:
+            session.request_frame()
 
     def run(self) -> RuntimeFrame:
         """
@@ -335,7 +371,8 @@ class Application:
 
         ### Parameters
         
-        * **fps** (`float`, optional): Target frames per second. Default is 30.0.
+        * **fps** (`float`, optional): Target frames per second. Default is 30.0. The CLI backend
+          treats it as a cap and only renders when a frame was requested.
 
         ### Returns
         
@@ -653,6 +690,9 @@ class Application:
     ) -> tuple[RenderOutput, str | bytes | None]:
         """Render ``frame`` for ``backend_target`` and memoize last output.
 
+        Frames the runtime reports as unchanged reuse the memoized output
+        without rendering again.
+
         ### Parameters
         
         * **frame** (`RuntimeFrame`): Runtime frame to convert.
@@ -668,6 +708,8 @@ class Application:
         previous_content: str | bytes | None = None
         if self._last_output is not None:
             previous_content = self._last_output.content
+            if frame.unchanged:
+                return self._last_output, previous_content
         render_tree = frame.gui_tree
         if render_tree is None:
             render_tree = self._prepare_render_tree(backend_target)
@@ -682,6 +724,8 @@ class Application:
             raise RuntimeError("No component tree registered. Call mount() first.")
         session = TerminalSession(sys.stdout)
         terminal_app = _ApplicationTerminalApp(self, session)
+        # Frames are driven by invalidation; only time-dependent builders poll.
+        terminal_app.refresh_interval = self._refresh_interval
         self._logger.debug("Terminal app: %s", terminal_app)
         self._logger.debug("Terminal session: %s", session)
         self._cli_terminal_session = session
@@ -700,8 +744,8 @@ class Application:
             self._cli_terminal_session = None
             self._running = False
 
-    def _render_cli_frame_content(self) -> str:
-        """Build and render the current CLI frame as string content."""
+    def _build_cli_frame(self) -> RuntimeFrame:
+        """Build the component tree and run the runtime for the next CLI frame."""
 
         if self._builder is None:
             raise RuntimeError("No component tree registered. Call mount() first.")
@@ -715,10 +759,35 @@ class Application:
         # Inject stored input values into the component tree
         self._restore_input_values(component, self._input_values)
         
-        frame = self._runtime.run(component)
+        return self._runtime.run(component)
+
+    def _render_cli_frame_content(self) -> str:
+        """Build and render the current CLI frame as string content."""
+
+        frame = self._build_cli_frame()
         output, _ = self._render_terminal_output(frame, BackendTarget.CLI, self._create_cli_renderer)
         return self._coerce_output_text(output)
 
+    def _render_cli_frame_buffer(self) -> CellBuffer | PackedCellBuffer | None:
+        """Build the current CLI frame and rasterize it without ANSI serialization.
+
+        ### Returns
+
+        * `CellBuffer | PackedCellBuffer | None`: Rasterized frame, or None when the
+          active CLI renderer cannot produce a cell buffer. Unchanged frames return
+          the previous buffer, whose cleared dirty spans make the diff empty.
+        """
+
+        backend = self._ensure_backend(BackendTarget.CLI, lambda: self._create_cli_renderer(BackendTarget.CLI))
+        rasterize = getattr(backend, "rasterize_tree", None)
+        if rasterize is None:
+            return None
+        frame = self._build_cli_frame()
+        if frame.unchanged and self._last_cli_buffer is not None:
+            return self._last_cli_buffer
+        self._last_cli_buffer = rasterize(frame.gui_tree, frame.layout)
+        return self._last_cli_buffer
+
     def _restore_input_values(self, component: Component, storage: dict[str, str]) -> None:
         """Recursively restore input values to component tree."""
         if hasattr(component, 'component_id') and component.component_id:
@@ -747,7 +816,7 @@ class Application:
 
         # Default background for the terminal (dark theme)
         default_bg = ANSIColor(13, 17, 23)  # #0d1117
-        return TerminalRenderer(backend_target, default_bg=default_bg, use_truecolor=True)
+        return TerminalRenderer(backend_target, default_bg=default_bg, use_truecolor=True, packed_cells=True)
 
     def _create_tty_renderer(self, backend_target: BackendTarget) -> Renderer:
         """Create the TTY renderer."""
@@ -920,6 +989,10 @@ class _ApplicationTerminalApp(TerminalApp):
         """Build and return the latest application frame."""
         return self._application._render_cli_frame_content()
 
+    def render_buffer(self) -> CellBuffer | PackedCellBuffer | None:
+        """Build and return the latest application frame as a cell buffer."""
+        return self._application._render_cli_frame_buffer()
+
     def on_key(self, key: str) -> None:
         """Handle quit gestures and forward to the Application."""
         try:
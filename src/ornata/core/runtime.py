@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from ornata.definitions.dataclasses.core import AppConfig, RuntimeFrame
@@ -9,8 +10,8 @@ from ornata.definitions.dataclasses.layout import LayoutResult
 from ornata.definitions.dataclasses.rendering import GuiNode
 from ornata.definitions.dataclasses.styling import BackendStylePayload, Insets, ResolvedStyle, StylingContext
 from ornata.definitions.dataclasses.vdom import VDOMTree
-from ornata.definitions.enums import BackendTarget
-from ornata.layout.engine.engine import LayoutEngine, LayoutNode, compute_layout
+from ornata.definitions.enums import BackendTarget, PatchType
+from ornata.layout.engine.engine import LayoutEngine, LayoutNode, compute_layout, relayout
 from ornata.styling.runtime import StylingRuntime
 from ornata.utils import get_logger
 
@@ -20,10 +21,29 @@ if TYPE_CHECKING:
 
     from ornata.definitions.dataclasses.components import Component
     from ornata.definitions.dataclasses.layout import LayoutStyle
+    from ornata.definitions.dataclasses.vdom import Patch
+
+
+@dataclass(slots=True)
+class FrameStats:
+    """Counters describing the most recent :meth:`OrnataRuntime.run` pass."""
+
+    full_rebuild: bool = False
+    unchanged: bool = False
+    patches: int = 0
+    restyled: int = 0
+    dirty_layout_nodes: int = 0
+    gui_nodes_built: int = 0
 
 
 class OrnataRuntime:
-    """Coordinates styling, VDOM, layout, and renderer selection."""
+    """Coordinates styling, VDOM, layout, and renderer selection.
+
+    The runtime is retained: styles, layout nodes and GUI nodes from the
+    previous pass are kept by VDOM key, and each new component tree is
+    reconciled against the previous VDOM tree so that only patched subtrees
+    are restyled, relaid out and rebuilt.
+    """
 
     def __init__(self, config: AppConfig) -> None:
         """Create a runtime bound to ``config``."""
@@ -38,6 +58,17 @@ class OrnataRuntime:
         self._layout_tree: LayoutNode | None = None
         self._last_gui_tree: GuiNode | None = None
         self._backend_payloads: dict[int, BackendStylePayload] = {}
+        self._root_key: str | None = None
+        self._viewport: tuple[int, int] | None = None
+        self._style_version: tuple[int, int, int] | None = None
+        self._last_frame: RuntimeFrame | None = None
+        self._last_frame_stats = FrameStats()
+        # Per-pass results retained by VDOM key for the next pass.
+        self._payloads_by_key: dict[str, BackendStylePayload] = {}
+        self._layout_by_key: dict[str, LayoutNode] = {}
+        self._gui_by_key: dict[str, GuiNode] = {}
+        # VDOM key of every component of the current pass, by ``id(component)``.
+        self._component_keys: dict[int, str] = {}
         for stylesheet in config.stylesheets:
             self.load_stylesheet(stylesheet)
 
@@ -51,21 +82,90 @@ class OrnataRuntime:
         self._logger.debug("Loaded stylesheet %s", path)
 
     def run(self, root_component: Component) -> RuntimeFrame:
-        """Execute one orchestration pass for ``root_component``."""
+        """Execute one orchestration pass for ``root_component``.
+
+        The first pass, and any pass after the root, the styles or the
+        stylesheets changed, builds everything from scratch. Later passes
+        reconcile ``root_component`` against the retained VDOM tree and only
+        restyle, relayout and rebuild the GUI nodes of patched subtrees. When
+        the reconciler finds no patches and the viewport is unchanged, the
+        previous frame's layout and GUI tree are returned with
+        ``unchanged`` set so callers can skip rendering.
+        """
+
+        bounds = self._config.viewport_bounds()
+        viewport = (int(bounds.width), int(bounds.height))
+        style_version = self._styling.style_version
+        root_key = self._assign_keys(root_component)
+        previous = self._last_frame
+
+        if (
+            previous is None
+            or self._layout_tree is None
+            or root_key != self._root_key
+            or style_version != self._style_version
+        ):
+            return self._run_full(root_component, root_key, viewport, style_version)
+
+        patches = self._vdom_tree.update_component(root_key, root_component, keys=self._component_keys)
+        self._vdom_tree.reset_dirty_tracking()
+        if any(patch.patch_type is PatchType.REPLACE_ROOT for patch in patches):
+            return self._run_full(root_component, root_key, viewport, style_version)
+
+        if not patches and viewport == self._viewport:
+            self._last_frame_stats = FrameStats(unchanged=True)
+            frame = RuntimeFrame(
+                root=root_component,
+                layout=previous.layout,
+                styles=self._retained_styles(root_component),
+                gui_tree=previous.gui_tree,
+                unchanged=True,
+            )
+            self._last_frame = frame
+            return frame
+
+        self._viewport = viewport
+        changed = _changed_keys(patches)
+        self._last_frame_stats = FrameStats(patches=len(patches))
+        return self._run_pass(root_component, changed)
+
+    def _run_full(
+        self,
+        root_component: Component,
+        root_key: str,
+        viewport: tuple[int, int],
+        style_version: tuple[int, int, int],
+    ) -> RuntimeFrame:
+        """Mount ``root_component`` in a fresh VDOM tree and rebuild every stage."""
 
         self._logger.info("Mounting root component %s", root_component.component_name)
         self._vdom_tree = VDOMTree(backend_target=self._backend_target)
-        key = self._vdom_tree.add_component(root_component)
+        key = self._vdom_tree.add_component(root_component, keys=self._component_keys)
         self._vdom_tree.root = self._vdom_tree.key_map.get(key)
+        self._root_key = root_key
+        self._viewport = viewport
+        self._style_version = style_version
+        self._last_frame_stats = FrameStats(full_rebuild=True)
+        return self._run_pass(root_component, None)
+
+    def _run_pass(self, root_component: Component, changed: set[str] | None) -> RuntimeFrame:
+        """Style, lay out and build the GUI tree, reusing results outside ``changed``.
+
+        ``changed`` holds the VDOM keys of patched components; ``None``
+        discards everything retained from earlier passes.
+        """
 
-        styles = self._resolve_styles(root_component)
-        layout_tree, binding_map = self._build_layout_tree(root_component, styles)
+        stats = self._last_frame_stats
+        styles = self._resolve_styles(root_component, changed)
+        layout_tree, binding_map = self._build_layout_tree(root_component, styles, changed)
         self._layout_tree = layout_tree
 
         bounds = self._config.viewport_bounds()
-        layout_result = self._layout_engine.calculate_layout(root_component, bounds, self._backend_target)
         try:
-            compute_layout(layout_tree, int(bounds.width), int(bounds.height))
+            if changed is None:
+                compute_layout(layout_tree, int(bounds.width), int(bounds.height))
+            else:
+                relayout(layout_tree, int(bounds.width), int(bounds.height))
             # Use LayoutNode tree dimensions which are correct for cell-based layouts
             layout_result = LayoutResult(
                 x=0,
@@ -75,10 +175,20 @@ class OrnataRuntime:
             )
         except Exception as exc:
             self._logger.debug("Legacy layout propagation failed: %s", exc)
-        gui_tree = self._build_gui_tree(root_component, binding_map, styles)
+            layout_result = self._layout_engine.calculate_layout(root_component, bounds, self._backend_target)
+        gui_tree = self._build_gui_tree(root_component, binding_map, styles, changed)
         self._last_gui_tree = gui_tree
+        self._logger.debug(
+            "Frame pass: patches=%d restyled=%d dirty_layout_nodes=%d gui_nodes_built=%d",
+            stats.patches,
+            stats.restyled,
+            stats.dirty_layout_nodes,
+            stats.gui_nodes_built,
+        )
         self._logger.info("Layout calculated width=%s height=%s", layout_result.width, layout_result.height)
-        return RuntimeFrame(root=root_component, layout=layout_result, styles=styles, gui_tree=gui_tree)
+        frame = RuntimeFrame(root=root_component, layout=layout_result, styles=styles, gui_tree=gui_tree)
+        self._last_frame = frame
+        return frame
 
     @property
     def vdom_tree(self) -> VDOMTree:
@@ -92,24 +202,117 @@ class OrnataRuntime:
 
         return self._last_gui_tree
 
-    def _build_layout_tree(self, root: Component, styles: dict[int, ResolvedStyle]) -> tuple[LayoutNode, dict[int, LayoutNode]]:
-        """Convert the component tree into a LayoutNode hierarchy."""
+    @property
+    def last_frame_stats(self) -> FrameStats:
+        """Return the counters of the most recent :meth:`run` pass."""
 
+        return self._last_frame_stats
+
+    def _assign_keys(self, root: Component) -> str:
+        """Key every component of ``root``, deriving missing keys from tree positions.
+
+        Builders usually return fresh component objects on every frame, so
+        positional keys are what lets the reconciler match them with the
+        retained VDOM nodes. Explicit keys and component ids are kept. Keys
+        are recorded in ``_component_keys`` rather than on the components,
+        which belong to the application.
+
+        Returns:
+            The key of ``root``.
+        """
+
+        keys: dict[int, str] = {}
+        seen: set[str] = set()
+
+        def _key(component: Component, fallback: str) -> str:
+            explicit = component.key or component.component_id
+            if explicit:
+                key = str(explicit)
+            else:
+                key = fallback
+                while key in seen:
+                    key += "~"
+            seen.add(key)
+            keys[id(component)] = key
+            return key
+
+        root_key = _key(root, "root")
+        stack: list[tuple[Component, str]] = [(root, root_key)]
+        while stack:
+            component, key = stack.pop()
+            for index, child in enumerate(component.iter_children()):
+                stack.append((child, _key(child, f"{key}/{index}")))
+        self._component_keys = keys
+        return root_key
+
+    def _retained_styles(self, root: Component) -> dict[int, ResolvedStyle]:
+        """Map the components of ``root`` to the styles retained under their keys."""
+
+        styles: dict[int, ResolvedStyle] = {}
+        payloads: dict[int, BackendStylePayload] = {}
+        keys = self._component_keys
+        for component in self._iter_components(root):
+            key = keys.get(id(component))
+            payload = self._payloads_by_key.get(key) if key else None
+            if payload is None:
+                styles[id(component)] = ResolvedStyle()
+            else:
+                styles[id(component)] = payload.style
+                payloads[id(component)] = payload
+        self._backend_payloads = payloads
+        return styles
+
+    def _build_layout_tree(
+        self,
+        root: Component,
+        styles: dict[int, ResolvedStyle],
+        changed: set[str] | None = None,
+    ) -> tuple[LayoutNode, dict[int, LayoutNode]]:
+        """Convert the component tree into a LayoutNode hierarchy.
+
+        When ``changed`` is given, the LayoutNodes retained for components
+        outside it are reused and keep their previous layout. Changed and new
+        components get a new style, which marks them dirty for
+        :func:`relayout`, and nodes whose children differ get the new list.
+        """
+
+        retained = {} if changed is None else self._layout_by_key
         bindings: dict[int, LayoutNode] = {}
+        by_key: dict[str, LayoutNode] = {}
+        stats = self._last_frame_stats
+
+        keys = self._component_keys
 
         def _convert(component: Component) -> LayoutNode:
+            key = keys.get(id(component))
             measure = self._make_measure_callback(component)
-            node = LayoutNode(style=component.get_layout_style(), measure=measure)
-
-            if id(component) in styles:
-                self._apply_resolved_style(node.style, styles[id(component)])
+            node = retained.get(key) if key else None
+            if node is None or changed is None or key in changed:
+                style = component.get_layout_style()
+                if id(component) in styles:
+                    self._apply_resolved_style(style, styles[id(component)])
+                if node is None:
+                    node = LayoutNode(style=style, measure=measure)
+                else:
+                    node.set_style(style)
+                    node.measure = measure
+                stats.dirty_layout_nodes += 1
+            else:
+                # Unchanged props measure the same; only drop the old component.
+                node.measure = measure
 
             bindings[id(component)] = node
-            for child in component.iter_children():
-                node.add(_convert(child))
+            if key:
+                by_key[key] = node
+            children = [_convert(child) for child in component.iter_children()]
+            current = node.children
+            if len(children) != len(current) or any(new is not old for new, old in zip(children, current, strict=True)):
+                node.set_children(children)
             return node
 
-        return _convert(root), bindings
+        root_node = _convert(root)
+        self._layout_by_key = by_key
+        return root_node, bindings
 
     def _apply_resolved_style(self, layout_style: LayoutStyle, resolved: ResolvedStyle) -> None:
         """Apply resolved OSTS properties to the layout style.
@@ -194,8 +397,12 @@ class OrnataRuntime:
 
         return _measure
 
-    def _resolve_styles(self, root: Component) -> dict[int, ResolvedStyle]:
-        """Resolve styles for the component tree rooted at ``root``."""
+    def _resolve_styles(self, root: Component, changed: set[str] | None = None) -> dict[int, ResolvedStyle]:
+        """Resolve styles for the component tree rooted at ``root``.
+
+        All contexts are resolved as one batch. When ``changed`` is given,
+        components outside it reuse the payload retained under their key.
+        """
 
         components = list(self._iter_components(root))
         if not components:
@@ -203,37 +410,54 @@ class OrnataRuntime:
 
         self._logger.debug(f"Found {len(components)} components")
 
+        retained = {} if changed is None else self._payloads_by_key
+        keys = self._component_keys
+        pending = [
+            component
+            for component in components
+            if (key := keys.get(id(component))) is None or key not in retained or (changed is not None and key in changed)
+        ]
+
         caps = self._config.combined_capabilities()
         backend = BackendTarget(self._backend_target.value)
 
         # Use backend-aware style resolution
-        payloads: dict[int, BackendStylePayload] = {}
-        for component in components:
-            context = StylingContext(
+        contexts = [
+            StylingContext(
                 component_name=component.component_name or type(component).__name__,
                 state=component.states,
                 theme_overrides=None,
                 caps=caps,
                 backend=backend,
             )
-            payload = self._styling.resolve_backend_style(context)
-            if payload:
-                payloads[id(component)] = payload
+            for component in pending
+        ]
+        resolved = self._styling.resolve_backend_styles(contexts) if contexts else []
+        fresh = {id(component): payload for component, payload in zip(pending, resolved, strict=True)}
+        self._last_frame_stats.restyled += len(pending)
 
-        self._logger.debug(f"Resolved {len(payloads)} backend styles")
+        self._logger.debug(f"Resolved {len(fresh)} backend styles")
 
         # Extract ResolvedStyle from payloads for compatibility
         style_map: dict[int, ResolvedStyle] = {}
+        payloads: dict[int, BackendStylePayload] = {}
+        by_key: dict[str, BackendStylePayload] = {}
         for component in components:
-            payload = payloads.get(id(component))
+            key = keys.get(id(component))
+            payload = fresh.get(id(component))
+            if payload is None and key:
+                payload = retained.get(key)
             if payload:
                 style_map[id(component)] = payload.style
                 payloads[id(component)] = payload
+                if key:
+                    by_key[key] = payload
             else:
                 # Fallback to empty style
                 style_map[id(component)] = ResolvedStyle()
 
         self._backend_payloads = payloads
+        self._payloads_by_key = by_key
         return style_map
 
     def _build_gui_tree(
@@ -241,9 +465,60 @@ class OrnataRuntime:
         component: Component,
         bindings: dict[int, LayoutNode],
         styles: dict[int, ResolvedStyle],
+        changed: set[str] | None = None,
+    ) -> GuiNode:
+        """Construct a GuiNode tree enriched with layout and styling information.
+
+        When ``changed`` is given, GUI nodes retained for components outside
+        it are reused with their geometry refreshed from the layout.
+        """
+
+        retained = {} if changed is None else self._gui_by_key
+        by_key: dict[str, GuiNode] = {}
+        stats = self._last_frame_stats
+        keys = self._component_keys
+
+        def _build(component: Component) -> GuiNode:
+            key = keys.get(id(component))
+            gui_node = retained.get(key) if key else None
+            if gui_node is None or (changed is not None and key in changed):
+                gui_node = self._create_gui_node(component, bindings, styles, self._gui_by_key.get(key) if key else None)
+                stats.gui_nodes_built += 1
+            else:
+                layout_node = bindings.get(id(component))
+                if layout_node is not None and layout_node.layout is not None:
+                    self._apply_layout_box(gui_node, layout_node.layout)
+            if key:
+                by_key[key] = gui_node
+            children = [_build(child) for child in component.iter_children()]
+            current = gui_node.children
+            if len(children) != len(current) or any(new is not old for new, old in zip(children, current, strict=True)):
+                gui_node.children = children
+            return gui_node
+
+        root = _build(component)
+        self._gui_by_key = by_key
+        return root
+
+    def _create_gui_node(
+        self,
+        component: Component,
+        bindings: dict[int, LayoutNode],
+        styles: dict[int, ResolvedStyle],
+        previous: GuiNode | None = None,
     ) -> GuiNode:
-        """Construct a GuiNode tree enriched with layout and styling information."""
+        """Construct the GuiNode of ``component`` without its children.
+
+        ``previous`` is the node built for the same key on an earlier pass;
+        a virtual table over the same source is taken from it so that its
+        scroll position and formatted lines survive the rebuild. It takes
+        the new table's revision, so rows edited in place are formatted again.
+        """
 
+        virtual_rows = component.virtual_rows
+        if previous is not None and previous.virtual_rows is not None and virtual_rows is not None and previous.virtual_rows.same_source(virtual_rows):
+            previous.virtual_rows.revision = virtual_rows.revision
+            virtual_rows = previous.virtual_rows
         layout_node = bindings.get(id(component))
         layout_box = layout_node.layout if layout_node is not None else None
         resolved_style = styles.get(id(component))
@@ -269,6 +544,7 @@ class OrnataRuntime:
             items=list(component.items),
             columns=list(component.columns),
             rows=[list(row) for row in component.rows],
+            virtual_rows=virtual_rows,
             selection=list(component.selection),
             selection_mode=component.selection_mode,
             sorting=component.sorting,
@@ -297,15 +573,19 @@ class OrnataRuntime:
             gui_node.metadata["backend_style"] = self._backend_payloads[id(component)]
         self._populate_style_metadata(gui_node, resolved_style)
         if layout_box is not None:
-            gui_node.x = int(getattr(layout_box, "x", 0) or 0)
-            gui_node.y = int(getattr(layout_box, "y", 0) or 0)
-            gui_node.width = int(getattr(layout_box, "width", 0) or 0)
-            gui_node.height = int(getattr(layout_box, "height", 0) or 0)
+            self._apply_layout_box(gui_node, layout_box)
             self._logger.debug(f"[gui_tree] {gui_node.component_name}: pos=({gui_node.x},{gui_node.y}) size={gui_node.width}x{gui_node.height}")
-
-        gui_node.children = [self._build_gui_tree(child, bindings, styles) for child in component.iter_children()]
         return gui_node
 
+    @staticmethod
+    def _apply_layout_box(gui_node: GuiNode, layout_box: LayoutResult) -> None:
+        """Copy the position and size of ``layout_box`` onto ``gui_node``."""
+
+        gui_node.x = int(getattr(layout_box, "x", 0) or 0)
+        gui_node.y = int(getattr(layout_box, "y", 0) or 0)
+        gui_node.width = int(getattr(layout_box, "width", 0) or 0)
+        gui_node.height = int(getattr(layout_box, "height", 0) or 0)
+
     def _extract_text(self, component: Component) -> str | None:
         """Derive a human-readable text snippet from component content."""
 
@@ -388,6 +668,24 @@ class OrnataRuntime:
         )
 
 
+def _changed_keys(patches: list[Patch]) -> set[str]:
+    """Return the keys of nodes whose props changed or that were added."""
+
+    changed: set[str] = set()
+    for patch in patches:
+        if patch.patch_type is PatchType.UPDATE_PROPS and patch.key is not None:
+            changed.add(patch.key)
+        elif patch.patch_type is PatchType.ADD_NODE and patch.data is not None:
+            stack = [patch.data]
+            while stack:
+                node = stack.pop()
+                if node.key is not None:
+                    changed.add(node.key)
+                stack.extend(node.children)
+    return changed
+
+
 __all__ = [
+    "FrameStats",
     "OrnataRuntime",
 ]
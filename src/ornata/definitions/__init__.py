@@ -348,7 +348,7 @@ from .errors import (
     VersionCompatibilityError,
     WindowCreationError,
 )
-from .flags import RenderCapability
+from .flags import CellAttribute, RenderCapability
 from .protocols import (
     BackendSelector,
     BootstrapPhase,
@@ -367,6 +367,7 @@ from .protocols import (
     RenderCallback,
     ResolvedStyleProtocol,
     ResponsiveBreakpoint,
+    RowProvider,
     SubsystemRegistry,
     WindowManagerProtocol,
 )
@@ -882,6 +883,7 @@ __all__ = [
     "EventQueueOverflowError",
 
     # Flags
+    "CellAttribute",
     "RenderCapability",
 
     # Protocols
@@ -904,6 +906,7 @@ __all__ = [
     "SubsystemRegistry",
     "HostObjectProtocol",
     "ComponentFactory",
+    "RowProvider",
 
     # Type Aliases
     "Vector2",
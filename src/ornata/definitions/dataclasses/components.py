@@ -13,6 +13,7 @@ if TYPE_CHECKING:
     from ornata.definitions.dataclasses.layout import LayoutStyle
     from ornata.definitions.dataclasses.styling import Property, Span
     from ornata.definitions.protocols import ComponentFactory
+    from ornata.layout.scrolling.virtual_table import VirtualTable
 
 # Forward declaration for recursive type hints
 ComponentEventHandler = Any 
@@ -293,6 +294,7 @@ class Component:
     items: list[Any] = field(default_factory=list)
     columns: list[str] = field(default_factory=list)
     rows: list[list[Any]] = field(default_factory=list)
+    virtual_rows: VirtualTable | None = None
     selection: list[int] = field(default_factory=list)
     selection_mode: str | None = None
     sorting: str | None = None
@@ -415,6 +417,7 @@ class Component:
     def _estimate_text_metrics(self) -> tuple[float, float]:
         """Estimate width/height metrics from textual content."""
         from ornata.definitions.constants import DEFAULT_COMPONENT_HEIGHT, DEFAULT_COMPONENT_WIDTH
+        from ornata.utils.unicode_width import text_width
         lines: list[str] = []
         candidates = [
             self.content.text,
@@ -431,7 +434,7 @@ class Component:
                 lines.extend(paragraph.splitlines() or [paragraph])
         if not lines:
             return DEFAULT_COMPONENT_WIDTH, DEFAULT_COMPONENT_HEIGHT
-        width = max(len(line) for line in lines) or DEFAULT_COMPONENT_WIDTH
+        width = max(text_width(line) for line in lines) or DEFAULT_COMPONENT_WIDTH
         height = max(len(lines), 1)
         return float(width), float(height)
 
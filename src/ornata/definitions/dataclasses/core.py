@@ -58,6 +58,8 @@ class RuntimeFrame:
     layout: LayoutResult
     styles: Mapping[int, ResolvedStyle]
     gui_tree: GuiNode
+    # True when nothing changed since the previous pass and ``gui_tree`` is that pass's tree.
+    unchanged: bool = False
 
 
 @dataclass(slots=True, weakref_slot=True)
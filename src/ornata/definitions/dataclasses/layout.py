@@ -142,6 +142,7 @@ class VirtualScrollConfig:
     overscan: int = 5
     scroll_offset: int = 0
     total_items: int = 0
+    estimated_item_height: int = 1
 
 
 @dataclass(slots=True)
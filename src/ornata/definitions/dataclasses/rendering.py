@@ -14,8 +14,16 @@ from ornata.definitions.enums import BackendTarget, BlendMode, FrameState, Input
 from ornata.definitions.flags import RenderCapability
 
 if TYPE_CHECKING:
+    from numpy import uint8
+    from numpy.typing import NDArray
+
     from ornata.api.exports.events import EventBus
     from ornata.definitions.protocols import LayoutStyleProtocol, ResolvedStyleProtocol
+    from ornata.layout.scrolling.virtual_table import VirtualTable
+
+# Pixel storage of a PixelSurface: rows of RGBA tuples, or a (height, width, 4) uint8 array.
+type PixelRows = list[list[tuple[int, int, int, int]]]
+type PixelArray = NDArray[uint8]
 
 
 @dataclass(slots=True)
@@ -351,8 +359,12 @@ class TextSurface(Surface):
 
 @dataclass(slots=True)
 class PixelSurface(Surface):
-    """Specialized surface for pixel-based rendering."""
-    data: list[list[tuple[int, int, int, int]]] | None = None
+    """Specialized surface for pixel-based rendering.
+
+    ``data`` holds rows of RGBA tuples, or a ``uint8`` NumPy array of shape
+    ``(height, width, 4)`` when produced by the vectorized compositor.
+    """
+    data: PixelRows | PixelArray | None = None
 
     def __post_init__(self) -> None:
         if self.data is None:
@@ -361,22 +373,28 @@ class PixelSurface(Surface):
     def set_pixel(self, x: int, y: int, color: tuple[int, int, int, int]) -> None:
         if self.data is None:
             self.__post_init__()
-        if self.data and 0 <= x < self.width and 0 <= y < self.height:
+        if self.data is not None and len(self.data) and 0 <= x < self.width and 0 <= y < self.height:
             self.data[y][x] = color
             self.mark_dirty(x, y, 1, 1)
 
     def get_pixel(self, x: int, y: int) -> tuple[int, int, int, int]:
         if self.data is None or not (0 <= x < self.width and 0 <= y < self.height):
             return (0, 0, 0, 0)
-        return self.data[y][x]
+        pixel = self.data[y][x]
+        if isinstance(pixel, tuple):
+            return pixel
+        red, green, blue, alpha = (int(channel) for channel in pixel)
+        return (red, green, blue, alpha)
 
     def fill(self, color: tuple[int, int, int, int]) -> None:
         if self.data is None:
             self.__post_init__()
-        if self.data:
+        if isinstance(self.data, list):
             for y in range(self.height):
                 for x in range(self.width):
                     self.data[y][x] = color
+        elif self.data is not None:
+            self.data[...] = color
         self.mark_all_dirty()
 
 
@@ -512,6 +530,7 @@ class GuiNode:
     items: list[Any] = field(default_factory=list)
     columns: list[str] = field(default_factory=list)
     rows: list[list[Any]] = field(default_factory=list)
+    virtual_rows: VirtualTable | None = None
     selection: list[int] = field(default_factory=list)
     selection_mode: str | None = None
     sorting: str | None = None
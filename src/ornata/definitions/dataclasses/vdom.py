@@ -12,7 +12,7 @@ from ornata.definitions.enums import BackendTarget, PatchType
 from ornata.definitions.errors import ComponentNotFoundError, InvalidVDOMOperationError
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
 
     from ornata.definitions.dataclasses.components import Component
 
@@ -98,14 +98,21 @@ class VDOMTree:
     _host_factory: Callable[[VDOMNode], Any] | None = field(default=None, init=False, repr=False)
     _host_apply_props: Callable[[Any, dict[str, Any]], None] | None = field(default=None, init=False, repr=False)
     _host_move: Callable[[Any, int], None] | None = field(default=None, init=False, repr=False)
+    _component_keys: Mapping[int, str] = field(default_factory=dict, init=False, repr=False)
 
-    def update_component(self, key: str, new_component: Component) -> list[Patch]:
+    def update_component(self, key: str, new_component: Component, *, keys: Mapping[int, str] | None = None) -> list[Patch]:
+        """Reconcile the subtree under ``key`` against ``new_component``.
+
+        ``keys`` maps ``id(component)`` to the VDOM key of components that
+        should not carry their key themselves; see :meth:`add_component`.
+        """
         with self._lock:
             if key not in self.key_map:
                 raise ComponentNotFoundError(f"Component with key '{key}' not found")
             old_node = self.key_map[key]
-            new_node = self._component_to_node(
+            new_node = self._build_with_keys(
                 new_component,
+                keys,
                 parent_key=old_node.parent_key,
                 position=old_node.child_index,
             )
@@ -115,9 +122,15 @@ class VDOMTree:
             self._component_refs[key] = new_component
             return patches
 
-    def add_component(self, component: Component, key: str | None = None) -> str:
+    def add_component(self, component: Component, key: str | None = None, *, keys: Mapping[int, str] | None = None) -> str:
+        """Mount ``component`` as a root subtree and return its key.
+
+        ``keys`` maps ``id(component)`` to the VDOM key of components in the
+        subtree. Mapped components are keyed without writing to their
+        ``key`` attribute; the others get a key assigned as usual.
+        """
         with self._lock:
-            node = self._component_to_node(component, parent_key=None, position=0)
+            node = self._build_with_keys(component, keys, parent_key=None, position=0)
             if key is None:
                 key = node.key or self._generate_key()
             elif key in self.key_map:
@@ -288,6 +301,22 @@ class VDOMTree:
             self._bubble_hashes(node)
             self._mark_node_dirty(node)
 
+    def _build_with_keys(
+        self,
+        component: Component,
+        keys: Mapping[int, str] | None,
+        *,
+        parent_key: str | None,
+        position: int,
+    ) -> VDOMNode:
+        if not keys:
+            return self._component_to_node(component, parent_key=parent_key, position=position)
+        self._component_keys = keys
+        try:
+            return self._component_to_node(component, parent_key=parent_key, position=position)
+        finally:
+            self._component_keys = {}
+
     def _component_to_node(
         self,
         component: Component,
@@ -365,6 +394,9 @@ class VDOMTree:
         )
 
     def _ensure_component_key(self, component: Component) -> str:
+        mapped = self._component_keys.get(id(component))
+        if mapped is not None:
+            return mapped
         key_value = getattr(component, "key", None)
         if isinstance(key_value, str) and key_value:
             return key_value
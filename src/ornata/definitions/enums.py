@@ -331,6 +331,7 @@ class EventType(Enum):
     MOUSE_UP = "mouse_up"
     MOUSE_MOVE = "mouse_move"
     MOUSE_WHEEL = "mouse_wheel"
+    PASTE = "paste"
     WINDOW_RESIZE = "window_resize"
     WINDOW_CLOSE = "window_close"
     WINDOW_FOCUS = "window_focus"
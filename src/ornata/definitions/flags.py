@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from enum import Flag, auto
+from enum import Flag, IntFlag, auto
 
 
 class RenderCapability(Flag):
@@ -21,6 +21,19 @@ class RenderCapability(Flag):
     EMOJI = auto()
     CUSTOM_FONTS = auto()
 
+
+class CellAttribute(IntFlag):
+    """Text attribute bits packed into a single byte per terminal cell."""
+    NONE = 0
+    BOLD = auto()
+    DIM = auto()
+    ITALIC = auto()
+    UNDERLINE = auto()
+    BLINK = auto()
+    REVERSE = auto()
+    STRIKETHROUGH = auto()
+
 __all__ = [
-    "RenderCapability"
+    "CellAttribute",
+    "RenderCapability",
 ]
\ No newline at end of file
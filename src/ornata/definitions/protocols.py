@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Iterator
+    from collections.abc import Iterable, Iterator, Sequence
 
     from ornata.definitions.dataclasses.components import Component
     from ornata.definitions.dataclasses.events import Event
@@ -153,6 +153,12 @@ class ComponentFactory(Protocol):
     def __call__(self, props: dict[str, Any] | None = None) -> Component: ...
 
 
+@runtime_checkable
+class RowProvider(Protocol):
+    def __len__(self) -> int: ...
+    def fetch(self, start: int, stop: int) -> Sequence[Sequence[Any]]: ...
+
+
 @runtime_checkable
 class HostObjectProtocol(Protocol):
     @property
@@ -198,4 +204,5 @@ __all__ = [
     "SubsystemRegistry",
     "HostObjectProtocol",
     "ComponentFactory",
+    "RowProvider",
 ]
\ No newline at end of file
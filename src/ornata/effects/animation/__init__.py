@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from . import coordinator, easing, effects, engine, events, interfaces, keyframes, optimization, timeline
+from . import coordinator, easing, effects, engine, events, interfaces, keyframes, optimization, timeline, tracks
 from .coordinator import (
     AnimationCoordinator,
     AnimationSequence,
 )
 from .easing import (
+    EASING_LUT_SIZE,
     ease_in_back,
     ease_in_bounce,
     ease_in_circ,
@@ -35,7 +36,10 @@ from .easing import (
     ease_out_quad,
     ease_out_quart,
     ease_out_sine,
+    easing_lut,
+    easing_table,
     linear_easing,
+    sample_lut,
 )
 from .effects import (
     FadeInAnimation,
@@ -67,8 +71,10 @@ from .interfaces import (
 from .keyframes import Animation
 from .optimization import AnimationBatcher, AnimationOptimizer
 from .timeline import AnimationScheduler, Timeline
+from .tracks import AnimationTracks
 
 __all__ = [
+    "EASING_LUT_SIZE",
     "Animation",
     "AnimationBatcher",
     "AnimationCoordinator",
@@ -77,6 +83,7 @@ __all__ = [
     "AnimationOptimizer",
     "AnimationScheduler",
     "AnimationSequence",
+    "AnimationTracks",
     "FadeInAnimation",
     "GradientPulseAnimation",
     "ParticleTrailAnimation",
@@ -118,6 +125,8 @@ __all__ = [
     "ease_out_quart",
     "ease_out_sine",
     "easing",
+    "easing_lut",
+    "easing_table",
     "effects",
     "engine",
     "events",
@@ -130,8 +139,10 @@ __all__ = [
     "optimization",
     "pause_animation",
     "resume_animation",
+    "sample_lut",
     "start_animation",
     "stop_animation",
     "timeline",
+    "tracks",
     "update_animations",
 ]
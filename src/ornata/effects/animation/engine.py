@@ -6,18 +6,26 @@ from typing import TYPE_CHECKING
 
 from ornata.api.exports.utils import get_logger
 from ornata.effects.animation.timeline import Timeline
+from ornata.effects.animation.tracks import AnimationTracks
 
 if TYPE_CHECKING:
+    from ornata.api.exports.definitions import Patch
     from ornata.effects.animation.keyframes import Animation
 
 logger = get_logger(__name__)
 
 
 class AnimationEngine:
-    """Engine for managing component animations."""
+    """Engine for managing component animations.
+
+    Attributes:
+        tracks: Batched property tracks advanced with the animations; add
+            bulk transitions here rather than as individual animations.
+    """
 
     def __init__(self) -> None:
         """Initialize the animation engine."""
+        self.tracks = AnimationTracks()
         self._active_animations: dict[str, Animation] = {}
         self._timelines: dict[str, Timeline] = {}
         self._lock = threading.RLock()
@@ -82,13 +90,18 @@ class AnimationEngine:
         with self._lock:
             return list(self._active_animations.values())
 
-    def update_animations(self, delta_time: float) -> None:
-        """Update all active animations.
+    def update_animations(self, delta_time: float) -> list[Patch]:
+        """Update all active animations and batched tracks.
 
         Args:
             delta_time: Time elapsed since last update.
+
+        Returns:
+            Property patches for the track values that changed.
         """
         with self._lock:
+            patches = self.tracks.update(delta_time)
+
             completed: list[str] = []
             for animation_id, animation in self._active_animations.items():
                 animation.update(delta_time)
@@ -99,6 +112,7 @@ class AnimationEngine:
             for animation_id in completed:
                 del self._active_animations[animation_id]
                 logger.debug(f"Completed animation {animation_id}")
+            return patches
 
     def create_timeline(self, timeline_id: str) -> Timeline:
         """Create a new animation timeline.
@@ -7,7 +7,7 @@ from ornata.api.exports.utils import get_logger
 if TYPE_CHECKING:
     from collections.abc import Callable
 
-    from ornata.api.exports.definitions import AnimationDirection, Component, Keyframe
+    from ornata.api.exports.definitions import AnimationDirection, Component, Keyframe, Patch
     from ornata.effects.animation.engine import AnimationEngine
     from ornata.effects.animation.keyframes import Animation
     from ornata.effects.animation.timeline import Timeline
@@ -109,14 +109,17 @@ def get_active_animations() -> list[Animation]:
     return engine.get_active_animations()
 
 
-def update_animations(delta_time: float) -> None:
+def update_animations(delta_time: float) -> list[Patch]:
     """Update all active animations.
 
     Args:
         delta_time: Time elapsed since last update.
+
+    Returns:
+        Property patches emitted by the engine's batched tracks.
     """
     engine = _get_animation_engine()
-    engine.update_animations(delta_time)
+    return engine.update_animations(delta_time)
 
 
 def start_animation(animation: Animation) -> str:
@@ -0,0 +1,373 @@
+"""Batched animation of numeric style properties stored as parallel arrays."""
+
+from __future__ import annotations
+
+import math
+from array import array
+from typing import TYPE_CHECKING, Any
+
+from ornata.api.exports.definitions import AnimationDirection, Patch
+from ornata.api.exports.utils import get_logger
+from ornata.effects.animation.easing import EASING_LUT_SIZE, easing_table, linear_easing, sample_lut
+
+if TYPE_CHECKING:
+    from collections.abc import MutableSequence, Sequence
+
+    from ornata.effects.animation.easing import EasingFunction
+    from ornata.effects.animation.keyframes import Animation
+
+logger = get_logger(__name__)
+
+# Per-track flag bits.
+_LOOP = 1
+_REVERSE = 2
+_ALTERNATE = 4
+
+_DIRECTION_FLAGS = {
+    AnimationDirection.NORMAL: 0,
+    AnimationDirection.REVERSE: _REVERSE,
+    AnimationDirection.ALTERNATE: _ALTERNATE,
+    AnimationDirection.ALTERNATE_REVERSE: _ALTERNATE | _REVERSE,
+}
+
+
+class AnimationTracks:
+    """Active property animations advanced together in one pass per frame.
+
+    Each track animates one numeric property of one component from keyframe
+    stops over a duration. Timing, endpoints and the last emitted value live
+    in parallel ``array`` columns indexed by slot, and easing curves are read
+    from shared lookup tables built by :func:`easing_lut`, so a frame costs a
+    tight loop over the columns with one :func:`sample_lut` per track instead
+    of a method call, a lock and an analytic easing evaluation per animation.
+    Curves a table cannot follow closely are evaluated directly (see
+    :func:`easing_table`).
+
+    :meth:`update` returns one ``UPDATE_PROPS`` patch per component whose
+    properties moved by more than ``tolerance`` since they were last emitted;
+    settled or delayed tracks produce nothing. Starting a track on a
+    component property that is already animating replaces the old track.
+
+    The class is not synchronized; :class:`AnimationEngine` calls it under
+    its own lock.
+    """
+
+    __slots__ = (
+        "tolerance",
+        "lut_size",
+        "_elapsed",
+        "_duration",
+        "_delay",
+        "_start",
+        "_end",
+        "_last",
+        "_flags",
+        "_tables",
+        "_easings",
+        "_stops",
+        "_keys",
+        "_props",
+        "_ids",
+        "_slots",
+        "_targets",
+        "_next_id",
+    )
+
+    def __init__(self, tolerance: float = 1e-4, lut_size: int = EASING_LUT_SIZE) -> None:
+        """Create an empty track set.
+
+        Args:
+            tolerance: Smallest change in a value that is emitted as a patch.
+            lut_size: Samples per easing lookup table.
+        """
+        self.tolerance = tolerance
+        self.lut_size = lut_size
+        self._elapsed = array("d")
+        self._duration = array("d")
+        self._delay = array("d")
+        self._start = array("d")
+        self._end = array("d")
+        self._last = array("d")
+        self._flags = array("b")
+        self._tables: list[array[float] | None] = []
+        self._easings: list[EasingFunction] = []
+        self._stops: list[tuple[tuple[float, float], ...] | None] = []
+        self._keys: list[str] = []
+        self._props: list[str] = []
+        self._ids: list[int] = []
+        self._slots: dict[int, int] = {}
+        self._targets: dict[tuple[str, str], int] = {}
+        self._next_id = 0
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, track_id: object) -> bool:
+        return track_id in self._slots
+
+    # -------------------------------
+    # Adding and removing tracks
+    # -------------------------------
+
+    def add(
+        self,
+        key: str,
+        prop: str,
+        start: float,
+        end: float,
+        duration: float,
+        easing: EasingFunction | None = None,
+        *,
+        delay: float = 0.0,
+        loop: bool = False,
+        direction: AnimationDirection = AnimationDirection.NORMAL,
+    ) -> int:
+        """Animate ``prop`` of the component ``key`` from ``start`` to ``end``.
+
+        Args:
+            key: Component key the emitted patches target.
+            prop: Property name.
+            start: Value at progress 0.
+            end: Value at progress 1.
+            duration: Length of one iteration in seconds.
+            easing: Easing function; linear when omitted.
+            delay: Seconds to wait before the first frame is emitted.
+            loop: Repeat until removed instead of finishing.
+            direction: Playback direction of each iteration.
+
+        Returns:
+            Track ID for :meth:`remove`.
+
+        Raises:
+            ValueError: If ``duration`` is not positive.
+        """
+        return self._insert(key, prop, float(start), float(end), None, duration, easing, delay, loop, direction)
+
+    def add_keyframes(
+        self,
+        key: str,
+        prop: str,
+        stops: Sequence[tuple[float, float]],
+        duration: float,
+        easing: EasingFunction | None = None,
+        *,
+        delay: float = 0.0,
+        loop: bool = False,
+        direction: AnimationDirection = AnimationDirection.NORMAL,
+    ) -> int:
+        """Animate ``prop`` through ``(offset, value)`` stops.
+
+        As in :class:`Animation`, easing is applied to the overall progress
+        before the stops are interpolated. Arguments otherwise match :meth:`add`.
+
+        Raises:
+            ValueError: If ``stops`` is empty or ``duration`` is not positive.
+        """
+        if not stops:
+            raise ValueError("A track needs at least one keyframe stop")
+        ordered = tuple(sorted((float(offset), float(value)) for offset, value in stops))
+        if len(ordered) <= 2 and ordered[0][0] == 0.0 and ordered[-1][0] == 1.0:
+            return self._insert(key, prop, ordered[0][1], ordered[-1][1], None, duration, easing, delay, loop, direction)
+        return self._insert(key, prop, ordered[0][1], ordered[-1][1], ordered, duration, easing, delay, loop, direction)
+
+    def add_animation(self, animation: Animation, key: str | None = None) -> list[int]:
+        """Split a keyframe :class:`Animation` into one track per numeric property.
+
+        Args:
+            animation: Animation to convert; its own state is not touched.
+            key: Component key for the patches; defaults to the component's
+                ``key`` or ``component_name``.
+
+        Returns:
+            IDs of the tracks created.
+
+        Raises:
+            ValueError: If no component key is available.
+        """
+        component = animation.component
+        key = key or component.key or component.component_name
+        if not key:
+            raise ValueError("Animation component has no key to target patches at")
+        stops: dict[str, list[tuple[float, float]]] = {}
+        for keyframe in animation.keyframes:
+            for prop, value in keyframe.properties.items():
+                try:
+                    stops.setdefault(prop, []).append((keyframe.offset, float(value)))
+                except (TypeError, ValueError):
+                    logger.debug(f"Skipping non-numeric property {prop!r} of animation for {key}")
+        return [
+            self.add_keyframes(key, prop, prop_stops, animation.duration, animation.easing, loop=animation.loop, direction=animation.direction)
+            for prop, prop_stops in stops.items()
+        ]
+
+    def _insert(
+        self,
+        key: str,
+        prop: str,
+        start: float,
+        end: float,
+        stops: tuple[tuple[float, float], ...] | None,
+        duration: float,
+        easing: EasingFunction | None,
+        delay: float,
+        loop: bool,
+        direction: AnimationDirection,
+    ) -> int:
+        if duration <= 0:
+            raise ValueError("duration must be positive")
+        previous = self._targets.get((key, prop))
+        if previous is not None:
+            self.remove(previous)
+
+        track_id = self._next_id
+        self._next_id += 1
+        self._slots[track_id] = len(self._ids)
+        self._targets[(key, prop)] = track_id
+        self._ids.append(track_id)
+        self._keys.append(key)
+        self._props.append(prop)
+        self._elapsed.append(0.0)
+        self._duration.append(float(duration))
+        self._delay.append(max(0.0, float(delay)))
+        self._start.append(start)
+        self._end.append(end)
+        self._last.append(math.nan)
+        self._flags.append((_LOOP if loop else 0) | _DIRECTION_FLAGS[direction])
+        easing = easing or linear_easing
+        self._tables.append(easing_table(easing, self.lut_size))
+        self._easings.append(easing)
+        self._stops.append(stops)
+        return track_id
+
+    def remove(self, track_id: int) -> bool:
+        """Drop a track without emitting anything; return whether it existed."""
+        slot = self._slots.pop(track_id, None)
+        if slot is None:
+            return False
+        target = (self._keys[slot], self._props[slot])
+        if self._targets.get(target) == track_id:
+            del self._targets[target]
+
+        # Swap-remove: the last track takes over the freed slot.
+        last = len(self._ids) - 1
+        if slot != last:
+            moved = self._ids[last]
+            self._slots[moved] = slot
+            for column in self._columns():
+                column[slot] = column[last]
+        for column in self._columns():
+            column.pop()
+        return True
+
+    def cancel(self, key: str, prop: str | None = None) -> int:
+        """Remove the tracks of component ``key``, or only its ``prop`` track.
+
+        Returns:
+            Number of tracks removed.
+        """
+        if prop is not None:
+            track_id = self._targets.get((key, prop))
+            return int(track_id is not None and self.remove(track_id))
+        doomed = [track_id for (target_key, _), track_id in self._targets.items() if target_key == key]
+        for track_id in doomed:
+            self.remove(track_id)
+        return len(doomed)
+
+    def clear(self) -> None:
+        """Remove every track."""
+        for column in self._columns():
+            del column[:]
+        self._slots.clear()
+        self._targets.clear()
+
+    def _columns(self) -> tuple[MutableSequence[Any], ...]:
+        return (
+            self._elapsed,
+            self._duration,
+            self._delay,
+            self._start,
+            self._end,
+            self._last,
+            self._flags,
+            self._tables,
+            self._easings,
+            self._stops,
+            self._keys,
+            self._props,
+            self._ids,
+        )
+
+    # -------------------------------
+    # Frame update
+    # -------------------------------
+
+    def update(self, delta_time: float) -> list[Patch]:
+        """Advance every track by ``delta_time`` and return patches for the values that changed.
+
+        Finished tracks emit their final value and are removed.
+
+        Returns:
+            One ``UPDATE_PROPS`` patch per component with changed properties.
+        """
+        elapsed_column = self._elapsed
+        durations, delays, flags = self._duration, self._delay, self._flags
+        starts, ends, last_values = self._start, self._end, self._last
+        tables, easings, all_stops, keys, props = self._tables, self._easings, self._stops, self._keys, self._props
+        tolerance = self.tolerance
+        changes: dict[str, dict[str, float]] = {}
+        finished: list[int] = []
+
+        for slot in range(len(elapsed_column)):
+            elapsed = elapsed_column[slot] + delta_time
+            elapsed_column[slot] = elapsed
+            local = elapsed - delays[slot]
+            if local < 0.0:
+                continue
+
+            duration = durations[slot]
+            flag = flags[slot]
+            if local >= duration and not flag & _LOOP:
+                cycle, t = 0, 1.0
+                finished.append(slot)
+            else:
+                cycle = int(local // duration)
+                t = local / duration - cycle
+            if flag & _REVERSE:
+                t = 1.0 - t
+            if flag & _ALTERNATE and cycle & 1:
+                t = 1.0 - t
+
+            table = tables[slot]
+            eased = easings[slot](t) if table is None else sample_lut(table, t)
+
+            stops = all_stops[slot]
+            if stops is None:
+                start = starts[slot]
+                value = start + (ends[slot] - start) * eased
+            else:
+                value = _interpolate_stops(stops, eased)
+
+            if not abs(value - last_values[slot]) <= tolerance:  # NaN on the first frame compares false
+                last_values[slot] = value
+                changes.setdefault(keys[slot], {})[props[slot]] = value
+
+        ids = self._ids
+        for slot in reversed(finished):
+            self.remove(ids[slot])
+        return [Patch.update_props(key, values) for key, values in changes.items()]
+
+
+def _interpolate_stops(stops: tuple[tuple[float, float], ...], progress: float) -> float:
+    """Return the value at ``progress`` between sorted ``(offset, value)`` stops."""
+    first_offset, first_value = stops[0]
+    if progress <= first_offset:
+        return first_value
+    for offset, value in stops[1:]:
+        if progress <= offset:
+            span = offset - first_offset
+            return value if span <= 0.0 else first_value + (value - first_value) * (progress - first_offset) / span
+        first_offset, first_value = offset, value
+    return first_value
+
+
+__all__ = ["AnimationTracks"]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from . import config, effects, emitter, engine, interfaces, optimization, physics, renderer
+from . import config, effects, emitter, engine, interfaces, optimization, physics, renderer, spatial, store, worker
 from .config import ParticleSystemConfig
 from .effects import ParticleEffects
 from .emitter import ParticleEmitter
@@ -20,15 +20,23 @@ from .interfaces import (
 from .optimization import ParticleOptimization
 from .physics import ParticlePhysics
 from .renderer import ParticleRenderer
+from .spatial import GridStats, SpatialHashGrid
+from .store import ParticleStore
+from .worker import ParticleSimulationWorker, ParticleSnapshot
 
 __all__ = [
+    "GridStats",
     "ParticleEffects",
     "ParticleEmitter",
     "ParticleEngine",
     "ParticleOptimization",
     "ParticlePhysics",
     "ParticleRenderer",
+    "ParticleSimulationWorker",
+    "ParticleSnapshot",
+    "ParticleStore",
     "ParticleSystemConfig",
+    "SpatialHashGrid",
     "config",
     "create_particle_effect",
     "destroy_particle_effect",
@@ -44,5 +52,8 @@ __all__ = [
     "physics",
     "render_particles",
     "renderer",
+    "spatial",
+    "store",
     "update_particles",
+    "worker",
 ]
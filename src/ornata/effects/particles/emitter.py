@@ -4,13 +4,17 @@ from __future__ import annotations
 
 import random
 import threading
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from ornata.api.exports.definitions import Particle
 from ornata.api.exports.utils import get_logger
+from ornata.effects.particles.store import ParticleStore
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from ornata.effects.particles.config import ParticleSystemConfig
+    from ornata.effects.particles.physics import ParticlePhysics
 
 logger = get_logger(__name__)
 
@@ -24,7 +28,7 @@ class ParticleEmitter:
 
     Attributes:
         config: Particle system configuration
-        particles: List of active particles
+        store: Column storage holding the active particles
     """
 
     def __init__(self, config: ParticleSystemConfig) -> None:
@@ -34,7 +38,7 @@ class ParticleEmitter:
             config: Configuration for the particle system.
         """
         self.config = config
-        self.particles: list[Particle] = []
+        self.store = ParticleStore(capacity=min(config.max_particles, 4096))
         self._lock = threading.RLock()
         self._active = True
         self._time_accumulator = 0.0
@@ -42,11 +46,19 @@ class ParticleEmitter:
         logger.debug(f"Initialized particle emitter with config: position={config.position}, "
                     f"emission_rate={config.emission_rate}, max_particles={config.max_particles}")
 
-    def update(self, delta_time: float) -> None:
+    @property
+    def particles(self) -> list[Particle]:
+        """Snapshot of the active particles as :class:`Particle` objects."""
+        with self._lock:
+            return self.store.to_particles()
+
+    def update(self, delta_time: float, physics: ParticlePhysics | None = None) -> None:
         """Update the emitter and its particles.
 
         Args:
             delta_time: Time elapsed since last update in seconds.
+            physics: Physics that moves the particles; without it they drift
+                at their own velocity.
         """
         with self._lock:
             if not self._active:
@@ -57,24 +69,19 @@ class ParticleEmitter:
             particles_to_emit = int(self._time_accumulator * self.config.emission_rate)
             self._time_accumulator -= particles_to_emit / self.config.emission_rate
 
-            for _ in range(particles_to_emit):
-                if len(self.particles) < self.config.max_particles:
-                    self._emit_particle()
+            for _ in range(min(particles_to_emit, self.config.max_particles - len(self.store))):
+                self._emit_particle()
 
-            # Update existing particles
-            alive_particles: list[Particle] = []
-            for particle in self.particles:
-                particle.life -= delta_time
-                if particle.life > 0:
-                    # Update physics (basic integration, physics system handles complex forces)
-                    particle.x += particle.vx * delta_time
-                    particle.y += particle.vy * delta_time
-                    particle.rotation += particle.rotation_speed * delta_time
-                    alive_particles.append(particle)
+            # Age particles, drop the dead ones, then move the survivors
+            store = self.store
+            store.age(delta_time)
+            store.compact()
+            if physics is not None:
+                physics.apply_physics(store, delta_time)
+            else:
+                store.integrate(delta_time)
 
-            self.particles = alive_particles
-
-            logger.debug(f"Updated {len(self.particles)} particles, emitted {particles_to_emit} new particles")
+            logger.debug(f"Updated {len(store)} particles, emitted {particles_to_emit} new particles")
 
     def _emit_particle(self) -> None:
         """Emit a single particle with configured properties and variations."""
@@ -100,21 +107,41 @@ class ParticleEmitter:
         # Calculate rotation speed with variation
         rotation_speed = self.config.rotation_speed + random.uniform(-self.config.rotation_variation, self.config.rotation_variation)
 
-        particle = Particle(
-            x=self.config.position[0],
-            y=self.config.position[1],
-            vx=vx,
-            vy=vy,
-            life=self.config.lifetime,
-            max_life=self.config.lifetime,
+        x, y = self.config.position
+        self.store.add(
+            x,
+            y,
+            vx,
+            vy,
+            self.config.lifetime,
             size=size,
             color=color,
-            rotation=0.0,
             rotation_speed=rotation_speed,
         )
 
-        self.particles.append(particle)
-        logger.debug(f"Emitted particle at ({particle.x}, {particle.y}) with velocity ({vx}, {vy})")
+    def copy_into(
+        self,
+        targets: dict[str, Any],
+        offset: int,
+        reserve: Callable[[int], dict[str, Any]] | None = None,
+    ) -> int:
+        """Copy the particle columns into ``targets`` at ``offset`` under the emitter lock.
+
+        Args:
+            targets: Column name to preallocated float buffer.
+            offset: First index written in every buffer.
+            reserve: Called under the lock with ``offset`` plus the particle
+                count; returns the buffers to copy into instead of ``targets``.
+                Lets the caller size its buffers for particles emitted from
+                other threads since it last counted.
+
+        Returns:
+            Number of particles copied.
+        """
+        with self._lock:
+            if reserve is not None:
+                targets = reserve(offset + len(self.store))
+            return self.store.copy_into(targets, offset)
 
     def set_active(self, active: bool) -> None:
         """Set whether the emitter is active.
@@ -129,8 +156,8 @@ class ParticleEmitter:
     def clear_particles(self) -> None:
         """Clear all particles from the emitter."""
         with self._lock:
-            particle_count = len(self.particles)
-            self.particles.clear()
+            particle_count = len(self.store)
+            self.store.clear()
             logger.debug(f"Cleared {particle_count} particles from emitter")
 
     def get_particle_count(self) -> int:
@@ -140,7 +167,7 @@ class ParticleEmitter:
             Number of active particles.
         """
         with self._lock:
-            return len(self.particles)
+            return len(self.store)
 
     def is_active(self) -> bool:
         """Check if the emitter is currently active.
@@ -3,17 +3,18 @@
 from __future__ import annotations
 
 import threading
-import time
 from typing import TYPE_CHECKING
 
 from ornata.api.exports.definitions import RenderOutput
 from ornata.api.exports.utils import get_logger
 from ornata.effects.particles.emitter import ParticleEmitter
+from ornata.effects.particles.physics import ParticlePhysics
 
 if TYPE_CHECKING:
     from ornata.definitions.enums import BackendTarget
     from ornata.effects.particles.config import ParticleSystemConfig
     from ornata.effects.particles.emitter import Particle
+    from ornata.effects.particles.worker import ParticleSimulationWorker
 
 logger = get_logger(__name__)
 
@@ -29,11 +30,11 @@ class ParticleEngine:
     def __init__(self) -> None:
         """Initialize the particle engine with thread-safe operations."""
         self._systems: dict[str, ParticleEmitter] = {}
-        self._physics: dict[str, ParticleEmitter] = {}  # Maps to same emitter for now
+        self._physics: dict[str, ParticlePhysics] = {}
         self._renderer = None  # Lazy initialization
         self._lock = threading.RLock()
         self._running = False
-        self._update_thread: threading.Thread | None = None
+        self._worker: ParticleSimulationWorker | None = None
         self._system_counter = 0
 
         logger.debug("Initialized particle engine")
@@ -61,8 +62,7 @@ class ParticleEngine:
                 # Create particle emitter with configuration
                 emitter = ParticleEmitter(config)
                 self._systems[system_id] = emitter
-
-                # Physics is applied during update, not stored separately
+                self._physics[system_id] = ParticlePhysics(config.physics)
 
                 logger.debug(f"Created particle system: {system_id} at position {config.position}")
                 return system_id
@@ -97,37 +97,40 @@ class ParticleEngine:
     def update_systems(self, delta_time: float) -> None:
         """Update all active particle systems with physics simulation.
 
+        The engine lock is only held to snapshot the systems; each emitter
+        is then stepped under its own lock, so creating or rendering
+        systems does not wait for the simulation.
+
         Args:
             delta_time: Time elapsed since last update in seconds.
         """
-        from ornata.effects.particles.physics import ParticlePhysics
-
         with self._lock:
-            updated_systems = 0
-            total_particles = 0
-
-            for system_id, emitter in self._systems.items():
-                try:
-                    # Update emitter (particle emission and lifecycle)
-                    emitter.update(delta_time)
+            systems = [(system_id, emitter, self._physics.get(system_id)) for system_id, emitter in self._systems.items()]
 
-                    # Apply physics to particles using the emitter's config
-                    physics = ParticlePhysics(emitter.config.physics)
-                    physics.apply_physics(emitter.particles, delta_time)
+        updated_systems = 0
+        total_particles = 0
+        for system_id, emitter, physics in systems:
+            try:
+                # Emission, lifecycle and physics in one pass over the emitter's store
+                emitter.update(delta_time, physics)
 
-                    particle_count = emitter.get_particle_count()
-                    total_particles += particle_count
-                    updated_systems += 1
+                particle_count = emitter.get_particle_count()
+                total_particles += particle_count
+                updated_systems += 1
 
-                    logger.debug(f"Updated particle system {system_id} with {particle_count} particles")
-                except Exception as e:
-                    logger.warning(f"Failed to update particle system {system_id}: {e}")
+                logger.debug(f"Updated particle system {system_id} with {particle_count} particles")
+            except Exception as e:
+                logger.warning(f"Failed to update particle system {system_id}: {e}")
 
-            logger.debug(f"Updated {updated_systems} systems with {total_particles} total particles")
+        logger.debug(f"Updated {updated_systems} systems with {total_particles} total particles")
 
     def render_particles(self, backend_target: BackendTarget) -> RenderOutput:
         """Render all active particle systems using the specified renderer.
 
+        While the auto-update worker runs, particles come from its latest
+        snapshot, interpolated to the current time, and no engine or
+        emitter lock is taken.
+
         Args:
             backend_target: Target backend for output.
 
@@ -140,19 +143,35 @@ class ParticleEngine:
             # Lazy initialize renderer
             if self._renderer is None:
                 self._renderer = ParticleRenderer()
-
-            all_particles: list[Particle] = []
-            for emitter in self._systems.values():
+            renderer = self._renderer
+            worker = self._worker
+
+        all_particles: list[Particle] = []
+        if worker is not None:
+            with worker.read() as snapshot:
+                if snapshot is not None:
+                    all_particles = snapshot.particles(snapshot.alpha())
+        else:
+            for _, emitter in self.systems():
                 all_particles.extend(emitter.particles)
 
-            if all_particles:
-                output = self._renderer.render_particles(all_particles, backend_target)
-                logger.debug(f"Rendered {len(all_particles)} particles across {len(self._systems)} systems to {backend_target.value}")
-                return output
-            else:
-                logger.debug("No particles to render")
-                # Return empty render output
-                return RenderOutput(content="", backend_target=backend_target.value, metadata={"particle_count": 0})
+        if all_particles:
+            output = renderer.render_particles(all_particles, backend_target)
+            logger.debug(f"Rendered {len(all_particles)} particles to {backend_target.value}")
+            return output
+        else:
+            logger.debug("No particles to render")
+            # Return empty render output
+            return RenderOutput(content="", backend_target=backend_target.value, metadata={"particle_count": 0})
+
+    def systems(self) -> list[tuple[str, ParticleEmitter]]:
+        """Return the current ``(system_id, emitter)`` pairs.
+
+        Returns:
+            A list copied under the engine lock, safe to iterate without it.
+        """
+        with self._lock:
+            return list(self._systems.items())
 
     def get_system(self, system_id: str) -> ParticleEmitter | None:
         """Get a particle system by ID.
@@ -167,39 +186,25 @@ class ParticleEngine:
             return self._systems.get(system_id)
 
     def start_auto_update(self, update_rate: float = 60.0) -> None:
-        """Start automatic particle system updates.
+        """Start simulating on a worker thread at a fixed rate.
 
         Args:
-            update_rate: Updates per second.
+            update_rate: Fixed simulation steps per second.
         """
-        if self._running:
-            return
+        from ornata.effects.particles.worker import ParticleSimulationWorker
 
-        self._running = True
-        self._update_thread = threading.Thread(target=self._auto_update_loop, args=(update_rate,), daemon=True)
-        self._update_thread.start()
-        logger.debug(f"Started auto-update loop at {update_rate} FPS")
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._worker = ParticleSimulationWorker(self, step=1.0 / update_rate)
+            worker = self._worker
+        worker.start()
 
     def stop_auto_update(self) -> None:
-        """Stop automatic particle system updates."""
-        self._running = False
-        if self._update_thread:
-            self._update_thread.join(timeout=1.0)
-            self._update_thread = None
-        logger.debug("Stopped auto-update loop")
-
-    def _auto_update_loop(self, update_rate: float) -> None:
-        """Main update loop for automatic particle updates."""
-        frame_time = 1.0 / update_rate
-        last_time = time.perf_counter()
-
-        while self._running:
-            current_time = time.perf_counter()
-            delta_time = current_time - last_time
-            last_time = current_time
-
-            self.update_systems(delta_time)
-
-            # Sleep to maintain frame rate
-            sleep_time = max(0, frame_time - (time.perf_counter() - current_time))
-            time.sleep(sleep_time)
+        """Stop the simulation worker."""
+        with self._lock:
+            self._running = False
+            worker, self._worker = self._worker, None
+        if worker is not None:
+            worker.stop()
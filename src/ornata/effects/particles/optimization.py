@@ -11,6 +11,8 @@ from ornata.api.exports.utils import get_logger
 if TYPE_CHECKING:
     from ornata.effects.particles.config import ParticleSystemConfig
     from ornata.effects.particles.emitter import Particle
+    from ornata.effects.particles.spatial import SpatialHashGrid
+    from ornata.effects.particles.store import ParticleStore
 
 logger = get_logger(__name__)
 
@@ -148,6 +150,35 @@ class ParticleOptimization:
 
             return visible
 
+    def cull_store(self, store: ParticleStore, viewport: tuple[float, float, float, float], grid: SpatialHashGrid | None = None) -> list[int]:
+        """Find the particles of a store that lie inside the viewport.
+
+        Args:
+            store: Particle store to cull.
+            viewport: Viewport rectangle as (x, y, width, height).
+            grid: Spatial grid over ``store``; when given, only the cells
+                overlapping the viewport are visited.
+
+        Returns:
+            Sorted slot indices of the visible particles.
+        """
+        with self._lock:
+            start_time = time.perf_counter()
+
+            if grid is not None:
+                visible = grid.query_rect(store, viewport)
+            else:
+                vx, vy, vw, vh = viewport
+                visible = [
+                    slot
+                    for slot, (x, y) in enumerate(zip(store.column("x"), store.column("y"), strict=True))
+                    if vx <= x <= vx + vw and vy <= y <= vy + vh
+                ]
+
+            self._performance_stats["particles_culled"] += len(store) - len(visible)
+            self._performance_stats["total_time_spent"] += time.perf_counter() - start_time
+            return visible
+
     def optimize_physics(self, particles: list[Particle], delta_time: float) -> None:
         """Optimize physics calculations for multiple particles using grouping.
 
@@ -7,6 +7,8 @@ import threading
 from typing import TYPE_CHECKING, Any
 
 from ornata.api.exports.utils import get_logger
+from ornata.effects.particles.spatial import SpatialHashGrid
+from ornata.effects.particles.store import ParticleStore
 
 if TYPE_CHECKING:
     from ornata.effects.particles.emitter import Particle
@@ -21,6 +23,9 @@ class ParticlePhysics:
     handling damping and friction, and managing boundary conditions including bouncing
     and wrap-around behavior.
 
+    Every method accepts either a list of :class:`Particle` objects or a
+    :class:`ParticleStore`; stores are updated with whole-column kernels.
+
     Attributes:
         gravity: Gravity force vector (gx, gy) in units per second squared.
         damping: Velocity damping factor (0-1, where 1 is full damping).
@@ -28,6 +33,9 @@ class ParticlePhysics:
         friction: Friction coefficient applied during boundary collisions (0-1).
         bounds: Boundary rectangle as (x, y, width, height) or None for no bounds.
         wrap_around: Whether particles wrap around boundaries instead of bouncing.
+        collision_radius: Radius of particle-particle collisions, 0 to disable.
+        restitution: Fraction of approach speed kept after a particle collision.
+        grid: Spatial index used for collisions and radius-limited forces.
     """
 
     def __init__(self, config: dict[str, Any]) -> None:
@@ -41,6 +49,10 @@ class ParticlePhysics:
                 - friction: float - Friction coefficient (default: 0.0)
                 - bounds: (float, float, float, float) - Boundary rectangle (default: None)
                 - wrap_around: bool - Wrap around boundaries (default: False)
+                - collision_radius: float - Particle collision radius (default: 0.0)
+                - restitution: float - Collision restitution (default: 1.0)
+                - grid_cell_size: float - Spatial grid cell size (default: twice
+                  the collision radius, or the first force radius used)
         """
         self.config = config
         self._lock = threading.RLock()
@@ -55,20 +67,29 @@ class ParticlePhysics:
         self.bounds = config.get("bounds", None)  # (x, y, width, height)
         self.wrap_around = config.get("wrap_around", False)
 
+        # Particle-particle collisions and localized forces share one spatial grid
+        self.collision_radius = config.get("collision_radius", 0.0)
+        self.restitution = config.get("restitution", 1.0)
+        cell_size = config.get("grid_cell_size") or 2.0 * self.collision_radius
+        self.grid: SpatialHashGrid | None = SpatialHashGrid(cell_size) if cell_size > 0 else None
+
         logger.debug(f"Initialized particle physics: gravity={self.gravity}, damping={self.damping}, "
                     f"bounce={self.bounce}, bounds={self.bounds}, wrap_around={self.wrap_around}")
 
-    def apply_physics(self, particles: list[Particle], delta_time: float) -> None:
+    def apply_physics(self, particles: list[Particle] | ParticleStore, delta_time: float) -> None:
         """Apply physics simulation to a list of particles.
 
         This method updates particle velocities and positions based on configured
         physics parameters including gravity, damping, and boundary conditions.
 
         Args:
-            particles: List of particles to update with physics.
+            particles: Particles to update with physics.
             delta_time: Time step for simulation in seconds.
         """
         with self._lock:
+            if isinstance(particles, ParticleStore):
+                self._update_store_physics(particles, delta_time)
+                return
             updated_count = 0
             for particle in particles:
                 self._update_particle_physics(particle, delta_time)
@@ -76,6 +97,42 @@ class ParticlePhysics:
 
             logger.debug(f"Applied physics to {updated_count} particles with delta_time={delta_time}")
 
+    def _update_store_physics(self, store: ParticleStore, delta_time: float) -> None:
+        """Run the same steps as :meth:`_update_particle_physics` over a whole store.
+
+        Args:
+            store: Particle store to update.
+            delta_time: Time step in seconds.
+        """
+        store.accelerate(self.gravity[0], self.gravity[1], delta_time)
+        if self.damping > 0:
+            store.scale_velocity((1.0 - self.damping) ** delta_time)
+        store.integrate(delta_time)
+        if self.bounds:
+            if self.wrap_around:
+                store.wrap(self.bounds)
+            else:
+                store.bounce(self.bounds, self.bounce, self.friction)
+        if self.collision_radius > 0 and self.grid is not None:
+            self.grid.collide(store, self.collision_radius, self.restitution)
+
+    def _nearby(self, store: ParticleStore, center: tuple[float, float], radius: float | None) -> list[int] | None:
+        """Return the store slots within ``radius`` of ``center``, or None for all of them.
+
+        Args:
+            store: Particle store to search.
+            center: Query point (x, y).
+            radius: Search radius, or None for no limit.
+
+        Returns:
+            Slot indices found through the spatial grid, created on first use.
+        """
+        if radius is None:
+            return None
+        if self.grid is None:
+            self.grid = SpatialHashGrid(radius)
+        return self.grid.query_radius(store, center, radius)
+
     def _update_particle_physics(self, particle: Particle, delta_time: float) -> None:
         """Update physics for a single particle.
 
@@ -152,7 +209,7 @@ class ParticlePhysics:
                 particle.vy = -particle.vy * self.bounce
                 particle.vx *= 1.0 - self.friction
 
-    def apply_force(self, particles: list[Particle], force: tuple[float, float], delta_time: float) -> None:
+    def apply_force(self, particles: list[Particle] | ParticleStore, force: tuple[float, float], delta_time: float) -> None:
         """Apply a constant force to all particles.
 
         Args:
@@ -162,13 +219,23 @@ class ParticlePhysics:
         """
         with self._lock:
             fx, fy = force
+            if isinstance(particles, ParticleStore):
+                particles.accelerate(fx, fy, delta_time)
+                return
             for particle in particles:
                 particle.vx += fx * delta_time
                 particle.vy += fy * delta_time
 
             logger.debug(f"Applied force {force} to {len(particles)} particles")
 
-    def apply_attraction(self, particles: list[Particle], center: tuple[float, float], strength: float, delta_time: float) -> None:
+    def apply_attraction(
+        self,
+        particles: list[Particle] | ParticleStore,
+        center: tuple[float, float],
+        strength: float,
+        delta_time: float,
+        radius: float | None = None,
+    ) -> None:
         """Apply gravitational attraction force towards a center point.
 
         Uses inverse square law with softening to avoid singularities.
@@ -178,15 +245,21 @@ class ParticlePhysics:
             center: Attraction center point (x, y).
             strength: Attraction strength coefficient.
             delta_time: Time step in seconds.
+            radius: Only particles within this distance are affected; stores
+                find them through the spatial grid instead of testing all.
         """
         with self._lock:
+            if isinstance(particles, ParticleStore):
+                particles.attract(center, strength, delta_time, self._nearby(particles, center, radius))
+                return
             cx, cy = center
+            limit = math.inf if radius is None else radius * radius
             for particle in particles:
                 dx = cx - particle.x
                 dy = cy - particle.y
                 distance_squared = dx * dx + dy * dy
 
-                if distance_squared > 0:
+                if 0 < distance_squared <= limit:
                     distance = math.sqrt(distance_squared)
                     # Inverse square law with epsilon softening
                     force = strength / (distance_squared + 1.0)
@@ -195,7 +268,14 @@ class ParticlePhysics:
 
             logger.debug(f"Applied attraction to {len(particles)} particles towards {center}")
 
-    def apply_repulsion(self, particles: list[Particle], center: tuple[float, float], strength: float, delta_time: float) -> None:
+    def apply_repulsion(
+        self,
+        particles: list[Particle] | ParticleStore,
+        center: tuple[float, float],
+        strength: float,
+        delta_time: float,
+        radius: float | None = None,
+    ) -> None:
         """Apply repulsive force away from a center point.
 
         Uses inverse square law with softening to avoid singularities.
@@ -205,15 +285,21 @@ class ParticlePhysics:
             center: Repulsion center point (x, y).
             strength: Repulsion strength coefficient.
             delta_time: Time step in seconds.
+            radius: Only particles within this distance are affected; stores
+                find them through the spatial grid instead of testing all.
         """
         with self._lock:
+            if isinstance(particles, ParticleStore):
+                particles.attract(center, -strength, delta_time, self._nearby(particles, center, radius))
+                return
             cx, cy = center
+            limit = math.inf if radius is None else radius * radius
             for particle in particles:
                 dx = particle.x - cx
                 dy = particle.y - cy
                 distance_squared = dx * dx + dy * dy
 
-                if distance_squared > 0:
+                if 0 < distance_squared <= limit:
                     distance = math.sqrt(distance_squared)
                     # Inverse square law with epsilon softening
                     force = strength / (distance_squared + 1.0)
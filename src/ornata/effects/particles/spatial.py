@@ -0,0 +1,296 @@
+"""Uniform-grid spatial index over the particles of a particle store."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from ornata.api.exports.utils import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import numpy as np
+
+    from ornata.effects.particles.store import ParticleStore
+else:
+    try:
+        import numpy as np
+    except ImportError:  # pragma: no cover - exercised when the optional extra is absent
+        np = None
+
+logger = get_logger(__name__)
+
+# Cell coordinates are packed into one int: column in the high 32 bits, row in the low 32.
+_ROW_MASK = 0xFFFFFFFF
+_ROW_SIGN = 0x80000000
+
+# Neighbours visited from each cell so that every adjacent pair of cells is checked once.
+_FORWARD_NEIGHBOURS = ((1, -1), (1, 0), (1, 1), (0, 1))
+
+
+def _pack(column: int, row: int) -> int:
+    return (column << 32) | (row & _ROW_MASK)
+
+
+def _unpack(key: int) -> tuple[int, int]:
+    row = key & _ROW_MASK
+    return key >> 32, row - (1 << 32) if row & _ROW_SIGN else row
+
+
+@dataclass(slots=True)
+class GridStats:
+    """Occupancy of a :class:`SpatialHashGrid` after its latest sync.
+
+    Attributes:
+        cell_size: Edge length of a grid cell.
+        particles: Particles indexed.
+        occupied_cells: Cells holding at least one particle.
+        max_per_cell: Particles in the fullest cell.
+        mean_per_cell: Average particles per occupied cell.
+        moved: Particles whose cell changed in the latest sync.
+    """
+
+    cell_size: float = 0.0
+    particles: int = 0
+    occupied_cells: int = 0
+    max_per_cell: int = 0
+    mean_per_cell: float = 0.0
+    moved: int = 0
+
+
+class SpatialHashGrid:
+    """Hash of grid cells to the store slots whose particle lies in them.
+
+    The grid mirrors one :class:`ParticleStore` at a time. :meth:`sync`
+    recomputes every slot's cell in a single column pass and then only
+    touches the cells of slots that changed, so a frame in which most
+    particles stay within their cell costs little more than that pass.
+    Swap-removes are handled the same way: a slot that now holds another
+    particle simply reports a different cell. Syncs are skipped while the
+    store's :attr:`~ParticleStore.version` is unchanged.
+
+    Queries visit only the cells overlapping the region, which keeps
+    viewport culling and short-range forces independent of how many
+    particles are elsewhere.
+    """
+
+    __slots__ = ("cell_size", "_inverse", "_cells", "_slot_keys", "_store", "_version", "_moved")
+
+    def __init__(self, cell_size: float = 8.0) -> None:
+        """Create an empty grid.
+
+        Args:
+            cell_size: Edge length of a cell; about the radius of the
+                typical query works best.
+
+        Raises:
+            ValueError: If ``cell_size`` is not positive.
+        """
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = float(cell_size)
+        self._inverse = 1.0 / self.cell_size
+        self._cells: dict[int, set[int]] = {}
+        self._slot_keys: Any = []
+        self._store: ParticleStore | None = None
+        self._version = -1
+        self._moved = 0
+
+    def __len__(self) -> int:
+        return len(self._slot_keys)
+
+    def cell_of(self, x: float, y: float) -> tuple[int, int]:
+        """Return the (column, row) of the cell containing point (x, y)."""
+        return math.floor(x * self._inverse), math.floor(y * self._inverse)
+
+    def clear(self) -> None:
+        """Forget every indexed particle."""
+        self._cells.clear()
+        self._slot_keys = []
+        self._store = None
+        self._version = -1
+
+    # -------------------------------
+    # Maintenance
+    # -------------------------------
+
+    def sync(self, store: ParticleStore, *, force: bool = False) -> int:
+        """Bring the grid up to date with ``store`` and return how many slots changed cell.
+
+        Args:
+            store: Store to mirror; switching stores reindexes from scratch.
+            force: Resync even if the store's version did not change, e.g.
+                after writing to its columns directly.
+        """
+        if store is not self._store:
+            self.clear()
+            self._store = store
+        elif store.version == self._version and not force:
+            return 0
+
+        count = len(store)
+        inverse = self._inverse
+        xs, ys = store.column("x"), store.column("y")
+        old_keys = self._slot_keys
+        old_count = len(old_keys)
+        common = min(count, old_count)
+        moves: Iterable[tuple[int, int, int]]
+        if store.vectorized:
+            columns = np.floor(xs * inverse).astype(np.int64)
+            rows = np.floor(ys * inverse).astype(np.int64)
+            keys = (columns << 32) | (rows & _ROW_MASK)
+            # Only the slots that changed cell are converted to Python ints.
+            changed = np.flatnonzero(keys[:common] != np.asarray(old_keys[:common], dtype=np.int64))
+            moves = zip(changed.tolist(), np.asarray(old_keys, dtype=np.int64)[changed].tolist(), keys[changed].tolist(), strict=True)
+            removed = np.asarray(old_keys[count:], dtype=np.int64).tolist()
+            added = keys[old_count:count].tolist()
+            changed_count = int(changed.size)
+        else:
+            floor = math.floor
+            keys = [(floor(x * inverse) << 32) | (floor(y * inverse) & _ROW_MASK) for x, y in zip(xs, ys, strict=True)]
+            moved_slots = [(slot, previous, key) for slot, key, previous in zip(range(common), keys, old_keys, strict=False) if key != previous]
+            moves = iter(moved_slots)
+            removed = list(old_keys[count:])
+            added = keys[old_count:count]
+            changed_count = len(moved_slots)
+
+        cells = self._cells
+        for slot, previous, key in moves:
+            self._leave(previous, slot)
+            cells.setdefault(key, set()).add(slot)
+        for slot, previous in enumerate(removed, start=count):
+            self._leave(previous, slot)
+        for slot, key in enumerate(added, start=old_count):
+            cells.setdefault(key, set()).add(slot)
+
+        self._moved = changed_count + abs(count - old_count)
+        self._slot_keys = keys
+        self._version = store.version
+        return self._moved
+
+    def _leave(self, key: int, slot: int) -> None:
+        members = self._cells.get(key)
+        if members is None:
+            return
+        members.discard(slot)
+        if not members:
+            del self._cells[key]
+
+    # -------------------------------
+    # Queries
+    # -------------------------------
+
+    def _candidates(self, left: float, top: float, right: float, bottom: float) -> list[int]:
+        """Return the slots in every cell overlapping the rectangle."""
+        first_column, first_row = self.cell_of(left, top)
+        last_column, last_row = self.cell_of(right, bottom)
+        cells = self._cells
+        slots: list[int] = []
+        if (last_column - first_column + 1) * (last_row - first_row + 1) > len(cells):
+            # The region spans more cells than are occupied: walk the occupied ones instead.
+            for key, members in cells.items():
+                column, row = _unpack(key)
+                if first_column <= column <= last_column and first_row <= row <= last_row:
+                    slots.extend(members)
+            return slots
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                occupants = cells.get(_pack(column, row))
+                if occupants:
+                    slots.extend(occupants)
+        return slots
+
+    def query_rect(self, store: ParticleStore, rect: tuple[float, float, float, float]) -> list[int]:
+        """Return the slots of particles inside ``rect`` given as (x, y, width, height), edges included."""
+        self.sync(store)
+        x, y, width, height = rect
+        right, bottom = x + width, y + height
+        xs, ys = store.column("x"), store.column("y")
+        return sorted(slot for slot in self._candidates(x, y, right, bottom) if x <= xs[slot] <= right and y <= ys[slot] <= bottom)
+
+    def query_radius(self, store: ParticleStore, center: tuple[float, float], radius: float) -> list[int]:
+        """Return the slots of particles within ``radius`` of ``center``."""
+        self.sync(store)
+        cx, cy = center
+        limit = radius * radius
+        xs, ys = store.column("x"), store.column("y")
+        found: list[int] = []
+        for slot in self._candidates(cx - radius, cy - radius, cx + radius, cy + radius):
+            dx, dy = xs[slot] - cx, ys[slot] - cy
+            if dx * dx + dy * dy <= limit:
+                found.append(slot)
+        found.sort()
+        return found
+
+    def collide(self, store: ParticleStore, radius: float, restitution: float = 1.0) -> int:
+        """Separate overlapping particles and exchange their approach velocity.
+
+        Particles are treated as equal-mass discs of ``radius``. Only pairs
+        in the same or adjacent cells are tested, so the cell size should
+        be at least ``2 * radius``.
+
+        Args:
+            store: Store whose particles collide.
+            radius: Collision radius of every particle.
+            restitution: Fraction of the approach speed kept after impact.
+
+        Returns:
+            Number of colliding pairs resolved.
+        """
+        self.sync(store)
+        xs, ys, vxs, vys = (store.column(name) for name in ("x", "y", "vx", "vy"))
+        contact = 2.0 * radius
+        limit = contact * contact
+        pairs = 0
+        cells = self._cells
+        for key, members in list(cells.items()):
+            column, row = _unpack(key)
+            local = sorted(members)
+            neighbours = [(slot, other) for i, slot in enumerate(local) for other in local[i + 1 :]]
+            for dc, dr in _FORWARD_NEIGHBOURS:
+                others = cells.get(_pack(column + dc, row + dr))
+                if others:
+                    neighbours.extend((slot, other) for slot in local for other in others)
+            for a, b in neighbours:
+                dx, dy = float(xs[b] - xs[a]), float(ys[b] - ys[a])
+                d2 = dx * dx + dy * dy
+                if d2 >= limit or d2 == 0.0:
+                    continue
+                distance = math.sqrt(d2)
+                nx, ny = dx / distance, dy / distance
+                push = (contact - distance) * 0.5
+                xs[a] -= nx * push
+                ys[a] -= ny * push
+                xs[b] += nx * push
+                ys[b] += ny * push
+                approach = float((vxs[b] - vxs[a]) * nx + (vys[b] - vys[a]) * ny)
+                if approach < 0.0:
+                    impulse = -(1.0 + restitution) * approach * 0.5
+                    vxs[a] -= nx * impulse
+                    vys[a] -= ny * impulse
+                    vxs[b] += nx * impulse
+                    vys[b] += ny * impulse
+                pairs += 1
+        if pairs:
+            store.version += 1
+            self.sync(store)
+        return pairs
+
+    def stats(self) -> GridStats:
+        """Return occupancy statistics as of the latest sync."""
+        cells = self._cells
+        sizes = [len(members) for members in cells.values()]
+        particles = len(self._slot_keys)
+        return GridStats(
+            cell_size=self.cell_size,
+            particles=particles,
+            occupied_cells=len(cells),
+            max_per_cell=max(sizes, default=0),
+            mean_per_cell=particles / len(cells) if cells else 0.0,
+            moved=self._moved,
+        )
+
+
+__all__ = ["GridStats", "SpatialHashGrid"]
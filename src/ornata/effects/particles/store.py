@@ -0,0 +1,376 @@
+"""Structure-of-arrays particle storage with batch physics kernels."""
+
+from __future__ import annotations
+
+import math
+from array import array
+from operator import add, mul
+from typing import TYPE_CHECKING, Any
+
+from ornata.api.exports.definitions import Particle
+from ornata.api.exports.utils import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    import numpy as np
+else:
+    try:
+        import numpy as np
+    except ImportError:  # pragma: no cover - exercised when the optional extra is absent
+        np = None
+
+_HAS_NUMPY: bool = np is not None
+
+logger = get_logger(__name__)
+
+FIELDS: tuple[str, ...] = ("x", "y", "vx", "vy", "life", "max_life", "size", "rotation", "rotation_speed", "r", "g", "b", "a")
+
+
+class ParticleStore:
+    """Particles kept as one contiguous float32 column per attribute.
+
+    Every kernel touches whole columns at once: NumPy ufuncs when NumPy is
+    installed, otherwise ``array('f')`` columns rebuilt through C-level
+    ``map`` calls, so neither backend pays for a Python method call per
+    particle on the hot paths. Dead particles are dropped by swap-remove:
+    the last live particle fills each hole, so removal is O(dead) and
+    particle order is not preserved.
+
+    Attributes:
+        vectorized: Whether the columns are NumPy arrays.
+        version: Bumped whenever a kernel moves particles or changes which
+            particle occupies which slot, so spatial indexes can tell when
+            they are stale. Code writing to :meth:`column` directly should
+            bump it too.
+    """
+
+    __slots__ = ("vectorized", "version", "_columns", "_count", "_capacity")
+
+    def __init__(self, capacity: int = 1024, *, vectorized: bool | None = None) -> None:
+        """Create an empty store.
+
+        Args:
+            capacity: Initial NumPy column length; columns grow by doubling.
+            vectorized: Use NumPy columns. ``None`` picks NumPy when installed.
+        """
+        if vectorized and not _HAS_NUMPY:
+            logger.warning("Vectorized particle store requested but NumPy is not installed")
+        self.vectorized = _HAS_NUMPY and vectorized is not False
+        self.version = 0
+        self._count = 0
+        self._capacity = max(16, capacity) if self.vectorized else 0
+        self._columns: dict[str, Any] = {name: self._new_column(self._capacity) for name in FIELDS}
+
+    def _new_column(self, length: int) -> Any:
+        if self.vectorized:
+            return np.zeros(length, dtype=np.float32)
+        return array("f")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def column(self, name: str) -> Any:
+        """Return the live values of column ``name`` (a view for NumPy columns)."""
+        column = self._columns[name]
+        return column[: self._count] if self.vectorized else column
+
+    # -------------------------------
+    # Adding and removing particles
+    # -------------------------------
+
+    def add(
+        self,
+        x: float,
+        y: float,
+        vx: float = 0.0,
+        vy: float = 0.0,
+        life: float = 1.0,
+        *,
+        max_life: float | None = None,
+        size: float = 1.0,
+        color: tuple[int, int, int, int] = (255, 255, 255, 255),
+        rotation: float = 0.0,
+        rotation_speed: float = 0.0,
+    ) -> int:
+        """Append one particle and return its index."""
+        r, g, b, a = color
+        values = (x, y, vx, vy, life, life if max_life is None else max_life, size, rotation, rotation_speed, r, g, b, a)
+        index = self._count
+        columns = self._columns
+        if self.vectorized:
+            if index == self._capacity:
+                self._grow(index + 1)
+            for name, value in zip(FIELDS, values, strict=True):
+                columns[name][index] = value
+        else:
+            for name, value in zip(FIELDS, values, strict=True):
+                columns[name].append(value)
+        self._count = index + 1
+        self.version += 1
+        return index
+
+    def add_particle(self, particle: Particle) -> int:
+        """Append a :class:`Particle` and return its index."""
+        return self.add(
+            particle.x,
+            particle.y,
+            particle.vx,
+            particle.vy,
+            particle.life,
+            max_life=particle.max_life,
+            size=particle.size,
+            color=particle.color,
+            rotation=particle.rotation,
+            rotation_speed=particle.rotation_speed,
+        )
+
+    def extend(self, particles: Iterable[Particle]) -> None:
+        """Append several :class:`Particle` objects."""
+        for particle in particles:
+            self.add_particle(particle)
+
+    def _grow(self, needed: int) -> None:
+        capacity = max(needed, self._capacity * 2)
+        count = self._count
+        for name, column in self._columns.items():
+            grown = np.zeros(capacity, dtype=np.float32)
+            grown[:count] = column[:count]
+            self._columns[name] = grown
+        self._capacity = capacity
+
+    def swap_remove(self, index: int) -> None:
+        """Remove particle ``index`` by moving the last particle into its slot."""
+        if not 0 <= index < self._count:
+            raise IndexError(f"particle index {index} out of range")
+        last = self._count - 1
+        for column in self._columns.values():
+            column[index] = column[last]
+            if not self.vectorized:
+                column.pop()
+        self._count = last
+        self.version += 1
+
+    def compact(self) -> int:
+        """Swap-remove every particle whose life ran out and return how many were removed."""
+        count = self._count
+        if not count:
+            return 0
+        columns = self._columns
+        if self.vectorized:
+            alive = columns["life"][:count] > 0.0
+            survivors = int(np.count_nonzero(alive))
+            if survivors == count:
+                return 0
+            # Dead slots below the new length are filled from live slots above it.
+            holes = np.flatnonzero(~alive[:survivors])
+            fillers = np.flatnonzero(alive[survivors:]) + survivors
+            if holes.size:
+                for column in columns.values():
+                    column[holes] = column[fillers]
+            self._count = survivors
+            self.version += 1
+            return count - survivors
+
+        life = columns["life"]
+        if min(life) > 0.0:
+            return 0
+        dead = [index for index, value in enumerate(life) if value <= 0.0]
+        # Descending order guarantees the tail particle moved into a hole is alive.
+        for index in reversed(dead):
+            last = len(life) - 1
+            for column in columns.values():
+                if index != last:
+                    column[index] = column[last]
+                column.pop()
+        self._count = len(life)
+        self.version += 1
+        return len(dead)
+
+    def clear(self) -> None:
+        """Remove every particle; NumPy columns keep their capacity."""
+        self._count = 0
+        self.version += 1
+        if not self.vectorized:
+            for name in FIELDS:
+                self._columns[name] = array("f")
+
+    def copy_into(self, targets: dict[str, Any], offset: int) -> int:
+        """Copy every column into ``targets[name][offset:]`` and return the particle count.
+
+        The targets must already hold at least ``offset + len(self)`` values.
+        """
+        count = self._count
+        for name in FIELDS:
+            targets[name][offset : offset + count] = self.column(name)
+        return count
+
+    # -------------------------------
+    # Particle views
+    # -------------------------------
+
+    def particle(self, index: int) -> Particle:
+        """Return a :class:`Particle` copy of particle ``index``."""
+        if not 0 <= index < self._count:
+            raise IndexError(f"particle index {index} out of range")
+        c = self._columns
+        return Particle(
+            x=float(c["x"][index]),
+            y=float(c["y"][index]),
+            vx=float(c["vx"][index]),
+            vy=float(c["vy"][index]),
+            life=float(c["life"][index]),
+            max_life=float(c["max_life"][index]),
+            size=float(c["size"][index]),
+            color=(int(c["r"][index]), int(c["g"][index]), int(c["b"][index]), int(c["a"][index])),
+            rotation=float(c["rotation"][index]),
+            rotation_speed=float(c["rotation_speed"][index]),
+        )
+
+    def to_particles(self) -> list[Particle]:
+        """Return :class:`Particle` copies of every live particle."""
+        columns = [self.column(name) for name in FIELDS]
+        if self.vectorized:
+            columns = [column.tolist() for column in columns]
+        return [
+            Particle(x, y, vx, vy, life, max_life, size, (int(r), int(g), int(b), int(a)), rotation, rotation_speed)
+            for x, y, vx, vy, life, max_life, size, rotation, rotation_speed, r, g, b, a in zip(*columns, strict=True)
+        ]
+
+    # -------------------------------
+    # Batch kernels
+    # -------------------------------
+
+    def _map_into(self, name: str, values: Iterable[float]) -> None:
+        """Replace an ``array('f')`` column with ``values``."""
+        self._columns[name] = array("f", values)
+
+    def age(self, delta_time: float) -> None:
+        """Subtract ``delta_time`` from every particle's remaining life."""
+        if self.vectorized:
+            self.column("life")[...] -= delta_time
+        elif self._count:
+            self._map_into("life", map(float(-delta_time).__add__, self._columns["life"]))
+
+    def accelerate(self, ax: float, ay: float, delta_time: float) -> None:
+        """Add a uniform acceleration such as gravity to every velocity."""
+        dvx, dvy = ax * delta_time, ay * delta_time
+        for name, delta in (("vx", dvx), ("vy", dvy)):
+            if not delta:
+                continue
+            if self.vectorized:
+                self.column(name)[...] += delta
+            elif self._count:
+                self._map_into(name, map(float(delta).__add__, self._columns[name]))
+
+    def scale_velocity(self, factor: float) -> None:
+        """Multiply every velocity by ``factor``, e.g. a damping factor."""
+        if factor == 1.0:
+            return
+        for name in ("vx", "vy"):
+            if self.vectorized:
+                self.column(name)[...] *= factor
+            elif self._count:
+                self._map_into(name, map(float(factor).__mul__, self._columns[name]))
+
+    def integrate(self, delta_time: float) -> None:
+        """Advance positions by velocity and rotations by rotation speed."""
+        self.version += 1
+        for target, rate in (("x", "vx"), ("y", "vy"), ("rotation", "rotation_speed")):
+            if self.vectorized:
+                column = self.column(target)
+                column += self.column(rate) * np.float32(delta_time)
+            elif self._count:
+                columns = self._columns
+                self._map_into(target, map(add, columns[target], map(float(delta_time).__mul__, columns[rate]), strict=True))
+
+    def bounce(self, bounds: tuple[float, float, float, float], bounce: float, friction: float) -> None:
+        """Clamp particles to ``bounds``, reflecting and damping their velocity on contact.
+
+        Horizontal walls are resolved before vertical ones, and friction
+        slows the velocity component along the wall that was hit.
+        """
+        left, top, width, height = bounds
+        keep = 1.0 - friction
+        self.version += 1
+        for axis, along, low, high in (("x", "vy", left, left + width), ("y", "vx", top, top + height)):
+            if self.vectorized:
+                position, velocity, tangent = self.column(axis), self.column("v" + axis), self.column(along)
+                hit = (position < low) | (position > high)
+                if not hit.any():
+                    continue
+                np.clip(position, low, high, out=position)
+                velocity[hit] *= -bounce
+                tangent[hit] *= keep
+                continue
+            position = self._columns[axis]
+            if not self._count or (min(position) >= low and max(position) <= high):
+                continue
+            velocity, tangent = self._columns["v" + axis], self._columns[along]
+            for index in [i for i, value in enumerate(position) if value < low or value > high]:
+                position[index] = low if position[index] < low else high
+                velocity[index] = -velocity[index] * bounce
+                tangent[index] *= keep
+
+    def wrap(self, bounds: tuple[float, float, float, float]) -> None:
+        """Move particles that left ``bounds`` in by the distance they overshot from the opposite edge."""
+        left, top, width, height = bounds
+        self.version += 1
+        for axis, low, high in (("x", left, left + width), ("y", top, top + height)):
+            if self.vectorized:
+                position = self.column(axis)
+                position[position < low] += width if axis == "x" else height
+                position[position > high] -= width if axis == "x" else height
+                continue
+            position = self._columns[axis]
+            if not self._count or (min(position) >= low and max(position) <= high):
+                continue
+            span = high - low
+            for index in [i for i, value in enumerate(position) if value < low or value > high]:
+                position[index] += span if position[index] < low else -span
+
+    def attract(self, center: tuple[float, float], strength: float, delta_time: float, indices: Sequence[int] | None = None) -> None:
+        """Pull particles toward ``center`` with a softened inverse-square force.
+
+        A negative ``strength`` pushes them away instead. ``indices``
+        limits the force to those particles, e.g. the ones a spatial grid
+        found within range.
+        """
+        cx, cy = center
+        if self.vectorized:
+            x, y = self.column("x"), self.column("y")
+            subset = slice(None) if indices is None else np.asarray(indices, dtype=np.intp)
+            dx = np.float32(cx) - x[subset]
+            dy = np.float32(cy) - y[subset]
+            distance_squared = dx * dx + dy * dy
+            distance = np.sqrt(distance_squared)
+            # Particles sitting exactly on the center feel no force.
+            scale = np.divide(strength * delta_time / (distance_squared + 1.0), distance, out=np.zeros_like(distance), where=distance > 0)
+            self.column("vx")[subset] += dx * scale
+            self.column("vy")[subset] += dy * scale
+            return
+        if not self._count:
+            return
+        columns = self._columns
+        impulse = strength * delta_time
+        if indices is not None:
+            xs, ys, vxs, vys = columns["x"], columns["y"], columns["vx"], columns["vy"]
+            for index in indices:
+                dx, dy = cx - xs[index], cy - ys[index]
+                d2 = dx * dx + dy * dy
+                if d2 > 0:
+                    scale = impulse / ((d2 + 1.0) * math.sqrt(d2))
+                    vxs[index] += dx * scale
+                    vys[index] += dy * scale
+            return
+        dxs = list(map(float(cx).__sub__, columns["x"]))
+        dys = list(map(float(cy).__sub__, columns["y"]))
+        scales = [
+            impulse / ((d2 + 1.0) * math.sqrt(d2)) if d2 > 0 else 0.0
+            for d2 in map(add, map(mul, dxs, dxs, strict=True), map(mul, dys, dys, strict=True), strict=True)
+        ]
+        self._map_into("vx", map(add, columns["vx"], map(mul, dxs, scales, strict=True), strict=True))
+        self._map_into("vy", map(add, columns["vy"], map(mul, dys, scales, strict=True), strict=True))
+
+
+__all__ = ["FIELDS", "ParticleStore"]
@@ -0,0 +1,304 @@
+"""Particle simulation on a worker thread with double-buffered snapshots."""
+
+from __future__ import annotations
+
+import threading
+import time
+from array import array
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import partial
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from ornata.api.exports.definitions import Particle
+from ornata.api.exports.utils import get_logger
+from ornata.effects.particles.store import FIELDS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+    import numpy as np
+
+    from ornata.effects.particles.engine import ParticleEngine
+else:
+    try:
+        import numpy as np
+    except ImportError:  # pragma: no cover - exercised when the optional extra is absent
+        np = None
+
+_HAS_NUMPY: bool = np is not None
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class ParticleSnapshot:
+    """Read-only copy of every particle system as of one simulation tick.
+
+    Columns hold the particles of all systems back to back; ``systems``
+    gives each system's ``(system_id, start, stop)`` range in them.
+
+    Attributes:
+        tick: Fixed steps simulated before this snapshot.
+        time: Simulated seconds before this snapshot.
+        step: Length of one fixed step in seconds.
+        published_at: ``time.perf_counter()`` when the snapshot was published.
+        remainder: Unsimulated time left in the accumulator at publication.
+        count: Particles in the snapshot.
+        systems: ``(system_id, start, stop)`` for each system.
+        columns: Read-only float column per particle attribute.
+    """
+
+    tick: int
+    time: float
+    step: float
+    published_at: float
+    remainder: float
+    count: int
+    systems: tuple[tuple[str, int, int], ...]
+    columns: Mapping[str, Any]
+
+    def alpha(self, now: float | None = None) -> float:
+        """Return how far into the next step ``now`` is, from 0 to 1.
+
+        Args:
+            now: A ``time.perf_counter()`` reading; defaults to the current time.
+        """
+        elapsed = (time.perf_counter() if now is None else now) - self.published_at
+        return min(1.0, max(0.0, (self.remainder + elapsed) / self.step))
+
+    def positions(self, alpha: float = 1.0) -> tuple[list[float], list[float]]:
+        """Return particle positions blended between the previous and this tick.
+
+        The previous position is recovered from the velocity, so no second
+        copy of the positions is kept. ``alpha`` 1 is this tick's position.
+        """
+        back = self.step * (1.0 - alpha)
+        columns = self.columns
+        xs = [x - vx * back for x, vx in zip(columns["x"], columns["vx"], strict=True)]
+        ys = [y - vy * back for y, vy in zip(columns["y"], columns["vy"], strict=True)]
+        return xs, ys
+
+    def particles(self, alpha: float = 1.0) -> list[Particle]:
+        """Return :class:`Particle` objects at the blended positions."""
+        columns = self.columns
+        xs, ys = self.positions(alpha)
+        rest = (columns[name] for name in ("vx", "vy", "life", "max_life", "size", "r", "g", "b", "a", "rotation", "rotation_speed"))
+        return [
+            Particle(x, y, vx, vy, life, max_life, size, (int(r), int(g), int(b), int(a)), rotation, rotation_speed)
+            for x, y, vx, vy, life, max_life, size, r, g, b, a, rotation, rotation_speed in zip(xs, ys, *rest, strict=True)
+        ]
+
+
+class _SnapshotBuffer:
+    """Fixed-capacity float columns one snapshot is copied into."""
+
+    __slots__ = ("columns", "capacity")
+
+    def __init__(self) -> None:
+        self.columns: dict[str, Any] = {}
+        self.capacity = -1
+
+    def reserve(self, count: int, keep: int = 0) -> dict[str, Any]:
+        """Ensure room for ``count`` values, carrying over the first ``keep``, and return the columns."""
+        # Columns are replaced rather than resized, so views held by old snapshots stay valid.
+        if count <= self.capacity:
+            return self.columns
+        capacity = max(64, count, self.capacity * 2)
+        columns: dict[str, Any]
+        if _HAS_NUMPY:
+            columns = {name: np.zeros(capacity, dtype=np.float32) for name in FIELDS}
+        else:
+            columns = {name: array("f", bytes(4 * capacity)) for name in FIELDS}
+        if keep:
+            for name, column in self.columns.items():
+                columns[name][:keep] = column[:keep]
+        self.columns = columns
+        self.capacity = capacity
+        return columns
+
+    def views(self, count: int) -> Mapping[str, Any]:
+        views: dict[str, Any] = {}
+        for name, column in self.columns.items():
+            if _HAS_NUMPY:
+                view = column[:count]
+                view.flags.writeable = False
+            else:
+                view = memoryview(column)[:count].toreadonly()
+            views[name] = view
+        return MappingProxyType(views)
+
+
+class ParticleSimulationWorker:
+    """Steps a :class:`ParticleEngine` at a fixed rate and publishes snapshots.
+
+    Real time is gathered in an accumulator and simulated in whole
+    ``step`` increments, so physics does not depend on the frame rate;
+    the leftover fraction is carried in each snapshot for interpolation.
+
+    After each batch of steps the particles are copied into whichever of
+    two buffers is not currently published, and publishing is a single
+    reference swap. The renderer reads the published snapshot without
+    taking any lock: :meth:`read` pins its buffer, and the worker skips a
+    publication rather than overwrite a pinned buffer. One rendering
+    thread is assumed.
+
+    Attributes:
+        step: Fixed simulation step in seconds.
+        max_steps: Most steps simulated per advance; time beyond that is
+            dropped so a stall cannot snowball.
+        published: Snapshots published so far.
+        skipped: Publications skipped because the renderer held the buffer.
+    """
+
+    def __init__(self, engine: ParticleEngine, step: float = 1.0 / 60.0, max_steps: int = 5) -> None:
+        """Create a stopped worker.
+
+        Args:
+            engine: Engine whose systems are simulated.
+            step: Fixed simulation step in seconds.
+            max_steps: Most steps simulated per advance.
+
+        Raises:
+            ValueError: If ``step`` is not positive.
+        """
+        if step <= 0:
+            raise ValueError("step must be positive")
+        self.engine = engine
+        self.step = step
+        self.max_steps = max(1, max_steps)
+        self.published = 0
+        self.skipped = 0
+        self._buffers = (_SnapshotBuffer(), _SnapshotBuffer())
+        self._snapshots: list[ParticleSnapshot | None] = [None, None]
+        self._published_index: int | None = None
+        self._reading: int | None = None
+        self._accumulator = 0.0
+        self._tick = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    # -------------------------------
+    # Simulation
+    # -------------------------------
+
+    def advance(self, elapsed: float) -> int:
+        """Add ``elapsed`` seconds to the accumulator and simulate the whole steps it holds.
+
+        Returns:
+            Number of steps simulated.
+        """
+        step = self.step
+        self._accumulator += min(max(0.0, elapsed), step * self.max_steps)
+        steps = 0
+        while self._accumulator >= step:
+            self.engine.update_systems(step)
+            self._accumulator -= step
+            self._tick += 1
+            steps += 1
+        if steps:
+            self._publish()
+        return steps
+
+    def _publish(self) -> bool:
+        target = 1 if self._published_index == 0 else 0
+        if self._reading == target:
+            self.skipped += 1
+            return False
+
+        systems = self.engine.systems()
+        buffer = self._buffers[target]
+        # Emitters can also be fed from other threads, so this total is only a
+        # hint; each copy re-reserves under its emitter's lock.
+        buffer.reserve(sum(emitter.get_particle_count() for _, emitter in systems))
+        ranges: list[tuple[str, int, int]] = []
+        offset = 0
+        for system_id, emitter in systems:
+            count = emitter.copy_into(buffer.columns, offset, reserve=partial(buffer.reserve, keep=offset))
+            ranges.append((system_id, offset, offset + count))
+            offset += count
+
+        self._snapshots[target] = ParticleSnapshot(
+            tick=self._tick,
+            time=self._tick * self.step,
+            step=self.step,
+            published_at=time.perf_counter(),
+            remainder=self._accumulator,
+            count=offset,
+            systems=tuple(ranges),
+            columns=buffer.views(offset),
+        )
+        self._published_index = target
+        self.published += 1
+        return True
+
+    # -------------------------------
+    # Reading
+    # -------------------------------
+
+    def latest(self) -> ParticleSnapshot | None:
+        """Return the published snapshot without pinning it.
+
+        Its columns stay intact until the second publication after this
+        call; use :meth:`read` to hold a snapshot longer.
+        """
+        index = self._published_index
+        return None if index is None else self._snapshots[index]
+
+    @contextmanager
+    def read(self) -> Iterator[ParticleSnapshot | None]:
+        """Pin the published snapshot for the duration of the ``with`` block."""
+        while True:
+            index = self._published_index
+            if index is None:
+                yield None
+                return
+            self._reading = index
+            # Re-check: the worker may have published between the load and the pin.
+            if self._published_index == index:
+                break
+        try:
+            yield self._snapshots[index]
+        finally:
+            self._reading = None
+
+    # -------------------------------
+    # Thread control
+    # -------------------------------
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start simulating on a daemon thread."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="ornata-particles", daemon=True)
+        self._thread.start()
+        logger.debug(f"Started particle simulation worker at {1.0 / self.step:.0f} steps per second")
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """Stop the worker thread and wait up to ``timeout`` seconds for it."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        logger.debug("Stopped particle simulation worker")
+
+    def _run(self) -> None:
+        last = time.perf_counter()
+        while not self._stop.is_set():
+            now = time.perf_counter()
+            try:
+                self.advance(now - last)
+            except Exception as e:
+                logger.warning(f"Particle simulation step failed: {e}")
+            last = now
+            self._stop.wait(max(0.0, self.step - self._accumulator - (time.perf_counter() - now)))
+
+
+__all__ = ["ParticleSimulationWorker", "ParticleSnapshot"]
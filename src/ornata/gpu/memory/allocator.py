@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import itertools
 import threading
 import weakref
 from typing import TYPE_CHECKING, Any
@@ -15,9 +16,43 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+# Allocations are carved from a linear address space starting here.
+_BASE_ADDRESS = 0x1000
+# Every block is reserved in multiples of this many bytes, so free ranges stay granule-aligned.
+_GRANULE = 16
+# Size classes split each power of two into 2**_CLASS_SPLIT_BITS evenly spaced classes.
+_CLASS_SPLIT_BITS = 2
+_CLASS_SPLITS = 1 << _CLASS_SPLIT_BITS
+# Free ranges inspected in the class just below a request before the arena is grown instead.
+_SCAN_LIMIT = 8
+
+
+def _size_class(size: int) -> int:
+    """Return the free-list class of a range of ``size`` bytes (``size >= _GRANULE``)."""
+    exponent = size.bit_length() - 1
+    split = (size >> (exponent - _CLASS_SPLIT_BITS)) & (_CLASS_SPLITS - 1)
+    return exponent * _CLASS_SPLITS + split
+
+
+def _class_floor(size_class: int) -> int:
+    """Return the smallest range size held in ``size_class``."""
+    exponent, split = divmod(size_class, _CLASS_SPLITS)
+    return (_CLASS_SPLITS + split) << (exponent - _CLASS_SPLIT_BITS)
+
+
 class Allocator:
-    """REQUIRED: GPU memory allocator with pooling."""
-    
+    """REQUIRED: GPU memory allocator with pooling.
+
+    Memory blocks are sub-allocated from one address space with segregated
+    free lists: free ranges are filed by size class (each power of two is
+    split into four classes), and a bitmask of non-empty classes finds the
+    smallest class that is guaranteed to fit a request in constant time.
+    The chosen range is split and the remainder stays free. Freed blocks
+    coalesce with free neighbours at once, and free space at the end of
+    the address space is handed back, so the address space only grows
+    when no free range fits.
+    """
+
     def __init__(self, backend: GPUBackend | None = None, max_pool_size: int = 1000) -> None:
         """Initialize the memory allocator.
 
@@ -29,9 +64,18 @@ class Allocator:
         self.max_pool_size = max_pool_size
         self._lock = threading.RLock()
 
-        # Memory block tracking for low-level allocations
+        # Memory block tracking for low-level allocations: live blocks and the bytes reserved for each
         self._memory_blocks: dict[int, MemoryBlock] = {}
-        self._next_address = 0x1000  # Start addresses at 0x1000
+        self._reserved: dict[int, int] = {}
+        self._top = _BASE_ADDRESS
+        # Addresses are reused once freed, so block ids also carry an allocation serial
+        self._block_serials = itertools.count(1)
+
+        # Free ranges by start, by end (for coalescing) and by size class
+        self._free_starts: dict[int, int] = {}
+        self._free_ends: dict[int, int] = {}
+        self._free_lists: dict[int, dict[int, None]] = {}
+        self._free_mask = 0
 
         # Buffer pools by type and usage pattern
         self._vertex_pools: dict[str, list[Any]] = {}
@@ -47,6 +91,10 @@ class Allocator:
         self._memory_stats = {
             "memory_allocated": 0,
             "memory_freed": 0,
+            "memory_in_use": 0,
+            "peak_memory_usage": 0,
+            "high_water_mark": 0,
+            "reused_allocations": 0,
             "defragmentation_ops": 0
         }
 
@@ -67,7 +115,7 @@ class Allocator:
 
         Args:
             size: Size of the block in bytes.
-            alignment: Memory alignment in bytes.
+            alignment: Memory alignment in bytes; must be a power of two.
             usage: Usage pattern ('general', 'vertex', 'index', 'uniform').
 
         Returns:
@@ -76,11 +124,34 @@ class Allocator:
         Raises:
             GPUMemoryError: If allocation fails.
         """
+        if size < 0 or alignment <= 0 or alignment & (alignment - 1):
+            from ornata.api.exports.definitions import GPUMemoryError
+            raise GPUMemoryError(f"Invalid allocation of {size} bytes with alignment {alignment}")
+
+        reserved = max(_GRANULE, -(-size // _GRANULE) * _GRANULE)
+        # Free ranges start on a granule, so only alignments above it can need padding.
+        needed = reserved + max(0, alignment - _GRANULE)
+
         with self._lock:
-            # Calculate aligned address
-            aligned_address = (self._next_address + alignment - 1) & ~(alignment - 1)
-            
-            block_id = f"block_{aligned_address:08x}"
+            start = self._find_free(needed, reserved, alignment)
+            if start is None:
+                start = self._top
+                range_size = -(-start // alignment) * alignment + reserved - start
+                self._top = start + range_size
+                self._memory_stats["high_water_mark"] = max(self._memory_stats["high_water_mark"], self._top - _BASE_ADDRESS)
+            else:
+                range_size = self._take_free(start)
+                self._memory_stats["reused_allocations"] += 1
+
+            # Give back the alignment padding in front and whatever is left after the block
+            aligned_address = -(-start // alignment) * alignment
+            if aligned_address > start:
+                self._add_free(start, aligned_address - start)
+            tail = start + range_size - (aligned_address + reserved)
+            if tail:
+                self._add_free(aligned_address + reserved, tail)
+
+            block_id = f"block_{next(self._block_serials)}_{aligned_address:08x}"
             block = MemoryBlock(
                 id=block_id,
                 size=size,
@@ -89,21 +160,27 @@ class Allocator:
                 address=aligned_address,
                 allocated=True
             )
-            
+
             # Track the block
             self._memory_blocks[aligned_address] = block
-            self._next_address = aligned_address + size
-            
+            self._reserved[aligned_address] = reserved
+
             # Update statistics
-            self._memory_stats["memory_allocated"] += size
-            
+            stats = self._memory_stats
+            stats["memory_allocated"] += size
+            stats["memory_in_use"] += size
+            stats["peak_memory_usage"] = max(stats["peak_memory_usage"], stats["memory_in_use"])
+
             logger.debug(f"Allocated {size} bytes at address 0x{aligned_address:08x} (alignment: {alignment})")
-            
+
             return block
 
     def deallocate(self, block: MemoryBlock) -> None:
         """REQUIRED: Deallocate a memory block.
 
+        The block's range is merged with any free neighbours and becomes
+        available to later allocations immediately.
+
         Args:
             block: Memory block to deallocate.
 
@@ -111,89 +188,103 @@ class Allocator:
             GPUMemoryError: If block is not found or already freed.
         """
         with self._lock:
-            if block.address not in self._memory_blocks:
+            address = block.address
+            if address is None or self._memory_blocks.get(address) is not block:
                 from ornata.api.exports.definitions import GPUMemoryError
-                raise GPUMemoryError(f"Memory block at address 0x{block.address:08x} not found")
-            
-            if not block.allocated:
-                from ornata.api.exports.definitions import GPUMemoryError
-                raise GPUMemoryError(f"Memory block at address 0x{block.address:08x} is already freed")
-            
+                if not block.allocated:
+                    raise GPUMemoryError(f"Memory block {block.id} is already freed")
+                raise GPUMemoryError(f"Memory block {block.id} not found")
+
             # Mark as freed
             block.allocated = False
-            
+            del self._memory_blocks[address]
+            self._release(address, self._reserved.pop(address))
+
             # Update statistics
             self._memory_stats["memory_freed"] += block.size
-            
-            logger.debug(f"Deallocated {block.size} bytes from address 0x{block.address:08x}")
+            self._memory_stats["memory_in_use"] -= block.size
+
+            logger.debug(f"Deallocated {block.size} bytes from address 0x{address:08x}")
 
     def defragment(self) -> list[MemoryBlock]:
         """REQUIRED: Defragment memory and return moved blocks.
 
+        Live blocks are packed towards the start of the address space,
+        keeping their alignment; callers must re-upload moved blocks. Free
+        ranges coalesce on release, so this is only needed to close gaps
+        between long-lived blocks.
+
         Returns:
             list[MemoryBlock]: List of blocks that were moved during defragmentation.
         """
         with self._lock:
             moved_blocks: list[MemoryBlock] = []
-            
-            # Simple defragmentation: compact allocated blocks
-            allocated_blocks = [block for block in self._memory_blocks.values() if block.allocated and block.address is not None]
-            allocated_blocks.sort(key=lambda b: b.address if b.address is not None else 0)
-
-            current_address = 0x1000
-            for block in allocated_blocks:
-                block_address = block.address
-                if block_address is None:
-                    continue
-
-                if block_address != current_address:
+            blocks = sorted(self._memory_blocks.items())
+            reserved = self._reserved
+
+            self._memory_blocks = {}
+            self._reserved = {}
+            self._free_starts.clear()
+            self._free_ends.clear()
+            self._free_lists.clear()
+            self._free_mask = 0
+
+            current_address = _BASE_ADDRESS
+            for old_address, block in blocks:
+                new_address = -(-current_address // block.alignment) * block.alignment
+                if new_address > current_address:
+                    self._add_free(current_address, new_address - current_address)
+                if new_address != old_address:
                     # Move block to new location
-                    old_address = block_address
-                    _old_size = block.size
-
-                    # Update block address
-                    block.address = current_address
+                    block.address = new_address
                     moved_blocks.append(block)
+                    logger.debug(f"Defragmentation: moved block {block.id} from 0x{old_address:08x} to 0x{new_address:08x}")
+                self._memory_blocks[new_address] = block
+                self._reserved[new_address] = reserved[old_address]
+                current_address = new_address + reserved[old_address]
+
+            self._top = current_address
 
-                    # Remove old entry and add new one
-                    del self._memory_blocks[old_address]
-                    self._memory_blocks[current_address] = block
-
-                    logger.debug(
-                        f"Defragmentation: moved block {block.id} from 0x{old_address:08x} to 0x{current_address:08x}"
-                    )
-                
-                current_address += block.size
-            
-            # Update next address
-            self._next_address = current_address
-            
             # Update statistics
             self._memory_stats["defragmentation_ops"] += 1
-            
+
             logger.info(f"Defragmentation completed: moved {len(moved_blocks)} blocks")
-            
+
             return moved_blocks
 
     def get_stats(self) -> dict[str, int | float]:
         """REQUIRED: Get allocator statistics.
 
+        ``fragmentation`` is the percentage of free bytes outside the
+        largest free range, i.e. how much free memory a single large
+        request could not use. ``high_water_mark`` is the furthest the
+        address space has extended, in bytes.
+
         Returns:
             dict[str, int | float]: Detailed allocation statistics.
         """
         with self._lock:
-            allocated_blocks = [b for b in self._memory_blocks.values() if b.allocated]
-            total_allocated = sum(block.size for block in allocated_blocks)
-            total_blocks = len(self._memory_blocks)
-            
+            total_allocated = self._memory_stats["memory_in_use"]
+            allocated_blocks = len(self._memory_blocks)
+            free_blocks = len(self._free_starts)
+            free_memory = sum(self._free_starts.values())
+            largest_free_block = max(self._free_starts.values(), default=0)
+
             return {
-                "total_blocks": total_blocks,
-                "allocated_blocks": len(allocated_blocks),
-                "freed_blocks": total_blocks - len(allocated_blocks),
+                "total_blocks": allocated_blocks + free_blocks,
+                "allocated_blocks": allocated_blocks,
+                "freed_blocks": free_blocks,
                 "total_memory_allocated": self._memory_stats["memory_allocated"],
                 "total_memory_freed": self._memory_stats["memory_freed"],
                 "current_memory_usage": total_allocated,
                 "memory_efficiency": (total_allocated / max(self._memory_stats["memory_allocated"], 1)) * 100,
+                "address_space": self._top - _BASE_ADDRESS,
+                "high_water_mark": self._memory_stats["high_water_mark"],
+                "peak_memory_usage": self._memory_stats["peak_memory_usage"],
+                "free_memory": free_memory,
+                "largest_free_block": largest_free_block,
+                "fragmentation": (1.0 - largest_free_block / free_memory) * 100 if free_memory else 0.0,
+                "reused_allocations": self._memory_stats["reused_allocations"],
                 "vertex_created": self._buffer_stats["vertex"].created,
                 "vertex_reused": self._buffer_stats["vertex"].reused,
                 "vertex_active": self._buffer_stats["vertex"].active,
@@ -206,6 +297,65 @@ class Allocator:
                 "defragmentation_ops": self._memory_stats["defragmentation_ops"]
             }
 
+    def _find_free(self, needed: int, reserved: int, alignment: int) -> int | None:
+        """Return the start of a free range that can hold the request, or None.
+
+        Args:
+            needed: Bytes that fit the request at any alignment offset.
+            reserved: Bytes reserved for the block itself.
+            alignment: Block alignment.
+        """
+        size_class = _size_class(needed)
+        lower_class = size_class
+        if _class_floor(size_class) < needed:
+            # Ranges in this class may be too small; every range in the next one fits.
+            size_class += 1
+        candidates = self._free_mask >> size_class
+        if candidates:
+            size_class += (candidates & -candidates).bit_length() - 1
+            return next(iter(self._free_lists[size_class]))
+
+        if lower_class != size_class and self._free_mask >> lower_class & 1:
+            for scanned, start in enumerate(self._free_lists[lower_class]):
+                if scanned == _SCAN_LIMIT:
+                    break
+                aligned = -(-start // alignment) * alignment
+                if aligned + reserved <= start + self._free_starts[start]:
+                    return start
+        return None
+
+    def _add_free(self, start: int, size: int) -> None:
+        self._free_starts[start] = size
+        self._free_ends[start + size] = start
+        size_class = _size_class(size)
+        self._free_lists.setdefault(size_class, {})[start] = None
+        self._free_mask |= 1 << size_class
+
+    def _take_free(self, start: int) -> int:
+        size = self._free_starts.pop(start)
+        del self._free_ends[start + size]
+        size_class = _size_class(size)
+        free_list = self._free_lists[size_class]
+        del free_list[start]
+        if not free_list:
+            del self._free_lists[size_class]
+            self._free_mask &= ~(1 << size_class)
+        return size
+
+    def _release(self, start: int, size: int) -> None:
+        """Return a range to the free lists, merging it with free neighbours."""
+        previous = self._free_ends.get(start)
+        if previous is not None:
+            size += self._take_free(previous)
+            start = previous
+        if start + size in self._free_starts:
+            size += self._take_free(start + size)
+        if start + size == self._top:
+            # Free space at the end shrinks the address space instead of being listed.
+            self._top = start
+        else:
+            self._add_free(start, size)
+
     def allocate_vertex_buffer(self, data: list[float], usage: str = "dynamic") -> Any:
         """Allocate a vertex buffer from pool or create new one.
 
@@ -371,9 +521,14 @@ class Allocator:
             self._active_buffers.clear()
             self._buffer_refs.clear()
 
-            # Clear memory blocks
+            # Clear memory blocks and free ranges
             self._memory_blocks.clear()
-            self._next_address = 0x1000
+            self._reserved.clear()
+            self._free_starts.clear()
+            self._free_ends.clear()
+            self._free_lists.clear()
+            self._free_mask = 0
+            self._top = _BASE_ADDRESS
 
             # Reset stats
             for stats in self._buffer_stats.values():
@@ -599,6 +599,7 @@ def component_to_gui_node(
         items=items,
         columns=columns,
         rows=rows,
+        virtual_rows=getattr(component, "virtual_rows", None),
         selection=selection,
         selection_mode=getattr(component, "selection_mode", None),
         sorting=getattr(component, "sorting", None),
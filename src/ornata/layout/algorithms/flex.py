@@ -3,13 +3,12 @@
 from __future__ import annotations
 
 import logging
-from threading import RLock
 from typing import TYPE_CHECKING
 
 from ornata.definitions.dataclasses.layout import LayoutResult
 from ornata.definitions.errors import LayoutCalculationError
 from ornata.definitions.protocols import LayoutAlgorithm
-from ornata.layout.engine.engine import LayoutNode, component_to_layout_node
+from ornata.layout.engine.engine import LayoutNode, sync_layout_node
 
 if TYPE_CHECKING:
     from ornata.api.exports.definitions import BackendTarget, Bounds
@@ -19,11 +18,12 @@ logger = logging.getLogger(__name__)
 
 
 class FlexLayout(LayoutAlgorithm):
-    """Flexbox layout algorithm implementation."""
+    """Flexbox layout algorithm implementation.
 
-    def __init__(self) -> None:
-        """Initialize the flex layout algorithm."""
-        self._lock = RLock()
+    The algorithm keeps no state of its own, so one instance may run
+    :meth:`calculate` from several threads at once as long as the calls lay
+    out disjoint component subtrees.
+    """
 
     def calculate(self, component: "Component", container_bounds: Bounds, backend_target: BackendTarget) -> LayoutResult:
         """Calculate flex layout for a component.
@@ -42,128 +42,125 @@ class FlexLayout(LayoutAlgorithm):
         Raises:
             LayoutCalculationError: If layout calculation fails.
         """
-        with self._lock:
-            try:
-                logger.debug(f"Calculating flex layout for node with backend: {backend_target}")
+        try:
+            logger.debug(f"Calculating flex layout for node with backend: {backend_target}")
 
-                node = component_to_layout_node(component)
+            node = sync_layout_node(component)
 
-                if hasattr(container_bounds, "to_backend_units"):
-                     bounds = container_bounds.to_backend_units(backend_target)
-                else:
-                     bounds = container_bounds
-
-                available_width = int(bounds.width)
-                available_height = int(bounds.height)
-
-                style = node.style
-
-                # Calculate padding and margin
-                padding_top = style.padding_top if style.padding_top is not None else style.padding
-                padding_right = style.padding_right if style.padding_right is not None else style.padding
-                padding_bottom = style.padding_bottom if style.padding_bottom is not None else style.padding
-                padding_left = style.padding_left if style.padding_left is not None else style.padding
-
-                margin_top = style.margin_top if style.margin_top is not None else style.margin
-                margin_right = style.margin_right if style.margin_right is not None else style.margin
-                margin_bottom = style.margin_bottom if style.margin_bottom is not None else style.margin
-                margin_left = style.margin_left if style.margin_left is not None else style.margin
-
-                # Calculate inner dimensions
-                inner_width = available_width - padding_left - padding_right - margin_left - margin_right
-                inner_height = available_height - padding_top - padding_bottom - margin_top - margin_bottom
-
-                if inner_width < 0:
-                    inner_width = 0
-                if inner_height < 0:
-                    inner_height = 0
-
-                # Handle leaf nodes
-                if not node.children:
-                    return self.calculate_leaf_layout(
-                        node, inner_width, inner_height, padding_left, padding_right,
-                        padding_top, padding_bottom, margin_left, margin_right, margin_top, margin_bottom
-                    )
-
-                # Calculate child layouts
-                child_layouts: list[LayoutResult] = []
-                total_main_size = 0
-                total_cross_size = 0
-                flex_grow_total = 0.0
-                flex_shrink_total = 0.0
-
-                is_row = style.direction == "row"
-
-                for child in node.children:
-                    if child.style.display == "none":
-                        continue
-
-                    child_result = self.calculate_child_layout(child, inner_width if is_row else inner_width, inner_height if not is_row else inner_height)
-                    child_layouts.append(child_result)
-
-                    main_size = child_result.width if is_row else child_result.height
-                    cross_size = child_result.height if is_row else child_result.width
-
-                    total_main_size += main_size
-                    total_cross_size = max(total_cross_size, cross_size)
-
-                    flex_grow_total += max(0.0, child.style.flex_grow)
-                    flex_shrink_total += max(0.0, child.style.flex_shrink)
-
-                # Add gaps
-                gaps = style.gap * (len(child_layouts) - 1) if child_layouts else 0
-                total_main_size += gaps
-
-                # Apply flex-grow and flex-shrink
-                if flex_grow_total > 0 and total_main_size < inner_width:
-                    extra_space = inner_width - total_main_size
-                    for i, _ in enumerate(child_layouts):
-                        grow = max(0.0, node.children[i].style.flex_grow)
-                        if grow > 0:
-                            delta = int(extra_space * (grow / flex_grow_total))
-                            if is_row:
-                                child_layouts[i] = self.calculate_child_layout(node.children[i], child_layouts[i].width + delta, inner_height)
-                            else:
-                                child_layouts[i] = self.calculate_child_layout(node.children[i], inner_width, child_layouts[i].height + delta)
-
-                elif flex_shrink_total > 0 and total_main_size > inner_width:
-                    deficit = total_main_size - inner_width
-                    for i, _ in enumerate(child_layouts):
-                        shrink = max(0.0, node.children[i].style.flex_shrink)
-                        if shrink > 0:
-                            reduce_amount = int(deficit * (shrink / flex_shrink_total))
-                            if is_row:
-                                child_layouts[i] = self.calculate_child_layout(node.children[i], max(0, child_layouts[i].width - reduce_amount), inner_height)
-                            else:
-                                child_layouts[i] = self.calculate_child_layout(node.children[i], inner_width, max(0, child_layouts[i].height - reduce_amount))
-
-                # Handle wrapping if enabled
-                if style.wrap and is_row and child_layouts:
-                    child_layouts, total_main_size, total_cross_size = self.handle_row_wrapping(child_layouts, inner_width, style.gap, style.align)
-
-                elif style.wrap and not is_row and child_layouts:
-                    child_layouts, total_main_size, total_cross_size = self.handle_column_wrapping(child_layouts, inner_height, style.gap, style.align)
-
-                # Position children
-                self.position_children(node, child_layouts, inner_width, inner_height, padding_left, padding_top, style.justify, style.align, is_row)
-
-                # Calculate final dimensions
-                container_width = inner_width + padding_left + padding_right
-                container_height = total_cross_size + padding_top + padding_bottom
-
-                # Apply min/max constraints
-                container_width = max(style.min_width or 0, min(style.max_width or container_width, container_width))
-                container_height = max(style.min_height or 0, min(style.max_height or container_height, container_height))
-
-                result = LayoutResult(x=margin_left, y=margin_top, width=container_width + margin_left + margin_right, height=container_height + margin_top + margin_bottom)
-
-                # Update node layout
-                node.layout = result
-                return result
-
-            except Exception as e:
-                logger.error(f"Flex layout calculation failed: {e}")
-                raise LayoutCalculationError(f"Failed to calculate flex layout: {e}") from e
+            if hasattr(container_bounds, "to_backend_units"):
+                bounds = container_bounds.to_backend_units(backend_target)
+            else:
+                bounds = container_bounds
+
+            available_width = int(bounds.width)
+            available_height = int(bounds.height)
+
+            style = node.style
+
+            # Calculate padding and margin
+            padding_top = style.padding_top if style.padding_top is not None else style.padding
+            padding_right = style.padding_right if style.padding_right is not None else style.padding
+            padding_bottom = style.padding_bottom if style.padding_bottom is not None else style.padding
+            padding_left = style.padding_left if style.padding_left is not None else style.padding
+
+            margin_top = style.margin_top if style.margin_top is not None else style.margin
+            margin_right = style.margin_right if style.margin_right is not None else style.margin
+            margin_bottom = style.margin_bottom if style.margin_bottom is not None else style.margin
+            margin_left = style.margin_left if style.margin_left is not None else style.margin
+
+            # Calculate inner dimensions
+            inner_width = available_width - padding_left - padding_right - margin_left - margin_right
+            inner_height = available_height - padding_top - padding_bottom - margin_top - margin_bottom
+
+            if inner_width < 0:
+                inner_width = 0
+            if inner_height < 0:
+                inner_height = 0
+
+            # Handle leaf nodes
+            if not node.children:
+                return self.calculate_leaf_layout(
+                    node, inner_width, inner_height, padding_left, padding_right,
+                    padding_top, padding_bottom, margin_left, margin_right, margin_top, margin_bottom
+                )
+
+            # Calculate child layouts
+            child_layouts: list[LayoutResult] = []
+            total_main_size = 0
+            total_cross_size = 0
+            flex_grow_total = 0.0
+            flex_shrink_total = 0.0
+
+            is_row = style.direction == "row"
+            visible = _visible_children(node)
+
+            for child in visible:
+                child_result = self.calculate_child_layout(child, inner_width if is_row else inner_width, inner_height if not is_row else inner_height)
+                child_layouts.append(child_result)
+
+                main_size = child_result.width if is_row else child_result.height
+                cross_size = child_result.height if is_row else child_result.width
+
+                total_main_size += main_size
+                total_cross_size = max(total_cross_size, cross_size)
+
+                flex_grow_total += max(0.0, child.style.flex_grow)
+                flex_shrink_total += max(0.0, child.style.flex_shrink)
+
+            # Add gaps
+            gaps = style.gap * (len(child_layouts) - 1) if child_layouts else 0
+            total_main_size += gaps
+
+            # Apply flex-grow and flex-shrink
+            if flex_grow_total > 0 and total_main_size < inner_width:
+                extra_space = inner_width - total_main_size
+                for i, _ in enumerate(child_layouts):
+                    grow = max(0.0, visible[i].style.flex_grow)
+                    if grow > 0:
+                        delta = int(extra_space * (grow / flex_grow_total))
+                        if is_row:
+                            child_layouts[i] = self.calculate_child_layout(visible[i], child_layouts[i].width + delta, inner_height)
+                        else:
+                            child_layouts[i] = self.calculate_child_layout(visible[i], inner_width, child_layouts[i].height + delta)
+
+            elif flex_shrink_total > 0 and total_main_size > inner_width:
+                deficit = total_main_size - inner_width
+                for i, _ in enumerate(child_layouts):
+                    shrink = max(0.0, visible[i].style.flex_shrink)
+                    if shrink > 0:
+                        reduce_amount = int(deficit * (shrink / flex_shrink_total))
+                        if is_row:
+                            child_layouts[i] = self.calculate_child_layout(visible[i], max(0, child_layouts[i].width - reduce_amount), inner_height)
+                        else:
+                            child_layouts[i] = self.calculate_child_layout(visible[i], inner_width, max(0, child_layouts[i].height - reduce_amount))
+
+            # Handle wrapping if enabled
+            if style.wrap and is_row and child_layouts:
+                child_layouts, total_main_size, total_cross_size = self.handle_row_wrapping(child_layouts, inner_width, style.gap, style.align)
+
+            elif style.wrap and not is_row and child_layouts:
+                child_layouts, total_main_size, total_cross_size = self.handle_column_wrapping(child_layouts, inner_height, style.gap, style.align)
+
+            # Position children
+            self.position_children(node, child_layouts, inner_width, inner_height, padding_left, padding_top, style.justify, style.align, is_row)
+
+            # Calculate final dimensions
+            container_width = inner_width + padding_left + padding_right
+            container_height = total_cross_size + padding_top + padding_bottom
+
+            # Apply min/max constraints
+            container_width = max(style.min_width or 0, min(style.max_width or container_width, container_width))
+            container_height = max(style.min_height or 0, min(style.max_height or container_height, container_height))
+
+            result = LayoutResult(x=margin_left, y=margin_top, width=container_width + margin_left + margin_right, height=container_height + margin_top + margin_bottom)
+
+            # Update node layout
+            node.layout = result
+            return result
+
+        except Exception as e:
+            logger.error(f"Flex layout calculation failed: {e}")
+            raise LayoutCalculationError(f"Failed to calculate flex layout: {e}") from e
 
     def calculate_leaf_layout(
         self,
@@ -317,8 +314,11 @@ class FlexLayout(LayoutAlgorithm):
         if not child_layouts:
             return
 
+        children = _visible_children(component)
+        # Justify slack widens a local copy of the gap; the style is never modified.
+        gap = component.style.gap
         if is_row:
-            total_width = sum(layout.width for layout in child_layouts) + component.style.gap * (len(child_layouts) - 1)
+            total_width = sum(layout.width for layout in child_layouts) + gap * (len(child_layouts) - 1)
             remaining_space = max(0, (inner_width or total_width) - total_width)
 
             # Calculate main axis positioning
@@ -329,22 +329,22 @@ class FlexLayout(LayoutAlgorithm):
             elif justify == "space-between" and len(child_layouts) > 1:
                 gap_extra = remaining_space // (len(child_layouts) - 1)
                 # Update gap in child positioning
-                component.style.gap += gap_extra
+                gap += gap_extra
                 main_offset = 0
             elif justify == "space-around" and child_layouts:
                 gap_extra = remaining_space // len(child_layouts)
-                component.style.gap += gap_extra
+                gap += gap_extra
                 main_offset = gap_extra // 2
             elif justify == "space-evenly" and child_layouts:
                 gap_extra = remaining_space // (len(child_layouts) + 1)
-                component.style.gap += gap_extra
+                gap += gap_extra
                 main_offset = gap_extra
             else:
                 main_offset = 0
 
             x_cursor = padding_left + main_offset
             for i, layout in enumerate(child_layouts):
-                child = component.children[i]
+                child = children[i]
                 child_margin_top = child.style.margin_top if child.style.margin_top is not None else child.style.margin
                 child_margin_bottom = child.style.margin_bottom if child.style.margin_bottom is not None else child.style.margin
 
@@ -362,10 +362,10 @@ class FlexLayout(LayoutAlgorithm):
                 else:
                     layout.y = padding_top + child_margin_top
 
-                x_cursor += layout.width + component.style.gap
+                x_cursor += layout.width + gap
         else:
             # Column direction
-            total_height = sum(layout.height for layout in child_layouts) + component.style.gap * (len(child_layouts) - 1)
+            total_height = sum(layout.height for layout in child_layouts) + gap * (len(child_layouts) - 1)
             remaining_space = max(0, (inner_height or total_height) - total_height)
 
             # Calculate main axis positioning
@@ -375,22 +375,22 @@ class FlexLayout(LayoutAlgorithm):
                 main_offset = remaining_space
             elif justify == "space-between" and len(child_layouts) > 1:
                 gap_extra = remaining_space // (len(child_layouts) - 1)
-                component.style.gap += gap_extra
+                gap += gap_extra
                 main_offset = 0
             elif justify == "space-around" and child_layouts:
                 gap_extra = remaining_space // len(child_layouts)
-                component.style.gap += gap_extra
+                gap += gap_extra
                 main_offset = gap_extra // 2
             elif justify == "space-evenly" and child_layouts:
                 gap_extra = remaining_space // (len(child_layouts) + 1)
-                component.style.gap += gap_extra
+                gap += gap_extra
                 main_offset = gap_extra
             else:
                 main_offset = 0
 
             y_cursor = padding_top + main_offset
             for i, layout in enumerate(child_layouts):
-                child = component.children[i]
+                child = children[i]
                 child_margin_left = child.style.margin_left if child.style.margin_left is not None else child.style.margin
                 child_margin_right = child.style.margin_right if child.style.margin_right is not None else child.style.margin
 
@@ -408,4 +408,9 @@ class FlexLayout(LayoutAlgorithm):
                 else:
                     layout.x = padding_left + child_margin_left
 
-                y_cursor += layout.height + component.style.gap
+                y_cursor += layout.height + gap
+
+
+def _visible_children(node: LayoutNode) -> list[LayoutNode]:
+    """Return the children that take part in flex layout, in order."""
+    return [child for child in node.children if child.style.display != "none"]
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Literal
 
+from ornata.utils.unicode_width import text_width
+
 JustifyContent = Literal["start", "center", "end", "space-between", "space-around", "space-evenly"]
 
 __all__ = [
@@ -54,11 +56,10 @@ def align_text(
 ) -> str:
     """Pad a rendered text segment to `width` according to alignment mode.
 
-    Assumes `text` is already markup-rendered; uses visible_width to compute
-    grapheme-aware length.
+    Assumes `text` is already markup-rendered; its width is measured in
+    terminal columns, so wide characters count twice.
     """
-    # Simple length check for now as markup was removed
-    visible_length = len(text)
+    visible_length = text_width(text)
     padding_space = max(0, width - visible_length)
     if mode in ("center", "centre"):
         left_padding = padding_space // 2
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 from . import engine
 from .engine import (
+    LayoutCache,
     LayoutEngine,
     LayoutNode,
+    LayoutPassStats,
     _calculate_grid_track_sizes,  # type: ignore [private]
     _parse_grid_template,  # type: ignore [private]
     calculate_component_layout,
@@ -15,12 +17,17 @@ from .engine import (
     compute_grid_layout,
     compute_layout,
     compute_relative_layout,
+    layout_fingerprint,
     measure_leaf,
+    relayout,
+    sync_layout_node,
 )
 
 __all__ = [
+    "LayoutCache",
     "LayoutEngine",
     "LayoutNode",
+    "LayoutPassStats",
     "_calculate_grid_track_sizes",
     "_parse_grid_template",
     "calculate_component_layout",
@@ -31,5 +38,8 @@ __all__ = [
     "compute_layout",
     "compute_relative_layout",
     "engine",
+    "layout_fingerprint",
     "measure_leaf",
+    "relayout",
+    "sync_layout_node",
 ]
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Sequence
-from dataclasses import asdict
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from contextvars import ContextVar, copy_context
+from dataclasses import asdict, dataclass, fields
 from math import floor
-from typing import TYPE_CHECKING
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
 
-from ornata.api.exports.utils import Lock, get_logger
+from ornata.api.exports.utils import get_logger
 from ornata.definitions.dataclasses.layout import LayoutResult, LayoutStyle
 
 if TYPE_CHECKING:
@@ -20,10 +28,43 @@ logger = get_logger(__name__)
 
 MeasureFunc = Callable[[int | None, int | None], tuple[int, int]]
 
+_layout_style_values = attrgetter(*(style_field.name for style_field in fields(LayoutStyle)))
+
+# Set while :func:`relayout` runs so clean nodes reuse their previous layout.
+_incremental_layout: ContextVar[bool] = ContextVar("ornata_incremental_layout", default=False)
+
+# Set by a parallel :meth:`LayoutEngine.layout_tree` pass; workers run with it cleared.
+_parallel_layout: ContextVar[_ParallelPass | None] = ContextVar("ornata_parallel_layout", default=None)
+
+DEFAULT_MIN_PARALLEL_SUBTREE = 64
+
+_LayoutJob = tuple["LayoutNode", int | None, int | None]
+
 class LayoutNode:
-    """Node in the layout tree."""
+    """Node in the layout tree.
 
-    __slots__ = ("style", "measure", "children", "layout", "__weakref__")
+    Nodes remember the constraints, style and natural size of their last
+    layout. Together with the dirty flags set by :meth:`mark_dirty` this lets
+    :func:`relayout` recompute only the parts of a tree that changed.
+    """
+
+    __slots__ = (
+        "style",
+        "measure",
+        "children",
+        "layout",
+        "_parent",
+        "_dirty",
+        "_dirty_descendants",
+        "_flexed",
+        "_layout_key",
+        "_measure_key",
+        "_measured",
+        "_style_snapshot",
+        "_computed",
+        "_fingerprint",
+        "__weakref__",
+    )
 
     __hash__ = object.__hash__
 
@@ -38,11 +79,81 @@ class LayoutNode:
         self.measure = measure
         self.children = children or []
         self.layout = layout or LayoutResult()
+        self._parent: weakref.ref[LayoutNode] | None = None
+        self._dirty = True
+        self._dirty_descendants = False
+        self._flexed = False
+        self._layout_key: tuple[int | None, int | None] | None = None
+        # Constraints and box of the measuring pass a flex parent runs before resizing this node.
+        self._measure_key: tuple[int | None, int | None] | None = None
+        self._measured: LayoutResult | None = None
+        self._style_snapshot: tuple[Any, ...] | None = None
+        self._computed: LayoutResult | None = None
+        # Memoized :func:`layout_fingerprint`; cleared up the ancestor chain by :meth:`mark_dirty`.
+        self._fingerprint: _Fingerprint | None = None
+        for child in self.children:
+            # Nodes shared with another tree keep their original parent.
+            if child._parent is None:
+                child._parent = weakref.ref(self)
 
     def add(self, child: LayoutNode) -> LayoutNode:
         self.children.append(child)
+        child._parent = weakref.ref(self)
+        self.mark_dirty()
         return child
 
+    def remove(self, child: LayoutNode) -> None:
+        """Detach ``child`` and mark this node for relayout."""
+        self.children.remove(child)
+        child._parent = None
+        self.mark_dirty()
+
+    @property
+    def parent(self) -> LayoutNode | None:
+        """Node this one was added to, if it is still alive."""
+        return self._parent() if self._parent is not None else None
+
+    @property
+    def is_dirty(self) -> bool:
+        """Whether this node or one of its descendants needs relayout."""
+        return self._dirty or self._dirty_descendants
+
+    def mark_dirty(self) -> None:
+        """Flag this node for relayout after its style, measure or children changed.
+
+        Ancestors are only told that a descendant is dirty; :func:`relayout`
+        decides how far up the size change actually propagates. Memoized
+        fingerprints of this node and its ancestors are dropped.
+        """
+        self._dirty = True
+        self._fingerprint = None
+        parent = self.parent
+        while parent is not None and (not parent._dirty_descendants or parent._fingerprint is not None):
+            parent._dirty_descendants = True
+            parent._fingerprint = None
+            parent = parent.parent
+
+    def set_style(self, style: LayoutStyle) -> None:
+        """Replace the layout style and mark the node dirty."""
+        self.style = style
+        self.mark_dirty()
+
+    def set_measure(self, measure: MeasureFunc | None) -> None:
+        """Replace the measure function and mark the node dirty."""
+        self.measure = measure
+        self.mark_dirty()
+
+    def set_children(self, children: list[LayoutNode]) -> None:
+        """Replace the children and mark the node dirty."""
+        kept = {id(child) for child in children}
+        for child in self.children:
+            if id(child) not in kept and child.parent is self:
+                child._parent = None
+        self.children = children
+        for child in children:
+            child._parent = weakref.ref(self)
+        self.mark_dirty()
+
     # ======================================================
     # COMPONENT-COMPATIBLE API (required by LayoutEngine)
     # ======================================================
@@ -77,21 +188,7 @@ def component_to_layout_node(component: Component) -> LayoutNode:
     layout_style = component.get_layout_style()
 
     # Create layout node
-
-    measure_func: MeasureFunc | None = None
-    if hasattr(component, "measure") and component.measure is not None:
-        def _measure(_: int | None, __: int | None) -> tuple[int, int]:
-            """Measure the component."""
-            try:
-                measured = component.measure()
-            except Exception as exc:  # pragma: no cover - defensive
-                logger.debug("Failed to measure %s: %s", component.component_name, exc)
-                return 0, 0
-            return int(measured.width), int(measured.height)
-
-        measure_func = _measure
-
-    layout_node = LayoutNode(style=layout_style, measure=measure_func)
+    layout_node = LayoutNode(style=layout_style, measure=_component_measure(component))
 
     # Convert children recursively
     for child in component.iter_children():
@@ -101,15 +198,376 @@ def component_to_layout_node(component: Component) -> LayoutNode:
     return layout_node
 
 
+# Nodes reused by :func:`sync_layout_node`, keyed by component id. Kept off the
+# component itself so they never show up in its VDOM props; each entry holds a
+# weak reference whose callback drops the entry when the component dies.
+_component_layout_nodes: dict[int, tuple[weakref.ref[Component], LayoutNode]] = {}
+
+
+def _forget_layout_node(key: int) -> Callable[[weakref.ref[Component]], None]:
+    """Return the weakref callback that drops the node stored under ``key``."""
+
+    def _forget(_: weakref.ref[Component]) -> None:
+        _component_layout_nodes.pop(key, None)
+
+    return _forget
+
+
+def sync_layout_node(component: Component) -> LayoutNode:
+    """Return the persistent layout node of a component, updated in place.
+
+    The first call builds the same tree as :func:`component_to_layout_node`
+    and records each node in a side table keyed by its component. Later
+    calls reuse those nodes: a node's style is replaced only when its values
+    changed and its children only when the child list changed. Entries are
+    only touched by their own component, so disjoint subtrees can be synced
+    and laid out from different threads. Objects that cannot be weakly
+    referenced get a fresh node on every call.
+
+    Args:
+        component: Root of the component subtree.
+
+    Returns:
+        LayoutNode: The component's node.
+    """
+    style = component.get_layout_style()
+    key = id(component)
+    entry = _component_layout_nodes.get(key)
+    node = entry[1] if entry is not None and entry[0]() is component else None
+    if node is None:
+        node = LayoutNode(style=style, measure=_component_measure(component))
+        try:
+            _component_layout_nodes[key] = (weakref.ref(component, _forget_layout_node(key)), node)
+        except TypeError:
+            pass
+    else:
+        fingerprint = node._fingerprint
+        if style is not node.style:
+            if _layout_style_values(style) != _layout_style_values(node.style):
+                node.set_style(style)
+            else:
+                node.style = style
+        elif fingerprint is not None and fingerprint.style != _layout_style_values(style):
+            # The style object was edited in place.
+            node.mark_dirty()
+        if node._fingerprint is not None and node._fingerprint.size != _node_content_size(node):
+            node.mark_dirty()
+
+    children = [sync_layout_node(child) for child in component.iter_children()]
+    current = node.children
+    if len(children) != len(current) or any(new is not old for new, old in zip(children, current, strict=True)):
+        node.set_children(children)
+    return node
+
+
+def _component_measure(component: Component) -> MeasureFunc | None:
+    """Return a measure function that sizes ``component`` from its content."""
+    if getattr(component, "measure", None) is None:
+        return None
+
+    def _measure(_: int | None, __: int | None) -> tuple[int, int]:
+        """Measure the component."""
+        try:
+            measured = component.measure()
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.debug("Failed to measure %s: %s", component.component_name, exc)
+            return 0, 0
+        return int(measured.width), int(measured.height)
+
+    return _measure
+
+
+class _Fingerprint:
+    """Memoized fingerprint of one layout node: its style, content size and children."""
+
+    __slots__ = ("style", "size", "children", "_hash")
+
+    def __init__(self, style: tuple[Any, ...], size: tuple[int, int] | None, children: tuple[_Fingerprint, ...]) -> None:
+        self.style = style
+        self.size = size
+        self.children = children
+        # Children cache their own hashes, so this is linear in the child count only.
+        self._hash = hash((style, size, children))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, _Fingerprint):
+            return NotImplemented
+        return self._hash == other._hash and self.style == other.style and self.size == other.size and self.children == other.children
+
+
+def layout_fingerprint(component: Component | LayoutNode) -> Hashable:
+    """Return a structural fingerprint of a component subtree.
+
+    The fingerprint captures everything the layout algorithms read: every
+    ``LayoutStyle`` field, the measured content size and the fingerprints of
+    the children, in order. Rebuilt trees with the same content therefore
+    produce equal fingerprints, while any style or text change produces a
+    different one.
+
+    Fingerprints are memoized on layout nodes and dropped by
+    :meth:`LayoutNode.mark_dirty`, so probing an unchanged tree again costs
+    nothing beyond the probe. Components are fingerprinted through their
+    persistent node from :func:`sync_layout_node`, which marks the node
+    dirty when its style or measured size changed. Raw layout nodes whose
+    style is edited in place must be marked dirty by the caller.
+
+    Args:
+        component: Root of the subtree.
+
+    Returns:
+        A hashable value that compares equal for equal subtrees.
+    """
+    node = component if isinstance(component, LayoutNode) else sync_layout_node(component)
+    return _node_fingerprint(node)
+
+
+def _node_fingerprint(node: LayoutNode) -> _Fingerprint:
+    """Return the memoized fingerprint of ``node``, computing stale parts of the subtree."""
+    fingerprint = node._fingerprint
+    if fingerprint is None:
+        fingerprint = _Fingerprint(
+            _layout_style_values(node.style),
+            _node_content_size(node),
+            tuple(_node_fingerprint(child) for child in node.children),
+        )
+        node._fingerprint = fingerprint
+    return fingerprint
+
+
+def _node_content_size(node: LayoutNode) -> tuple[int, int] | None:
+    """Return the natural content size reported by ``node``'s measure function."""
+    measure = node.measure
+    if measure is None:
+        return None
+    try:
+        width, height = measure(None, None)
+    except Exception:
+        return (0, 0)
+    return int(width), int(height)
+
+
+class LayoutCache:
+    """Bounded LRU cache of layout results with generation tagging.
+
+    Every entry remembers the generation it was stored in. Bumping the
+    generation with :meth:`invalidate` retires all entries at once; stale
+    entries are dropped lazily when they are looked up.
+    """
+
+    __slots__ = ("_entries", "_max_size", "_generation", "_lock", "hits", "misses", "evictions")
+
+    def __init__(self, max_size: int = 512) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries kept before evicting the least recently used.
+        """
+        self._entries: OrderedDict[Hashable, tuple[int, LayoutResult]] = OrderedDict()
+        self._max_size = max(1, max_size)
+        self._generation = 0
+        self._lock: threading.Lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def generation(self) -> int:
+        """Current cache generation."""
+        return self._generation
+
+    def get(self, key: Hashable) -> LayoutResult | None:
+        """Return the cached result for ``key`` or ``None`` on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != self._generation:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, result: LayoutResult) -> None:
+        """Store ``result`` under ``key`` in the current generation."""
+        with self._lock:
+            self._entries[key] = (self._generation, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self) -> None:
+        """Retire every cached entry by starting a new generation."""
+        with self._lock:
+            self._generation += 1
+
+    def clear(self) -> None:
+        """Drop all entries and start a new generation."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def get_stats(self) -> dict[str, int]:
+        """Return size, capacity, generation and hit/miss/eviction counters."""
+        with self._lock:
+            return {
+                "cache_size": len(self._entries),
+                "cache_max_size": self._max_size,
+                "cache_generation": self._generation,
+                "cache_hits": self.hits,
+                "cache_misses": self.misses,
+                "cache_evictions": self.evictions,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass(slots=True)
+class LayoutPassStats:
+    """Timing and dispatch counters for :meth:`LayoutEngine.layout_tree`.
+
+    ``parallel_batches`` and ``parallel_tasks`` describe the most recent
+    pass: how many child lists were fanned out and into how many tasks.
+    """
+
+    passes: int = 0
+    last_seconds: float = 0.0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    parallel_passes: int = 0
+    parallel_batches: int = 0
+    parallel_tasks: int = 0
+
+
+class _ParallelPass:
+    """Worker pool and subtree sizes shared by one parallel layout pass."""
+
+    __slots__ = ("executor", "min_subtree_size", "sizes", "batches", "tasks")
+
+    def __init__(self, executor: ThreadPoolExecutor, min_subtree_size: int, sizes: dict[int, int]) -> None:
+        self.executor = executor
+        self.min_subtree_size = min_subtree_size
+        self.sizes = sizes
+        self.batches = 0
+        self.tasks = 0
+
+    def partition(self, jobs: list[_LayoutJob]) -> list[tuple[int, int]]:
+        """Split ``jobs`` into consecutive ranges of at least ``min_subtree_size`` nodes."""
+        sizes = self.sizes
+        minimum = self.min_subtree_size
+        ranges: list[tuple[int, int]] = []
+        start = 0
+        weight = 0
+        for index, (node, _, _) in enumerate(jobs):
+            weight += sizes.get(id(node), 1)
+            if weight >= minimum:
+                ranges.append((start, index + 1))
+                start = index + 1
+                weight = 0
+        if start < len(jobs):
+            # A light tail rides along with the previous range.
+            if ranges:
+                ranges[-1] = (ranges[-1][0], len(jobs))
+            else:
+                ranges.append((start, len(jobs)))
+        return ranges
+
+    def run(self, jobs: list[_LayoutJob], ranges: list[tuple[int, int]]) -> list[LayoutResult]:
+        """Lay out each range on the pool, keeping the first on the calling thread."""
+        self.batches += 1
+        self.tasks += len(ranges)
+        futures = [self.executor.submit(copy_context().run, _layout_serially, jobs[start:stop]) for start, stop in ranges[1:]]
+        try:
+            start, stop = ranges[0]
+            results = copy_context().run(_layout_serially, jobs[start:stop])
+        finally:
+            wait_futures(futures)
+        for future in futures:
+            results.extend(future.result())
+        return results
+
+
+def _layout_serially(jobs: list[_LayoutJob]) -> list[LayoutResult]:
+    """Lay out ``jobs`` on this thread without further fan-out."""
+    _parallel_layout.set(None)
+    return [compute_layout(node, width, height) for node, width, height in jobs]
+
+
+def _layout_subtrees(jobs: list[_LayoutJob]) -> list[LayoutResult]:
+    """Lay out sibling subtrees whose constraints are already fixed.
+
+    During a parallel pass the siblings are grouped into tasks of at least
+    the pass's minimum subtree size and solved on the worker pool; smaller
+    sibling lists, and every list outside a parallel pass, stay serial.
+    """
+    parallel = _parallel_layout.get()
+    if parallel is not None and len(jobs) > 1:
+        ranges = parallel.partition(jobs)
+        if len(ranges) > 1:
+            return parallel.run(jobs, ranges)
+    return [compute_layout(node, width, height) for node, width, height in jobs]
+
+
+def _subtree_sizes(root: LayoutNode) -> dict[int, int]:
+    """Return the number of nodes under each node of ``root``, keyed by ``id``."""
+    order: list[LayoutNode] = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        order.append(node)
+        stack.extend(node.children)
+    sizes: dict[int, int] = {}
+    for node in reversed(order):
+        total = 1
+        for child in node.children:
+            total += sizes[id(child)]
+        sizes[id(node)] = total
+    return sizes
+
+
 class LayoutEngine:
-    """Engine for calculating component layouts with parallelization support."""
+    """Engine for calculating component layouts with parallelization support.
+
+    :meth:`layout_tree` times every pass. With ``parallel`` enabled, sibling
+    subtrees whose constraints are fixed are solved on a thread pool once
+    they hold at least ``min_parallel_subtree`` nodes between them; measure
+    functions must then be safe to call from worker threads.
+    """
+
+    def __init__(
+        self,
+        cache_size: int = 512,
+        *,
+        parallel: bool = False,
+        max_workers: int | None = None,
+        min_parallel_subtree: int = DEFAULT_MIN_PARALLEL_SUBTREE,
+    ) -> None:
+        """Initialize the layout engine.
 
-    def __init__(self) -> None:
-        """Initialize the layout engine."""
-        self._cache: dict[str, LayoutResult] = {}
+        Args:
+            cache_size: Maximum number of layout results kept in the structural cache.
+            parallel: Solve independent subtrees on a worker pool in :meth:`layout_tree`.
+            max_workers: Size of the worker pool; ``None`` uses the executor default.
+            min_parallel_subtree: Fewest nodes a worker task is given; smaller trees stay serial.
+        """
+        if min_parallel_subtree < 1:
+            raise ValueError("min_parallel_subtree must be positive")
+        self._cache = LayoutCache(cache_size)
         self._algorithms: dict[str, LayoutAlgorithm] = {}
         self._constraints: list[LayoutConstraint] = []
-        self._lock = Lock()
+        self._lock: threading.Lock = threading.Lock()
+        self.parallel = parallel
+        self.min_parallel_subtree = min_parallel_subtree
+        self._max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._pass_stats = LayoutPassStats()
 
         # Initialize built-in algorithms using lazy imports to avoid circular dependencies
         from ornata.layout.algorithms.absolute import AbsoluteLayout
@@ -140,9 +598,10 @@ class LayoutEngine:
             cache_key = self._make_cache_key(component, container_bounds, backend_target)
 
             # Check cache first
-            if cache_key in self._cache:
-                logger.log(5, f"Layout cache hit for key: {cache_key}")
-                return self._cache[cache_key]
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                logger.log(5, "Layout cache hit")
+                return cached
 
             logger.debug(f"Calculating layout for component with renderer: {backend_target}")
 
@@ -161,7 +620,7 @@ class LayoutEngine:
                     result = LayoutResult(x=int(adjusted_bounds.x), y=int(adjusted_bounds.y), width=int(adjusted_bounds.width), height=int(adjusted_bounds.height))
 
             # Cache result
-            self._cache[cache_key] = result
+            self._cache.set(cache_key, result)
 
             logger.debug(f"Layout calculation completed in {len(self._cache)} cached entries")
             return result
@@ -171,45 +630,102 @@ class LayoutEngine:
             from ornata.definitions.errors import LayoutCalculationError
             raise LayoutCalculationError(f"Failed to calculate layout: {e}") from e
 
+    def layout_tree(
+        self,
+        node: LayoutNode,
+        available_width: int | None = None,
+        available_height: int | None = None,
+        *,
+        incremental: bool = False,
+    ) -> LayoutResult:
+        """Lay out a node tree, timing the pass and fanning out subtrees when parallel.
+
+        Args:
+            node: Root of the tree.
+            available_width: Available width.
+            available_height: Available height.
+            incremental: Use :func:`relayout` instead of a full :func:`compute_layout`.
+
+        Returns:
+            The layout result of ``node``.
+        """
+        parallel: _ParallelPass | None = None
+        if self.parallel:
+            sizes = _subtree_sizes(node)
+            if sizes[id(node)] >= 2 * self.min_parallel_subtree:
+                parallel = _ParallelPass(self._get_executor(), self.min_parallel_subtree, sizes)
+
+        token = _parallel_layout.set(parallel)
+        start = time.perf_counter()
+        try:
+            if incremental:
+                result = relayout(node, available_width, available_height)
+            else:
+                result = compute_layout(node, available_width, available_height)
+        finally:
+            elapsed = time.perf_counter() - start
+            _parallel_layout.reset(token)
+
+        stats = self._pass_stats
+        stats.passes += 1
+        stats.last_seconds = elapsed
+        stats.total_seconds += elapsed
+        stats.max_seconds = max(stats.max_seconds, elapsed)
+        stats.parallel_batches = parallel.batches if parallel is not None else 0
+        stats.parallel_tasks = parallel.tasks if parallel is not None else 0
+        if stats.parallel_batches:
+            stats.parallel_passes += 1
+        return result
+
+    @property
+    def pass_stats(self) -> LayoutPassStats:
+        """Timing and parallel dispatch counters for :meth:`layout_tree`."""
+        return self._pass_stats
+
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the worker pool, starting it on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="ornata-layout")
+            return self._executor
+
     def get_layout_stats(self) -> dict[str, int]:
         """Get layout engine statistics.
 
         Returns:
-            Dictionary with layout statistics.
+            Dictionary with layout statistics, including the structural
+            cache's size, capacity, generation and hit/miss/eviction counts.
         """
         return {
-            'cache_size': len(self._cache),
+            **self._cache.get_stats(),
             'algorithms_count': len(self._algorithms),
-            'constraints_count': len(self._constraints)
+            'constraints_count': len(self._constraints),
+            'layout_passes': self._pass_stats.passes,
         }
 
-    def _make_cache_key(self, component: Component, bounds: Bounds, backend_target: BackendTarget) -> str:
+    def _make_cache_key(self, component: Component, bounds: Bounds, backend_target: BackendTarget) -> Hashable:
         """Create cache key for layout calculation.
 
+        The key is built from the subtree's content rather than object
+        identity, so rebuilt but equivalent trees share entries and a
+        changed ``LayoutStyle`` anywhere in the subtree yields a new key.
+
         Args:
             component: The component.
             bounds: The container bounds.
             backend_target: The backend target.
 
         Returns:
-            Cache key string.
+            Hashable cache key.
         """
-        # Create a hash of relevant properties
-        layout_style = component.get_layout_style()
-        style_hash = hash(
-            (
-                layout_style.width,
-                layout_style.height,
-                layout_style.direction,
-                layout_style.justify,
-                layout_style.align,
-                layout_style.gap,
-                layout_style.wrap,
-                layout_style.display,
-                layout_style.position,
-            )
-        )
-        return f"{id(component)}:{bounds.x}:{bounds.y}:{bounds.width}:{bounds.height}:{backend_target.value}:{style_hash}"
+        return (layout_fingerprint(component), bounds.x, bounds.y, bounds.width, bounds.height, backend_target.value)
 
     def _select_algorithm(self, component: Component) -> LayoutAlgorithm:
         """Select appropriate layout algorithm.
@@ -241,6 +757,7 @@ class LayoutEngine:
         """
         with self._lock:
             self._constraints.append(constraint)
+            self._cache.invalidate()
 
     def clear_cache(self) -> None:
         """Clear the layout cache."""
@@ -268,6 +785,13 @@ def calculate_component_layout(component: Component, container_bounds: Bounds, b
 def compute_layout(node: LayoutNode, available_width: int | None = None, available_height: int | None = None) -> LayoutResult:
     """Compute layout for a node (backward compatibility).
 
+    Outside :func:`relayout` the whole subtree is always recomputed. Either
+    way the node records its constraints and natural size so that a later
+    incremental pass can reuse them. Flexed children are asked twice by
+    their parent, first at the container size and then at their flexed
+    size; both answers are kept, so an unchanged flexed subtree is reused
+    on either call.
+
     Args:
         node: The layout node.
         available_width: Available width.
@@ -276,20 +800,129 @@ def compute_layout(node: LayoutNode, available_width: int | None = None, availab
     Returns:
         The layout result.
     """
-    from ornata.api.exports.utils import ThreadSafeLRUCache
-    # Check cache first
-    cache: ThreadSafeLRUCache[tuple[LayoutNode, int | None, int | None], LayoutResult] = ThreadSafeLRUCache()
-    cache_key = (node, available_width, available_height)
-    cached_result = cache.get(cache_key)
-    if cached_result is not None:
-        node.layout = cached_result
-        return cached_result
+    key = (available_width, available_height)
+    if (
+        not node._dirty
+        and not node._dirty_descendants
+        and _incremental_layout.get()
+        and node._style_snapshot == _layout_style_values(node.style)
+    ):
+        if node._layout_key == key:
+            reused = node._computed
+        elif node._measure_key == key:
+            # Only the box: the subtree stays laid out for ``_layout_key``,
+            # and the parent either flexes this node to it again or recomputes it.
+            reused = node._measured
+        else:
+            reused = None
+        if reused is not None:
+            node.layout = LayoutResult(x=reused.x, y=reused.y, width=reused.width, height=reused.height)
+            return node.layout
+
+    return _recompute_layout(node, available_width, available_height)
+
+
+def _recompute_layout(node: LayoutNode, available_width: int | None, available_height: int | None) -> LayoutResult:
+    """Lay out ``node``'s subtree from scratch and record the result for reuse."""
+    snapshot = _layout_style_values(node.style)
+    if node._dirty or node._dirty_descendants or snapshot != node._style_snapshot:
+        # The subtree changed, so the box measured for a flex parent is stale.
+        node._measure_key = None
+        node._measured = None
+    result = _compute_node_layout(node, available_width, available_height)
+    node._computed = LayoutResult(x=result.x, y=result.y, width=result.width, height=result.height)
+    node._layout_key = (available_width, available_height)
+    node._style_snapshot = snapshot
+    node._dirty = False
+    node._dirty_descendants = False
+    return result
+
+
+def relayout(node: LayoutNode, available_width: int | None = None, available_height: int | None = None) -> LayoutResult:
+    """Incrementally recompute the layout of a previously laid out tree.
+
+    Subtrees that are clean and receive the same constraints keep their
+    previous layout. Each node flagged with :meth:`LayoutNode.mark_dirty` is
+    recomputed with the constraints it last received; if its natural size
+    is unchanged its old position is kept and the walk stops there, so the
+    relayout boundary is the nearest ancestor whose size did not change.
+    Otherwise its parent is recomputed, which repositions the siblings
+    without re-resolving them, and so on up the tree.
+
+    Args:
+        node: Root of the tree.
+        available_width: Available width.
+        available_height: Available height.
 
+    Returns:
+        The layout result of ``node``.
+    """
+    token = _incremental_layout.set(True)
+    try:
+        if node._computed is None or node._dirty or node._layout_key != (available_width, available_height):
+            return compute_layout(node, available_width, available_height)
+        for dirty in list(_iter_dirty_nodes(node)):
+            _relayout_upwards(dirty, node)
+        return node.layout
+    finally:
+        _incremental_layout.reset(token)
+
+
+def _iter_dirty_nodes(node: LayoutNode) -> Iterator[LayoutNode]:
+    """Yield the topmost dirty nodes below ``node`` and clear the descendant flags.
+
+    The upward walk may stop below a node whose subtree changed, so the box
+    such a node measured for its flex parent is dropped here: it no longer
+    matches the subtree, and the parent has to measure it again.
+    """
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        current._dirty_descendants = False
+        current._measure_key = None
+        current._measured = None
+        for child in current.children:
+            if child._dirty:
+                yield child
+            elif child._dirty_descendants:
+                stack.append(child)
+
+
+def _relayout_upwards(node: LayoutNode, root: LayoutNode) -> None:
+    """Recompute ``node`` and its ancestors until a size stops changing."""
+    while node._dirty or node._dirty_descendants:
+        previous_box = node.layout
+        previous = node._computed
+        key = node._layout_key or (None, None)
+        result = compute_layout(node, *key)
+        parent = node.parent
+        if node is root or parent is None:
+            return
+        if (
+            previous is not None
+            and not node._flexed
+            and (previous.x, previous.y, previous.width, previous.height) == (result.x, result.y, result.width, result.height)
+        ):
+            # Same natural size: the parent would place it exactly as before.
+            node.layout = previous_box
+            return
+        parent._dirty = True
+        node = parent
+
+
+def _record_measure(child: LayoutNode, available_width: int | None, available_height: int | None) -> None:
+    """Mark ``child`` as flexed and keep the box it measured at the container size."""
+    child._flexed = True
+    child._measure_key = (available_width, available_height)
+    box = child.layout
+    child._measured = LayoutResult(x=box.x, y=box.y, width=box.width, height=box.height)
+
+
+def _compute_node_layout(node: LayoutNode, available_width: int | None, available_height: int | None) -> LayoutResult:
+    """Lay out ``node`` and its subtree without consulting the node's previous layout."""
     # Performance optimization: early exit for invisible nodes
     if node.style.display == "none":
-        result = LayoutResult(width=0, height=0)
-        cache.set(cache_key, result)
-        return result
+        return LayoutResult(width=0, height=0)
 
     # Debug logging for flex layout overlapping issue
     logger.debug(f"compute_layout: node={node.style.display}, children={len(node.children)}, available_width={available_width}, available_height={available_height}")
@@ -300,27 +933,19 @@ def compute_layout(node: LayoutNode, available_width: int | None = None, availab
     if style.position in ("absolute", "fixed"):
         result = compute_absolute_layout(node, available_width, available_height)
         node.layout = result
-        cache_key = (node, available_width, available_height)
-        cache[cache_key] = result    # or cache.set(cache_key, result)
         return result
     if style.position == "relative":
         result = compute_relative_layout(node, available_width, available_height)
         node.layout = result
-        cache_key = (node, available_width, available_height)
-        cache[cache_key] = result    # or cache.set(cache_key, result)
         return result
     # Check if this is a grid container
     if style.grid_template_columns or style.grid_template_rows:
         result = compute_grid_layout(node, available_width, available_height)
         node.layout = result
-        cache_key = (node, available_width, available_height)
-        cache[cache_key] = result    # or cache.set(cache_key, result)
         return result
     if not node.children:
         result = measure_leaf(node, available_width, available_height)
         node.layout = result
-        cache_key = (node, available_width, available_height)
-        cache[cache_key] = result    # or cache.set(cache_key, result)
         return result
 
     # Initialise common box-model measures for containers with children
@@ -360,10 +985,9 @@ def compute_layout(node: LayoutNode, available_width: int | None = None, availab
     # Performance optimization: batch process children to reduce cache misses
     children_to_process = [child for child in node.children if child.style.display != "none"]
 
-    for child in children_to_process:
-        child_available_width = inner_width
-        child_available_height = inner_height
-        child_result = compute_layout(child, child_available_width, child_available_height)
+    child_results = _layout_subtrees([(child, inner_width, inner_height) for child in children_to_process])
+    for child, child_result in zip(children_to_process, child_results, strict=True):
+        child._flexed = False
         child_layouts.append(child.layout)
 
         main_size = child_result.width if is_row else child_result.height
@@ -385,19 +1009,24 @@ def compute_layout(node: LayoutNode, available_width: int | None = None, availab
 
     extra_space = inner_main - content_main
 
+    # Constraints each child is finally laid out with, after flexing.
+    constraints: list[tuple[int | None, int | None]] = [(inner_width, inner_height)] * len(children_to_process)
     if not style.wrap:
+        # Resolve every flexed child's main size first; the resized subtrees are then independent.
+        flexed: list[int] = []
+        jobs: list[_LayoutJob] = []
         if extra_space > 0 and flex_grow_total > 0:
             for idx, child in enumerate(children_to_process):
                 grow = max(0.0, child.style.flex_grow)
                 if grow == 0:
                     continue
                 delta = int(extra_space * (grow / flex_grow_total))
+                _record_measure(child, inner_width, inner_height)
+                flexed.append(idx)
                 if is_row:
-                    target_width = child_layouts[idx].width + delta
-                    child_layouts[idx] = compute_layout(child, target_width, inner_height)
+                    jobs.append((child, child_layouts[idx].width + delta, inner_height))
                 else:
-                    target_height = child_layouts[idx].height + delta
-                    child_layouts[idx] = compute_layout(child, inner_width, target_height)
+                    jobs.append((child, inner_width, child_layouts[idx].height + delta))
             inner_main = content_main + extra_space
         elif extra_space < 0 and flex_shrink_total > 0:
             deficit = -extra_space
@@ -406,13 +1035,23 @@ def compute_layout(node: LayoutNode, available_width: int | None = None, availab
                 if shrink == 0:
                     continue
                 reduce = int(deficit * (shrink / flex_shrink_total))
+                _record_measure(child, inner_width, inner_height)
+                flexed.append(idx)
                 if is_row:
-                    target_width = max(0, child_layouts[idx].width - reduce)
-                    child_layouts[idx] = compute_layout(child, target_width, inner_height)
+                    jobs.append((child, max(0, child_layouts[idx].width - reduce), inner_height))
                 else:
-                    target_height = max(0, child_layouts[idx].height - reduce)
-                    child_layouts[idx] = compute_layout(child, inner_width, target_height)
+                    jobs.append((child, inner_width, max(0, child_layouts[idx].height - reduce)))
             inner_main = content_main - deficit
+        for idx, job, flexed_result in zip(flexed, jobs, _layout_subtrees(jobs), strict=True):
+            child_layouts[idx] = flexed_result
+            constraints[idx] = (job[1], job[2])
+
+    # A child may have reused only the box it measured for a flex parent, either
+    # because it is no longer flexed or because its flexed size equals the
+    # container size; its subtree is still laid out for other constraints.
+    for idx, child in enumerate(children_to_process):
+        if child._layout_key != constraints[idx]:
+            child_layouts[idx] = _recompute_layout(child, *constraints[idx])
 
     if children_to_process:
         content_main = sum(layout.width if is_row else layout.height for layout in child_layouts) + style.gap * (len(children_to_process) - 1)
@@ -484,8 +1123,6 @@ def compute_layout(node: LayoutNode, available_width: int | None = None, availab
             y_cursor += line_cross
             if line_index < len(lines) - 1:
                 y_cursor += style.gap
-        cache_key = (node, available_width, available_height)
-        cache[cache_key] = result    # or cache.set(cache_key, result)
         return result
 
     # Column-direction wrapping: pack children top-to-bottom into columns
@@ -554,8 +1191,6 @@ def compute_layout(node: LayoutNode, available_width: int | None = None, availab
             x_cursor += col_cross
             if col_index < len(columns) - 1:
                 x_cursor += style.gap
-        cache_key = (node, available_width, available_height)
-        cache[cache_key] = result    # or cache.set(cache_key, result)
         return result
 
     inner_cross = inner_height if is_row else inner_width
@@ -654,8 +1289,6 @@ def compute_layout(node: LayoutNode, available_width: int | None = None, availab
                 child_layout.x = padding_left + child_margin_left
             cursor_main += size.height + gap
 
-    cache_key = (node, available_width, available_height)
-    cache[cache_key] = result    # or cache.set(cache_key, result)
     return result
 
 
@@ -2,18 +2,26 @@
 
 from __future__ import annotations
 
-from . import virtual_scrolling
+from . import height_index, virtual_scrolling, virtual_table
+from .height_index import HeightIndex
 from .virtual_scrolling import (
     VirtualScrollContainer,
     VirtualScrollState,
     create_simple_item_renderer,
     create_virtual_scroll_node,
 )
+from .virtual_table import TableRowSource, VirtualTable, format_table_row
 
 __all__ = [
+    "HeightIndex",
+    "TableRowSource",
     "VirtualScrollContainer",
     "VirtualScrollState",
+    "VirtualTable",
     "create_simple_item_renderer",
     "create_virtual_scroll_node",
+    "format_table_row",
+    "height_index",
     "virtual_scrolling",
+    "virtual_table",
 ]
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import TYPE_CHECKING, Any
 
 from ornata.definitions.dataclasses.layout import VirtualScrollState
 from ornata.layout.engine.engine import LayoutNode
+from ornata.layout.scrolling.height_index import HeightIndex
+from ornata.utils.unicode_width import text_width
 
 if TYPE_CHECKING:
     from ornata.definitions.dataclasses.layout import LayoutStyle, VirtualScrollConfig
@@ -14,25 +16,40 @@ if TYPE_CHECKING:
 # Type hints
 ItemRenderer = Callable[[Any, int], LayoutNode]
 ItemMeasurer = Callable[[Any], tuple[int, int]]
+ItemRecycler = Callable[[LayoutNode, int], LayoutNode]
 
 
 class VirtualScrollContainer:
-    """Container that efficiently renders large lists using virtual scrolling."""
+    """Container that efficiently renders large lists using virtual scrolling.
+
+    With ``config.item_height`` set every item has that height. Otherwise
+    heights are kept in a :class:`HeightIndex`: items count as
+    ``config.estimated_item_height`` until they are rendered and measured,
+    and offset/index lookups stay O(log n) however many items there are.
+
+    Nodes of items that scroll out of range are kept in a pool. When an
+    ``item_recycler`` is given, items scrolling into range reuse a pooled
+    node through ``item_recycler(node, index)`` instead of building a new
+    one with ``item_renderer``.
+    """
 
     def __init__(
         self,
         config: VirtualScrollConfig,
         item_renderer: ItemRenderer,
         item_measurer: ItemMeasurer | None = None,
+        item_recycler: ItemRecycler | None = None,
+        max_pooled_nodes: int = 256,
     ):
         self.config = config
         self.item_renderer = item_renderer
         self.item_measurer = item_measurer
+        self.item_recycler = item_recycler
+        self.max_pooled_nodes = max_pooled_nodes
         self.state = VirtualScrollState()
-
-        # Performance optimization: pre-allocate height cache if we know total items
-        if config.total_items > 0 and config.item_height is None:
-            self.state.item_heights = [0] * config.total_items
+        self._heights: HeightIndex | None = None
+        self._node_pool: list[LayoutNode] = []
+        self._sync_heights()
 
     def update_config(self, **updates: Any) -> None:
         """Update configuration and recalculate visible range."""
@@ -40,17 +57,23 @@ class VirtualScrollContainer:
             if hasattr(self.config, key):
                 setattr(self.config, key, value)
 
-        # Invalidate cached heights if total_items changed
-        if "total_items" in updates and self.config.item_height is None:
-            old_total = len(self.state.item_heights)
-            new_total = self.config.total_items
-            if new_total > old_total:
-                self.state.item_heights.extend([0] * (new_total - old_total))
-            elif new_total < old_total:
-                self.state.item_heights = self.state.item_heights[:new_total]
+        if "total_items" in updates or "item_height" in updates:
+            self._sync_heights()
 
         self._update_visible_range()
 
+    def _sync_heights(self) -> None:
+        """Create, resize or drop the height index to match the configuration."""
+        if self.config.item_height:
+            self._heights = None
+            self.state.item_heights = []
+            return
+        if self._heights is None:
+            self._heights = HeightIndex(self.config.total_items, self.config.estimated_item_height)
+        else:
+            self._heights.resize(self.config.total_items)
+        self.state.item_heights = self._heights.heights
+
     def scroll_to(self, item_index: int) -> None:
         """Scroll to make the specified item visible."""
         self.config.scroll_offset = max(0, min(item_index, max(0, self.config.total_items - 1)))
@@ -60,6 +83,20 @@ class VirtualScrollContainer:
         """Scroll by the specified number of items."""
         self.scroll_to(self.config.scroll_offset + delta)
 
+    def scroll_to_offset(self, offset: int) -> None:
+        """Scroll so the item covering height ``offset`` is the first one visible."""
+        if self._heights is not None:
+            self.scroll_to(self._heights.index_at(offset))
+        else:
+            self.scroll_to(offset // max(1, self.config.item_height or 1))
+
+    def set_item_height(self, item_index: int, height: int) -> None:
+        """Record the measured height of an item, e.g. after it was laid out."""
+        if self._heights is None or not 0 <= item_index < len(self._heights):
+            return
+        if self._heights.set(item_index, max(0, height)):
+            self._update_visible_range()
+
     def get_visible_range(self) -> tuple[int, int]:
         """Get the range of currently visible items."""
         return (self.state.visible_start, self.state.visible_end)
@@ -68,106 +105,147 @@ class VirtualScrollContainer:
         """Get the nodes that should be rendered for the current viewport."""
         return [node for _, node in self.state.rendered_items]
 
+    def get_item_offset(self, item_index: int) -> int:
+        """Get the height of all items before ``item_index``."""
+        if self._heights is not None:
+            return self._heights.offset_of(item_index)
+        return item_index * (self.config.item_height or 0)
+
     def _update_visible_range(self) -> None:
         """Calculate which items should be visible based on current scroll position."""
+        self.state.total_height = self.get_total_height()
         if self.config.total_items == 0:
             self.state.visible_start = 0
             self.state.visible_end = 0
+            self._release_nodes(node for _, node in self.state.rendered_items)
             self.state.rendered_items = []
             return
 
-        # Calculate visible range with overscan
-        start = max(0, self.config.scroll_offset - self.config.overscan)
-        end = min(self.config.total_items, self.config.scroll_offset + self._calculate_visible_count() + self.config.overscan)
+        # Measuring newly rendered items can change how many fit; one more pass settles it.
+        for _ in range(2):
+            start = max(0, self.config.scroll_offset - self.config.overscan)
+            end = min(self.config.total_items, self.config.scroll_offset + self._calculate_visible_count() + self.config.overscan)
 
-        self.state.visible_start = start
-        self.state.visible_end = end
+            self.state.visible_start = start
+            self.state.visible_end = end
 
-        # Update rendered items
-        self._update_rendered_items()
+            if not self._update_rendered_items():
+                break
+        self.state.total_height = self.get_total_height()
 
     def _calculate_visible_count(self) -> int:
         """Calculate how many items fit in the viewport."""
         if self.config.item_height and self.config.item_height > 0:
             # Fixed height items
             return max(1, self.config.viewport_height // self.config.item_height)
-        else:
-            # Variable height - estimate based on average height
-            if self.state.item_heights:
-                measured_heights = [h for h in self.state.item_heights if h > 0]
-                if measured_heights:
-                    avg_height = sum(measured_heights) / len(measured_heights)
-                    return max(1, int(self.config.viewport_height / avg_height))
-            # Fallback estimate
+        heights = self._heights
+        if heights is None or not len(heights):
             return max(1, self.config.viewport_height // 2)
+        first = min(self.config.scroll_offset, len(heights) - 1)
+        top = heights.offset_of(first)
+        last = heights.index_at(top + max(1, self.config.viewport_height) - 1)
+        return max(1, last - first + 1)
+
+    def _update_rendered_items(self) -> bool:
+        """Update the rendered items for the current range; return whether any height changed."""
+        start, end = self.state.visible_start, self.state.visible_end
+        rendered: dict[int, LayoutNode] = {}
+        leaving: list[LayoutNode] = []
+        for index, node in self.state.rendered_items:
+            if start <= index < end:
+                rendered[index] = node
+            else:
+                leaving.append(node)
+        self._release_nodes(leaving)
 
-    def _update_rendered_items(self) -> None:
-        """Update the list of rendered items for the current visible range."""
         new_items: list[tuple[int, LayoutNode]] = []
-
-        for i in range(self.state.visible_start, self.state.visible_end):
+        resized = False
+        for i in range(start, end):
             # Check if we already have this item rendered
-            existing = next((node for idx, node in self.state.rendered_items if idx == i), None)
+            existing = rendered.get(i)
 
             if existing is not None:
                 new_items.append((i, existing))
-            else:
-                # Render new item
-                try:
-                    item_node = self.item_renderer(None, i)  # Pass None as data, let renderer handle indexing
-                    new_items.append((i, item_node))
+                continue
+            try:
+                item_node = self._acquire_node(i)
+            except Exception:
+                # Skip items that fail to render
+                continue
+            new_items.append((i, item_node))
+            if self._heights is not None:
+                height = self._measure_item(item_node)
+                if height > 0 and self._heights.set(i, height):
+                    resized = True
 
-                    # Cache height for variable-height items
-                    if self.config.item_height is None and i < len(self.state.item_heights):
-                        # Estimate height from rendered node
-                        height = getattr(item_node.layout, "height", 1)
-                        self.state.item_heights[i] = height
+        self.state.rendered_items = new_items
+        return resized
 
-                except Exception:
-                    # Skip items that fail to render
-                    continue
+    def _acquire_node(self, index: int) -> LayoutNode:
+        """Return a node for item ``index``, recycling a pooled one when possible."""
+        if self.item_recycler is not None and self._node_pool:
+            return self.item_recycler(self._node_pool.pop(), index)
+        return self.item_renderer(None, index)  # Pass None as data, let renderer handle indexing
 
-        self.state.rendered_items = new_items
+    def _release_nodes(self, nodes: Iterable[LayoutNode]) -> None:
+        """Detach nodes that left the rendered range and keep them for reuse."""
+        if self.item_recycler is None:
+            return
+        pool = self._node_pool
+        for node in nodes:
+            parent = node.parent
+            if parent is not None and node in parent.children:
+                parent.remove(node)
+            if len(pool) < self.max_pooled_nodes:
+                pool.append(node)
+
+    def _measure_item(self, node: LayoutNode) -> int:
+        """Return the height of a freshly rendered item node, or 0 if unknown."""
+        if self.item_measurer is not None:
+            return self.item_measurer(node)[1]
+        height = node.style.height
+        if isinstance(height, int):
+            return height
+        return getattr(node.layout, "height", 0) or 0
 
     def get_total_height(self) -> int:
         """Get the total height of all items."""
-        if self.config.item_height:
-            return self.config.total_items * self.config.item_height
-        else:
-            # Sum cached heights
-            return sum(h for h in self.state.item_heights if h > 0)
+        if self._heights is not None:
+            return self._heights.total
+        return self.config.total_items * (self.config.item_height or 0)
+
+    def _max_scroll_index(self) -> int:
+        """Return the first item index at which the last item is fully visible."""
+        heights = self._heights
+        if heights is None:
+            return max(0, self.config.total_items - self._calculate_visible_count())
+        target = heights.total - self.config.viewport_height
+        if target <= 0:
+            return 0
+        index = heights.index_at(target)
+        return index + 1 if heights.offset_of(index) < target else index
 
     def get_scroll_position(self) -> float:
         """Get scroll position as a fraction (0.0 to 1.0)."""
-        if self.config.total_items <= self._calculate_visible_count():
-            return 0.0
-
-        max_scroll = max(0, self.config.total_items - self._calculate_visible_count())
+        max_scroll = self._max_scroll_index()
         if max_scroll == 0:
             return 0.0
-
-        return self.config.scroll_offset / max_scroll
+        return min(1.0, self.config.scroll_offset / max_scroll)
 
     def set_scroll_position(self, fraction: float) -> None:
         """Set scroll position from a fraction (0.0 to 1.0)."""
-        if self.config.total_items <= self._calculate_visible_count():
-            self.scroll_to(0)
-            return
-
-        max_scroll = max(0, self.config.total_items - self._calculate_visible_count())
-        target_offset = int(fraction * max_scroll)
-        self.scroll_to(target_offset)
+        self.scroll_to(int(fraction * self._max_scroll_index()))
+        if fraction >= 1.0:
+            # Measuring the tail can move the end of the list; follow it until it settles.
+            for _ in range(8):
+                end = self._max_scroll_index()
+                if end == self.config.scroll_offset:
+                    break
+                self.scroll_to(end)
 
     def get_scroll_offset_height(self) -> int:
         """Get the height offset for scrolling in variable-height mode."""
-        if self.config.item_height:
-            return self.config.scroll_offset * self.config.item_height
-        else:
-            # Calculate cumulative height up to scroll offset
-            height = 0
-            for i in range(min(self.config.scroll_offset, len(self.state.item_heights))):
-                height += self.state.item_heights[i]
-            return height
+        return self.get_item_offset(self.config.scroll_offset)
 
 
 def create_virtual_scroll_node(container: VirtualScrollContainer, style: LayoutStyle | None = None) -> LayoutNode:
@@ -185,20 +263,10 @@ def create_virtual_scroll_node(container: VirtualScrollContainer, style: LayoutS
     # Create container node
     container_node = LayoutNode(style=style)
 
-    # Add visible child nodes
+    # Add visible child nodes, positioned relative to the scroll offset
+    scroll_top = container.get_scroll_offset_height()
     for item_index, item_node in container.state.rendered_items:
-        # Position the item relative to the scroll offset
-        if container.config.item_height:
-            # Fixed height positioning
-            item_node.layout.y = (item_index - container.config.scroll_offset) * container.config.item_height
-        else:
-            # Variable height - calculate cumulative height
-            y_offset = 0
-            for i in range(item_index):
-                if i < len(container.state.item_heights):
-                    y_offset += container.state.item_heights[i]
-            item_node.layout.y = y_offset - container.get_scroll_offset_height()
-
+        item_node.layout.y = container.get_item_offset(item_index) - scroll_top
         item_node.layout.x = 0  # Items fill the full width
         container_node.add(item_node)
 
@@ -221,7 +289,7 @@ def create_simple_item_renderer(items: list[Any], render_func: Callable[[Any], s
 
         # Create a text node
         style = LayoutStyle(width=80, height=1)  # Will be overridden by measurement
-        node = LayoutNode(style=style, measure=lambda w, h: (len(text), 1))
+        node = LayoutNode(style=style, measure=lambda w, h: (text_width(text), 1))
 
         return node
 
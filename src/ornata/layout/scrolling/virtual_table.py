@@ -0,0 +1,263 @@
+"""Virtualized table rows for very large or streaming datasets."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from itertools import islice
+from typing import Any
+
+from ornata.definitions.dataclasses.layout import LayoutStyle, VirtualScrollConfig
+from ornata.definitions.protocols import RowProvider
+from ornata.layout.engine.engine import LayoutNode
+from ornata.layout.scrolling.virtual_scrolling import VirtualScrollContainer
+from ornata.utils.cache import LRUCache
+from ornata.utils.unicode_width import clip_to_width, fit_to_width
+
+RowFetcher = Callable[[int, int], Iterable[Sequence[Any]]]
+RowCount = int | Callable[[], int]
+
+
+def format_table_row(cells: Iterable[Any], cell_width: int, width: int, spacer: int = 1) -> str:
+    """Format one table row as fixed-width columns clipped to ``width`` terminal columns."""
+    return clip_to_width((" " * spacer).join(fit_to_width(str(cell).strip(), cell_width) for cell in cells), width)
+
+
+class TableRowSource:
+    """:class:`RowProvider` over rows held in a sequence, an iterator or a fetch callable.
+
+    * Sequences (anything with ``__len__`` and slicing) are sliced directly.
+    * Iterators are consumed lazily up to the furthest row requested; rows
+      already read are kept so the view can scroll back.
+    * A callable ``fetch(start, stop)`` returns the rows of that range.
+
+    Iterators and callables need ``length``: a row count, or a callable
+    returning it for sources that grow, such as a log being tailed.
+    """
+
+    __slots__ = ("_sequence", "_iterator", "_consumed", "_fetch", "_length")
+
+    def __init__(self, rows: Sequence[Sequence[Any]] | Iterable[Sequence[Any]] | RowFetcher, *, length: RowCount | None = None) -> None:
+        self._sequence: Sequence[Sequence[Any]] | None = None
+        self._iterator: Iterator[Sequence[Any]] | None = None
+        self._consumed: list[Sequence[Any]] = []
+        self._fetch: RowFetcher | None = None
+        self._length = length
+
+        if hasattr(rows, "__getitem__") and hasattr(rows, "__len__"):
+            self._sequence = rows  # type: ignore[assignment]
+        elif isinstance(rows, Iterable):
+            if length is None:
+                raise ValueError("iterable row sources need a length")
+            self._iterator = iter(rows)
+        elif callable(rows):
+            if length is None:
+                raise ValueError("callable row sources need a length")
+            self._fetch = rows
+        else:
+            raise TypeError(f"unsupported row source: {type(rows).__name__}")
+
+    def __len__(self) -> int:
+        if self._sequence is not None:
+            return len(self._sequence)
+        length = self._length
+        return length() if callable(length) else int(length or 0)
+
+    def fetch(self, start: int, stop: int) -> Sequence[Sequence[Any]]:
+        """Return the rows in ``[start, stop)``, clamped to the source length."""
+        start = max(0, start)
+        stop = min(stop, len(self))
+        if stop <= start:
+            return ()
+        if self._sequence is not None:
+            return self._sequence[start:stop]
+        if self._fetch is not None:
+            return list(self._fetch(start, stop))
+        missing = stop - len(self._consumed)
+        if missing > 0 and self._iterator is not None:
+            self._consumed.extend(islice(self._iterator, missing))
+        return self._consumed[start:stop]
+
+
+class VirtualTable:
+    """Scrollable window over a table that fetches and formats only visible rows.
+
+    Scrolling is tracked by a :class:`VirtualScrollContainer` with one-line
+    items. The rows of its overscanned window are fetched from the source
+    in one call, and each formatted line is kept in an LRU keyed by row
+    index, :attr:`revision` and column geometry, so scrolling back and
+    forth reformats nothing.
+
+    Tables compare equal when they read the same source object, saw the
+    same number of rows in it and carry the same revision, and their
+    ``repr`` names all three. Builders that wrap the same rows in a new
+    table every frame therefore produce no VDOM patch until the source
+    grows or the builder bumps the revision after editing rows in place,
+    and the runtime keeps drawing the table it already holds (see
+    :meth:`same_source`), with its scroll position and formatted lines.
+
+    Attributes:
+        rows_fetched: Rows read from the source so far.
+        rows_formatted: Rows turned into text so far (LRU misses).
+    """
+
+    def __init__(
+        self,
+        rows: RowProvider | Sequence[Sequence[Any]] | Iterable[Sequence[Any]] | RowFetcher,
+        *,
+        length: RowCount | None = None,
+        viewport_rows: int = 20,
+        overscan: int = 5,
+        cache_size: int = 2048,
+        revision: int = 0,
+    ) -> None:
+        """Create a virtual table.
+
+        Args:
+            rows: A :class:`RowProvider`, or anything :class:`TableRowSource` accepts.
+            length: Row count for iterator and callable sources.
+            viewport_rows: Number of body rows on screen.
+            overscan: Rows fetched beyond each edge of the viewport.
+            cache_size: Formatted lines kept in the LRU.
+            revision: Version of the rows; bump it after editing rows in place.
+        """
+        self.source: RowProvider = rows if isinstance(rows, RowProvider) else TableRowSource(rows, length=length)
+        self._rows = rows
+        config = VirtualScrollConfig(item_height=1, viewport_height=max(1, viewport_rows), overscan=overscan, total_items=len(self.source))
+        self.scroll = VirtualScrollContainer(config, self._row_node, item_recycler=self._reuse_row_node)
+        self._lines: LRUCache[tuple[int, int, int, int, int], str] = LRUCache(cache_size)
+        self._revision = revision
+        self._window_start = 0
+        self._window: Sequence[Sequence[Any]] = ()
+        self.rows_fetched = 0
+        self.rows_formatted = 0
+        self.scroll.update_config()
+
+    def __len__(self) -> int:
+        return self.scroll.config.total_items
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, VirtualTable):
+            return NotImplemented
+        return self._rows is other._rows and len(self) == len(other) and self._revision == other._revision
+
+    def __hash__(self) -> int:
+        return id(self._rows)
+
+    def __repr__(self) -> str:
+        return f"VirtualTable({type(self._rows).__name__}@{id(self._rows):#x}, rows={len(self)}, revision={self._revision})"
+
+    def same_source(self, other: VirtualTable) -> bool:
+        """Whether ``other`` reads the same rows, whatever their count."""
+        return self._rows is other._rows
+
+    @property
+    def revision(self) -> int:
+        """Version of the rows; lines formatted under another revision are not reused."""
+        return self._revision
+
+    @revision.setter
+    def revision(self, value: int) -> None:
+        if value != self._revision:
+            self._revision = value
+            self._window = ()
+
+    @property
+    def scroll_offset(self) -> int:
+        """Index of the first row on screen."""
+        return self.scroll.config.scroll_offset
+
+    def scroll_to(self, index: int) -> None:
+        """Scroll so that row ``index`` is the first row on screen."""
+        self.scroll.scroll_to(index)
+
+    def scroll_by(self, delta: int) -> None:
+        """Scroll by ``delta`` rows."""
+        self.scroll.scroll_by(delta)
+
+    def set_viewport(self, rows: int) -> None:
+        """Set the number of body rows on screen."""
+        rows = max(1, rows)
+        if rows != self.scroll.config.viewport_height:
+            self.scroll.update_config(viewport_height=rows)
+
+    def refresh(self) -> None:
+        """Re-read the source length, e.g. after rows were appended."""
+        total = len(self.source)
+        if total != self.scroll.config.total_items:
+            self.scroll.update_config(total_items=total)
+            self._window = ()
+
+    def invalidate(self) -> None:
+        """Forget fetched and formatted rows, e.g. after the source was edited in place."""
+        self._lines.clear()
+        self._window = ()
+        self.refresh()
+
+    def visible_range(self) -> tuple[int, int]:
+        """Return the half-open range of rows on screen, excluding overscan."""
+        config = self.scroll.config
+        start = config.scroll_offset
+        return start, min(config.total_items, start + config.viewport_height)
+
+    def visible_lines(self, cell_width: int, width: int, spacer: int = 1) -> list[str]:
+        """Return the formatted lines of the rows on screen.
+
+        The source length is re-read first, so rows appended since the
+        last call are reachable without an explicit :meth:`refresh`.
+
+        Args:
+            cell_width: Width of each column in terminal columns.
+            width: Width of the whole line.
+            spacer: Columns between adjacent cells.
+
+        Returns:
+            One line per visible row, top to bottom.
+        """
+        self.refresh()
+        start, stop = self.visible_range()
+        lines = self._lines
+        result: list[str] = []
+        for index in range(start, stop):
+            key = (index, self._revision, cell_width, width, spacer)
+            line = lines.get(key)
+            if line is None:
+                row = self._row(index)
+                line = format_table_row(row, cell_width, width, spacer) if row is not None else ""
+                lines.set(key, line)
+                self.rows_formatted += 1
+            result.append(line)
+        return result
+
+    def _row(self, index: int) -> Sequence[Any] | None:
+        """Return row ``index``, fetching the container's visible window if needed."""
+        offset = index - self._window_start
+        if not 0 <= offset < len(self._window):
+            window_start, window_stop = self.scroll.get_visible_range()
+            if not window_start <= index < window_stop:
+                window_start, window_stop = index, index + 1
+            self._window = self.source.fetch(window_start, window_stop)
+            self._window_start = window_start
+            self.rows_fetched += len(self._window)
+            offset = index - window_start
+            if not 0 <= offset < len(self._window):
+                return None
+        return self._window[offset]
+
+    @staticmethod
+    def _row_node(_: Any, index: int) -> LayoutNode:
+        """One-line layout placeholder the scroll container tracks for row ``index``."""
+        return LayoutNode(style=LayoutStyle(height=1))
+
+    @staticmethod
+    def _reuse_row_node(node: LayoutNode, index: int) -> LayoutNode:
+        """Placeholders carry no per-row state, so pooled ones are reused as they are."""
+        return node
+
+
+__all__ = [
+    "RowCount",
+    "RowFetcher",
+    "TableRowSource",
+    "VirtualTable",
+    "format_table_row",
+]
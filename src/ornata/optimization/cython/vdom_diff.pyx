@@ -130,48 +130,158 @@ def children_all_keyed(object old_children, object new_children):
     return True
 
 
-def reconcile_children_keyed(object old_children, object new_children):
-    """Return patch instructions for keyed reconciliation (legacy plan)."""
-    cdef dict old_map = {}
-    cdef set seen = set()
-    cdef list instructions = []
-    cdef Py_ssize_t idx
-    cdef object child
-    cdef object key
-    cdef object info
-    cdef int old_idx
-    cdef object old_child
-
-    for idx in range(len(old_children)):
-        child = old_children[idx]
-        key = getattr(child, "key", None)
-        if key is not None:
-            old_map[key] = (idx, child)
-
-    for idx in range(len(new_children)):
-        child = new_children[idx]
-        key = getattr(child, "key", None)
-        if key is None:
+cdef list _longest_increasing_run(list sequence):
+    """Return a 0/1 list marking one longest strictly increasing subsequence."""
+    cdef Py_ssize_t size = len(sequence)
+    cdef list tails = []
+    cdef list tail_positions = []
+    cdef list previous = [-1] * size
+    cdef list marked = [0] * size
+    cdef Py_ssize_t position, low, high, middle, length
+    cdef long value
+    for position in range(size):
+        value = sequence[position]
+        low = 0
+        high = len(tails)
+        while low < high:
+            middle = (low + high) >> 1
+            if <long>tails[middle] < value:
+                low = middle + 1
+            else:
+                high = middle
+        length = low
+        if length == len(tails):
+            tails.append(value)
+            tail_positions.append(position)
+        else:
+            tails[length] = value
+            tail_positions[length] = position
+        previous[position] = tail_positions[length - 1] if length else -1
+    position = tail_positions[len(tail_positions) - 1] if tail_positions else -1
+    while position >= 0:
+        marked[position] = 1
+        position = previous[position]
+    return marked
+
+
+cdef list _plan_moves(list order):
+    """Return ``(target, insert_at)`` moves; mirrors ``reconciler.plan_keyed_moves``."""
+    cdef Py_ssize_t size = len(order)
+    cdef list stable = _longest_increasing_run(order)
+    cdef Py_ssize_t stable_count = sum(stable)
+    cdef list moves = []
+    if stable_count == size:
+        return moves
+
+    cdef list stable_at_old = [0] * size
+    cdef list anchors = [0] * size
+    cdef list tree = [0] * (stable_count + 2)
+    cdef Py_ssize_t tree_size = stable_count + 2
+    cdef Py_ssize_t target, position, i, seen = 0, placed = 0, pending
+    for target in range(size):
+        if stable[target]:
+            stable_at_old[<Py_ssize_t>order[target]] = 1
+    for position in range(size):
+        anchors[position] = seen
+        seen += <Py_ssize_t>stable_at_old[position]
+    for target in range(size):
+        if not stable[target]:
+            i = <Py_ssize_t>anchors[<Py_ssize_t>order[target]] + 1
+            while i < tree_size:
+                tree[i] = <Py_ssize_t>tree[i] + 1
+                i += i & -i
+    for target in range(size):
+        if stable[target]:
+            placed += 1
             continue
-        info = old_map.get(key)
-        if info is None:
-            instructions.append(("add", child))
-            continue
-        old_idx = info[0]
-        old_child = info[1]
-        seen.add(key)
-        if old_idx != idx:
-            instructions.append(("move", key, idx, old_idx))
-        if _nodes_differ(old_child, child):
-            instructions.append(("diff", old_child, child))
-
-    for key, info in old_map.items():
-        if key not in seen:
+        i = <Py_ssize_t>anchors[<Py_ssize_t>order[target]] + 1
+        while i < tree_size:
+            tree[i] = <Py_ssize_t>tree[i] - 1
+            i += i & -i
+        pending = 0
+        i = placed
+        while i > 0:
+            pending += <Py_ssize_t>tree[i]
+            i -= i & -i
+        moves.append((target, target + pending))
+    return moves
+
+
+cdef list _keyed_plan(object old_children, object new_children):
+    """Build keyed instructions: head diffs, removes, moves, adds, diffs, tail diffs."""
+    cdef list instructions = []
+    cdef list suffix = []
+    cdef Py_ssize_t old_len = len(old_children)
+    cdef Py_ssize_t new_len = len(new_children)
+    cdef Py_ssize_t start = 0, end_old = old_len, end_new = new_len
+    cdef Py_ssize_t idx, target, insert_at
+    cdef object old_child, new_child, key, position
+    cdef set new_keys
+    cdef dict retained = {}
+    cdef dict old_by_key = {}
+    cdef list order = []
+    cdef list kept = []
+    cdef list added = []
+
+    while start < old_len and start < new_len:
+        old_child = old_children[start]
+        new_child = new_children[start]
+        if getattr(old_child, "key", None) != getattr(new_child, "key", None):
+            break
+        if _nodes_differ(old_child, new_child):
+            instructions.append(("diff", old_child, new_child))
+        start += 1
+
+    while end_old > start and end_new > start:
+        old_child = old_children[end_old - 1]
+        new_child = new_children[end_new - 1]
+        if getattr(old_child, "key", None) != getattr(new_child, "key", None):
+            break
+        if _nodes_differ(old_child, new_child):
+            suffix.append(("diff", old_child, new_child))
+        end_old -= 1
+        end_new -= 1
+
+    new_keys = {getattr(new_children[idx], "key", None) for idx in range(start, end_new)}
+    for idx in range(start, end_old):
+        old_child = old_children[idx]
+        key = getattr(old_child, "key", None)
+        if key in new_keys:
+            retained[key] = len(retained)
+            old_by_key[key] = old_child
+        elif key is not None:
             instructions.append(("remove", key))
 
+    for idx in range(start, end_new):
+        new_child = new_children[idx]
+        position = retained.get(getattr(new_child, "key", None))
+        if position is None:
+            added.append(new_child)
+        else:
+            order.append(position)
+            kept.append(new_child)
+
+    for target, insert_at in _plan_moves(order):
+        instructions.append(("move", getattr(kept[target], "key", None), start + insert_at, start + <Py_ssize_t>order[target]))
+
+    for new_child in added:
+        instructions.append(("add", new_child))
+
+    for new_child in kept:
+        old_child = old_by_key[getattr(new_child, "key", None)]
+        if _nodes_differ(old_child, new_child):
+            instructions.append(("diff", old_child, new_child))
+
+    suffix.reverse()
+    instructions.extend(suffix)
     return instructions
 
 
+def reconcile_children_keyed(object old_children, object new_children):
+    """Return patch instructions for keyed reconciliation with the fewest moves."""
+    return _keyed_plan(old_children, new_children)
+
+
 def reconcile_children_keyed_fast(
     object old_children,
     object new_children,
@@ -181,51 +291,26 @@ def reconcile_children_keyed_fast(
     object diff_callback,
 ):
     """Return concrete Patch objects for keyed reconciliation."""
-    cdef dict old_map = {}
-    cdef set seen = set()
     cdef list patches = []
-    cdef Py_ssize_t idx
-    cdef object child
-    cdef object key
-    cdef object info
-    cdef int old_idx
-    cdef object old_child
+    cdef tuple instruction
+    cdef object op
     cdef object patch_obj
     cdef object extra_patches
 
-    for idx in range(len(old_children)):
-        child = old_children[idx]
-        key = getattr(child, "key", None)
-        if key is not None:
-            old_map[key] = (idx, child)
-
-    for idx in range(len(new_children)):
-        child = new_children[idx]
-        key = getattr(child, "key", None)
-        if key is None:
-            continue
-        info = old_map.get(key)
-        if info is None:
-            patch_obj = add_patch(child)
-            if patch_obj is not None:
-                patches.append(patch_obj)
-            continue
-        old_idx = info[0]
-        old_child = info[1]
-        seen.add(key)
-        if old_idx != idx:
-            patch_obj = move_patch(key, idx)
-            if patch_obj is not None:
-                patches.append(patch_obj)
-        if _nodes_differ(old_child, child):
-            extra_patches = diff_callback(old_child, child)
+    for instruction in _keyed_plan(old_children, new_children):
+        op = instruction[0]
+        if op == "diff":
+            extra_patches = diff_callback(instruction[1], instruction[2])
             if extra_patches:
                 patches.extend(extra_patches)
-
-    for key, info in old_map.items():
-        if key not in seen:
-            patch_obj = remove_patch(key)
-            if patch_obj is not None:
-                patches.append(patch_obj)
+            continue
+        if op == "add":
+            patch_obj = add_patch(instruction[1])
+        elif op == "move":
+            patch_obj = move_patch(instruction[1], instruction[2])
+        else:
+            patch_obj = remove_patch(instruction[1])
+        if patch_obj is not None:
+            patches.append(patch_obj)
 
     return patches
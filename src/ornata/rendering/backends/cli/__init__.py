@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
-from . import ansi, ansi_renderer, cells, input, platform, rasterizer, renderer, session, terminal, terminal_app
+from . import ansi, ansi_diff, ansi_renderer, cells, input, input_parser, platform, rasterizer, renderer, scheduler, session, terminal, terminal_app
+from .ansi_diff import ANSIDiffRenderer, DiffStats
 from .ansi_renderer import ANSIRenderer as CellANSIRenderer, render_buffer
-from .cells import Cell, CellBuffer, Segment
+from .cells import WIDE_CONTINUATION, Cell, CellBuffer, DirtySpans, PackedCellBuffer, Segment, create_cell_buffer, segment_codepoints
 from .input import (
     CLIInputPipeline,
+    StdinReader,
     create_cli_input_pipeline,
 )
+from .input_parser import InputParser
 from .rasterizer import NodeRasterizer, RasterContext
 from .renderer import ANSIRenderer
+from .scheduler import FrameScheduler, FrameSchedulerStats
 from .session import LiveSessionRenderer
 from .terminal import TerminalRenderer
 from .terminal_app import (
@@ -21,29 +25,43 @@ from .terminal_app import (
 )
 
 __all__ = [
+    "ANSIDiffRenderer",
     "ANSIRenderer",
     "Cell",
     "CellANSIRenderer",
     "CellBuffer",
     "CLIInputPipeline",
+    "DiffStats",
+    "DirtySpans",
+    "FrameScheduler",
+    "FrameSchedulerStats",
+    "InputParser",
     "LiveSessionRenderer",
     "NodeRasterizer",
+    "PackedCellBuffer",
     "RasterContext",
     "Segment",
+    "StdinReader",
     "TerminalApp",
     "TerminalRenderer",
     "TerminalSession",
+    "WIDE_CONTINUATION",
     "ansi",
+    "ansi_diff",
     "ansi_renderer",
     "cells",
+    "create_cell_buffer",
     "create_cli_input_pipeline",
     "disable_mouse_reporting",
     "enable_mouse_reporting",
     "input",
+    "input_parser",
     "platform",
     "rasterizer",
     "render_buffer",
     "renderer",
+    "scheduler",
+    "segment_codepoints",
     "session",
     "terminal",
     "terminal_app",
@@ -2,7 +2,17 @@
 
 from __future__ import annotations
 
-from . import cursor, palette, screen_buffer, sgr
+from . import colors, cursor, palette, screen_buffer, sgr
+from .colors import (
+    ANSI_16_PALETTE,
+    ANSI_256_PALETTE,
+    ansi_16_to_color,
+    ansi_256_to_color,
+    nearest_ansi_16,
+    nearest_ansi_256,
+    parse_ansi_color,
+    quantize_color,
+)
 from .cursor import (
     cursor_column,
     cursor_get_position,
@@ -95,11 +105,15 @@ from .sgr import (
 )
 
 __all__ = [
+    "ANSI_16_PALETTE",
+    "ANSI_256_PALETTE",
     "ansi_16_background",
     "ansi_16_by_name",
     "ansi_16_foreground",
+    "ansi_16_to_color",
     "ansi_256_background",
     "ansi_256_foreground",
+    "ansi_256_to_color",
     "bell",
     "blink",
     "bold",
@@ -111,6 +125,7 @@ __all__ = [
     "clear_screen_to_cursor",
     "color_background",
     "color_foreground",
+    "colors",
     "combine_styles",
     "cursor",
     "cursor_column",
@@ -145,8 +160,12 @@ __all__ = [
     "insert_chars",
     "insert_lines",
     "italic",
+    "nearest_ansi_16",
+    "nearest_ansi_256",
     "palette",
+    "parse_ansi_color",
     "parse_cursor_position_response",
+    "quantize_color",
     "rapid_blink",
     "report_cursor_position",
     "report_device_attributes",
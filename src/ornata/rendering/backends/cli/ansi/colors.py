@@ -0,0 +1,212 @@
+"""Precomputed ANSI color tables and color conversion helpers.
+
+The 16- and 256-color palettes are materialized once as :class:`ANSIColor`
+tuples so that decoding an SGR color is a table lookup. Escape sequences
+are parsed through a memoized parser, and truecolor values are quantized to
+the nearest palette entry for terminals without 24-bit color support.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from ornata.definitions.dataclasses.styling import ANSIColor
+
+# Standard VGA-style values for the 16 base colors.
+_ANSI_16_RGB: tuple[tuple[int, int, int], ...] = (
+    (0, 0, 0),
+    (170, 0, 0),
+    (0, 170, 0),
+    (170, 85, 0),
+    (0, 0, 170),
+    (170, 0, 170),
+    (0, 170, 170),
+    (170, 170, 170),
+    (85, 85, 85),
+    (255, 85, 85),
+    (85, 255, 85),
+    (255, 255, 85),
+    (85, 85, 255),
+    (255, 85, 255),
+    (85, 255, 255),
+    (255, 255, 255),
+)
+# Channel values xterm-compatible terminals use for the 6x6x6 color cube.
+_CUBE_LEVELS: tuple[int, ...] = (0, 95, 135, 175, 215, 255)
+
+
+def _cube_index(value: int) -> int:
+    """Return the index of the cube level nearest to a channel ``value``."""
+    if value < 48:
+        return 0
+    if value < 115:
+        return 1
+    return (value - 35) // 40
+
+
+def _build_256_palette() -> tuple[ANSIColor, ...]:
+    colors = [ANSIColor(*rgb) for rgb in _ANSI_16_RGB]
+    colors.extend(ANSIColor(r, g, b) for r in _CUBE_LEVELS for g in _CUBE_LEVELS for b in _CUBE_LEVELS)
+    colors.extend(ANSIColor(level, level, level) for level in range(8, 248, 10))
+    return tuple(colors)
+
+
+ANSI_256_PALETTE: tuple[ANSIColor, ...] = _build_256_palette()
+ANSI_16_PALETTE: tuple[ANSIColor, ...] = ANSI_256_PALETTE[:16]
+
+# SGR parameter -> 16-color palette index (fg 30-37/90-97, bg 40-47/100-107).
+_SGR_16_INDEX: dict[int, int] = {
+    **{index: index for index in range(16)},
+    **{30 + index: index for index in range(8)},
+    **{40 + index: index for index in range(8)},
+    **{90 + index: 8 + index for index in range(8)},
+    **{100 + index: 8 + index for index in range(8)},
+}
+_UNKNOWN_16 = ANSIColor(128, 128, 128)
+
+
+def ansi_16_to_color(code: int) -> ANSIColor:
+    """Return the color of a 16-color palette index or SGR color parameter.
+
+    Args:
+        code: Palette index (0-15) or SGR parameter (30-37, 40-47, 90-97, 100-107).
+
+    Returns:
+        Palette color; mid gray for unknown codes.
+    """
+    index = _SGR_16_INDEX.get(code)
+    return _UNKNOWN_16 if index is None else ANSI_16_PALETTE[index]
+
+
+def ansi_256_to_color(code: int) -> ANSIColor | None:
+    """Return the color of a 256-color palette index.
+
+    Args:
+        code: Palette index (0-255).
+
+    Returns:
+        Palette color, or ``None`` when ``code`` is out of range.
+    """
+    if 0 <= code < 256:
+        return ANSI_256_PALETTE[code]
+    return None
+
+
+@lru_cache(maxsize=1024)
+def parse_ansi_color(sequence: str) -> ANSIColor | None:
+    """Parse an SGR color escape sequence into an :class:`ANSIColor`.
+
+    Supports truecolor (``\\x1b[38;2;R;G;Bm``), 256-color (``\\x1b[38;5;Nm``)
+    and single-parameter 16-color sequences, for both foreground and
+    background. Results are memoized since styles repeat the same few
+    sequences across every node.
+
+    Args:
+        sequence: Escape sequence produced by the styling system.
+
+    Returns:
+        Parsed color, or ``None`` when ``sequence`` is not a color sequence.
+    """
+    if not sequence or not sequence.startswith("\x1b["):
+        return None
+    content = sequence[2:-1] if sequence.endswith("m") else sequence[2:]
+    parts = content.split(";")
+    try:
+        if len(parts) >= 5 and parts[1] == "2":
+            return ANSIColor(int(parts[2]), int(parts[3]), int(parts[4]))
+        if len(parts) >= 3 and parts[1] == "5":
+            return ansi_256_to_color(int(parts[2]))
+        if len(parts) == 1:
+            return ansi_16_to_color(int(parts[0]))
+    except ValueError:
+        pass
+    return None
+
+
+def nearest_ansi_256(color: ANSIColor) -> int:
+    """Return the 256-color index closest to ``color``.
+
+    The nearest entry of the 6x6x6 cube and of the gray ramp are found
+    arithmetically and the closer of the two is returned. The 16 base
+    colors are skipped because terminals commonly remap them.
+
+    Args:
+        color: Truecolor value to quantize.
+
+    Returns:
+        Palette index in 16-255.
+    """
+    r, g, b = color.red, color.green, color.blue
+    ri = _cube_index(r)
+    gi = _cube_index(g)
+    bi = _cube_index(b)
+    cr = _CUBE_LEVELS[ri]
+    cg = _CUBE_LEVELS[gi]
+    cb = _CUBE_LEVELS[bi]
+    cube_distance = (r - cr) ** 2 + (g - cg) ** 2 + (b - cb) ** 2
+
+    step = ((r + g + b) // 3 - 3) // 10
+    step = 0 if step < 0 else (23 if step > 23 else step)
+    gray = 8 + step * 10
+    gray_distance = (r - gray) ** 2 + (g - gray) ** 2 + (b - gray) ** 2
+
+    if gray_distance < cube_distance:
+        return 232 + step
+    return 16 + ri * 36 + gi * 6 + bi
+
+
+@lru_cache(maxsize=4096)
+def nearest_ansi_16(color: ANSIColor) -> int:
+    """Return the 16-color index closest to ``color``.
+
+    Results are memoized per color, so repeated styles cost one lookup.
+
+    Args:
+        color: Truecolor value to quantize.
+
+    Returns:
+        Palette index in 0-15.
+    """
+    r, g, b = color.red, color.green, color.blue
+    best = 0
+    best_distance = 1 << 30
+    for index, (pr, pg, pb) in enumerate(_ANSI_16_RGB):
+        distance = (r - pr) ** 2 + (g - pg) ** 2 + (b - pb) ** 2
+        if distance < best_distance:
+            best = index
+            best_distance = distance
+    return best
+
+
+def quantize_color(color: ANSIColor, color_mode: str) -> ANSIColor:
+    """Return the palette color a terminal in ``color_mode`` would display.
+
+    Args:
+        color: Truecolor value.
+        color_mode: Color mode ("16", "256", or "truecolor").
+
+    Returns:
+        The nearest palette color, or ``color`` itself for truecolor.
+
+    Raises:
+        ValueError: If color_mode is not supported.
+    """
+    if color_mode == "truecolor":
+        return color
+    if color_mode == "256":
+        return ANSI_256_PALETTE[nearest_ansi_256(color)]
+    if color_mode == "16":
+        return ANSI_16_PALETTE[nearest_ansi_16(color)]
+    raise ValueError(f"Unsupported color mode: {color_mode}")
+
+
+__all__ = [
+    "ANSI_16_PALETTE",
+    "ANSI_256_PALETTE",
+    "ansi_16_to_color",
+    "ansi_256_to_color",
+    "nearest_ansi_16",
+    "nearest_ansi_256",
+    "parse_ansi_color",
+    "quantize_color",
+]
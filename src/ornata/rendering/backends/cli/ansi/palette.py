@@ -9,6 +9,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from ornata.api.exports.definitions import ANSI_16_BACKGROUND, ANSI_16_COLORS, ANSI_16_FOREGROUND, CSI, RESET_ALL, RESET_BACKGROUND, RESET_FOREGROUND
+from ornata.rendering.backends.cli.ansi.colors import nearest_ansi_16, nearest_ansi_256
 
 if TYPE_CHECKING:
     from ornata.api.exports.definitions import ANSIColor
@@ -148,9 +149,9 @@ def color_foreground(color: ANSIColor, color_mode: str = "256") -> str:
     """
     color_mode = color_mode.lower()
     if color_mode == "16":
-        return ansi_16_foreground(color.to_ansi_16())
+        return ansi_16_foreground(nearest_ansi_16(color))
     elif color_mode == "256":
-        return ansi_256_foreground(color.to_ansi_256())
+        return ansi_256_foreground(nearest_ansi_256(color))
     elif color_mode == "truecolor":
         return true_color_foreground(color)
     else:
@@ -172,9 +173,9 @@ def color_background(color: ANSIColor, color_mode: str = "256") -> str:
     """
     color_mode = color_mode.lower()
     if color_mode == "16":
-        return ansi_16_background(color.to_ansi_16())
+        return ansi_16_background(nearest_ansi_16(color))
     elif color_mode == "256":
-        return ansi_256_background(color.to_ansi_256())
+        return ansi_256_background(nearest_ansi_256(color))
     elif color_mode == "truecolor":
         return true_color_background(color)
     else:
@@ -0,0 +1,403 @@
+"""Minimal-diff ANSI output for cell-based rendering.
+
+Where :class:`~ornata.rendering.backends.cli.ansi_renderer.ANSIRenderer`
+serializes the whole buffer every frame, :class:`ANSIDiffRenderer` keeps a
+copy of the last frame it emitted (the front buffer) and writes only the runs
+of cells that differ from it. Style changes are coalesced into the shortest
+SGR sequence and cursor moves use whichever escape is fewest bytes.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from ornata.definitions.flags import CellAttribute
+from ornata.rendering.backends.cli.ansi.colors import nearest_ansi_256
+from ornata.rendering.backends.cli.cells import WIDE_CONTINUATION, PackedCellBuffer, pack_attributes
+from ornata.utils.unicode_width import codepoint_width
+
+if TYPE_CHECKING:
+    from ornata.definitions.dataclasses.styling import ANSIColor
+    from ornata.rendering.backends.cli.cells import CellBuffer
+
+# Codepoint that never occurs in a real buffer; marks front cells as unknown.
+_UNKNOWN_CHAR = 0xFFFFFFFF
+_CONTINUATION = ord(WIDE_CONTINUATION)
+
+_ATTR_ON: tuple[tuple[int, str], ...] = (
+    (int(CellAttribute.BOLD), "1"),
+    (int(CellAttribute.DIM), "2"),
+    (int(CellAttribute.ITALIC), "3"),
+    (int(CellAttribute.UNDERLINE), "4"),
+    (int(CellAttribute.BLINK), "5"),
+    (int(CellAttribute.REVERSE), "7"),
+    (int(CellAttribute.STRIKETHROUGH), "9"),
+)
+_ATTR_OFF: tuple[tuple[int, str], ...] = (
+    (int(CellAttribute.BOLD | CellAttribute.DIM), "22"),
+    (int(CellAttribute.ITALIC), "23"),
+    (int(CellAttribute.UNDERLINE), "24"),
+    (int(CellAttribute.BLINK), "25"),
+    (int(CellAttribute.REVERSE), "27"),
+    (int(CellAttribute.STRIKETHROUGH), "29"),
+)
+_INTENSITY = int(CellAttribute.BOLD | CellAttribute.DIM)
+
+
+@dataclass(slots=True)
+class DiffStats:
+    """Counters describing the most recent diff.
+
+    Attributes
+    ----------
+    cells_changed : int
+        Number of cells written to the terminal.
+    runs : int
+        Number of contiguous runs emitted (one cursor move each at most).
+    bytes_written : int
+        UTF-8 size of the emitted escape stream.
+    full_redraw : bool
+        Whether the frame was repainted from scratch.
+    """
+
+    cells_changed: int = 0
+    runs: int = 0
+    bytes_written: int = 0
+    full_redraw: bool = False
+
+
+@dataclass(slots=True)
+class ANSIDiffRenderer:
+    """Emit only the cells that changed since the previously emitted frame.
+
+    The renderer reads the back buffer's dirty row spans (all rows on the
+    first frame or after a size change), compares them against its front
+    buffer and emits the changed runs. Unchanged gaps of up to ``merge_gap``
+    cells between two runs are re-sent rather than skipped, since that is
+    cheaper than a cursor move. The back buffer's dirty spans are cleared once
+    consumed.
+
+    Parameters
+    ----------
+    use_truecolor : bool
+        Use 24-bit RGB colors instead of the 256-color palette.
+    merge_gap : int
+        Largest unchanged gap, in cells, that is bridged inside one run.
+
+    Examples
+    --------
+    >>> from ornata.rendering.backends.cli.cells import PackedCellBuffer, Segment
+    >>> diff = ANSIDiffRenderer()
+    >>> buf = PackedCellBuffer(10, 2)
+    >>> _ = diff.render(buf)
+    >>> _ = buf.write_segment(3, 1, Segment("hi"))
+    >>> diff.render(buf)
+    '\\x1b[2;4Hhi'
+    """
+
+    use_truecolor: bool = True
+    merge_gap: int = 4
+    _width: int = field(default=0, init=False, repr=False)
+    _height: int = field(default=0, init=False, repr=False)
+    _chars: array[int] = field(default_factory=lambda: array("I"), init=False, repr=False)
+    _fg: array[int] = field(default_factory=lambda: array("I"), init=False, repr=False)
+    _bg: array[int] = field(default_factory=lambda: array("I"), init=False, repr=False)
+    _attrs: array[int] = field(default_factory=lambda: array("B"), init=False, repr=False)
+    _palette_index: dict[ANSIColor, int] = field(default_factory=dict, init=False, repr=False)
+    _fg_codes: list[str] = field(default_factory=lambda: ["39"], init=False, repr=False)
+    _bg_codes: list[str] = field(default_factory=lambda: ["49"], init=False, repr=False)
+    _last_stats: DiffStats = field(default_factory=DiffStats, init=False, repr=False)
+
+    @property
+    def last_stats(self) -> DiffStats:
+        """Return the counters of the most recent :meth:`render` call."""
+        return self._last_stats
+
+    def reset(self) -> None:
+        """Forget the front buffer so the next frame is fully repainted."""
+        self._width = 0
+        self._height = 0
+
+    def render(self, buffer: CellBuffer | PackedCellBuffer, *, full: bool = False) -> str:
+        """Return the escape stream that turns the front buffer into ``buffer``.
+
+        Parameters
+        ----------
+        buffer : CellBuffer | PackedCellBuffer
+            The freshly rasterized back buffer.
+        full : bool
+            Repaint every cell regardless of the front buffer contents.
+
+        Returns
+        -------
+        str
+            ANSI text to write to the terminal; empty when nothing changed.
+        """
+        width = buffer.width
+        height = buffer.height
+        full = full or width != self._width or height != self._height
+        if full:
+            self._allocate_front(width, height)
+            spans = [(y, 0, width) for y in range(height)]
+        else:
+            spans = buffer.get_dirty_spans()
+
+        remap = self._palette_remap(buffer) if isinstance(buffer, PackedCellBuffer) else None
+        front_chars = self._chars
+        front_fg = self._fg
+        front_bg = self._bg
+        front_attrs = self._attrs
+        fg_codes = self._fg_codes
+        bg_codes = self._bg_codes
+        merge_gap = self.merge_gap
+
+        out: list[str] = []
+        cursor_y = -1
+        cursor_x = -1
+        sgr_fg = 0
+        sgr_bg = 0
+        sgr_attrs = 0
+        cells_changed = 0
+        runs = 0
+
+        for y, start, end in spans:
+            end = min(end, width)
+            if end <= start:
+                continue
+            chars, fgs, bgs, attrs = self._load_row(buffer, y, start, end, remap)
+            base = y * width + start
+
+            row_runs: list[tuple[int, int]] = []
+            run_start = -1
+            last_changed = -1
+            for i in range(end - start):
+                j = base + i
+                if chars[i] != front_chars[j] or fgs[i] != front_fg[j] or bgs[i] != front_bg[j] or attrs[i] != front_attrs[j]:
+                    if run_start < 0:
+                        run_start = i
+                    elif i - last_changed - 1 > merge_gap:
+                        row_runs.append((run_start, last_changed + 1))
+                        run_start = i
+                    last_changed = i
+            if run_start >= 0:
+                row_runs.append((run_start, last_changed + 1))
+
+            for run_begin, run_end in row_runs:
+                # The right half of a wide glyph is drawn by its left half, so a run never starts on one.
+                while run_begin < run_end and chars[run_begin] == _CONTINUATION:
+                    j = base + run_begin
+                    front_chars[j] = _CONTINUATION
+                    front_fg[j] = fgs[run_begin]
+                    front_bg[j] = bgs[run_begin]
+                    front_attrs[j] = attrs[run_begin]
+                    run_begin += 1
+                if run_begin == run_end:
+                    continue
+                x = start + run_begin
+                out.append(_cursor_move(cursor_y, cursor_x, y, x))
+                for i in range(run_begin, run_end):
+                    if chars[i] == _CONTINUATION:
+                        j = base + i
+                        front_chars[j] = _CONTINUATION
+                        front_fg[j] = fgs[i]
+                        front_bg[j] = bgs[i]
+                        front_attrs[j] = attrs[i]
+                        continue
+                    fg = fgs[i]
+                    bg = bgs[i]
+                    attr = attrs[i]
+                    if fg != sgr_fg or bg != sgr_bg or attr != sgr_attrs:
+                        out.append(_sgr_transition(sgr_fg, sgr_bg, sgr_attrs, fg, bg, attr, fg_codes, bg_codes))
+                        sgr_fg = fg
+                        sgr_bg = bg
+                        sgr_attrs = attr
+                    out.append(chr(chars[i]))
+                    j = base + i
+                    front_chars[j] = chars[i]
+                    front_fg[j] = fg
+                    front_bg[j] = bg
+                    front_attrs[j] = attr
+                cells_changed += run_end - run_begin
+                runs += 1
+                cursor_y = y
+                cursor_x = x + run_end - run_begin
+                last = chars[run_end - 1]
+                if last != _CONTINUATION and codepoint_width(last) == 2:
+                    # The run ends on a wide glyph whose unchanged right half lies outside it.
+                    cursor_x += 1
+                if cursor_x >= width:
+                    # Pending-wrap state differs between terminals; re-anchor next time.
+                    cursor_y = -1
+                    cursor_x = -1
+
+        if sgr_fg or sgr_bg or sgr_attrs:
+            out.append("\x1b[0m")
+        buffer.clear_dirty()
+
+        text = "".join(out)
+        self._last_stats = DiffStats(
+            cells_changed=cells_changed,
+            runs=runs,
+            bytes_written=len(text.encode("utf-8")),
+            full_redraw=full,
+        )
+        return text
+
+    def _allocate_front(self, width: int, height: int) -> None:
+        """Reset the front buffer to unknown cells of the given size."""
+        size = width * height
+        self._width = width
+        self._height = height
+        self._chars = array("I", [_UNKNOWN_CHAR]) * size
+        self._fg = array("I", [0]) * size
+        self._bg = array("I", [0]) * size
+        self._attrs = array("B", [0]) * size
+
+    def _intern(self, color: ANSIColor | None) -> int:
+        """Return this renderer's stable id for ``color`` (0 for None)."""
+        if color is None:
+            return 0
+        index = self._palette_index.get(color)
+        if index is None:
+            index = len(self._fg_codes)
+            self._palette_index[color] = index
+            if self.use_truecolor:
+                rgb = f"{color.red};{color.green};{color.blue}"
+                self._fg_codes.append(f"38;2;{rgb}")
+                self._bg_codes.append(f"48;2;{rgb}")
+            else:
+                code = nearest_ansi_256(color)
+                self._fg_codes.append(f"38;5;{code}")
+                self._bg_codes.append(f"48;5;{code}")
+        return index
+
+    def _palette_remap(self, buffer: PackedCellBuffer) -> list[int]:
+        """Map ``buffer``'s palette indices onto this renderer's color ids."""
+        return [self._intern(color) for color in buffer.palette]
+
+    def _load_row(
+        self,
+        buffer: CellBuffer | PackedCellBuffer,
+        y: int,
+        start: int,
+        end: int,
+        remap: list[int] | None,
+    ) -> tuple[list[int], list[int], list[int], list[int]]:
+        """Read ``[start, end)`` of row ``y`` as codepoint/fg/bg/attr id lists."""
+        if remap is not None and isinstance(buffer, PackedCellBuffer):
+            chars, fgs, bgs, attrs = buffer.export_row(y, start, end)
+            return chars.tolist(), [remap[i] for i in fgs], [remap[i] for i in bgs], attrs.tolist()
+
+        chars_list: list[int] = []
+        fg_list: list[int] = []
+        bg_list: list[int] = []
+        attr_list: list[int] = []
+        for x in range(start, end):
+            cell = buffer.get_cell(x, y)
+            if cell is None:
+                chars_list.append(32)
+                fg_list.append(0)
+                bg_list.append(0)
+                attr_list.append(0)
+                continue
+            chars_list.append(ord(cell.char))
+            fg_list.append(self._intern(cell.fg))
+            bg_list.append(self._intern(cell.bg))
+            attr_list.append(pack_attributes(cell))
+        return chars_list, fg_list, bg_list, attr_list
+
+
+def _cursor_move(cursor_y: int, cursor_x: int, y: int, x: int) -> str:
+    """Return the shortest escape moving the cursor to row ``y``, column ``x``.
+
+    ``cursor_y``/``cursor_x`` are -1 when the current position is unknown, in
+    which case only an absolute move is possible.
+    """
+    if cursor_y == y and cursor_x == x:
+        return ""
+    if x == 0:
+        best = "\x1b[H" if y == 0 else f"\x1b[{y + 1}H"
+    else:
+        best = f"\x1b[{y + 1};{x + 1}H"
+    if cursor_y < 0 or cursor_x < 0 or y < cursor_y:
+        return best
+
+    if y == cursor_y:
+        candidate = _horizontal_move(cursor_x, x)
+    elif y == cursor_y + 1 and x == 0:
+        candidate = "\r\n"
+    else:
+        lines = y - cursor_y
+        candidate = ("\x1b[B" if lines == 1 else f"\x1b[{lines}B") + _horizontal_move(cursor_x, x)
+    return candidate if len(candidate) < len(best) else best
+
+
+def _horizontal_move(cursor_x: int, x: int) -> str:
+    """Return the shortest relative move along the current row."""
+    delta = x - cursor_x
+    if delta == 0:
+        return ""
+    if delta > 0:
+        return "\x1b[C" if delta == 1 else f"\x1b[{delta}C"
+    if x == 0:
+        return "\r"
+    back = "\x1b[D" if delta == -1 else f"\x1b[{-delta}D"
+    forward = "\r" + ("\x1b[C" if x == 1 else f"\x1b[{x}C")
+    return back if len(back) <= len(forward) else forward
+
+
+def _sgr_transition(
+    cur_fg: int,
+    cur_bg: int,
+    cur_attrs: int,
+    fg: int,
+    bg: int,
+    attrs: int,
+    fg_codes: list[str],
+    bg_codes: list[str],
+) -> str:
+    """Return the shortest SGR sequence switching from one style to another.
+
+    Two candidates are compared: an incremental update that only turns off
+    removed attributes and changes differing colors, and a full reset followed
+    by the complete target style.
+    """
+    incremental: list[str] = []
+    removed = cur_attrs & ~attrs
+    added = attrs & ~cur_attrs
+    if removed:
+        for bits, code in _ATTR_OFF:
+            if removed & bits:
+                incremental.append(code)
+        if removed & _INTENSITY:
+            # SGR 22 clears both bold and dim; restore whichever is still wanted.
+            added |= attrs & _INTENSITY
+    for bit, code in _ATTR_ON:
+        if added & bit:
+            incremental.append(code)
+    if fg != cur_fg:
+        incremental.append(fg_codes[fg])
+    if bg != cur_bg:
+        incremental.append(bg_codes[bg])
+
+    reset: list[str] = ["0"]
+    for bit, code in _ATTR_ON:
+        if attrs & bit:
+            reset.append(code)
+    if fg:
+        reset.append(fg_codes[fg])
+    if bg:
+        reset.append(bg_codes[bg])
+
+    incremental_text = ";".join(incremental)
+    reset_text = ";".join(reset)
+    chosen = incremental_text if len(incremental_text) <= len(reset_text) else reset_text
+    return f"\x1b[{chosen}m"
+
+
+__all__ = [
+    "ANSIDiffRenderer",
+    "DiffStats",
+]
@@ -10,9 +10,12 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+from ornata.rendering.backends.cli.ansi.colors import nearest_ansi_256
+from ornata.rendering.backends.cli.cells import WIDE_CONTINUATION
+
 if TYPE_CHECKING:
     from ornata.definitions.dataclasses.styling import ANSIColor
-    from ornata.rendering.backends.cli.cells import Cell, CellBuffer
+    from ornata.rendering.backends.cli.cells import Cell, CellBuffer, PackedCellBuffer
 
 
 @dataclass(slots=True)
@@ -66,12 +69,12 @@ class ANSIRenderer:
     _REVERSE: str = field(default="\x1b[7m", repr=False)
     _STRIKETHROUGH: str = field(default="\x1b[9m", repr=False)
 
-    def render(self, buffer: CellBuffer) -> ANSIOutput:
+    def render(self, buffer: CellBuffer | PackedCellBuffer) -> ANSIOutput:
         """Render a CellBuffer to ANSI-formatted text.
 
         Parameters
         ----------
-        buffer : CellBuffer
+        buffer : CellBuffer | PackedCellBuffer
             The cell buffer to render.
 
         Returns
@@ -98,12 +101,12 @@ class ANSIRenderer:
             has_colors=has_colors,
         )
 
-    def _render_line(self, buffer: CellBuffer, y: int) -> str:
+    def _render_line(self, buffer: CellBuffer | PackedCellBuffer, y: int) -> str:
         """Render a single line of the buffer.
 
         Parameters
         ----------
-        buffer : CellBuffer
+        buffer : CellBuffer | PackedCellBuffer
             The cell buffer.
         y : int
             Line index.
@@ -123,7 +126,8 @@ class ANSIRenderer:
 
         for x in range(buffer.width):
             cell = buffer.get_cell(x, y)
-            if cell is None:
+            if cell is None or cell.char == WIDE_CONTINUATION:
+                # The right half of a wide glyph was drawn with its left half.
                 continue
 
             # Check if any style attributes changed
@@ -201,8 +205,8 @@ class ANSIRenderer:
         """
         if self.use_truecolor:
             return f"38;2;{color.red};{color.green};{color.blue}"
-        # Fall back to 256-color palette
-        return f"38;5;{color.to_ansi_256()}"
+        # Fall back to the nearest 256-color palette entry
+        return f"38;5;{nearest_ansi_256(color)}"
 
     def _bg_code(self, color: ANSIColor) -> str:
         """Generate ANSI background color code.
@@ -219,8 +223,8 @@ class ANSIRenderer:
         """
         if self.use_truecolor:
             return f"48;2;{color.red};{color.green};{color.blue}"
-        # Fall back to 256-color palette
-        return f"48;5;{color.to_ansi_256()}"
+        # Fall back to the nearest 256-color palette entry
+        return f"48;5;{nearest_ansi_256(color)}"
 
     def render_cell(self, cell: Cell) -> str:
         """Render a single cell to ANSI string.
@@ -257,12 +261,12 @@ class ANSIRenderer:
 
 
 # Convenience function for quick rendering
-def render_buffer(buffer: CellBuffer, *, use_truecolor: bool = True) -> str:
+def render_buffer(buffer: CellBuffer | PackedCellBuffer, *, use_truecolor: bool = True) -> str:
     """Quick render a CellBuffer to ANSI string.
 
     Parameters
     ----------
-    buffer : CellBuffer
+    buffer : CellBuffer | PackedCellBuffer
         The buffer to render.
     use_truecolor : bool
         Use 24-bit colors (default: True).
@@ -7,12 +7,35 @@ background, and attributes - no terminal state is trusted.
 
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
+from unicodedata import normalize
+
+from ornata.definitions.flags import CellAttribute
+from ornata.utils.unicode_width import char_widths, codepoint_width
 
 if TYPE_CHECKING:
     from ornata.definitions.dataclasses.styling import ANSIColor
 
+_BOLD = int(CellAttribute.BOLD)
+_DIM = int(CellAttribute.DIM)
+_ITALIC = int(CellAttribute.ITALIC)
+_UNDERLINE = int(CellAttribute.UNDERLINE)
+_BLINK = int(CellAttribute.BLINK)
+_REVERSE = int(CellAttribute.REVERSE)
+_STRIKETHROUGH = int(CellAttribute.STRIKETHROUGH)
+
+# Palette indices are stored as unsigned shorts; index 0 is reserved for None.
+_PALETTE_LIMIT = 0xFFFF
+# Sentinel start column for rows without a dirty span.
+_UNSET = -1
+
+# Character of the cell covered by the right half of a wide glyph.
+WIDE_CONTINUATION = "\x00"
+_CONTINUATION = 0
+_SPACE = 32
+
 
 @dataclass(slots=True, frozen=True)
 class Segment:
@@ -133,7 +156,8 @@ class Cell:
     Parameters
     ----------
     char : str
-        Single character to display (space for empty).
+        Single character to display (space for empty, or
+        :data:`WIDE_CONTINUATION` for the right half of a wide glyph).
     fg : ANSIColor | None
         Foreground color (always set, never None in practice).
     bg : ANSIColor | None
@@ -223,6 +247,90 @@ class Cell:
         )
 
 
+@dataclass(slots=True)
+class DirtySpans:
+    """Per-row dirty column spans for a cell buffer.
+
+    Each row keeps a single half-open ``[start, end)`` span covering every
+    column modified since the last :meth:`clear`. Marking is O(1) and reading
+    the spans back needs no sorting, unlike a set of coordinates.
+
+    Parameters
+    ----------
+    height : int
+        Number of rows tracked.
+
+    Attributes
+    ----------
+    _start : list[int]
+        First dirty column per row (``_UNSET`` when clean).
+    _end : list[int]
+        One past the last dirty column per row.
+    _count : int
+        Number of rows that currently have a dirty span.
+    """
+
+    height: int
+    _start: list[int] = field(init=False, repr=False)
+    _end: list[int] = field(init=False, repr=False)
+    _count: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Allocate clean span storage."""
+        self._start = [_UNSET] * self.height
+        self._end = [0] * self.height
+
+    def mark(self, y: int, start: int, end: int) -> None:
+        """Extend row ``y``'s dirty span to include ``[start, end)``."""
+        if end <= start:
+            return
+        current = self._start[y]
+        if current == _UNSET:
+            self._count += 1
+            self._start[y] = start
+            self._end[y] = end
+            return
+        if start < current:
+            self._start[y] = start
+        if end > self._end[y]:
+            self._end[y] = end
+
+    def mark_all(self, width: int) -> None:
+        """Mark every row dirty across ``width`` columns."""
+        self._start = [0] * self.height
+        self._end = [width] * self.height
+        self._count = self.height if width > 0 else 0
+
+    def spans(self) -> list[tuple[int, int, int]]:
+        """Return dirty spans as ``(y, start, end)`` tuples in row order."""
+        if self._count == 0:
+            return []
+        starts = self._start
+        ends = self._end
+        return [(y, starts[y], ends[y]) for y in range(self.height) if starts[y] != _UNSET]
+
+    def resize(self, height: int) -> None:
+        """Change the number of tracked rows, keeping spans of surviving rows."""
+        if height < self.height:
+            self._count -= sum(1 for start in self._start[height:] if start != _UNSET)
+            self._start = self._start[:height]
+            self._end = self._end[:height]
+        else:
+            self._start.extend([_UNSET] * (height - self.height))
+            self._end.extend([0] * (height - self.height))
+        self.height = height
+
+    def clear(self) -> None:
+        """Forget all dirty spans."""
+        if self._count:
+            self._start = [_UNSET] * self.height
+            self._end = [0] * self.height
+            self._count = 0
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+
 @dataclass(slots=True)
 class CellBuffer:
     """A 2D grid of Cells representing the terminal screen.
@@ -247,8 +355,8 @@ class CellBuffer:
     ----------
     _grid : list[list[Cell]]
         The 2D cell grid, row-major order.
-    _dirty : set[tuple[int, int]]
-        Set of (x, y) coordinates that have been modified.
+    _dirty : DirtySpans
+        Per-row spans of columns modified since the last clear_dirty().
 
     Examples
     --------
@@ -262,10 +370,11 @@ class CellBuffer:
     default_fg: ANSIColor | None = None
     default_bg: ANSIColor | None = None
     _grid: list[list[Cell]] = field(init=False, repr=False)
-    _dirty: set[tuple[int, int]] = field(default_factory=set, repr=False)
+    _dirty: DirtySpans = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Initialize the cell grid with default colors."""
+        self._dirty = DirtySpans(self.height)
         self._grid = [
             [
                 Cell(char=" ", fg=self.default_fg, bg=self.default_bg)
@@ -286,7 +395,7 @@ class CellBuffer:
         for y in range(self.height):
             for x in range(self.width):
                 self._grid[y][x] = Cell(char=" ", fg=self.default_fg, bg=fill_bg)
-                self._dirty.add((x, y))
+        self._dirty.mark_all(self.width)
 
     def get_cell(self, x: int, y: int) -> Cell | None:
         """Get the cell at the specified coordinates.
@@ -317,13 +426,15 @@ class CellBuffer:
         if not (0 <= x < self.width and 0 <= y < self.height):
             return False
         self._grid[y][x] = cell
-        self._dirty.add((x, y))
+        self._dirty.mark(y, x, x + 1)
+        self._repair_wide_edges(y, x, x + 1)
         return True
 
     def write_segment(self, x: int, y: int, segment: Segment, inherited_bg: ANSIColor | None = None) -> int:
         """Write a segment to the buffer starting at (x, y).
 
-        Each character in the segment becomes a cell with the segment's style.
+        Each character in the segment becomes a cell with the segment's style;
+        wide characters take two cells (see :func:`segment_codepoints`).
         Background color is resolved: segment.bg > inherited_bg > default_bg.
 
         Parameters
@@ -340,7 +451,7 @@ class CellBuffer:
         Returns
         -------
         int
-            Number of characters written.
+            Number of cells written.
         """
         if not (0 <= y < self.height):
             return 0
@@ -353,14 +464,11 @@ class CellBuffer:
         # Resolve foreground: segment > default
         resolved_fg = segment.fg if segment.fg is not None else self.default_fg
 
-        chars_written = 0
-        for i, char in enumerate(segment.text):
-            col = x + i
-            if col >= self.width:
-                break
-
-            cell = Cell(
-                char=char,
+        start, codepoints = segment_codepoints(segment.text, x, self.width)
+        row = self._grid[y]
+        for offset, codepoint in enumerate(codepoints):
+            row[start + offset] = Cell(
+                char=chr(codepoint),
                 fg=resolved_fg,
                 bg=resolved_bg,
                 bold=segment.bold,
@@ -371,11 +479,12 @@ class CellBuffer:
                 reverse=segment.reverse,
                 strikethrough=segment.strikethrough,
             )
-            self._grid[y][col] = cell
-            self._dirty.add((col, y))
-            chars_written += 1
 
-        return chars_written
+        count = len(codepoints)
+        if count:
+            self._dirty.mark(y, start, start + count)
+            self._repair_wide_edges(y, start, start + count)
+        return count
 
     def fill_rect(
         self,
@@ -420,20 +529,43 @@ class CellBuffer:
                     fg=resolved_fg,
                     bg=resolved_bg,
                 )
-                self._dirty.add((col, row))
+            self._dirty.mark(row, x_start, x_end)
+            if x_start < x_end:
+                self._repair_wide_edges(row, x_start, x_end)
+
+    def _repair_wide_edges(self, y: int, start: int, end: int) -> None:
+        """Blank the other half of any wide glyph cut by a write to ``[start, end)``."""
+        row = self._grid[y]
+        if start > 0 and row[start].char != WIDE_CONTINUATION and codepoint_width(ord(row[start - 1].char)) == 2:
+            row[start - 1] = row[start - 1].with_char(" ")
+            self._dirty.mark(y, start - 1, start)
+        if end < self.width and row[end].char == WIDE_CONTINUATION and codepoint_width(ord(row[end - 1].char)) != 2:
+            row[end] = row[end].with_char(" ")
+            self._dirty.mark(y, end, end + 1)
+
+    def get_dirty_spans(self) -> list[tuple[int, int, int]]:
+        """Get dirty column spans as ``(y, start, end)`` tuples in row order.
+
+        Returns
+        -------
+        list[tuple[int, int, int]]
+            Half-open column ranges modified since the last clear_dirty().
+        """
+        return self._dirty.spans()
 
     def get_dirty_cells(self) -> list[tuple[int, int, Cell]]:
-        """Get all dirty cells as (x, y, cell) tuples.
+        """Get all cells inside dirty spans as (x, y, cell) tuples.
 
         Returns
         -------
         list[tuple[int, int, Cell]]
-            List of modified cells with their coordinates.
+            List of modified cells with their coordinates, in row-major order.
         """
-        result = []
-        for x, y in sorted(self._dirty):
-            if 0 <= x < self.width and 0 <= y < self.height:
-                result.append((x, y, self._grid[y][x]))
+        result: list[tuple[int, int, Cell]] = []
+        for y, start, end in self._dirty.spans():
+            row = self._grid[y]
+            for x in range(start, min(end, self.width)):
+                result.append((x, y, row[x]))
         return result
 
     def clear_dirty(self) -> None:
@@ -442,7 +574,7 @@ class CellBuffer:
 
     def is_dirty(self) -> bool:
         """Check if any cells have been modified since last clear."""
-        return len(self._dirty) > 0
+        return bool(self._dirty)
 
     def resize(self, width: int, height: int) -> None:
         """Resize the buffer, preserving existing content where possible.
@@ -472,15 +604,553 @@ class CellBuffer:
         for y in range(copy_height):
             for x in range(copy_width):
                 new_grid[y][x] = self._grid[y][x]
-                self._dirty.add((x, y))
 
+        self._dirty.resize(height)
+        for y in range(copy_height):
+            self._dirty.mark(y, 0, copy_width)
         self.width = width
         self.height = height
         self._grid = new_grid
 
 
+def segment_codepoints(text: str, x: int, limit: int) -> tuple[int, list[int]]:
+    """Lay ``text`` out in cells starting at column ``x``, clipped to ``[0, limit)``.
+
+    Each cell holds one codepoint. A wide character is followed by a
+    :data:`WIDE_CONTINUATION` cell (codepoint 0); one cut by either edge is
+    replaced by a space. Text is NFC-normalized first so accents compose
+    into their base character; any remaining zero-width characters are
+    dropped. A narrow character widened by a variation selector keeps its
+    second column as a space.
+
+    Parameters
+    ----------
+    text : str
+        Text to place.
+    x : int
+        Column of the first character; may be negative.
+    limit : int
+        Width of the row.
+
+    Returns
+    -------
+    tuple[int, list[int]]
+        First column written and the codepoint of every cell from there.
+    """
+    if text.isascii() and text.isprintable():
+        if x < 0:
+            text = text[-x:]
+            x = 0
+        return x, list(map(ord, text[: max(0, limit - x)]))
+
+    if not text.isascii():
+        text = normalize("NFC", text)
+    codepoints: list[int] = []
+    col = x
+    for char, cells in zip(text, char_widths(text), strict=True):
+        if cells == 0:
+            continue
+        if col >= limit:
+            break
+        if col + cells > 0:
+            if cells == 1:
+                codepoints.append(ord(char))
+            elif col < 0 or col + 1 >= limit:
+                codepoints.append(_SPACE)
+            elif codepoint_width(ord(char)) == 2:
+                codepoints.append(ord(char))
+                codepoints.append(_CONTINUATION)
+            else:
+                # Widened by a dropped variation selector: keep the reserved column blank.
+                codepoints.append(ord(char))
+                codepoints.append(_SPACE)
+        col += cells
+    return max(0, x), codepoints
+
+
+def pack_attributes(style: Cell | Segment) -> int:
+    """Pack the boolean text attributes of a cell or segment into bitflags.
+
+    Parameters
+    ----------
+    style : Cell | Segment
+        Source of the attribute flags.
+
+    Returns
+    -------
+    int
+        Bitwise OR of the matching :class:`CellAttribute` values.
+    """
+    attrs = 0
+    if style.bold:
+        attrs |= _BOLD
+    if style.dim:
+        attrs |= _DIM
+    if style.italic:
+        attrs |= _ITALIC
+    if style.underline:
+        attrs |= _UNDERLINE
+    if style.blink:
+        attrs |= _BLINK
+    if style.reverse:
+        attrs |= _REVERSE
+    if style.strikethrough:
+        attrs |= _STRIKETHROUGH
+    return attrs
+
+
+@dataclass(slots=True)
+class PackedCellBuffer:
+    """Array-backed alternative to :class:`CellBuffer`.
+
+    Instead of one :class:`Cell` object per position, the grid is stored as
+    parallel row-major arrays: codepoints (``array('I')``), foreground and
+    background palette indices (``array('H')``) and attribute bitflags
+    (``array('B')``). Colors are interned in a palette table so each distinct
+    :class:`ANSIColor` is stored once and cells refer to it by index.
+
+    The public API mirrors :class:`CellBuffer`; :meth:`get_cell` materializes
+    a :class:`Cell` view on demand, so rasterizers and renderers can use either
+    buffer interchangeably.
+
+    Parameters
+    ----------
+    width : int
+        Buffer width in cells.
+    height : int
+        Buffer height in cells.
+    default_fg : ANSIColor | None
+        Default foreground color for empty cells.
+    default_bg : ANSIColor | None
+        Default background color for empty cells.
+
+    Attributes
+    ----------
+    _chars : array[int]
+        Codepoint per cell, row-major.
+    _fg : array[int]
+        Foreground palette index per cell (0 = no color).
+    _bg : array[int]
+        Background palette index per cell (0 = no color).
+    _attrs : array[int]
+        :class:`CellAttribute` bitflags per cell.
+    _palette : list[ANSIColor | None]
+        Interned colors; ``_palette[0]`` is always ``None``.
+    _palette_index : dict[ANSIColor, int]
+        Reverse lookup from color to palette index.
+    _dirty : DirtySpans
+        Per-row spans of columns modified since the last clear_dirty().
+
+    Examples
+    --------
+    >>> from ornata.definitions.dataclasses.styling import ANSIColor
+    >>> buf = PackedCellBuffer(80, 24, default_bg=ANSIColor(0, 0, 0))
+    >>> buf.write_segment(0, 0, Segment("Hi", fg=ANSIColor(255, 0, 0)))
+    2
+    >>> buf.get_cell(1, 0).char
+    'i'
+    """
+
+    width: int
+    height: int
+    default_fg: ANSIColor | None = None
+    default_bg: ANSIColor | None = None
+    _chars: array[int] = field(init=False, repr=False)
+    _fg: array[int] = field(init=False, repr=False)
+    _bg: array[int] = field(init=False, repr=False)
+    _attrs: array[int] = field(init=False, repr=False)
+    _palette: list[ANSIColor | None] = field(init=False, repr=False)
+    _palette_index: dict[ANSIColor, int] = field(init=False, repr=False)
+    _dirty: DirtySpans = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Allocate the cell arrays and seed the palette."""
+        self._dirty = DirtySpans(self.height)
+        self._palette = [None]
+        self._palette_index = {}
+        size = self.width * self.height
+        self._chars = array("I", [32]) * size
+        self._fg = array("H", [self.intern_color(self.default_fg)]) * size
+        self._bg = array("H", [self.intern_color(self.default_bg)]) * size
+        self._attrs = array("B", [0]) * size
+
+    def intern_color(self, color: ANSIColor | None) -> int:
+        """Return the palette index for ``color``, adding it if needed.
+
+        Parameters
+        ----------
+        color : ANSIColor | None
+            Color to intern. ``None`` always maps to index 0.
+
+        Returns
+        -------
+        int
+            Palette index usable in the fg/bg arrays.
+
+        Raises
+        ------
+        ValueError
+            If the palette is full even after dropping unused entries.
+        """
+        if color is None:
+            return 0
+        index = self._palette_index.get(color)
+        if index is not None:
+            return index
+        self._reserve_palette(1)
+        index = len(self._palette)
+        self._palette.append(color)
+        self._palette_index[color] = index
+        return index
+
+    def palette_color(self, index: int) -> ANSIColor | None:
+        """Return the color stored at palette ``index``."""
+        return self._palette[index]
+
+    @property
+    def palette(self) -> list[ANSIColor | None]:
+        """Return the interned color table (index 0 is ``None``); do not mutate."""
+        return self._palette
+
+    def export_row(self, y: int, start: int, end: int) -> tuple[array[int], array[int], array[int], array[int]]:
+        """Return copies of the packed arrays for columns ``[start, end)`` of row ``y``.
+
+        Returns
+        -------
+        tuple[array[int], array[int], array[int], array[int]]
+            Codepoints, fg palette indices, bg palette indices and attribute flags.
+        """
+        offset = y * self.width
+        lo = offset + max(0, start)
+        hi = offset + min(self.width, end)
+        return self._chars[lo:hi], self._fg[lo:hi], self._bg[lo:hi], self._attrs[lo:hi]
+
+    def _reserve_palette(self, count: int) -> None:
+        """Make room for ``count`` new palette entries, compacting if needed.
+
+        Call sites that intern several colors before writing reserve up front
+        so an intermediate compaction cannot invalidate an index they hold.
+        """
+        if len(self._palette) + count <= _PALETTE_LIMIT + 1:
+            return
+        used = set(self._fg) | set(self._bg)
+        remap: dict[int, int] = {0: 0}
+        palette: list[ANSIColor | None] = [None]
+        index_map: dict[ANSIColor, int] = {}
+        for old in sorted(used):
+            color = self._palette[old]
+            if color is None:
+                continue
+            remap[old] = len(palette)
+            index_map[color] = len(palette)
+            palette.append(color)
+        self._fg = array("H", [remap[i] for i in self._fg])
+        self._bg = array("H", [remap[i] for i in self._bg])
+        self._palette = palette
+        self._palette_index = index_map
+        if len(self._palette) + count > _PALETTE_LIMIT + 1:
+            raise ValueError("PackedCellBuffer palette exhausted")
+
+    def clear(self, bg: ANSIColor | None = None) -> None:
+        """Clear the buffer, filling with the specified or default background.
+
+        Parameters
+        ----------
+        bg : ANSIColor | None
+            Background color to fill with. If None, uses default_bg.
+        """
+        fill_bg = bg if bg is not None else self.default_bg
+        size = self.width * self.height
+        # Every cell is overwritten, so the palette can start over.
+        self._palette = [None]
+        self._palette_index = {}
+        self._chars[:] = array("I", [32]) * size
+        self._fg[:] = array("H", [self.intern_color(self.default_fg)]) * size
+        self._bg[:] = array("H", [self.intern_color(fill_bg)]) * size
+        self._attrs[:] = array("B", [0]) * size
+        self._dirty.mark_all(self.width)
+
+    def get_cell(self, x: int, y: int) -> Cell | None:
+        """Get a :class:`Cell` view of the specified coordinates.
+
+        The returned cell is a snapshot; mutating it does not change the
+        buffer. Returns None if coordinates are out of bounds.
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        i = y * self.width + x
+        attrs = self._attrs[i]
+        return Cell(
+            char=chr(self._chars[i]),
+            fg=self._palette[self._fg[i]],
+            bg=self._palette[self._bg[i]],
+            bold=bool(attrs & _BOLD),
+            dim=bool(attrs & _DIM),
+            italic=bool(attrs & _ITALIC),
+            underline=bool(attrs & _UNDERLINE),
+            blink=bool(attrs & _BLINK),
+            reverse=bool(attrs & _REVERSE),
+            strikethrough=bool(attrs & _STRIKETHROUGH),
+        )
+
+    def set_cell(self, x: int, y: int, cell: Cell) -> bool:
+        """Set the cell at the specified coordinates.
+
+        Parameters
+        ----------
+        x : int
+            X coordinate (column).
+        y : int
+            Y coordinate (row).
+        cell : Cell
+            The cell to place.
+
+        Returns
+        -------
+        bool
+            True if the cell was set, False if out of bounds.
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        self._reserve_palette(2)
+        i = y * self.width + x
+        self._chars[i] = ord(cell.char)
+        self._fg[i] = self.intern_color(cell.fg)
+        self._bg[i] = self.intern_color(cell.bg)
+        self._attrs[i] = pack_attributes(cell)
+        self._dirty.mark(y, x, x + 1)
+        self._repair_wide_edges(y, x, x + 1)
+        return True
+
+    def write_segment(self, x: int, y: int, segment: Segment, inherited_bg: ANSIColor | None = None) -> int:
+        """Write a segment to the buffer starting at (x, y).
+
+        Background color is resolved: segment.bg > inherited_bg > default_bg.
+        The whole run is written with slice assignment, so no per-character
+        objects are allocated. Wide characters take two cells (see
+        :func:`segment_codepoints`).
+
+        Parameters
+        ----------
+        x : int
+            Starting X coordinate.
+        y : int
+            Y coordinate (row).
+        segment : Segment
+            The styled text segment to write.
+        inherited_bg : ANSIColor | None
+            Background color to inherit if segment has no bg.
+
+        Returns
+        -------
+        int
+            Number of cells written.
+        """
+        if not (0 <= y < self.height):
+            return 0
+
+        resolved_bg = segment.bg if segment.bg is not None else inherited_bg
+        if resolved_bg is None:
+            resolved_bg = self.default_bg
+        resolved_fg = segment.fg if segment.fg is not None else self.default_fg
+
+        x, codepoints = segment_codepoints(segment.text, x, self.width)
+        count = len(codepoints)
+        if count == 0:
+            return 0
+
+        self._reserve_palette(2)
+        fg_index = self.intern_color(resolved_fg)
+        bg_index = self.intern_color(resolved_bg)
+        start = y * self.width + x
+        end = start + count
+        self._chars[start:end] = array("I", codepoints)
+        self._fg[start:end] = array("H", [fg_index]) * count
+        self._bg[start:end] = array("H", [bg_index]) * count
+        self._attrs[start:end] = array("B", [pack_attributes(segment)]) * count
+        self._dirty.mark(y, x, x + count)
+        self._repair_wide_edges(y, x, x + count)
+        return count
+
+    def fill_rect(
+        self,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        char: str = " ",
+        fg: ANSIColor | None = None,
+        bg: ANSIColor | None = None,
+    ) -> None:
+        """Fill a rectangular region with the specified cell properties.
+
+        Parameters
+        ----------
+        x, y : int
+            Top-left corner of the rectangle.
+        width, height : int
+            Dimensions of the rectangle.
+        char : str
+            Character to fill with (default: space).
+        fg : ANSIColor | None
+            Foreground color (None = use default).
+        bg : ANSIColor | None
+            Background color (None = use default).
+        """
+        if len(char) != 1:
+            raise ValueError(f"Fill char must be single character, got {char!r}")
+
+        x_start = max(0, x)
+        x_end = min(self.width, x + width)
+        y_start = max(0, y)
+        y_end = min(self.height, y + height)
+        span = x_end - x_start
+        if span <= 0 or y_end <= y_start:
+            return
+
+        self._reserve_palette(2)
+        chars = array("I", [ord(char)]) * span
+        fgs = array("H", [self.intern_color(fg if fg is not None else self.default_fg)]) * span
+        bgs = array("H", [self.intern_color(bg if bg is not None else self.default_bg)]) * span
+        attrs = array("B", [0]) * span
+        for row in range(y_start, y_end):
+            start = row * self.width + x_start
+            end = start + span
+            self._chars[start:end] = chars
+            self._fg[start:end] = fgs
+            self._bg[start:end] = bgs
+            self._attrs[start:end] = attrs
+            self._dirty.mark(row, x_start, x_end)
+            self._repair_wide_edges(row, x_start, x_end)
+
+    def _repair_wide_edges(self, y: int, start: int, end: int) -> None:
+        """Blank the other half of any wide glyph cut by a write to ``[start, end)``."""
+        chars = self._chars
+        offset = y * self.width
+        if start > 0 and chars[offset + start] != _CONTINUATION and codepoint_width(chars[offset + start - 1]) == 2:
+            chars[offset + start - 1] = _SPACE
+            self._dirty.mark(y, start - 1, start)
+        if end < self.width and chars[offset + end] == _CONTINUATION and codepoint_width(chars[offset + end - 1]) != 2:
+            chars[offset + end] = _SPACE
+            self._dirty.mark(y, end, end + 1)
+
+    def get_dirty_spans(self) -> list[tuple[int, int, int]]:
+        """Get dirty column spans as ``(y, start, end)`` tuples in row order.
+
+        Returns
+        -------
+        list[tuple[int, int, int]]
+            Half-open column ranges modified since the last clear_dirty().
+        """
+        return self._dirty.spans()
+
+    def get_dirty_cells(self) -> list[tuple[int, int, Cell]]:
+        """Get all cells inside dirty spans as (x, y, cell) tuples.
+
+        Returns
+        -------
+        list[tuple[int, int, Cell]]
+            List of modified cells with their coordinates, in row-major order.
+        """
+        result: list[tuple[int, int, Cell]] = []
+        for y, start, end in self._dirty.spans():
+            for x in range(start, min(end, self.width)):
+                cell = self.get_cell(x, y)
+                if cell is not None:
+                    result.append((x, y, cell))
+        return result
+
+    def clear_dirty(self) -> None:
+        """Clear the dirty cell tracking."""
+        self._dirty.clear()
+
+    def is_dirty(self) -> bool:
+        """Check if any cells have been modified since last clear."""
+        return bool(self._dirty)
+
+    def resize(self, width: int, height: int) -> None:
+        """Resize the buffer, preserving existing content where possible.
+
+        Parameters
+        ----------
+        width : int
+            New width.
+        height : int
+            New height.
+        """
+        if width == self.width and height == self.height:
+            return
+
+        self._reserve_palette(2)
+        size = width * height
+        chars = array("I", [32]) * size
+        fgs = array("H", [self.intern_color(self.default_fg)]) * size
+        bgs = array("H", [self.intern_color(self.default_bg)]) * size
+        attrs = array("B", [0]) * size
+
+        copy_width = min(self.width, width)
+        copy_height = min(self.height, height)
+        for y in range(copy_height):
+            src = y * self.width
+            dst = y * width
+            chars[dst : dst + copy_width] = self._chars[src : src + copy_width]
+            fgs[dst : dst + copy_width] = self._fg[src : src + copy_width]
+            bgs[dst : dst + copy_width] = self._bg[src : src + copy_width]
+            attrs[dst : dst + copy_width] = self._attrs[src : src + copy_width]
+
+        self._dirty.resize(height)
+        for y in range(copy_height):
+            self._dirty.mark(y, 0, copy_width)
+        self.width = width
+        self.height = height
+        self._chars = chars
+        self._fg = fgs
+        self._bg = bgs
+        self._attrs = attrs
+
+
+def create_cell_buffer(
+    width: int,
+    height: int,
+    *,
+    default_fg: ANSIColor | None = None,
+    default_bg: ANSIColor | None = None,
+    packed: bool = False,
+) -> CellBuffer | PackedCellBuffer:
+    """Create a cell buffer using the requested storage mode.
+
+    Parameters
+    ----------
+    width : int
+        Buffer width in cells.
+    height : int
+        Buffer height in cells.
+    default_fg : ANSIColor | None
+        Default foreground color for empty cells.
+    default_bg : ANSIColor | None
+        Default background color for empty cells.
+    packed : bool
+        Use the array-backed :class:`PackedCellBuffer` instead of a grid of
+        :class:`Cell` objects.
+
+    Returns
+    -------
+    CellBuffer | PackedCellBuffer
+        The newly allocated buffer.
+    """
+    if packed:
+        return PackedCellBuffer(width, height, default_fg=default_fg, default_bg=default_bg)
+    return CellBuffer(width, height, default_fg=default_fg, default_bg=default_bg)
+
+
 __all__ = [
     "Cell",
     "CellBuffer",
+    "DirtySpans",
+    "PackedCellBuffer",
     "Segment",
+    "WIDE_CONTINUATION",
+    "create_cell_buffer",
+    "pack_attributes",
+    "segment_codepoints",
 ]
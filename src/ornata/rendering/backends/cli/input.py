@@ -7,6 +7,8 @@ them through the event subsystem without relying on legacy helpers.
 
 from __future__ import annotations
 
+import codecs
+import os
 import sys
 import threading
 import time
@@ -14,6 +16,7 @@ from typing import TYPE_CHECKING
 
 from ornata.api.exports.definitions import Event, EventPriority, EventType, KeyEvent, KeyEventType
 from ornata.api.exports.utils import get_logger
+from ornata.rendering.backends.cli.input_parser import InputItem, InputParser, _map_mouse_button, coalesce_motion
 
 if TYPE_CHECKING:
     from ornata.api.exports.events import EventSubsystem
@@ -21,48 +24,85 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
-def _map_mouse_button(button_code: int, released: bool) -> str:
-    """Map SGR mouse button code to a semantic token.
+class StdinReader:
+    """Non-blocking reader that decodes whole chunks of stdin at once.
+
+    Each :meth:`read_events` call drains everything the terminal has
+    buffered with ``os.read`` (POSIX descriptors only) and runs it through an :class:`InputParser`,
+    so a large paste or a burst of mouse reports is handled in one wakeup
+    instead of one character per loop iteration.
 
     Parameters
     ----------
-    button_code : int
-        Value encoded in the first field of the SGR mouse sequence.
-    released : bool
-        Whether the sequence ends with ``m`` (release) instead of ``M`` (press).
-
-    Returns
-    -------
-    str
-        Semantic mouse token.
+    fd : int | None
+        File descriptor to read; defaults to ``sys.stdin``.
+    chunk_size : int
+        Bytes requested per ``os.read`` call.
+    coalesce_motion : bool
+        Keep only the last of consecutive mouse-move reports in a batch.
     """
 
-    wheel_bit = 64
-    motion_bit = 32
-    base = button_code & 0b11
-    is_motion = (button_code & motion_bit) == motion_bit
-    is_wheel = (button_code & wheel_bit) == wheel_bit
-
-    if is_wheel:
-        # Wheel events encode direction in lower bits
-        if base == 0:
-            return "mouse_scroll_up"
-        if base == 1:
-            return "mouse_scroll_down"
-        return "mouse_scroll"
-
-    if is_motion:
-        return "mouse_move"
-
-    button_map = {
-        0: "mouse_left",
-        1: "mouse_middle",
-        2: "mouse_right",
-    }
-    token = button_map.get(base, "mouse_unknown")
-    if released:
-        return f"{token}_release"
-    return token
+    def __init__(self, fd: int | None = None, *, chunk_size: int = 65536, coalesce_motion: bool = True) -> None:
+        self._fd = sys.stdin.fileno() if fd is None else fd
+        self._chunk_size = chunk_size
+        self._coalesce_motion = coalesce_motion
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._parser = InputParser()
+        self.bytes_read = 0
+        self.reads = 0
+
+    def fileno(self) -> int:
+        """Return the watched file descriptor, for selector registration."""
+        return self._fd
+
+    @property
+    def pending(self) -> bool:
+        """Whether a partial escape sequence awaits more input or :meth:`flush`."""
+        return self._parser.pending
+
+    def read_events(self) -> list[InputItem]:
+        """Read all available input and return the items it completes.
+
+        Returns
+        -------
+        list[KeyEvent | MouseEvent | str]
+            Parsed items in arrival order; bracketed pastes are single strings.
+
+        Raises
+        ------
+        EOFError
+            If the input reached end of file.
+        """
+        import select
+
+        # The descriptor stays blocking (stdout often shares its file
+        # description), so only read while select reports data.
+        chunks: list[bytes] = []
+        while select.select([self._fd], [], [], 0)[0]:
+            try:
+                data = os.read(self._fd, self._chunk_size)
+            except InterruptedError:
+                continue
+            self.reads += 1
+            if not data:
+                if not chunks:
+                    raise EOFError("stdin closed")
+                break
+            chunks.append(data)
+            if len(data) < self._chunk_size:
+                break
+        if not chunks:
+            return []
+        raw = b"".join(chunks)
+        self.bytes_read += len(raw)
+        items = self._parser.feed(self._decoder.decode(raw))
+        if self._coalesce_motion:
+            items = coalesce_motion(items)
+        return items
+
+    def flush(self) -> list[InputItem]:
+        """Resolve a pending lone ESC once no more input followed it."""
+        return self._parser.flush()
 
 
 class CLIInputPipeline:
@@ -306,6 +346,9 @@ class CLIInputPipeline:
                     return None
 
                 fd = sys.stdin.fileno()
+                if not os.isatty(fd):
+                    # Redirected stdin has no line discipline to switch; read it line by line below.
+                    raise OSError("stdin is not a terminal")
                 old_settings = termios.tcgetattr(fd)
 
                 try:
@@ -0,0 +1,448 @@
+"""Incremental parser for terminal input streams.
+
+:class:`InputParser` turns decoded stdin chunks into key and mouse events.
+It is a small state machine, so CSI, SS3, SGR mouse reports and bracketed
+paste sequences may be split across any number of reads. Key and mouse
+events are frozen, so they are interned and shared between reads instead
+of being allocated per keystroke.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from ornata.api.exports.definitions import KeyEvent, KeyEventType, MouseEvent, MouseEventType
+
+# Parsed input items: key presses, mouse reports, and pasted text as one string.
+InputItem = KeyEvent | MouseEvent | str
+
+PASTE_START = "\x1b[200~"
+PASTE_END = "\x1b[201~"
+
+_GROUND = 0
+_ESCAPE = 1
+_CSI = 2
+_SS3 = 3
+_PASTE = 4
+_X10_MOUSE = 5
+
+# Sequences longer than this are malformed and are dropped.
+_MAX_SEQUENCE = 64
+
+_CONTROL_KEYS = {
+    "\r": "enter",
+    "\n": "enter",
+    "\t": "tab",
+    "\x7f": "backspace",
+    "\x08": "backspace",
+    " ": "space",
+    "\x00": "ctrl+space",
+}
+
+# Final byte of ``CSI [1;mod] X`` and ``SS3 X`` sequences.
+_FINAL_KEYS = {
+    "A": "up",
+    "B": "down",
+    "C": "right",
+    "D": "left",
+    "H": "home",
+    "F": "end",
+    "P": "f1",
+    "Q": "f2",
+    "R": "f3",
+    "S": "f4",
+}
+
+# Keypad enter is only sent as ``SS3 M``; ``CSI M`` starts an X10 mouse report.
+_SS3_KEYS = {**_FINAL_KEYS, "M": "enter"}
+
+# First parameter of ``CSI n [;mod] ~`` sequences.
+_TILDE_KEYS = {
+    1: "home",
+    2: "insert",
+    3: "delete",
+    4: "end",
+    5: "page_up",
+    6: "page_down",
+    7: "home",
+    8: "end",
+    11: "f1",
+    12: "f2",
+    13: "f3",
+    14: "f4",
+    15: "f5",
+    17: "f6",
+    18: "f7",
+    19: "f8",
+    20: "f9",
+    21: "f10",
+    23: "f11",
+    24: "f12",
+}
+
+_MODIFIER_PREFIXES = ("ctrl+", "alt+", "shift+")
+
+
+def _map_mouse_button(button_code: int, released: bool) -> str:
+    """Map SGR mouse button code to a semantic token.
+
+    Parameters
+    ----------
+    button_code : int
+        Value encoded in the first field of the SGR mouse sequence.
+    released : bool
+        Whether the sequence ends with ``m`` (release) instead of ``M`` (press).
+
+    Returns
+    -------
+    str
+        Semantic mouse token.
+    """
+
+    wheel_bit = 64
+    motion_bit = 32
+    base = button_code & 0b11
+    is_motion = (button_code & motion_bit) == motion_bit
+    is_wheel = (button_code & wheel_bit) == wheel_bit
+
+    if is_wheel:
+        # Wheel events encode direction in lower bits
+        if base == 0:
+            return "mouse_scroll_up"
+        if base == 1:
+            return "mouse_scroll_down"
+        return "mouse_scroll"
+
+    if is_motion:
+        return "mouse_move"
+
+    button_map = {
+        0: "mouse_left",
+        1: "mouse_middle",
+        2: "mouse_right",
+    }
+    token = button_map.get(base, "mouse_unknown")
+    if released:
+        return f"{token}_release"
+    return token
+
+
+@lru_cache(maxsize=1024)
+def key_event(token: str) -> KeyEvent:
+    """Return the shared key-down event for ``token``.
+
+    Parameters
+    ----------
+    token : str
+        Key token with optional ``ctrl+``, ``alt+`` and ``shift+`` prefixes,
+        e.g. ``"a"``, ``"enter"`` or ``"ctrl+up"``.
+
+    Returns
+    -------
+    KeyEvent
+        Event whose ``key`` is the full token; modifier flags are set from
+        its prefixes.
+    """
+    modifiers: set[str] = set()
+    base = token
+    matched = True
+    while matched and len(base) > 1:
+        matched = False
+        for prefix in _MODIFIER_PREFIXES:
+            if base.startswith(prefix) and len(base) > len(prefix):
+                modifiers.add(prefix[:-1])
+                base = base[len(prefix):]
+                matched = True
+    if len(base) == 1:
+        char: str | None = base
+    elif base == "space":
+        char = " "
+    else:
+        char = None
+    return KeyEvent(
+        event_type=KeyEventType.KEYDOWN,
+        key=token,
+        char=char,
+        modifiers=frozenset(modifiers),
+        ctrl="ctrl" in modifiers,
+        alt="alt" in modifiers,
+        shift="shift" in modifiers,
+    )
+
+
+@lru_cache(maxsize=4096)
+def mouse_event(button_code: int, x: int, y: int, released: bool) -> MouseEvent:
+    """Return the shared event for an SGR mouse report.
+
+    Parameters
+    ----------
+    button_code : int
+        First field of the report, including modifier and motion bits.
+    x, y : int
+        Zero-based cell coordinates.
+    released : bool
+        Whether the report ended with ``m``.
+
+    Returns
+    -------
+    MouseEvent
+        Decoded event; ``button_name`` carries the semantic mouse token.
+    """
+    modifiers = frozenset(
+        name for bit, name in ((4, "shift"), (8, "alt"), (16, "ctrl")) if button_code & bit
+    )
+    base = button_code & 0b11
+    delta_y = 0
+    if button_code & 64:
+        event_type = MouseEventType.SCROLL_UP if base == 0 else MouseEventType.SCROLL_DOWN
+        delta_y = -1 if base == 0 else 1
+    elif button_code & 32:
+        event_type = MouseEventType.MOVE
+    elif released:
+        event_type = MouseEventType.BUTTON_UP
+    else:
+        event_type = MouseEventType.BUTTON_DOWN
+    return MouseEvent(
+        event_type=event_type,
+        x=x,
+        y=y,
+        button=base,
+        button_name=_map_mouse_button(button_code, released),
+        modifiers=modifiers,
+        delta_y=delta_y,
+    )
+
+
+def _modifier_prefix(param: str) -> str:
+    """Return the token prefix for an xterm modifier parameter (``1 + bits``)."""
+    try:
+        bits = int(param) - 1
+    except ValueError:
+        return ""
+    if bits <= 0:
+        return ""
+    return ("ctrl+" if bits & 4 else "") + ("alt+" if bits & 2 else "") + ("shift+" if bits & 1 else "")
+
+
+def _ctrl_token(ch: str) -> str:
+    """Return the token for a C0 control character, e.g. ``"\\x03"`` -> ``"ctrl+c"``."""
+    return "ctrl+" + chr(ord(ch) + 64).lower()
+
+
+def _marker_prefix_length(chunk: str) -> int:
+    """Return the length of the longest suffix of ``chunk`` that starts :data:`PASTE_END`."""
+    for length in range(min(len(PASTE_END) - 1, len(chunk)), 0, -1):
+        if chunk.endswith(PASTE_END[:length]):
+            return length
+    return 0
+
+
+class InputParser:
+    """Incremental decoder for VT input sequences.
+
+    Feed it decoded text as it arrives; incomplete sequences are kept until
+    the next :meth:`feed`. A trailing lone ESC is ambiguous (it may be the
+    escape key or the start of a sequence), so callers that see
+    :attr:`pending` set after a read should call :meth:`flush` once no more
+    input arrives within a short timeout.
+    """
+
+    __slots__ = ("_state", "_sequence", "_paste")
+
+    def __init__(self) -> None:
+        self._state = _GROUND
+        self._sequence = ""
+        self._paste: list[str] = []
+
+    @property
+    def pending(self) -> bool:
+        """Whether an escape sequence has started but not finished."""
+        return self._state in (_ESCAPE, _CSI, _SS3, _X10_MOUSE)
+
+    @property
+    def in_paste(self) -> bool:
+        """Whether a bracketed paste is being collected."""
+        return self._state == _PASTE
+
+    def reset(self) -> None:
+        """Discard partial sequences and paste content."""
+        self._state = _GROUND
+        self._sequence = ""
+        self._paste.clear()
+
+    def flush(self) -> list[InputItem]:
+        """Resolve a pending sequence after the input went quiet.
+
+        A lone ESC becomes the escape key; a truncated sequence is dropped
+        and also reported as escape. Bracketed pastes keep collecting.
+        """
+        if not self.pending:
+            return []
+        self._state = _GROUND
+        self._sequence = ""
+        return [key_event("escape")]
+
+    def feed(self, text: str) -> list[InputItem]:
+        """Parse ``text`` and return the complete items it finished.
+
+        Parameters
+        ----------
+        text : str
+            Decoded input, of any length.
+
+        Returns
+        -------
+        list[KeyEvent | MouseEvent | str]
+            Items in arrival order; a bracketed paste is one ``str``.
+        """
+        out: list[InputItem] = []
+        i = 0
+        n = len(text)
+        while i < n:
+            state = self._state
+            if state == _PASTE:
+                i = self._feed_paste(text, i, out)
+                continue
+            ch = text[i]
+            i += 1
+            if state == _GROUND:
+                if ch == "\x1b":
+                    self._state = _ESCAPE
+                elif ch in _CONTROL_KEYS:
+                    out.append(key_event(_CONTROL_KEYS[ch]))
+                elif ch < " ":
+                    out.append(key_event(_ctrl_token(ch)))
+                else:
+                    out.append(key_event(ch))
+            elif state == _ESCAPE:
+                if ch == "[":
+                    self._state = _CSI
+                    self._sequence = ""
+                elif ch == "O":
+                    self._state = _SS3
+                elif ch == "\x1b":
+                    out.append(key_event("escape"))
+                else:
+                    self._state = _GROUND
+                    token = _CONTROL_KEYS.get(ch)
+                    if token is None:
+                        token = _ctrl_token(ch) if ch < " " else ch
+                    out.append(key_event("alt+" + token))
+            elif state == _CSI:
+                if "@" <= ch <= "~":
+                    self._state = _GROUND
+                    self._finish_csi(self._sequence, ch, out)
+                    self._sequence = ""
+                elif len(self._sequence) >= _MAX_SEQUENCE:
+                    self._state = _GROUND
+                    self._sequence = ""
+                else:
+                    self._sequence += ch
+            elif state == _SS3:
+                self._state = _GROUND
+                token = _SS3_KEYS.get(ch)
+                if token is not None:
+                    out.append(key_event(token))
+            else:  # _X10_MOUSE
+                self._sequence += ch
+                if len(self._sequence) == 3:
+                    self._state = _GROUND
+                    code, x, y = (ord(value) - 32 for value in self._sequence)
+                    self._sequence = ""
+                    released = code & 0b11 == 0b11 and not code & 96
+                    out.append(mouse_event(code, max(0, x - 1), max(0, y - 1), released))
+        return out
+
+    def _feed_paste(self, text: str, start: int, out: list[InputItem]) -> int:
+        """Collect paste content from ``text[start:]``; return the next index to parse."""
+        # A partial end marker held back from the previous read is re-scanned.
+        chunk = self._sequence + text[start:]
+        self._sequence = ""
+        end = chunk.find(PASTE_END)
+        if end < 0:
+            keep = _marker_prefix_length(chunk)
+            self._paste.append(chunk[: len(chunk) - keep])
+            self._sequence = chunk[len(chunk) - keep:]
+            return len(text)
+        self._paste.append(chunk[:end])
+        out.append("".join(self._paste))
+        self._paste.clear()
+        self._state = _GROUND
+        return len(text) - (len(chunk) - end - len(PASTE_END))
+
+    def _finish_csi(self, params: str, final: str, out: list[InputItem]) -> None:
+        """Decode one complete ``CSI params final`` sequence into ``out``."""
+        if params.startswith("<") and final in ("M", "m"):
+            fields = params[1:].split(";")
+            if len(fields) == 3:
+                try:
+                    code, x, y = (int(value) for value in fields)
+                except ValueError:
+                    return
+                out.append(mouse_event(code, max(0, x - 1), max(0, y - 1), final == "m"))
+            return
+        if final == "~":
+            fields = params.split(";")
+            try:
+                number = int(fields[0])
+            except ValueError:
+                return
+            if number == 200:
+                self._state = _PASTE
+                return
+            token = _TILDE_KEYS.get(number)
+            if token is not None:
+                prefix = _modifier_prefix(fields[1]) if len(fields) > 1 else ""
+                out.append(key_event(prefix + token))
+            return
+        if final == "M" and not params:
+            self._state = _X10_MOUSE
+            return
+        if final == "Z":
+            out.append(key_event("shift+tab"))
+            return
+        token = _FINAL_KEYS.get(final)
+        if token is None:
+            # Focus reports, device responses and unknown sequences are ignored.
+            return
+        fields = params.split(";")
+        prefix = _modifier_prefix(fields[1]) if len(fields) > 1 else ""
+        out.append(key_event(prefix + token))
+
+
+def coalesce_motion(items: list[InputItem]) -> list[InputItem]:
+    """Drop mouse-move reports that are immediately followed by another move.
+
+    Parameters
+    ----------
+    items : list[KeyEvent | MouseEvent | str]
+        One read's worth of parsed items.
+
+    Returns
+    -------
+    list[KeyEvent | MouseEvent | str]
+        ``items`` with each run of consecutive moves reduced to its last report.
+    """
+    if len(items) < 2:
+        return items
+    result: list[InputItem] = []
+    previous_move = False
+    for item in items:
+        is_move = isinstance(item, MouseEvent) and item.event_type is MouseEventType.MOVE
+        if is_move and previous_move:
+            result[-1] = item
+        else:
+            result.append(item)
+        previous_move = is_move
+    return result
+
+
+__all__ = [
+    "InputItem",
+    "InputParser",
+    "PASTE_END",
+    "PASTE_START",
+    "coalesce_motion",
+    "key_event",
+    "mouse_event",
+]
@@ -10,22 +10,28 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 from ornata.api.exports.utils import get_logger
+from ornata.definitions.dataclasses.styling import ANSIColor
+from ornata.layout.scrolling.virtual_table import format_table_row
+from ornata.rendering.backends.cli.ansi.colors import parse_ansi_color
+from ornata.utils.unicode_width import fit_to_width, text_width
 
 if TYPE_CHECKING:
     from ornata.api.exports.definitions import GuiNode
-    from ornata.definitions.dataclasses.styling import ANSIColor, BackendStylePayload
-    from ornata.rendering.backends.cli.cells import CellBuffer, Segment
+    from ornata.definitions.dataclasses.styling import BackendStylePayload
+    from ornata.layout.scrolling.virtual_table import VirtualTable
+    from ornata.rendering.backends.cli.cells import CellBuffer, PackedCellBuffer, Segment
 
 
 logger = get_logger(__name__)
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class RasterContext:
     """Context for rasterizing a node hierarchy.
 
     Maintains the current style state during depth-first traversal,
-    handling parent-to-child inheritance for colors.
+    handling parent-to-child inheritance for colors. Contexts are immutable
+    and shared between nodes whose styles do not change them.
 
     Attributes
     ----------
@@ -62,26 +68,18 @@ class RasterContext:
     def with_style(self, style: BackendStylePayload | None) -> RasterContext:
         """Create a child context with merged style.
 
-        Child style overrides parent style where explicitly set.
+        Child style overrides parent style where explicitly set. Contexts are
+        immutable, so when the style changes nothing the parent context is
+        returned as-is rather than copied.
         """
         if style is None or style.style is None:
-            return RasterContext(
-                inherited_fg=self.inherited_fg,
-                inherited_bg=self.inherited_bg,
-                bold=self.bold,
-                dim=self.dim,
-                italic=self.italic,
-                underline=self.underline,
-                blink=self.blink,
-                reverse=self.reverse,
-                strikethrough=self.strikethrough,
-            )
+            return self
 
         resolved = style.style
 
         # Extract colors from resolved style (already converted to ANSI strings by style system)
-        fg = self._extract_color(resolved.color)
-        bg = self._extract_color(resolved.background)
+        fg = _extract_color(resolved.color)
+        bg = _extract_color(resolved.background)
 
         # Inheritance: explicit > parent > None
         new_fg = fg if fg is not None else self.inherited_fg
@@ -89,138 +87,39 @@ class RasterContext:
 
         # Attributes: accumulate (parent OR child)
         # Note: This is a design choice - we could also have child override parent
+        bold = self.bold or self._extract_bool(resolved, "bold")
+        dim = self.dim or self._extract_bool(resolved, "dim")
+        italic = self.italic or self._extract_bool(resolved, "italic")
+        underline = self.underline or self._extract_bool(resolved, "underline")
+        blink = self.blink or self._extract_bool(resolved, "blink")
+        reverse = self.reverse or self._extract_bool(resolved, "reverse")
+        strikethrough = self.strikethrough or self._extract_bool(resolved, "strikethrough")
+
+        if (
+            new_fg == self.inherited_fg
+            and new_bg == self.inherited_bg
+            and bold == self.bold
+            and dim == self.dim
+            and italic == self.italic
+            and underline == self.underline
+            and blink == self.blink
+            and reverse == self.reverse
+            and strikethrough == self.strikethrough
+        ):
+            return self
+
         return RasterContext(
             inherited_fg=new_fg,
             inherited_bg=new_bg,
-            bold=self.bold or self._extract_bool(resolved, "bold"),
-            dim=self.dim or self._extract_bool(resolved, "dim"),
-            italic=self.italic or self._extract_bool(resolved, "italic"),
-            underline=self.underline or self._extract_bool(resolved, "underline"),
-            blink=self.blink or self._extract_bool(resolved, "blink"),
-            reverse=self.reverse or self._extract_bool(resolved, "reverse"),
-            strikethrough=self.strikethrough or self._extract_bool(resolved, "strikethrough"),
+            bold=bold,
+            dim=dim,
+            italic=italic,
+            underline=underline,
+            blink=blink,
+            reverse=reverse,
+            strikethrough=strikethrough,
         )
 
-    def _extract_color(self, color_value: Any) -> ANSIColor | None:
-        """Extract ANSIColor from style value.
-
-        The styling system converts colors to ANSI escape sequences for CLI backends.
-        We need to parse these strings to extract RGB values.
-        """
-        if color_value is None:
-            return None
-
-        from ornata.definitions.dataclasses.styling import ANSIColor
-
-        # If it's already an ANSIColor, return it
-        if isinstance(color_value, ANSIColor):
-            return color_value
-
-        # If it's a string (ANSI escape sequence), parse it
-        if isinstance(color_value, str):
-            return self._parse_ansi_color(color_value)
-
-        return None
-
-    def _parse_ansi_color(self, ansi_str: str) -> ANSIColor | None:
-        """Parse ANSI escape sequence to extract RGB values.
-
-        Supports:
-        - Truecolor: \x1b[38;2;R;G;Bm or \x1b[48;2;R;G;Bm
-        - 256-color: \x1b[38;5;Nm or \x1b[48;5;Nm
-        - 16-color: \x1b[30-37m, \x1b[90-97m (fg) or \x1b[40-47m, \x1b[100-107m (bg)
-        """
-        from ornata.definitions.dataclasses.styling import ANSIColor
-
-        if not ansi_str or not ansi_str.startswith("\x1b["):
-            return None
-
-        # Remove escape prefix and suffix
-        # \x1b[38;2;R;G;Bm -> 38;2;R;G;B
-        content = ansi_str[2:]  # Skip \x1b[
-        if content.endswith("m"):
-            content = content[:-1]
-
-        parts = content.split(";")
-        if not parts:
-            return None
-
-        try:
-            # Truecolor: 38;2;R;G;B (fg) or 48;2;R;G;B (bg)
-            if len(parts) >= 5 and parts[1] == "2":
-                r = int(parts[2])
-                g = int(parts[3])
-                b = int(parts[4])
-                return ANSIColor(r, g, b)
-
-            # 256-color: 38;5;N (fg) or 48;5;N (bg)
-            if len(parts) >= 3 and parts[1] == "5":
-                code = int(parts[2])
-                r, g, b = self._ansi_256_to_rgb(code)
-                return ANSIColor(r, g, b)
-
-            # 16-color standard codes
-            if len(parts) == 1:
-                code = int(parts[0])
-                r, g, b = self._ansi_16_to_rgb(code)
-                return ANSIColor(r, g, b)
-
-        except (ValueError, IndexError):
-            pass
-
-        return None
-
-    def _ansi_256_to_rgb(self, code: int) -> tuple[int, int, int]:
-        """Convert ANSI 256-color code to RGB."""
-        if code < 16:
-            # Standard 16 colors
-            return self._ansi_16_to_rgb(code)
-        elif code < 232:
-            # 6x6x6 color cube (16-231)
-            code -= 16
-            r = (code // 36) * 51
-            g = ((code % 36) // 6) * 51
-            b = (code % 6) * 51
-            return (r, g, b)
-        else:
-            # Grayscale (232-255)
-            gray = (code - 232) * 10 + 8
-            return (gray, gray, gray)
-
-    def _ansi_16_to_rgb(self, code: int) -> tuple[int, int, int]:
-        """Convert ANSI 16-color code to RGB."""
-        # Standard ANSI 16 colors
-        colors = [
-            (0, 0, 0),       # 0: Black
-            (170, 0, 0),     # 1: Red
-            (0, 170, 0),     # 2: Green
-            (170, 85, 0),    # 3: Yellow
-            (0, 0, 170),     # 4: Blue
-            (170, 0, 170),   # 5: Magenta
-            (0, 170, 170),   # 6: Cyan
-            (170, 170, 170), # 7: White/Gray
-            (85, 85, 85),    # 8: Bright Black
-            (255, 85, 85),   # 9: Bright Red
-            (85, 255, 85),   # 10: Bright Green
-            (255, 255, 85),  # 11: Bright Yellow
-            (85, 85, 255),   # 12: Bright Blue
-            (255, 85, 255),  # 13: Bright Magenta
-            (85, 255, 255),  # 14: Bright Cyan
-            (255, 255, 255), # 15: Bright White
-        ]
-        if 0 <= code < 16:
-            return colors[code]
-        # Handle foreground (30-37, 90-97) and background (40-47, 100-107) codes
-        if 30 <= code <= 37:
-            return colors[code - 30]
-        if 40 <= code <= 47:
-            return colors[code - 40]
-        if 90 <= code <= 97:
-            return colors[code - 82]  # 90 -> 8, 97 -> 15
-        if 100 <= code <= 107:
-            return colors[code - 92]  # 100 -> 8, 107 -> 15
-        return (128, 128, 128)  # Default gray
-
     def _extract_bool(self, style: Any, attr: str) -> bool:
         """Extract boolean attribute from style."""
         val = getattr(style, attr, None)
@@ -236,6 +135,22 @@ class RasterContext:
         return False
 
 
+def _extract_color(color_value: Any) -> ANSIColor | None:
+    """Extract ANSIColor from style value.
+
+    The styling system converts colors to ANSI escape sequences for CLI backends;
+    those are decoded through the memoized parser in
+    :mod:`~ornata.rendering.backends.cli.ansi.colors`.
+    """
+    if color_value is None:
+        return None
+    if isinstance(color_value, str):
+        return parse_ansi_color(color_value)
+    if isinstance(color_value, ANSIColor):
+        return color_value
+    return None
+
+
 class NodeRasterizer:
     """Rasterizes GuiNode trees to CellBuffer.
 
@@ -245,7 +160,7 @@ class NodeRasterizer:
     - Spatial composition only (no style cascade beyond inheritance)
     """
 
-    def __init__(self, width: int, height: int, default_bg: ANSIColor | None = None) -> None:
+    def __init__(self, width: int, height: int, default_bg: ANSIColor | None = None, *, packed: bool = False) -> None:
         """Initialize the rasterizer.
 
         Parameters
@@ -256,12 +171,15 @@ class NodeRasterizer:
             Target buffer height.
         default_bg : ANSIColor | None
             Default background color for the entire screen.
+        packed : bool
+            Rasterize into an array-backed :class:`PackedCellBuffer`.
         """
         self.width = width
         self.height = height
         self.default_bg = default_bg
+        self.packed = packed
 
-    def rasterize(self, root: GuiNode) -> CellBuffer:
+    def rasterize(self, root: GuiNode) -> CellBuffer | PackedCellBuffer:
         """Rasterize a GuiNode tree to a CellBuffer.
 
         Parameters
@@ -271,15 +189,16 @@ class NodeRasterizer:
 
         Returns
         -------
-        CellBuffer
+        CellBuffer | PackedCellBuffer
             The rasterized cell buffer.
         """
-        from ornata.rendering.backends.cli.cells import CellBuffer
+        from ornata.rendering.backends.cli.cells import create_cell_buffer
 
-        buffer = CellBuffer(
-            width=self.width,
-            height=self.height,
+        buffer = create_cell_buffer(
+            self.width,
+            self.height,
             default_bg=self.default_bg,
+            packed=self.packed,
         )
 
         # Clear with root background
@@ -293,7 +212,7 @@ class NodeRasterizer:
 
         return buffer
 
-    def _rasterize_node(self, buffer: CellBuffer, node: GuiNode, context: RasterContext) -> None:
+    def _rasterize_node(self, buffer: CellBuffer | PackedCellBuffer, node: GuiNode, context: RasterContext) -> None:
         """Rasterize a single node and its children."""
         if not getattr(node, "visible", True):
             return
@@ -349,7 +268,7 @@ class NodeRasterizer:
 
     def _rasterize_borders(
         self,
-        buffer: CellBuffer,
+        buffer: CellBuffer | PackedCellBuffer,
         node: GuiNode,
         x: int,
         y: int,
@@ -358,7 +277,6 @@ class NodeRasterizer:
         context: RasterContext,
     ) -> None:
         """Rasterize node borders using box-drawing characters."""
-        from ornata.definitions.dataclasses.styling import ANSIColor
         from ornata.definitions.unicode_assets import BORDER_STYLES
         from ornata.rendering.backends.cli.cells import Cell
 
@@ -428,8 +346,6 @@ class NodeRasterizer:
 
     def _extract_border_color(self, node: GuiNode, context: RasterContext) -> ANSIColor | None:
         """Extract border color from node style."""
-        from ornata.definitions.dataclasses.styling import ANSIColor
-
         style = getattr(node, "style", None)
         if style is None:
             return None
@@ -450,7 +366,7 @@ class NodeRasterizer:
 
     def _rasterize_content(
         self,
-        buffer: CellBuffer,
+        buffer: CellBuffer | PackedCellBuffer,
         node: GuiNode,
         x: int,
         y: int,
@@ -470,9 +386,11 @@ class NodeRasterizer:
         # Check for table data
         columns = getattr(node, "columns", None)
         rows = getattr(node, "rows", None)
-        if columns and rows:
+        virtual_rows = getattr(node, "virtual_rows", None)
+        if columns and (rows or virtual_rows is not None):
             self._rasterize_table(
-                buffer, columns, rows, inner_x, inner_y, inner_width, inner_height, context
+                buffer, columns, rows or [], inner_x, inner_y, inner_width, inner_height, context,
+                virtual_rows=virtual_rows,
             )
             return
 
@@ -512,7 +430,7 @@ class NodeRasterizer:
 
     def _rasterize_text(
         self,
-        buffer: CellBuffer,
+        buffer: CellBuffer | PackedCellBuffer,
         text: str,
         x: int,
         y: int,
@@ -523,7 +441,6 @@ class NodeRasterizer:
         """Rasterize text content with word wrapping."""
         from textwrap import wrap
 
-        from ornata.definitions.dataclasses.styling import ANSIColor
         from ornata.rendering.backends.cli.cells import Segment
 
         # Resolve final colors for this content
@@ -548,7 +465,7 @@ class NodeRasterizer:
             if row_idx >= height:
                 break
             segment = Segment(
-                text=line[:width].ljust(width),
+                text=fit_to_width(line, width),
                 fg=fg,
                 bg=bg,
                 bold=context.bold,
@@ -563,7 +480,7 @@ class NodeRasterizer:
 
     def _rasterize_table(
         self,
-        buffer: CellBuffer,
+        buffer: CellBuffer | PackedCellBuffer,
         columns: list[str],
         rows: list[list[Any]],
         x: int,
@@ -571,9 +488,15 @@ class NodeRasterizer:
         width: int,
         height: int,
         context: RasterContext,
+        *,
+        virtual_rows: VirtualTable | None = None,
     ) -> None:
-        """Rasterize table content."""
-        from ornata.definitions.dataclasses.styling import ANSIColor
+        """Rasterize table content.
+
+        With ``virtual_rows`` the table body is sized to the available height
+        and only the rows on screen are fetched and formatted; ``rows`` is
+        ignored.
+        """
         from ornata.rendering.backends.cli.cells import Segment
 
         if height < 2:
@@ -587,8 +510,7 @@ class NodeRasterizer:
         spacer = 1 if slots > 1 else 0
         cell_width = max(1, (width - (spacer * (slots - 1))) // slots)
 
-        header_cells = [str(col).strip()[:cell_width].ljust(cell_width) for col in columns]
-        header_line = (" " * spacer).join(header_cells)[:width]
+        header_line = format_table_row(columns, cell_width, width, spacer)
 
         # Write header
         header_segment = Segment(
@@ -606,7 +528,7 @@ class NodeRasterizer:
         buffer.write_segment(x, y, header_segment, inherited_bg=bg)
 
         # Separator line
-        separator = "-" * min(len(header_line.replace("\x1b[", "").replace("m", "")), width)
+        separator = "-" * min(text_width(header_line), width)
         sep_segment = Segment(
             text=separator[:width].ljust(width),
             fg=fg,
@@ -623,12 +545,17 @@ class NodeRasterizer:
             buffer.write_segment(x, y + 1, sep_segment, inherited_bg=bg)
 
         # Data rows
+        body_height = height - 2
+        if body_height <= 0:
+            return
+        if virtual_rows is not None:
+            virtual_rows.set_viewport(body_height)
+            row_lines = virtual_rows.visible_lines(cell_width, width, spacer)
+        else:
+            row_lines = [format_table_row(row, cell_width, width, spacer) for row in rows[:body_height]]
+
         row_y = y + 2
-        for row in rows:
-            if row_y >= y + height:
-                break
-            row_cells = [str(cell).strip()[:cell_width].ljust(cell_width) for cell in row]
-            row_line = (" " * spacer).join(row_cells)[:width]
+        for row_line in row_lines:
             row_segment = Segment(
                 text=row_line,
                 fg=fg,
@@ -0,0 +1,326 @@
+"""Event-driven frame scheduling for live terminal sessions.
+
+:class:`FrameScheduler` blocks in a selector until a registered file is
+readable, a timer or signal fires, or a frame was requested, so an idle
+session does not use CPU. Frame requests are coalesced: any number of
+requests between two frames produce a single render, and frames are never
+started more often than the configured frame rate.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import selectors
+import signal
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from ornata.api.exports.utils import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = get_logger(__name__)
+
+
+@dataclass(slots=True)
+class FrameSchedulerStats:
+    """Counters describing the work done by a :class:`FrameScheduler`."""
+
+    frames: int = 0
+    wakeups: int = 0
+    overruns: int = 0
+    last_frame_time: float = 0.0
+    max_frame_time: float = 0.0
+
+
+class TimerHandle:
+    """Handle returned by :meth:`FrameScheduler.call_later`."""
+
+    __slots__ = ("deadline", "callback", "interval", "cancelled")
+
+    def __init__(self, deadline: float, callback: Callable[[], None], interval: float | None) -> None:
+        self.deadline = deadline
+        self.callback = callback
+        self.interval = interval
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Prevent the timer from firing again."""
+        self.cancelled = True
+
+
+class FrameScheduler:
+    """Single-threaded loop that renders frames only when requested.
+
+    Parameters
+    ----------
+    render : Callable[[], None]
+        Called once per frame, after the animation-frame callbacks.
+    fps : float
+        Maximum frame rate; ``1 / fps`` is also the frame budget used for
+        overrun reporting.
+    on_overrun : Callable[[float, float], None] | None
+        Called with ``(elapsed, budget)`` after a frame that took longer
+        than its budget.
+    clock : Callable[[], float]
+        Monotonic clock in seconds.
+    """
+
+    def __init__(
+        self,
+        render: Callable[[], None],
+        *,
+        fps: float = 60.0,
+        on_overrun: Callable[[float, float], None] | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        if fps <= 0:
+            raise ValueError("fps must be greater than zero")
+        self._render = render
+        self._on_overrun = on_overrun
+        self._clock = clock
+        self.frame_budget = 1.0 / fps
+        self._selector = selectors.DefaultSelector()
+        # Other threads and signal handlers wake the selector through this pair.
+        self._wake_reader, self._wake_writer = socket.socketpair()
+        self._wake_reader.setblocking(False)
+        self._wake_writer.setblocking(False)
+        self._selector.register(self._wake_reader, selectors.EVENT_READ, self._drain_wakeups)
+        self._timers: list[tuple[float, int, TimerHandle]] = []
+        self._timer_sequence = itertools.count()
+        self._animation_callbacks: dict[int, Callable[[float], None]] = {}
+        self._animation_handles = itertools.count(1)
+        self._pending_signals: list[Callable[[], None]] = []
+        self._previous_handlers: dict[int, Any] = {}
+        self._frame_requested = False
+        self._last_frame_start = float("-inf")
+        self._loop_thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._running = False
+        self._stats = FrameSchedulerStats()
+
+    @property
+    def stats(self) -> FrameSchedulerStats:
+        """Counters accumulated since the scheduler was created."""
+        return self._stats
+
+    @property
+    def frame_pending(self) -> bool:
+        """Whether a frame has been requested but not rendered yet."""
+        return self._frame_requested
+
+    # Sources ------------------------------------------------
+
+    def add_reader(self, fileobj: Any, callback: Callable[[], None]) -> None:
+        """Call ``callback`` whenever ``fileobj`` is readable.
+
+        Raises
+        ------
+        ValueError
+            If ``fileobj`` cannot be watched by the platform selector.
+        """
+        self._selector.register(fileobj, selectors.EVENT_READ, callback)
+
+    def remove_reader(self, fileobj: Any) -> None:
+        """Stop watching ``fileobj``."""
+        try:
+            self._selector.unregister(fileobj)
+        except (KeyError, ValueError):
+            pass
+
+    def call_later(self, delay: float, callback: Callable[[], None], *, interval: float | None = None) -> TimerHandle:
+        """Run ``callback`` after ``delay`` seconds, then every ``interval`` seconds if given."""
+        handle = TimerHandle(self._clock() + max(0.0, delay), callback, interval)
+        with self._lock:
+            heapq.heappush(self._timers, (handle.deadline, next(self._timer_sequence), handle))
+        self._wake()
+        return handle
+
+    def add_signal_handler(self, signum: int, callback: Callable[[], None]) -> bool:
+        """Run ``callback`` on the loop after ``signum`` is delivered.
+
+        Returns
+        -------
+        bool
+            False when signal handlers cannot be installed from this thread
+            or the signal is not supported on this platform.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            return False
+
+        def _handler(_signum: int, _frame: Any) -> None:
+            self._pending_signals.append(callback)
+            self._wake()
+
+        try:
+            previous = signal.signal(signum, _handler)
+        except (OSError, ValueError):
+            return False
+        self._previous_handlers.setdefault(signum, previous)
+        return True
+
+    # Frames -------------------------------------------------
+
+    def request_frame(self) -> None:
+        """Schedule a frame; repeated requests before it renders are merged."""
+        with self._lock:
+            if self._frame_requested:
+                return
+            self._frame_requested = True
+        if threading.current_thread() is not self._loop_thread:
+            self._wake()
+
+    def request_animation_frame(self, callback: Callable[[float], None]) -> int:
+        """Call ``callback`` with the frame timestamp right before the next render.
+
+        Callbacks run once; animations re-request from inside the callback.
+
+        Returns
+        -------
+        int
+            Handle accepted by :meth:`cancel_animation_frame`.
+        """
+        handle = next(self._animation_handles)
+        with self._lock:
+            self._animation_callbacks[handle] = callback
+        self.request_frame()
+        return handle
+
+    def cancel_animation_frame(self, handle: int) -> None:
+        """Drop a callback registered with :meth:`request_animation_frame`."""
+        with self._lock:
+            self._animation_callbacks.pop(handle, None)
+
+    # Loop ---------------------------------------------------
+
+    def run(self) -> None:
+        """Dispatch events and render frames until :meth:`stop` is called."""
+        self._running = True
+        while self._running:
+            self.run_once()
+
+    def stop(self) -> None:
+        """Make :meth:`run` return after the current iteration."""
+        self._running = False
+        self._wake()
+
+    def run_once(self, timeout: float | None = None) -> bool:
+        """Wait for the next event, dispatch it, and render a frame if one is due.
+
+        Parameters
+        ----------
+        timeout : float | None
+            Upper bound on the wait; ``None`` blocks until something happens.
+
+        Returns
+        -------
+        bool
+            Whether a frame was rendered.
+        """
+        self._loop_thread = threading.current_thread()
+        wait = self._next_wait()
+        if timeout is not None:
+            wait = timeout if wait is None else min(wait, timeout)
+
+        for key, _ in self._selector.select(wait):
+            key.data()
+        self._stats.wakeups += 1
+
+        while self._pending_signals:
+            self._pending_signals.pop(0)()
+        self._run_due_timers()
+
+        if self._frame_requested and self._clock() >= self._last_frame_start + self.frame_budget:
+            self._render_frame()
+            return True
+        return False
+
+    def close(self) -> None:
+        """Release the selector and restore replaced signal handlers."""
+        for signum, previous in self._previous_handlers.items():
+            try:
+                signal.signal(signum, previous)
+            except (OSError, ValueError):
+                pass
+        self._previous_handlers.clear()
+        self._selector.close()
+        self._wake_reader.close()
+        self._wake_writer.close()
+
+    def _next_wait(self) -> float | None:
+        """Return how long the selector may block, or None to block indefinitely."""
+        deadline: float | None = None
+        if self._frame_requested:
+            deadline = self._last_frame_start + self.frame_budget
+        with self._lock:
+            while self._timers and self._timers[0][2].cancelled:
+                heapq.heappop(self._timers)
+            if self._timers and (deadline is None or self._timers[0][0] < deadline):
+                deadline = self._timers[0][0]
+        if deadline is None:
+            return None
+        return max(0.0, deadline - self._clock())
+
+    def _run_due_timers(self) -> None:
+        now = self._clock()
+        due: list[TimerHandle] = []
+        with self._lock:
+            while self._timers and self._timers[0][0] <= now:
+                handle = heapq.heappop(self._timers)[2]
+                if handle.cancelled:
+                    continue
+                due.append(handle)
+                if handle.interval is not None:
+                    handle.deadline = max(handle.deadline + handle.interval, now)
+                    heapq.heappush(self._timers, (handle.deadline, next(self._timer_sequence), handle))
+        for handle in due:
+            handle.callback()
+
+    def _render_frame(self) -> None:
+        with self._lock:
+            self._frame_requested = False
+            callbacks = self._animation_callbacks
+            self._animation_callbacks = {}
+        start = self._clock()
+        self._last_frame_start = start
+        for callback in callbacks.values():
+            callback(start)
+        self._render()
+        elapsed = self._clock() - start
+
+        stats = self._stats
+        stats.frames += 1
+        stats.last_frame_time = elapsed
+        if elapsed > stats.max_frame_time:
+            stats.max_frame_time = elapsed
+        if elapsed > self.frame_budget:
+            stats.overruns += 1
+            logger.debug("frame_scheduler: frame took %.2fms (budget %.2fms)", elapsed * 1000, self.frame_budget * 1000)
+            if self._on_overrun is not None:
+                self._on_overrun(elapsed, self.frame_budget)
+
+    def _wake(self) -> None:
+        try:
+            self._wake_writer.send(b"\0")
+        except (BlockingIOError, OSError):
+            # Already has unread wakeups, or the scheduler was closed.
+            pass
+
+    def _drain_wakeups(self) -> None:
+        try:
+            while self._wake_reader.recv(4096):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+
+
+__all__ = [
+    "FrameScheduler",
+    "FrameSchedulerStats",
+    "TimerHandle",
+]
@@ -15,6 +15,7 @@ from ornata.rendering.core.base_renderer import Renderer
 if TYPE_CHECKING:
     from ornata.api.exports.definitions import BackendTarget, GuiNode, LayoutResult, RenderOutput
     from ornata.definitions.dataclasses.styling import ANSIColor
+    from ornata.rendering.backends.cli.cells import CellBuffer, PackedCellBuffer
 
 logger = get_logger(__name__)
 
@@ -34,12 +35,14 @@ class TerminalRenderer(Renderer):
         Default background color for the terminal.
     use_truecolor : bool
         Use 24-bit RGB colors instead of 256-color palette.
+    packed_cells : bool
+        Rasterize into an array-backed cell buffer instead of Cell objects.
 
     Attributes
     ----------
     _lock : RLock
         Thread lock for renderer access.
-    _cell_buffer : CellBuffer | None
+    _cell_buffer : CellBuffer | PackedCellBuffer | None
         The current cell buffer being rendered.
     _min_width : int
         Minimum terminal width.
@@ -57,6 +60,7 @@ class TerminalRenderer(Renderer):
         *,
         default_bg: ANSIColor | None = None,
         use_truecolor: bool = True,
+        packed_cells: bool = False,
     ) -> None:
         super().__init__(backend_target)
         self._lock = RLock()
@@ -67,6 +71,7 @@ class TerminalRenderer(Renderer):
         self._max_height = 80
         self._default_bg = default_bg
         self._use_truecolor = use_truecolor
+        self._packed_cells = packed_cells
         self._ansi_renderer: Any | None = None
 
     def render_tree(self, tree: Any, layout_result: Any) -> RenderOutput:
@@ -91,12 +96,7 @@ class TerminalRenderer(Renderer):
 
         with self._lock:
             try:
-                # Determine canvas size from layout or use defaults
-                layout_width = max(1, int(getattr(layout_result, "width", 0) or self._min_width))
-                layout_height = max(1, int(getattr(layout_result, "height", 0) or self._min_height))
-
-                canvas_width = min(self._max_width, max(layout_width, self._min_width))
-                canvas_height = min(self._max_height, max(layout_height, self._min_height))
+                canvas_width, canvas_height = self._canvas_size(layout_result)
 
                 # Get the root node
                 root = getattr(tree, "root", tree)
@@ -114,6 +114,7 @@ class TerminalRenderer(Renderer):
                         width=canvas_width,
                         height=canvas_height,
                         default_bg=self._default_bg,
+                        packed=self._packed_cells,
                     )
                     self._cell_buffer = rasterizer.rasterize(root)
 
@@ -141,6 +142,53 @@ class TerminalRenderer(Renderer):
                 from ornata.api.exports.definitions import RenderingError
                 raise RenderingError(str(exc)) from exc
 
+    def rasterize_tree(self, tree: Any, layout_result: Any) -> CellBuffer | PackedCellBuffer | None:
+        """Rasterize a tree into a cell buffer without serializing it to ANSI.
+
+        Callers that diff frames (see :class:`ANSIDiffRenderer`) use this
+        instead of :meth:`render_tree` to skip the full-frame string.
+
+        Parameters
+        ----------
+        tree : Any
+            VDOM-like tree or GuiNode hierarchy.
+        layout_result : Any
+            Precomputed layout information.
+
+        Returns
+        -------
+        CellBuffer | PackedCellBuffer | None
+            The rasterized buffer, or None if the root is not a GuiNode.
+        """
+        from ornata.rendering.backends.cli.rasterizer import NodeRasterizer
+
+        with self._lock:
+            root = getattr(tree, "root", tree)
+            if not self._is_gui_node(root):
+                return None
+            try:
+                canvas_width, canvas_height = self._canvas_size(layout_result)
+                rasterizer = NodeRasterizer(
+                    width=canvas_width,
+                    height=canvas_height,
+                    default_bg=self._default_bg,
+                    packed=self._packed_cells,
+                )
+                self._cell_buffer = rasterizer.rasterize(root)
+                return self._cell_buffer
+            except Exception as exc:
+                logger.error(f"Terminal rasterization failed: {exc}")
+                from ornata.api.exports.definitions import RenderingError
+                raise RenderingError(str(exc)) from exc
+
+    def _canvas_size(self, layout_result: Any) -> tuple[int, int]:
+        """Clamp the layout size to the renderer's canvas limits."""
+        layout_width = max(1, int(getattr(layout_result, "width", 0) or self._min_width))
+        layout_height = max(1, int(getattr(layout_result, "height", 0) or self._min_height))
+        canvas_width = min(self._max_width, max(layout_width, self._min_width))
+        canvas_height = min(self._max_height, max(layout_height, self._min_height))
+        return canvas_width, canvas_height
+
     def apply_patches(self, patches: list[Any]) -> None:
         """Apply patches by invalidating buffer for now.
 
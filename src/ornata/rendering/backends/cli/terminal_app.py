@@ -8,20 +8,45 @@ from __future__ import annotations
 
 import atexit
 import os
+import signal
 import sys
 import time as _t
-from typing import TYPE_CHECKING, TextIO
+from typing import TYPE_CHECKING, Any, TextIO
 
-from ornata.api.exports.definitions import BackendTarget, Event, EventType, KeyEvent, KeyEventType, QuitEvent, TickEvent
+from ornata.api.exports.definitions import BackendTarget, Event, EventType, KeyEvent, MouseEvent, MouseEventType, QuitEvent, TickEvent
 from ornata.api.exports.events import EventBus
 from ornata.api.exports.interop import kernel32
 from ornata.api.exports.utils import get_logger
-from ornata.rendering.backends.cli.input import read_key
+from ornata.rendering.backends.cli.ansi_diff import ANSIDiffRenderer
+from ornata.rendering.backends.cli.input import StdinReader, read_key
+from ornata.rendering.backends.cli.input_parser import key_event
+from ornata.rendering.backends.cli.scheduler import FrameScheduler
 from ornata.rendering.backends.cli.session import LiveSessionRenderer
+from ornata.rendering.backends.tty.output import FrameWriter
 
 if TYPE_CHECKING:
+    import logging
     from collections.abc import Callable
 
+    from ornata.rendering.backends.cli.cells import CellBuffer, PackedCellBuffer
+    from ornata.rendering.backends.cli.input_parser import InputItem
+    from ornata.rendering.backends.cli.scheduler import TimerHandle
+
+# Keys decoded per poll where stdin cannot be read in chunks.
+_MAX_KEYS_PER_WAKEUP = 64
+# Poll period for stdin where it cannot be registered with a selector.
+_INPUT_POLL_INTERVAL = 0.05
+# How long a trailing ESC waits for the rest of a sequence before it counts as the escape key.
+_ESCAPE_TIMEOUT = 0.025
+
+_MOUSE_EVENT_TYPES = {
+    MouseEventType.BUTTON_DOWN: EventType.MOUSE_DOWN,
+    MouseEventType.BUTTON_UP: EventType.MOUSE_UP,
+    MouseEventType.MOVE: EventType.MOUSE_MOVE,
+    MouseEventType.SCROLL_UP: EventType.MOUSE_WHEEL,
+    MouseEventType.SCROLL_DOWN: EventType.MOUSE_WHEEL,
+}
+
 
 def enable_mouse_reporting() -> str:
     return "\x1b[?1000;1002;1006;1004h"
@@ -31,6 +56,14 @@ def disable_mouse_reporting() -> str:
     return "\x1b[?1000;1002;1006;1004l"
 
 
+def enable_bracketed_paste() -> str:
+    return "\x1b[?2004h"
+
+
+def disable_bracketed_paste() -> str:
+    return "\x1b[?2004l"
+
+
 def hide_cursor() -> str:
     return "\x1b[?25l"
 
@@ -51,7 +84,7 @@ def _emergency_cleanup() -> None:
     """Emergency cleanup function registered with atexit."""
     try:
         # Print directly to stdout in case stream is closed
-        sys.stdout.write(disable_mouse_reporting() + show_cursor() + exit_alternate_buffer())
+        sys.stdout.write(disable_bracketed_paste() + disable_mouse_reporting() + show_cursor() + exit_alternate_buffer())
         sys.stdout.flush()
     except Exception:
         pass
@@ -73,21 +106,24 @@ class CLIInputManager:
         self._component_values: dict[str, str] = {}
         self._logger = get_logger(__name__ + ".input_manager")
         self._sub_token: object | None = None
+        self._paste_sub_token: object | None = None
 
     def attach(self) -> None:
-        """Subscribe to key events."""
+        """Subscribe to key and paste events."""
         self._sub_token = self._bus.subscribe(EventType.KEY_DOWN.value, self._on_key_event)
+        self._paste_sub_token = self._bus.subscribe(EventType.PASTE.value, self._on_paste_event)
         self._logger.debug("input_manager: attached to event bus")
 
     def detach(self) -> None:
-        """Unsubscribe from key events."""
-        if self._sub_token is not None:
+        """Unsubscribe from key and paste events."""
+        for token in (self._sub_token, self._paste_sub_token):
             try:
-                if callable(self._sub_token):
-                    self._sub_token()
+                if callable(token):
+                    token()
             except Exception:
                 pass
-            self._sub_token = None
+        self._sub_token = None
+        self._paste_sub_token = None
         self._logger.debug("input_manager: detached from event bus")
 
     def focus(self, component_id: str | None) -> None:
@@ -164,6 +200,24 @@ class CLIInputManager:
         except Exception as exc:
             self._logger.debug("input_manager: error handling key event: %s", exc)
 
+    def _on_paste_event(self, evt: Event) -> None:
+        """Append pasted text to the focused component in a single change.
+
+        Parameters
+        ----------
+        evt : Event
+            Paste event whose data is the pasted string.
+        """
+        if self._focused_component is None or not isinstance(evt.data, str):
+            return
+        text = "".join(ch for ch in evt.data if ch.isprintable())
+        if not text:
+            return
+        new_value = self._component_values.get(self._focused_component, "") + text
+        self._component_values[self._focused_component] = new_value
+        self._logger.debug("input_manager: pasted %d chars into %s", len(text), self._focused_component)
+        self._emit_change(new_value)
+
     def _emit_change(self, value: str) -> None:
         """Emit change event to the focused component.
 
@@ -248,15 +302,26 @@ def _enable_vt_mode(stream: TextIO, logger) -> None:
 
 
 class TerminalSession(LiveSessionRenderer):
-    """Extended live session with input-driven app loop support."""
+    """Extended live session with input-driven app loop support.
 
-    def __init__(self, stream: TextIO) -> None:
+    Each frame is written with a single write call through a
+    :class:`FrameWriter`; with ``synchronized_updates`` (the default) it is
+    also wrapped in DEC synchronized-update mode so supporting terminals
+    never show a half-drawn frame.
+    """
+
+    def __init__(self, stream: TextIO, *, use_truecolor: bool = True, synchronized_updates: bool = True) -> None:
         super().__init__(BackendTarget.CLI)
         self._bus = EventBus()
         self._running = False
         self._stream = stream
+        self._writer = FrameWriter(stream, synchronized=synchronized_updates)
         self._logger = get_logger(__name__)
         self._input_manager = CLIInputManager(self._bus)
+        self._diff_renderer = ANSIDiffRenderer(use_truecolor=use_truecolor)
+        self._scheduler: FrameScheduler | None = None
+        self._last_frame = ""
+        self._last_tick = 0.0
 
     @property
     def events(self) -> EventBus:
@@ -268,22 +333,80 @@ class TerminalSession(LiveSessionRenderer):
         """Access the input manager for focus and text input."""
         return self._input_manager
 
+    @property
+    def writer(self) -> FrameWriter:
+        """Access the frame writer (and its per-frame ``stats``)."""
+        return self._writer
+
+    @property
+    def diff_renderer(self) -> ANSIDiffRenderer:
+        """Access the front-buffer diff renderer (and its ``last_stats``)."""
+        return self._diff_renderer
+
+    def _render_frame(self, app: TerminalApp) -> str | None:
+        """Return the escape stream for the next frame.
+
+        Apps that expose a cell buffer are diffed against the previously
+        emitted frame and yield only the changed runs (or ``""`` when nothing
+        changed). Other apps return None so the caller falls back to
+        comparing whole frame strings.
+        """
+        buffer = app.render_buffer()
+        if buffer is None:
+            return None
+        return self._diff_renderer.render(buffer)
+
+    @property
+    def scheduler(self) -> FrameScheduler | None:
+        """Frame scheduler of the running session (and its ``stats``), if any."""
+        return self._scheduler
+
+    def request_frame(self) -> None:
+        """Ask the running session to render a new frame."""
+        if self._scheduler is not None:
+            self._scheduler.request_frame()
+
+    def request_animation_frame(self, callback: Callable[[float], None]) -> int | None:
+        """Run ``callback`` with the frame timestamp before the next frame renders.
+
+        Returns
+        -------
+        int | None
+            Handle for :meth:`FrameScheduler.cancel_animation_frame`, or None
+            when no session is running.
+        """
+        if self._scheduler is None:
+            return None
+        return self._scheduler.request_animation_frame(callback)
+
     def run(self, app: TerminalApp, *, fps: float = 30.0) -> None:
-        """Run the application in a live terminal session with input handling."""
+        """Run the application in a live terminal session with input handling.
+
+        The session sleeps in a :class:`FrameScheduler` until stdin is
+        readable, the terminal is resized, a timer fires or a frame is
+        requested, and renders at most ``fps`` frames per second. Each frame
+        publishes a TICK with the time since the previous frame, then renders.
+        Apps that change without input set :attr:`TerminalApp.refresh_interval`
+        or call :meth:`TerminalApp.request_frame`.
+        """
         self._logger.debug("terminal_session: running app %r", app)
         self._running = True
-        app.attach(self._bus)
+        scheduler = FrameScheduler(lambda: self._draw(app, scheduler), fps=fps)
+        self._scheduler = scheduler
+        app.attach(self._bus, scheduler=scheduler)
         self._input_manager.attach()
-        frame: str = app.render()
+        self._diff_renderer.reset()
+        diff_frame = self._render_frame(app)
+        frame: str = diff_frame if diff_frame is not None else app.render()
+        self._last_frame = frame
         _enable_vt_mode(self._stream, self._logger)
         self._logger.debug("terminal_session: VT mode setup complete")
         # Enable mouse reporting in terminal
         try:
             self._logger.debug("terminal_session: about to enter alternate buffer")
-            self._stream.write(
-                enter_alternate_buffer() + hide_cursor() + enable_mouse_reporting() + frame
-            )
-            self._stream.flush()
+            self._writer.write(enter_alternate_buffer() + hide_cursor() + enable_mouse_reporting() + enable_bracketed_paste())
+            with self._writer.frame():
+                self._writer.write(frame)
             self._logger.debug(
                 "terminal_session: sent enable_mouse_reporting (frame=%d chars)",
                 len(frame),
@@ -292,67 +415,62 @@ class TerminalSession(LiveSessionRenderer):
             atexit.register(_emergency_cleanup)
         except Exception as exc:
             self._logger.error("terminal_session: exception in setup: %s", exc)
+            self._writer.discard()
             self._stream.write(frame)
         self._logger.debug("terminal_session: setup complete, preparing loop")
 
-        interval = 1.0 / max(1e-6, fps)
-        last = _t.perf_counter()
-        idle_cycles = 0
-        loop_count = 0
-        self._logger.debug("terminal_session: entering main loop (running=%s, should_quit=%s)", self._running, app.should_quit)
-        import sys
         sys.stdout.flush()
         sys.stderr.flush()
+        restore_terminal = _enter_cbreak_mode(self._logger)
+        reader = _open_stdin_reader(self._logger)
         # Wait for terminal to settle after mode changes, then drain any spurious input
         _t.sleep(0.1)
-        for _ in range(10):
-            if not read_key(timeout=0.01):
-                break
-        while self._running and not app.should_quit:
+        if reader is not None:
             try:
-                loop_count += 1
-                if loop_count == 1:
-                    self._logger.debug("terminal_session: first loop iteration")
-                now = _t.perf_counter()
-                dt = now - last
-                last = now
-                key = read_key(timeout=0.0)
-                if key:
-                    idle_cycles = 0
-                    self._logger.debug("terminal_session: read key %r", key)
-                    self._bus.publish(
-                        Event(
-                            type=EventType.KEY_DOWN,
-                            data=KeyEvent(event_type=KeyEventType.KEYDOWN, key=key),
-                        )
-                    )
-                else:
-                    idle_cycles += 1
-                    if idle_cycles >= int(fps):  # log once per second of idle time
-                        self._logger.debug("terminal_session: no input detected for %.1fs", idle_cycles / fps)
-                        idle_cycles = 0
-                # Tick after input so values can be updated before render
-                self._bus.publish(Event(type=EventType.TICK, data=TickEvent(dt=dt)))
-                new_frame = app.render()
-                if new_frame != frame:
-                    frame = new_frame
-                    self._logger.debug("terminal_session: new frame rendered (len=%d)", len(new_frame))
-                    self._stream.write(frame)
-                sleep_for = interval - (_t.perf_counter() - now)
-                if sleep_for > 0:
-                    _t.sleep(sleep_for)
-            except Exception as exc:
-                self._logger.error("terminal_session: error in main loop: %s", exc, exc_info=True)
-                raise
+                reader.read_events()
+                reader.flush()
+            except (EOFError, OSError) as exc:
+                self._logger.debug("terminal_session: stdin reader unusable, polling instead: %s", exc)
+                reader = None
+        elif _stdin_is_terminal():
+            for _ in range(10):
+                if not read_key(timeout=0.01):
+                    break
+
+        self._watch_input(scheduler, app, reader)
+        if hasattr(signal, "SIGWINCH"):
+            scheduler.add_signal_handler(signal.SIGWINCH, scheduler.request_frame)
+        if app.refresh_interval is not None:
+            scheduler.call_later(app.refresh_interval, scheduler.request_frame, interval=app.refresh_interval)
+        self._last_tick = _t.perf_counter()
+        self._logger.debug("terminal_session: entering frame loop (running=%s, should_quit=%s)", self._running, app.should_quit)
+        try:
+            while self._running and not app.should_quit:
+                scheduler.run_once()
+        except Exception as exc:
+            self._logger.error("terminal_session: error in main loop: %s", exc, exc_info=True)
+            raise
+        finally:
+            stats = scheduler.stats
+            self._logger.debug(
+                "terminal_session: exited frame loop after %d frames, %d wakeups, %d overruns (max %.2fms)",
+                stats.frames,
+                stats.wakeups,
+                stats.overruns,
+                stats.max_frame_time * 1000,
+            )
+            scheduler.close()
+            self._scheduler = None
+            if restore_terminal is not None:
+                restore_terminal()
         # Cleanup after loop exits
-        self._logger.debug("terminal_session: exited main loop after %d iterations (running=%s, should_quit=%s)", loop_count, self._running, app.should_quit)
         self._logger.debug("terminal_session: starting cleanup")
         self._bus.publish(Event(type=EventType.WINDOW_CLOSE, data=QuitEvent()))
         app.detach()
         # Disable mouse reporting
         try:
-            self._stream.write(disable_mouse_reporting() + show_cursor() + exit_alternate_buffer())
-            self._stream.flush()
+            self._writer.write(disable_bracketed_paste() + disable_mouse_reporting() + show_cursor() + exit_alternate_buffer())
+            self._writer.flush()
             self._logger.debug("terminal_session: sent disable_mouse_reporting")
         except Exception as exc:
             self._logger.debug("terminal_session: cleanup exception: %s", exc)
@@ -367,22 +485,181 @@ class TerminalSession(LiveSessionRenderer):
         """Stop the running session loop."""
         self._logger.debug("terminal_session: stop() called")
         self._running = False
+        if self._scheduler is not None:
+            self._scheduler.stop()
+
+    def _watch_input(self, scheduler: FrameScheduler, app: TerminalApp, reader: StdinReader | None) -> None:
+        """Dispatch input when stdin is readable, or poll it where it cannot be selected."""
+        if reader is None:
+            self._poll_input(scheduler, app)
+            return
+        escape_timer: list[TimerHandle] = []
+
+        def _dispatch(items: list[InputItem]) -> None:
+            if items:
+                self._publish_input(items)
+                scheduler.request_frame()
+            if app.should_quit:
+                scheduler.stop()
+
+        def _flush() -> None:
+            escape_timer.clear()
+            _dispatch(reader.flush())
+
+        def _on_input() -> None:
+            if escape_timer:
+                escape_timer.pop().cancel()
+            try:
+                items = reader.read_events()
+            except (EOFError, OSError) as exc:
+                self._logger.debug("terminal_session: stdin closed: %s", exc)
+                scheduler.remove_reader(reader)
+                return
+            self._logger.log(5, "terminal_session: decoded %d input items", len(items))
+            _dispatch(items)
+            if reader.pending:
+                escape_timer.append(scheduler.call_later(_ESCAPE_TIMEOUT, _flush))
+
+        try:
+            scheduler.add_reader(reader, _on_input)
+        except (OSError, ValueError) as exc:
+            self._logger.debug("terminal_session: stdin not selectable: %s", exc)
+            self._poll_input(scheduler, app)
+
+    def _poll_input(self, scheduler: FrameScheduler, app: TerminalApp) -> None:
+        """Poll :func:`read_key` on a timer; used for Windows consoles and redirected stdin."""
+
+        def _on_input() -> None:
+            for _ in range(_MAX_KEYS_PER_WAKEUP):
+                key = read_key(timeout=0.0)
+                if not key:
+                    break
+                self._logger.debug("terminal_session: read key %r", key)
+                self._bus.publish(Event(type=EventType.KEY_DOWN, data=key_event(key)))
+                scheduler.request_frame()
+            if app.should_quit:
+                scheduler.stop()
+
+        self._logger.debug("terminal_session: stdin not selectable, polling every %.0fms", _INPUT_POLL_INTERVAL * 1000)
+        scheduler.call_later(_INPUT_POLL_INTERVAL, _on_input, interval=_INPUT_POLL_INTERVAL)
+
+    def _publish_input(self, items: list[InputItem]) -> None:
+        """Publish one batch of parsed input; pastes are delivered as a single PASTE event."""
+        bus = self._bus
+        for item in items:
+            if isinstance(item, KeyEvent):
+                bus.publish(Event(type=EventType.KEY_DOWN, data=item))
+            elif isinstance(item, MouseEvent):
+                bus.publish(Event(type=_MOUSE_EVENT_TYPES[item.event_type], data=item))
+            else:
+                bus.publish(Event(type=EventType.PASTE, data=item))
+
+    def _draw(self, app: TerminalApp, scheduler: FrameScheduler) -> None:
+        """Tick ``app`` and write the next frame; invoked by the scheduler."""
+        now = _t.perf_counter()
+        dt = now - self._last_tick
+        self._last_tick = now
+        # Tick before render so values can be updated first
+        self._bus.publish(Event(type=EventType.TICK, data=TickEvent(dt=dt)))
+        diff_frame = self._render_frame(app)
+        if diff_frame:
+            with self._writer.frame():
+                self._writer.write(diff_frame)
+            stats = self._diff_renderer.last_stats
+            self._logger.debug(
+                "terminal_session: diff frame (%d cells, %d runs, %d bytes in %d writes)",
+                stats.cells_changed,
+                stats.runs,
+                self._writer.stats.last_bytes,
+                self._writer.stats.last_syscalls,
+            )
+        elif diff_frame is None:
+            new_frame = app.render()
+            if new_frame != self._last_frame:
+                self._last_frame = new_frame
+                with self._writer.frame():
+                    self._writer.write(new_frame)
+                self._logger.debug("terminal_session: new frame rendered (len=%d)", len(new_frame))
+        if app.should_quit:
+            scheduler.stop()
+
+
+def _open_stdin_reader(logger: logging.Logger) -> StdinReader | None:
+    """Return a chunked reader for a POSIX terminal stdin, or None where it cannot be used."""
+    if os.name == "nt" or not _stdin_is_terminal():
+        return None
+    try:
+        return StdinReader()
+    except (AttributeError, OSError, ValueError) as exc:
+        logger.debug("terminal_session: chunked stdin reader unavailable: %s", exc)
+        return None
+
+
+def _stdin_is_terminal() -> bool:
+    """Whether stdin is an interactive terminal rather than a file, pipe or closed stream."""
+    try:
+        return os.isatty(sys.stdin.fileno())
+    except (AttributeError, OSError, ValueError):
+        return False
+
+
+def _enter_cbreak_mode(logger: logging.Logger) -> Callable[[], None] | None:
+    """Switch an interactive POSIX stdin to cbreak mode and return a restore callback.
+
+    Without it the line discipline holds keystrokes until Enter, so stdin
+    would never look readable to the scheduler.
+    """
+    if os.name == "nt":
+        return None
+    try:
+        import importlib
+
+        termios: Any = importlib.import_module("termios")
+        tty: Any = importlib.import_module("tty")
+        fd = sys.stdin.fileno()
+        if not os.isatty(fd):
+            return None
+        old_settings = termios.tcgetattr(fd)
+        tty.setcbreak(fd)
+    except (ImportError, AttributeError, OSError, ValueError) as exc:
+        logger.debug("terminal_session: cbreak mode unavailable: %s", exc)
+        return None
+
+    def _restore() -> None:
+        try:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        except (OSError, ValueError):
+            pass
+
+    return _restore
 
 
 class TerminalApp:
-    """Base class for custom terminal applications."""
+    """Base class for custom terminal applications.
+
+    Sessions only render when something asked for a frame. Input does so
+    automatically; apps whose content changes on its own either call
+    :meth:`request_frame` / :meth:`request_animation_frame`, or set
+    ``refresh_interval`` to be redrawn periodically.
+    """
 
     def __init__(self) -> None:
         self._bus: EventBus | None = None
+        self._scheduler: FrameScheduler | None = None
         self.should_quit: bool = False
+        self.refresh_interval: float | None = None
         self._subs: list[Callable[[], None]] = []
 
-    def attach(self, bus: EventBus) -> None:
-        """Attach the app to an event bus."""
+    def attach(self, bus: EventBus, *, scheduler: FrameScheduler | None = None) -> None:
+        """Attach the app to an event bus and the session's frame scheduler."""
         self._bus = bus
+        self._scheduler = scheduler
         self._subs.append(bus.subscribe(EventType.KEY_DOWN.value, self._on_key_event))
         self._subs.append(bus.subscribe(EventType.TICK.value, self._on_tick_event))
         self._subs.append(bus.subscribe(EventType.WINDOW_CLOSE.value, self._on_quit_event))
+        self._subs.append(bus.subscribe(EventType.PASTE.value, self._on_paste_event))
+        for event_type in (EventType.MOUSE_DOWN, EventType.MOUSE_UP, EventType.MOUSE_MOVE, EventType.MOUSE_WHEEL):
+            self._subs.append(bus.subscribe(event_type.value, self._on_mouse_event))
 
     def detach(self) -> None:
         """Detach the app and unsubscribe from events."""
@@ -393,6 +670,18 @@ class TerminalApp:
                 pass
         self._subs.clear()
         self._bus = None
+        self._scheduler = None
+
+    def request_frame(self) -> None:
+        """Ask the session to render a new frame."""
+        if self._scheduler is not None:
+            self._scheduler.request_frame()
+
+    def request_animation_frame(self, callback: Callable[[float], None]) -> int | None:
+        """Run ``callback`` with the frame timestamp before the next frame renders."""
+        if self._scheduler is None:
+            return None
+        return self._scheduler.request_animation_frame(callback)
 
     def _on_key_event(self, evt: Event) -> None:
         try:
@@ -410,6 +699,20 @@ class TerminalApp:
         except Exception:
             pass
 
+    def _on_mouse_event(self, evt: Event) -> None:
+        try:
+            if isinstance(evt.data, MouseEvent):
+                self.on_mouse(evt.data)
+        except Exception:
+            pass
+
+    def _on_paste_event(self, evt: Event) -> None:
+        try:
+            if isinstance(evt.data, str):
+                self.on_paste(evt.data)
+        except Exception:
+            pass
+
     def _on_quit_event(self, evt: Event) -> None:
         try:
             if isinstance(evt.data, QuitEvent) or evt.type is EventType.WINDOW_CLOSE:
@@ -428,5 +731,21 @@ class TerminalApp:
     def on_tick(self, dt: float) -> None:
         _ = dt
 
+    def on_mouse(self, event: MouseEvent) -> None:
+        """Handle a decoded mouse report; the default ignores it."""
+        _ = event
+
+    def on_paste(self, text: str) -> None:
+        """Handle a bracketed paste, delivered as one string; the default ignores it."""
+        _ = text
+
     def render(self) -> str:
         return ""
+
+    def render_buffer(self) -> CellBuffer | PackedCellBuffer | None:
+        """Return the next frame as a cell buffer for diffed output.
+
+        The default returns None, which makes :class:`TerminalSession` fall
+        back to :meth:`render` and whole-string frame comparison.
+        """
+        return None
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from . import input, platform, renderer, termios, vt100
+from . import input, output, platform, renderer, termios, vt100
 from .input import (
     InputReader,
     parse_mouse_event,
 )
+from .output import FrameOutputStats, FrameWriter
 from .renderer import TTYRenderer
 from .termios import (
     TerminalController,
@@ -20,6 +21,8 @@ from .vt100 import (
 )
 
 __all__ = [
+    "FrameOutputStats",
+    "FrameWriter",
     "InputReader",
     "TTYRenderer",
     "TerminalController",
@@ -28,6 +31,7 @@ __all__ = [
     "get_text_width",
     "input",
     "is_terminal",
+    "output",
     "parse_mouse_event",
     "platform",
     "renderer",
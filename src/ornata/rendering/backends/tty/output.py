@@ -0,0 +1,197 @@
+"""Frame-at-a-time terminal output.
+
+:class:`FrameWriter` collects everything written during a frame and hands
+it to the terminal in one piece: the text is joined and encoded once and
+sent with a single ``os.write`` (looping only on partial writes). Frames
+can be wrapped in DEC synchronized-update mode 2026 so terminals that
+support it present the whole frame at once instead of tearing.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, BinaryIO, TextIO, TypeIs
+
+from ornata.api.exports.utils import get_logger
+from ornata.rendering.backends.tty.vt100 import VT100
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+logger = get_logger(__name__)
+
+
+@dataclass(slots=True)
+class FrameOutputStats:
+    """Output counters for the most recent flush and since creation."""
+
+    frames: int = 0
+    last_bytes: int = 0
+    last_syscalls: int = 0
+    total_bytes: int = 0
+    total_syscalls: int = 0
+    max_bytes: int = 0
+
+
+class FrameWriter:
+    """Buffer terminal output and write each frame with one system call.
+
+    Text passed to :meth:`write` is held until :meth:`flush`, or until the
+    outermost :meth:`frame` block exits. Streams backed by a file
+    descriptor are written with ``os.write`` on that descriptor, after
+    flushing the stream's own buffer so ordering is preserved; in-memory
+    streams receive a single ``write`` call instead.
+
+    Parameters
+    ----------
+    stream : TextIO | BinaryIO
+        Destination stream, usually ``sys.stdout``.
+    synchronized : bool
+        Wrap frames in DEC synchronized-update mode (``CSI ? 2026 h/l``).
+    encoding : str | None
+        Output encoding; defaults to the stream's encoding or UTF-8.
+    """
+
+    def __init__(self, stream: TextIO | BinaryIO, *, synchronized: bool = False, encoding: str | None = None) -> None:
+        self._stream: TextIO | BinaryIO = stream
+        self.synchronized = synchronized
+        self._encoding = encoding or getattr(stream, "encoding", None) or "utf-8"
+        self._fd = _output_fd(stream)
+        self._parts: list[str] = []
+        self._depth = 0
+        self._sync_begin = VT100.synchronized_update_begin()
+        self._sync_end = VT100.synchronized_update_end()
+        self._stats = FrameOutputStats()
+
+    @property
+    def stream(self) -> TextIO | BinaryIO:
+        """The stream frames are written to."""
+        return self._stream
+
+    @property
+    def stats(self) -> FrameOutputStats:
+        """Counters for the last flush and totals since creation."""
+        return self._stats
+
+    @property
+    def in_frame(self) -> bool:
+        """Whether a :meth:`frame` block is open."""
+        return self._depth > 0
+
+    def write(self, text: str) -> None:
+        """Queue ``text`` for the next flush."""
+        if text:
+            self._parts.append(text)
+
+    def flush(self) -> None:
+        """Write queued text now, unless a frame is open; frames flush when they end."""
+        if self._depth == 0:
+            self._commit(synchronized=False)
+
+    def begin_frame(self) -> None:
+        """Open a frame; nested frames are merged into the outermost one."""
+        self._depth += 1
+
+    def end_frame(self) -> None:
+        """Close a frame, writing it if it was the outermost one."""
+        if self._depth == 0:
+            return
+        self._depth -= 1
+        if self._depth == 0:
+            self._commit(synchronized=self.synchronized)
+
+    @contextmanager
+    def frame(self) -> Iterator[FrameWriter]:
+        """Collect everything written inside the block into one write."""
+        self.begin_frame()
+        try:
+            yield self
+        finally:
+            self.end_frame()
+
+    def discard(self) -> None:
+        """Drop queued text without writing it."""
+        self._parts.clear()
+
+    def _commit(self, *, synchronized: bool) -> None:
+        if not self._parts:
+            return
+        text = "".join(self._parts)
+        self._parts.clear()
+        if synchronized:
+            text = self._sync_begin + text + self._sync_end
+
+        if self._fd is not None:
+            data = text.encode(self._encoding, "replace")
+            size = len(data)
+            syscalls = self._write_fd(data)
+        elif _is_binary_stream(self._stream):
+            data = text.encode(self._encoding, "replace")
+            size = len(data)
+            self._stream.write(data)
+            self._stream.flush()
+            syscalls = 1
+        else:
+            size = len(text) if text.isascii() else len(text.encode(self._encoding, "replace"))
+            self._stream.write(text)
+            self._stream.flush()
+            syscalls = 1
+
+        stats = self._stats
+        stats.frames += 1
+        stats.last_bytes = size
+        stats.last_syscalls = syscalls
+        stats.total_bytes += size
+        stats.total_syscalls += syscalls
+        if size > stats.max_bytes:
+            stats.max_bytes = size
+
+    def _write_fd(self, data: bytes) -> int:
+        """Write ``data`` to the descriptor and return the number of write calls."""
+        fd = self._fd
+        assert fd is not None
+        # Anything written to the stream directly must reach the terminal first.
+        self._stream.flush()
+        view = memoryview(data)
+        calls = 0
+        while view:
+            try:
+                written = os.write(fd, view)
+            except InterruptedError:
+                continue
+            except BlockingIOError:
+                import select
+
+                select.select([], [fd], [])
+                continue
+            calls += 1
+            view = view[written:]
+        if calls > 1:
+            logger.log(5, "frame_writer: %d bytes needed %d writes", len(data), calls)
+        return calls
+
+
+def _is_binary_stream(stream: TextIO | BinaryIO) -> TypeIs[BinaryIO]:
+    """Return whether ``stream`` takes bytes rather than text."""
+    return isinstance(stream, (io.RawIOBase, io.BufferedIOBase))
+
+
+def _output_fd(stream: TextIO | BinaryIO) -> int | None:
+    """Return the descriptor to write frames to, or None to use ``stream.write``."""
+    try:
+        fd = stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+    # Windows consoles need the stream's own console writer for Unicode output.
+    if os.name == "nt" and os.isatty(fd):
+        return None
+    return fd
+
+
+__all__ = [
+    "FrameOutputStats",
+    "FrameWriter",
+]
@@ -14,9 +14,11 @@ from ornata.api.exports.utils import get_logger
 from ornata.rendering.core.base_renderer import Renderer
 
 if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
     from types import TracebackType
 
     from ornata.api.exports.definitions import BackendTarget, Patch, RenderOutput
+    from ornata.rendering.backends.tty.output import FrameOutputStats
 
 logger = get_logger(__name__)
 
@@ -35,6 +37,8 @@ class TTYRenderer(Renderer):
         Output stream (usually sys.stdout).
     use_alt_screen : bool
         Whether to use alternate screen buffer.
+    synchronized_updates : bool
+        Wrap each frame in DEC synchronized-update mode to avoid tearing.
     
     Returns
     -------
@@ -47,6 +51,7 @@ class TTYRenderer(Renderer):
         backend_target: BackendTarget,
         stream: TextIO = sys.stdout,
         use_alt_screen: bool = True,
+        synchronized_updates: bool = False,
     ) -> None:
         """Initialize the TTY renderer.
         
@@ -58,15 +63,19 @@ class TTYRenderer(Renderer):
             Output stream for rendering.
         use_alt_screen : bool
             Whether to use alternate screen buffer.
+        synchronized_updates : bool
+            Whether frames are wrapped in synchronized-update mode.
         
         Returns
         -------
         None
         """
+        from ornata.rendering.backends.tty.output import FrameWriter
         from ornata.rendering.backends.tty.termios import TerminalController
         super().__init__(backend_target)
         self.stream = stream
         self.use_alt_screen = use_alt_screen
+        self._writer = FrameWriter(stream, synchronized=synchronized_updates)
         self._term_controller = TerminalController(stream)
         self._render_lock = RLock()
         self._initialized = False
@@ -90,15 +99,15 @@ class TTYRenderer(Renderer):
             self._term_controller.save_state()
 
             if self.use_alt_screen:
-                self.stream.write(VT100.alternate_screen_enable())
+                self._writer.write(VT100.alternate_screen_enable())
                 logger.debug("Enabled alternate screen")
 
-            self.stream.write(VT100.cursor_hide())
+            self._writer.write(VT100.cursor_hide())
             self._cursor_visible = False
 
-            self.stream.write(VT100.erase_display(EraseMode.ALL))
-            self.stream.write(VT100.cursor_position(1, 1))
-            self.stream.flush()
+            self._writer.write(VT100.erase_display(EraseMode.ALL))
+            self._writer.write(VT100.cursor_position(1, 1))
+            self._writer.flush()
 
             self._last_size = self._term_controller.get_size()
             self._initialized = True
@@ -117,15 +126,15 @@ class TTYRenderer(Renderer):
 
         with self._render_lock:
             if not self._cursor_visible:
-                self.stream.write(VT100.cursor_show())
+                self._writer.write(VT100.cursor_show())
                 self._cursor_visible = True
 
             if self.use_alt_screen:
-                self.stream.write(VT100.alternate_screen_disable())
+                self._writer.write(VT100.alternate_screen_disable())
                 logger.debug("Disabled alternate screen")
 
-            self.stream.write(VT100.reset())
-            self.stream.flush()
+            self._writer.write(VT100.reset())
+            self._writer.flush()
 
             self._term_controller.restore_state()
             self._initialized = False
@@ -154,15 +163,14 @@ class TTYRenderer(Renderer):
         with self._render_lock:
             try:
                 current_size = self._term_controller.get_size()
-                if current_size != self._last_size:
-                    self._handle_resize(current_size)
-                    self._last_size = current_size
-
                 content = self._render_node(getattr(tree, "root", None))
 
-                self.stream.write(VT100.cursor_position(1, 1))
-                self.stream.write(content)
-                self.stream.flush()
+                with self._writer.frame():
+                    if current_size != self._last_size:
+                        self._handle_resize(current_size)
+                        self._last_size = current_size
+                    self._writer.write(VT100.cursor_position(1, 1))
+                    self._writer.write(content)
 
                 output = RenderOutput(
                     content=content,
@@ -219,16 +227,15 @@ class TTYRenderer(Renderer):
                     # Property updates can often be applied incrementally
                     patch_operations.append(patch)
             
-            # Apply patches
-            if needs_full_redraw:
-                # For root replacement, we need to re-render everything
-                logger.debug("Full redraw required due to root replacement")
-                self._full_redraw()
-            else:
-                # Apply incremental patches
-                self._apply_incremental_patches(patch_operations)
-            
-            self.stream.flush()
+            # Apply patches as one frame
+            with self._writer.frame():
+                if needs_full_redraw:
+                    # For root replacement, we need to re-render everything
+                    logger.debug("Full redraw required due to root replacement")
+                    self._full_redraw()
+                else:
+                    # Apply incremental patches
+                    self._apply_incremental_patches(patch_operations)
     
     def apply_vdom_patches(self, patches: list[Any]) -> None:
         """Apply VDOM patches to the TTY renderer.
@@ -368,7 +375,7 @@ class TTYRenderer(Renderer):
             if node_text:
                 # For now, add at the end of the display
                 # A more sophisticated approach would track positions
-                self.stream.write(node_text)
+                self._writer.write(node_text)
                 logger.debug(f"Added node to TTY display: {len(node_text)} chars")
     
     def _apply_remove_operations(self, patches: list[Patch]) -> None:
@@ -450,6 +457,24 @@ class TTYRenderer(Renderer):
         self.clear_screen()
         logger.debug("Performed full TTY redraw")
 
+    @property
+    def output_stats(self) -> FrameOutputStats:
+        """Bytes and write calls of the last flushed frame, plus running totals."""
+        return self._writer.stats
+
+    def frame(self) -> AbstractContextManager[Any]:
+        """Batch the output of every call inside the block into one write.
+
+        Frames are wrapped in synchronized-update mode when the renderer was
+        created with ``synchronized_updates=True``.
+        
+        Returns
+        -------
+        AbstractContextManager[Any]
+            Context manager that flushes the frame on exit.
+        """
+        return self._writer.frame()
+
     def clear_screen(self) -> None:
         """Clear the terminal screen.
         
@@ -460,9 +485,9 @@ class TTYRenderer(Renderer):
         from ornata.api.exports.definitions import EraseMode
         from ornata.rendering.backends.tty.vt100 import VT100
         with self._render_lock:
-            self.stream.write(VT100.erase_display(EraseMode.ALL))
-            self.stream.write(VT100.cursor_position(1, 1))
-            self.stream.flush()
+            self._writer.write(VT100.erase_display(EraseMode.ALL))
+            self._writer.write(VT100.cursor_position(1, 1))
+            self._writer.flush()
             logger.log(5, "Cleared TTY screen")
 
     def set_cursor_position(self, row: int, col: int) -> None:
@@ -481,8 +506,8 @@ class TTYRenderer(Renderer):
         """
         from ornata.rendering.backends.tty.vt100 import VT100
         with self._render_lock:
-            self.stream.write(VT100.cursor_position(row, col))
-            self.stream.flush()
+            self._writer.write(VT100.cursor_position(row, col))
+            self._writer.flush()
 
     def hide_cursor(self) -> None:
         """Hide the cursor.
@@ -496,8 +521,8 @@ class TTYRenderer(Renderer):
             return
 
         with self._render_lock:
-            self.stream.write(VT100.cursor_hide())
-            self.stream.flush()
+            self._writer.write(VT100.cursor_hide())
+            self._writer.flush()
             self._cursor_visible = False
             logger.log(5, "Cursor hidden")
 
@@ -513,8 +538,8 @@ class TTYRenderer(Renderer):
             return
 
         with self._render_lock:
-            self.stream.write(VT100.cursor_show())
-            self.stream.flush()
+            self._writer.write(VT100.cursor_show())
+            self._writer.flush()
             self._cursor_visible = True
             logger.log(5, "Cursor shown")
 
@@ -536,9 +561,9 @@ class TTYRenderer(Renderer):
         """
         from ornata.rendering.backends.tty.vt100 import VT100
         with self._render_lock:
-            self.stream.write(VT100.cursor_position(row, col))
-            self.stream.write(text)
-            self.stream.flush()
+            self._writer.write(VT100.cursor_position(row, col))
+            self._writer.write(text)
+            self._writer.flush()
 
     def _render_node(self, node: Any) -> str:
         """Recursively render a VDOM node to text.
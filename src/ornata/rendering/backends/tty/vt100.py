@@ -6,11 +6,13 @@ terminal control, cursor movement, colors, and text attributes.
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from ornata.api.exports.definitions import EraseMode
 from ornata.api.exports.utils import get_logger
+from ornata.utils.unicode_width import text_width
 
 if TYPE_CHECKING:
     from ornata.api.exports.definitions import Color8
@@ -18,6 +20,8 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+_ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*[mGKHJABCDsuflh]|\x1b[78]|\x1b\][^\x07]*\x07")
+
 
 @dataclass(frozen=True)
 class VT100:
@@ -463,6 +467,33 @@ class VT100:
         from ornata.api.exports.definitions import CSI
         return f"{CSI}?2004l"
 
+    @staticmethod
+    def synchronized_update_begin() -> str:
+        """Begin a synchronized update (DEC mode 2026).
+
+        Terminals that support the mode hold the screen until the matching
+        :meth:`synchronized_update_end`; others ignore it.
+
+        Returns
+        -------
+        str
+            The escape sequence.
+        """
+        from ornata.api.exports.definitions import CSI
+        return f"{CSI}?2026h"
+
+    @staticmethod
+    def synchronized_update_end() -> str:
+        """End a synchronized update and present the frame.
+        
+        Returns
+        -------
+        str
+            The escape sequence.
+        """
+        from ornata.api.exports.definitions import CSI
+        return f"{CSI}?2026l"
+
     @staticmethod
     def request_cursor_position() -> str:
         """Request cursor position report.
@@ -501,10 +532,7 @@ def strip_ansi(text: str) -> str:
     str
         Text without ANSI sequences.
     """
-    import re
-
-    ansi_escape = re.compile(r"\x1b\[[0-9;]*[mGKHJABCDsuflh]|\x1b[78]|\x1b\][^\x07]*\x07")
-    return ansi_escape.sub("", text)
+    return _ANSI_ESCAPE.sub("", text)
 
 
 def get_text_width(text: str) -> int:
@@ -518,6 +546,9 @@ def get_text_width(text: str) -> int:
     Returns
     -------
     int
-        Display width in characters.
+        Display width in terminal columns; wide characters count as two
+        and combining marks as zero.
     """
-    return len(strip_ansi(text))
+    if "\x1b" in text:
+        text = _ANSI_ESCAPE.sub("", text)
+    return text_width(text)
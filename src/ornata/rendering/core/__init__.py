@@ -10,7 +10,7 @@ from .capabilities import (
     get_gui_capabilities,
     get_tty_capabilities,
 )
-from .compositor import Compositor
+from .compositor import CompositionStats, Compositor
 from .frame import FrameBuffer
 from .pipeline import RenderPipeline
 from .render_signals import (
@@ -23,6 +23,7 @@ from .render_signals import (
 # from .surface import Empty currently
 
 __all__ = [
+    "CompositionStats",
     "Compositor",
     "FrameBuffer",
     "RenderPipeline",
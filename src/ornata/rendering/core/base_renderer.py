@@ -84,8 +84,10 @@ class RenderableBase:
                 height: int
                 
                 def __init__(self, text: str) -> None:
+                    from ornata.utils.unicode_width import text_width
+
                     lines = text.split('\n')
-                    self.width = max(len(line) for line in lines) if lines else 0
+                    self.width = max(text_width(line) for line in lines) if lines else 0
                     self.height = len(lines)
                 
                 @classmethod
@@ -2,20 +2,61 @@
 
 The compositor handles blending multiple rendering layers together
 into a final output surface, supporting various blend modes and transforms.
+
+When NumPy is installed, stacks made entirely of ``PixelSurface`` layers are
+blended as ``uint8`` arrays of shape ``(height, width, 4)`` instead of
+per-pixel Python loops. The tuple-based path remains as the fallback and
+both produce identical pixels.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 from ornata.api.exports.utils import get_logger
 
 if TYPE_CHECKING:
-    from ornata.api.exports.definitions import Layer, PixelSurface, Surface
+    import numpy as np
+
+    from ornata.api.exports.definitions import BlendMode, Layer, PixelSurface, Surface
+    from ornata.definitions.dataclasses.rendering import PixelRows
+else:
+    try:
+        import numpy as np
+    except ImportError:  # pragma: no cover - exercised when the optional extra is absent
+        np = None
+
+_HAS_NUMPY: bool = np is not None
 
 logger = get_logger(__name__)
 
 
+@dataclass(slots=True)
+class CompositionStats:
+    """Counters describing the most recent composition.
+
+    Attributes
+    ----------
+    pixels_recomposited : int
+        Pixels cleared and blended again across all dirty regions.
+    pixels_skipped : int
+        Pixels carried over untouched from the previous composition.
+    regions : int
+        Number of merged dirty regions that were recomposited.
+    layers : int
+        Number of visible layers blended into each region.
+    full : bool
+        Whether the frame was composed from scratch.
+    """
+
+    pixels_recomposited: int = 0
+    pixels_skipped: int = 0
+    regions: int = 0
+    layers: int = 0
+    full: bool = False
+
+
 class Compositor:
     """Manages composition of multiple rendering layers.
     
@@ -28,6 +69,9 @@ class Compositor:
         Target composition width in renderer units.
     height : int
         Target composition height in renderer units.
+    vectorized : bool | None
+        Blend pixel layers with NumPy. ``None`` enables it when NumPy is
+        importable; ``True`` without NumPy logs a warning and falls back.
         
     Returns
     -------
@@ -35,7 +79,7 @@ class Compositor:
         A layer compositor instance.
     """
 
-    def __init__(self, width: int, height: int) -> None:
+    def __init__(self, width: int, height: int, *, vectorized: bool | None = None) -> None:
         """Initialize the compositor.
 
         Parameters
@@ -44,6 +88,8 @@ class Compositor:
             Target composition width.
         height : int
             Target composition height.
+        vectorized : bool | None
+            Whether to blend pixel layers as NumPy arrays.
 
         Returns
         -------
@@ -54,7 +100,11 @@ class Compositor:
         self._layers: dict[str, Layer] = {}
         self._dirty_regions: list[tuple[int, int, int, int]] = []  # (x, y, width, height)
         self._last_composition: Surface | None = None
-        logger.debug(f"Initialized Compositor ({width}x{height})")
+        self._last_stats = CompositionStats()
+        if vectorized and not _HAS_NUMPY:
+            logger.warning("Vectorized composition requested but NumPy is not installed")
+        self.vectorized = _HAS_NUMPY and vectorized is not False
+        logger.debug(f"Initialized Compositor ({width}x{height}, vectorized={self.vectorized})")
 
     def add_layer(self, layer: Layer) -> None:
         """Add a layer to the composition.
@@ -133,6 +183,8 @@ class Compositor:
         """
         layer = self._layers.get(name)
         if layer:
+            if layer.visible != visible and layer.surface:
+                self._mark_dirty_region(0, 0, layer.surface.width, layer.surface.height)
             layer.visible = visible
             logger.log(5, f"Layer '{name}' visibility set to {visible}")
         else:
@@ -145,51 +197,137 @@ class Compositor:
         layer's blend mode and transform applied. Only dirty regions are
         recomposited for efficiency.
 
+        When every visible layer is a ``PixelSurface`` the result is a
+        ``PixelSurface``; the bottom layer is copied as-is and the layers
+        above it are blended onto it. With vectorization enabled its
+        ``data`` is the ``uint8`` array the layers were blended into.
+
+        Damage reported through the layers' own surfaces is folded into the
+        compositor's dirty regions. Once a pixel composition exists, later
+        calls update it in place: each merged dirty rectangle is cleared and
+        only the intersecting part of every layer is blended again, so the
+        returned surface is the same object from frame to frame. Counters
+        for the call are available from :attr:`last_stats`.
+
         Returns
         -------
         Surface
             The final composited surface.
         """
-        from ornata.api.exports.definitions import Surface
+        from ornata.api.exports.definitions import PixelSurface, Surface
 
+        total_pixels = self.width * self.height
         visible_layers = [layer for layer in self._layers.values() if layer.visible]
         if not visible_layers:
             logger.debug("No visible layers to compose")
             empty_surface = Surface(width=self.width, height=self.height)
+            self._dirty_regions.clear()
             self._last_composition = empty_surface
+            self._last_stats = CompositionStats(pixels_skipped=total_pixels)
             return empty_surface
 
         sorted_layers = sorted(visible_layers, key=lambda layer: layer.z_index)
         logger.log(5, f"Composing {len(sorted_layers)} layers")
+        self._collect_surface_damage(sorted_layers)
 
         # Create result surface, potentially reusing previous composition
         if self._last_composition and not self._dirty_regions:
             # No changes, return cached result
             logger.log(5, "Returning cached composition (no dirty regions)")
+            self._last_stats = CompositionStats(pixels_skipped=total_pixels)
             return self._last_composition
 
-        result_surface = Surface(width=self.width, height=self.height)
-
-        # If we have dirty regions, we need full recomposition for now
-        # TODO: Implement partial recomposition for better performance
-        if self._dirty_regions:
-            logger.log(5, f"Recomposing due to {len(self._dirty_regions)} dirty regions")
-
-        for layer in sorted_layers:
-            try:
-                self._composite_layer(result_surface, layer)
-            except Exception as e:
-                logger.error(f"Failed to composite layer '{layer.name}': {e}")
-                from ornata.api.exports.definitions import CompositionError
-                raise CompositionError(f"Composition failed for layer '{layer.name}': {e}") from e
+        pixel_stack = all(isinstance(layer.surface, PixelSurface) for layer in sorted_layers)
+        previous = self._last_composition
+        partial = (
+            pixel_stack
+            and isinstance(previous, PixelSurface)
+            and (previous.width, previous.height) == (self.width, self.height)
+            and (_HAS_NUMPY and isinstance(previous.data, np.ndarray)) == self.vectorized
+        )
+
+        if partial:
+            assert isinstance(previous, PixelSurface)
+            result_surface: Surface = previous
+            regions = list(self._dirty_regions)
+            logger.log(5, f"Recomposing {len(regions)} dirty regions")
+        elif pixel_stack:
+            result_surface = PixelSurface(width=self.width, height=self.height)
+            if self.vectorized:
+                result_surface.data = np.zeros((self.height, self.width, 4), dtype=np.uint8)
+            regions = [(0, 0, self.width, self.height)]
+        else:
+            result_surface = Surface(width=self.width, height=self.height)
+            regions = [(0, 0, self.width, self.height)]
+
+        recomposited = 0
+        for region in regions:
+            if pixel_stack:
+                self._clear_pixels(result_surface, region)
+            for index, layer in enumerate(sorted_layers):
+                try:
+                    if pixel_stack and self.vectorized:
+                        self._composite_array(result_surface.data, layer, region, first=index == 0)
+                    elif pixel_stack and index == 0:
+                        self._copy_pixels(result_surface, layer, region)
+                    else:
+                        self._composite_layer(result_surface, layer, region)
+                except Exception as e:
+                    logger.error(f"Failed to composite layer '{layer.name}': {e}")
+                    from ornata.api.exports.definitions import CompositionError
+                    raise CompositionError(f"Composition failed for layer '{layer.name}': {e}") from e
+            recomposited += region[2] * region[3]
 
         # Clear dirty regions after successful composition
         self._dirty_regions.clear()
         self._last_composition = result_surface
+        self._last_stats = CompositionStats(
+            pixels_recomposited=recomposited,
+            pixels_skipped=total_pixels - recomposited,
+            regions=len(regions),
+            layers=len(sorted_layers),
+            full=not partial,
+        )
 
         return result_surface
 
-    def _composite_layer(self, target: Surface, layer: Layer) -> None:
+    @property
+    def last_stats(self) -> CompositionStats:
+        """Return the counters of the most recent :meth:`compose` call."""
+        return self._last_stats
+
+    def invalidate_region(self, x: int, y: int, width: int, height: int) -> None:
+        """Request recomposition of an area on the next :meth:`compose` call.
+
+        Parameters
+        ----------
+        x : int
+            X coordinate of the area.
+        y : int
+            Y coordinate of the area.
+        width : int
+            Width of the area.
+        height : int
+            Height of the area.
+
+        Returns
+        -------
+        None
+        """
+        self._mark_dirty_region(x, y, width, height)
+
+    def _collect_surface_damage(self, layers: list[Layer]) -> None:
+        """Move dirty rectangles recorded on layer surfaces into the compositor."""
+        for layer in layers:
+            surface = layer.surface
+            if surface is None or not surface.is_dirty():
+                continue
+            assert surface.metadata is not None and surface.metadata.dirty_regions is not None
+            for x, y, width, height in surface.metadata.dirty_regions:
+                self._mark_dirty_region(x, y, width, height)
+            surface.clear_dirty_regions()
+
+    def _composite_layer(self, target: Surface, layer: Layer, region: tuple[int, int, int, int] | None = None) -> None:
         """Composite a single layer onto the target surface.
         
         Parameters
@@ -198,6 +336,8 @@ class Compositor:
             The target surface to composite onto.
         layer : Layer
             The layer to composite.
+        region : tuple[int, int, int, int] | None
+            Optional ``(x, y, width, height)`` area to restrict blending to.
             
         Returns
         -------
@@ -208,22 +348,108 @@ class Compositor:
             layer.transform = LayerTransform()
 
         if layer.blend_mode == BlendMode.REPLACE:
-            target.data = layer.surface.data
+            self._copy_pixels(target, layer, region)
         elif layer.blend_mode == BlendMode.ALPHA:
-            self._blend_alpha(target, layer)
+            self._blend_alpha(target, layer, region)
         elif layer.blend_mode == BlendMode.ADD:
-            self._blend_add(target, layer)
+            self._blend_add(target, layer, region)
         elif layer.blend_mode == BlendMode.MULTIPLY:
-            self._blend_multiply(target, layer)
+            self._blend_multiply(target, layer, region)
         elif layer.blend_mode == BlendMode.SCREEN:
-            self._blend_screen(target, layer)
+            self._blend_screen(target, layer, region)
         elif layer.blend_mode == BlendMode.OVERLAY:
-            self._blend_overlay(target, layer)
+            self._blend_overlay(target, layer, region)
         else:
             logger.warning(f"Blend mode {layer.blend_mode} not implemented, using REPLACE")
+            self._copy_pixels(target, layer, region)
+
+    def _copy_pixels(self, target: Surface, layer: Layer, region: tuple[int, int, int, int] | None = None) -> None:
+        """Copy a layer's pixels onto the target, ignoring blending.
+
+        Pixel targets receive a copy of the overlapping region so later blends
+        never write through to the layer's own surface. Other surfaces keep
+        sharing the layer's data as before.
+
+        Parameters
+        ----------
+        target : Surface
+            The target surface.
+        layer : Layer
+            The layer whose pixels are copied.
+        region : tuple[int, int, int, int] | None
+            Optional ``(x, y, width, height)`` area to restrict copying to.
+
+        Returns
+        -------
+        None
+        """
+        from ornata.api.exports.definitions import PixelSurface
+
+        if not isinstance(target, PixelSurface) or not isinstance(layer.surface, PixelSurface):
             target.data = layer.surface.data
+            return
+
+        source_data = self._ensure_pixel_surface_data(layer.surface)
+        target_data = self._ensure_pixel_surface_data(target)
+        x0, y0, x1, y1 = _clip_region(target, layer, region)
+        for y in range(y0, y1):
+            source_row = source_data[y]
+            end = min(x1, len(target_data[y]), len(source_row))
+            target_data[y][x0:end] = [(int(r), int(g), int(b), int(a)) for r, g, b, a in source_row[x0:end]]
+
+    def _clear_pixels(self, target: Surface, region: tuple[int, int, int, int]) -> None:
+        """Reset ``region`` of a pixel target to transparent black."""
+        from ornata.api.exports.definitions import PixelSurface
+
+        assert isinstance(target, PixelSurface)
+        x, y, width, height = region
+        if _HAS_NUMPY and isinstance(target.data, np.ndarray):
+            target.data[y:y + height, x:x + width] = 0
+            return
+        data = self._ensure_pixel_surface_data(target)
+        for row in data[y:y + height]:
+            row[x:x + width] = [(0, 0, 0, 0)] * len(row[x:x + width])
+
+    def _composite_array(
+        self, canvas: Any, layer: Layer, region: tuple[int, int, int, int] | None = None, *, first: bool = False
+    ) -> None:
+        """Blend a pixel layer into ``canvas`` with NumPy array operations.
+
+        Parameters
+        ----------
+        canvas : numpy.ndarray
+            ``uint8`` composition target of shape ``(height, width, 4)``.
+        layer : Layer
+            The layer to blend. Its surface must be a ``PixelSurface``.
+        region : tuple[int, int, int, int] | None
+            Optional ``(x, y, width, height)`` area to restrict blending to.
+        first : bool
+            Whether this is the bottom layer, which is copied unblended.
+
+        Returns
+        -------
+        None
+        """
+        from ornata.api.exports.definitions import BlendMode, PixelSurface
+
+        assert isinstance(layer.surface, PixelSurface)
+        x0, y0, x1, y1 = 0, 0, canvas.shape[1], canvas.shape[0]
+        if region is not None:
+            x0, y0 = max(x0, region[0]), max(y0, region[1])
+            x1, y1 = min(x1, region[0] + region[2]), min(y1, region[1] + region[3])
+        if y1 <= y0 or x1 <= x0:
+            return
+        source = _pixel_array(layer.surface, (x0, y0, x1, y1))
+        if source.ndim != 3 or source.shape[0] == 0 or source.shape[1] == 0:
+            return
+
+        target = canvas[y0:y0 + source.shape[0], x0:x0 + source.shape[1]]
+        opacity = layer.transform.opacity if layer.transform else 1.0
+        mode = BlendMode.REPLACE if first else layer.blend_mode
+        target[...] = _blend_arrays(mode, target, source, opacity)
+        logger.log(5, f"Vectorized {mode} blend of layer '{layer.name}' with opacity {opacity}")
 
-    def _blend_alpha(self, target: Surface, layer: Layer) -> None:
+    def _blend_alpha(self, target: Surface, layer: Layer, region: tuple[int, int, int, int] | None = None) -> None:
         """Apply alpha blending for a layer.
 
         Parameters
@@ -232,6 +458,8 @@ class Compositor:
             The target surface.
         layer : Layer
             The layer to blend.
+        region : tuple[int, int, int, int] | None
+            Optional ``(x, y, width, height)`` area to restrict blending to.
 
         Returns
         -------
@@ -253,12 +481,11 @@ class Compositor:
         opacity = layer.transform.opacity if layer.transform else 1.0
 
         # Perform alpha blending pixel by pixel
-        max_height = min(target.height, layer.surface.height, len(target_data), len(source_data))
-        max_width = min(target.width, layer.surface.width)
-        for y in range(max_height):
+        x0, y0, x1, y1 = _clip_region(target, layer, region)
+        for y in range(y0, y1):
             target_row = target_data[y]
             source_row = source_data[y]
-            for x in range(min(max_width, len(target_row), len(source_row))):
+            for x in range(x0, min(x1, len(target_row), len(source_row))):
                 target_r, target_g, target_b, target_a = target_row[x]
                 source_r, source_g, source_b, source_a = source_row[x]
 
@@ -290,7 +517,7 @@ class Compositor:
 
         logger.log(5, f"Alpha blended layer '{layer.name}' with opacity {opacity}")
 
-    def _blend_add(self, target: Surface, layer: Layer) -> None:
+    def _blend_add(self, target: Surface, layer: Layer, region: tuple[int, int, int, int] | None = None) -> None:
         """Apply additive blending for a layer.
 
         Parameters
@@ -299,6 +526,8 @@ class Compositor:
             The target surface.
         layer : Layer
             The layer to blend.
+        region : tuple[int, int, int, int] | None
+            Optional ``(x, y, width, height)`` area to restrict blending to.
 
         Returns
         -------
@@ -318,12 +547,11 @@ class Compositor:
 
         opacity = layer.transform.opacity if layer.transform else 1.0
 
-        max_height = min(target.height, layer.surface.height, len(target_data), len(source_data))
-        max_width = min(target.width, layer.surface.width)
-        for y in range(max_height):
+        x0, y0, x1, y1 = _clip_region(target, layer, region)
+        for y in range(y0, y1):
             target_row = target_data[y]
             source_row = source_data[y]
-            for x in range(min(max_width, len(target_row), len(source_row))):
+            for x in range(x0, min(x1, len(target_row), len(source_row))):
                 target_r, target_g, target_b, target_a = target_row[x]
                 source_r, source_g, source_b, source_a = source_row[x]
 
@@ -341,7 +569,7 @@ class Compositor:
 
         logger.log(5, f"Additively blended layer '{layer.name}' with opacity {opacity}")
 
-    def _blend_multiply(self, target: Surface, layer: Layer) -> None:
+    def _blend_multiply(self, target: Surface, layer: Layer, region: tuple[int, int, int, int] | None = None) -> None:
         """Apply multiplicative blending for a layer.
 
         Parameters
@@ -350,6 +578,8 @@ class Compositor:
             The target surface.
         layer : Layer
             The layer to blend.
+        region : tuple[int, int, int, int] | None
+            Optional ``(x, y, width, height)`` area to restrict blending to.
 
         Returns
         -------
@@ -369,12 +599,11 @@ class Compositor:
 
         opacity = layer.transform.opacity if layer.transform else 1.0
 
-        max_height = min(target.height, layer.surface.height, len(target_data), len(source_data))
-        max_width = min(target.width, layer.surface.width)
-        for y in range(max_height):
+        x0, y0, x1, y1 = _clip_region(target, layer, region)
+        for y in range(y0, y1):
             target_row = target_data[y]
             source_row = source_data[y]
-            for x in range(min(max_width, len(target_row), len(source_row))):
+            for x in range(x0, min(x1, len(target_row), len(source_row))):
                 target_r, target_g, target_b, target_a = target_row[x]
                 source_r, source_g, source_b, source_a = source_row[x]
 
@@ -385,13 +614,13 @@ class Compositor:
                 blended_g = int((tg * sg) * 255.0)
                 blended_b = int((tb * sb) * 255.0)
 
-                blended_a = int((target_a / 255.0 * source_a / 255.0) * 255.0)
+                blended_a = int((target_a / 255.0) * (source_a / 255.0) * 255.0)
 
-                target_row[x] = (blended_r, blended_g, blended_b, blended_a)
+                target_row[x] = _mix_pixel(target_row[x], (blended_r, blended_g, blended_b, blended_a), opacity)
 
         logger.log(5, f"Multiply blended layer '{layer.name}' with opacity {opacity}")
 
-    def _blend_screen(self, target: Surface, layer: Layer) -> None:
+    def _blend_screen(self, target: Surface, layer: Layer, region: tuple[int, int, int, int] | None = None) -> None:
         """Apply screen blending for a layer.
 
         Parameters
@@ -400,6 +629,8 @@ class Compositor:
             The target surface.
         layer : Layer
             The layer to blend.
+        region : tuple[int, int, int, int] | None
+            Optional ``(x, y, width, height)`` area to restrict blending to.
 
         Returns
         -------
@@ -419,12 +650,11 @@ class Compositor:
 
         opacity = layer.transform.opacity if layer.transform else 1.0
 
-        max_height = min(target.height, layer.surface.height, len(target_data), len(source_data))
-        max_width = min(target.width, layer.surface.width)
-        for y in range(max_height):
+        x0, y0, x1, y1 = _clip_region(target, layer, region)
+        for y in range(y0, y1):
             target_row = target_data[y]
             source_row = source_data[y]
-            for x in range(min(max_width, len(target_row), len(source_row))):
+            for x in range(x0, min(x1, len(target_row), len(source_row))):
                 target_r, target_g, target_b, target_a = target_row[x]
                 source_r, source_g, source_b, source_a = source_row[x]
 
@@ -437,11 +667,11 @@ class Compositor:
 
                 blended_a = int((1.0 - (1.0 - target_a / 255.0) * (1.0 - source_a / 255.0)) * 255.0)
 
-                target_row[x] = (blended_r, blended_g, blended_b, blended_a)
+                target_row[x] = _mix_pixel(target_row[x], (blended_r, blended_g, blended_b, blended_a), opacity)
 
         logger.log(5, f"Screen blended layer '{layer.name}' with opacity {opacity}")
 
-    def _blend_overlay(self, target: Surface, layer: Layer) -> None:
+    def _blend_overlay(self, target: Surface, layer: Layer, region: tuple[int, int, int, int] | None = None) -> None:
         """Apply overlay blending for a layer.
 
         Parameters
@@ -450,6 +680,8 @@ class Compositor:
             The target surface.
         layer : Layer
             The layer to blend.
+        region : tuple[int, int, int, int] | None
+            Optional ``(x, y, width, height)`` area to restrict blending to.
 
         Returns
         -------
@@ -469,12 +701,11 @@ class Compositor:
 
         opacity = layer.transform.opacity if layer.transform else 1.0
 
-        max_height = min(target.height, layer.surface.height, len(target_data), len(source_data))
-        max_width = min(target.width, layer.surface.width)
-        for y in range(max_height):
+        x0, y0, x1, y1 = _clip_region(target, layer, region)
+        for y in range(y0, y1):
             target_row = target_data[y]
             source_row = source_data[y]
-            for x in range(min(max_width, len(target_row), len(source_row))):
+            for x in range(x0, min(x1, len(target_row), len(source_row))):
                 target_r, target_g, target_b, target_a = target_row[x]
                 source_r, source_g, source_b, source_a = source_row[x]
 
@@ -492,14 +723,20 @@ class Compositor:
 
                 blended_a = int(overlay_blend(target_a / 255.0, source_a / 255.0) * 255.0)
 
-                target_row[x] = (blended_r, blended_g, blended_b, blended_a)
+                target_row[x] = _mix_pixel(target_row[x], (blended_r, blended_g, blended_b, blended_a), opacity)
 
         logger.log(5, f"Overlay blended layer '{layer.name}' with opacity {opacity}")
 
-    def _ensure_pixel_surface_data(self, surface: PixelSurface) -> list[list[tuple[int, int, int, int]]]:
-        """Ensure a PixelSurface has initialized pixel data."""
+    def _ensure_pixel_surface_data(self, surface: PixelSurface) -> PixelRows:
+        """Ensure a PixelSurface has initialized pixel data.
+
+        Array-backed surfaces are returned as converted rows, so they can be
+        read on the tuple path but are not written through.
+        """
         if surface.data is None:
             surface.data = [[(0, 0, 0, 0) for _ in range(surface.width)] for _ in range(surface.height)]
+        if not isinstance(surface.data, list):
+            return [[(int(r), int(g), int(b), int(a)) for r, g, b, a in row] for row in surface.data]
         return surface.data
 
     def _mark_dirty_region(self, x: int, y: int, width: int, height: int) -> None:
@@ -517,19 +754,26 @@ class Compositor:
             Height of dirty region.
         """
         # Clamp to compositor bounds
-        x = max(0, min(x, self.width - 1))
-        y = max(0, min(y, self.height - 1))
-        width = min(width, self.width - x)
-        height = min(height, self.height - y)
-
-        if width <= 0 or height <= 0:
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(self.width, x + width), min(self.height, y + height)
+        if x1 <= x0 or y1 <= y0:
             return
 
-        # Check if this region overlaps with existing dirty regions
-        # For simplicity, we just add it to the list
-        # TODO: Implement region merging for better performance
-        self._dirty_regions.append((x, y, width, height))
-        logger.log(5, f"Marked dirty region: ({x},{y}) {width}x{height}")
+        # Fold every overlapping or touching region into one bounding box so
+        # the list stays disjoint and no pixel is blended twice per frame.
+        merged = True
+        while merged:
+            merged = False
+            for index, (rx, ry, rw, rh) in enumerate(self._dirty_regions):
+                if rx <= x1 and x0 <= rx + rw and ry <= y1 and y0 <= ry + rh:
+                    x0, y0 = min(x0, rx), min(y0, ry)
+                    x1, y1 = max(x1, rx + rw), max(y1, ry + rh)
+                    del self._dirty_regions[index]
+                    merged = True
+                    break
+
+        self._dirty_regions.append((x0, y0, x1 - x0, y1 - y0))
+        logger.log(5, f"Marked dirty region: ({x0},{y0}) {x1 - x0}x{y1 - y0}")
 
     def get_dirty_regions(self) -> list[tuple[int, int, int, int]]:
         """Get list of dirty regions.
@@ -559,12 +803,18 @@ class Compositor:
 
     def clear_all_layers(self) -> None:
         """Remove all layers from the compositor.
+
+        The whole target is marked dirty and the cached composition is
+        dropped, so the next :meth:`compose` starts from an empty surface.
         
         Returns
         -------
         None
         """
         self._layers.clear()
+        self._dirty_regions.clear()
+        self._last_composition = None
+        self._mark_dirty_region(0, 0, self.width, self.height)
         logger.debug("Cleared all compositor layers")
 
     def get_layer_count(self) -> int:
@@ -607,3 +857,107 @@ class Compositor:
             logger.debug(f"Resizing compositor from {self.width}x{self.height} to {width}x{height}")
             self.width = width
             self.height = height
+            self._dirty_regions.clear()
+            self._last_composition = None
+            self._mark_dirty_region(0, 0, width, height)
+
+
+def _clip_region(target: Surface, layer: Layer, region: tuple[int, int, int, int] | None) -> tuple[int, int, int, int]:
+    """Return ``(x0, y0, x1, y1)`` bounds shared by the target, layer and region."""
+    target_rows = len(target.data) if target.data is not None else 0
+    source_rows = len(layer.surface.data) if layer.surface.data is not None else 0
+    x1 = min(target.width, layer.surface.width)
+    y1 = min(target.height, layer.surface.height, target_rows, source_rows)
+    if region is None:
+        return 0, 0, x1, y1
+    x, y, width, height = region
+    return max(0, x), max(0, y), min(x1, x + width), min(y1, y + height)
+
+
+def _mix_pixel(
+    target: tuple[int, int, int, int], blended: tuple[int, int, int, int], opacity: float
+) -> tuple[int, int, int, int]:
+    """Fade a blended pixel back towards the target by the layer opacity."""
+    if opacity >= 1.0:
+        return blended
+    inverse = 1.0 - opacity
+    return (
+        int(blended[0] * opacity + target[0] * inverse),
+        int(blended[1] * opacity + target[1] * inverse),
+        int(blended[2] * opacity + target[2] * inverse),
+        int(blended[3] * opacity + target[3] * inverse),
+    )
+
+
+def _pixel_array(surface: PixelSurface, bounds: tuple[int, int, int, int]) -> Any:
+    """Return the ``(x0, y0, x1, y1)`` window of ``surface`` as a ``uint8`` array of shape ``(h, w, 4)``.
+
+    The window is clipped to the pixels the surface holds. List-backed
+    surfaces only convert the rows and columns inside it, so a small
+    dirty region does not pay for the whole layer.
+    """
+    x0, y0, x1, y1 = bounds
+    data = surface.data
+    if data is None:
+        height = max(0, min(y1, surface.height) - y0)
+        width = max(0, min(x1, surface.width) - x0)
+        return np.zeros((height, width, 4), dtype=np.uint8)
+    if isinstance(data, np.ndarray):
+        window = data[y0:y1, x0:x1]
+        return window if window.dtype == np.uint8 else window.astype(np.uint8)
+    rows = [row[x0:x1] for row in data[y0:y1]]
+    if not rows or not rows[0]:
+        return np.zeros((len(rows), 0, 4), dtype=np.uint8)
+    return np.asarray(rows, dtype=np.uint8)
+
+
+def _blend_arrays(mode: BlendMode, target: Any, source: Any, opacity: float) -> Any:
+    """Blend ``source`` over ``target`` and return the resulting ``uint8`` pixels.
+
+    The arithmetic mirrors the per-pixel fallbacks in :class:`Compositor`
+    operation for operation, so both paths agree bit for bit.
+
+    Parameters
+    ----------
+    mode : BlendMode
+        Blend mode to apply.
+    target : numpy.ndarray
+        Destination pixels, ``uint8`` of shape ``(h, w, 4)``.
+    source : numpy.ndarray
+        Source pixels with the same shape as ``target``.
+    opacity : float
+        Layer opacity from its transform.
+
+    Returns
+    -------
+    numpy.ndarray
+        The blended pixels.
+    """
+    from ornata.api.exports.definitions import BlendMode
+
+    if mode == BlendMode.ALPHA:
+        source_f = source.astype(np.float64)
+        source_a = np.floor(source_f[..., 3] * opacity)
+        alpha_norm = (source_a / 255.0)[..., np.newaxis]
+        result = np.empty_like(target)
+        result[..., :3] = (source_f[..., :3] * alpha_norm + target[..., :3] * (1.0 - alpha_norm)).astype(np.uint8)
+        result[..., 3] = np.maximum(target[..., 3], source_a.astype(np.uint8))
+        return result
+    if mode == BlendMode.ADD:
+        scaled = source.astype(np.uint16) if opacity >= 1.0 else np.floor(source * opacity).astype(np.uint16)
+        return np.minimum(target.astype(np.uint16) + scaled, 255).astype(np.uint8)
+    if mode not in (BlendMode.MULTIPLY, BlendMode.SCREEN, BlendMode.OVERLAY):
+        return source
+
+    base = target / 255.0
+    blend = source / 255.0
+    if mode == BlendMode.MULTIPLY:
+        blended = base * blend
+    elif mode == BlendMode.SCREEN:
+        blended = 1.0 - (1.0 - base) * (1.0 - blend)
+    else:
+        blended = np.where(base < 0.5, 2.0 * base * blend, 1.0 - 2.0 * (1.0 - base) * (1.0 - blend))
+    result = (blended * 255.0).astype(np.uint8)
+    if opacity < 1.0:
+        result = (result * opacity + target * (1.0 - opacity)).astype(np.uint8)
+    return result
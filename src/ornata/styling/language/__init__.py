@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-from . import cascade, diag, engine, grammar
+from . import cache, cascade, diag, engine, grammar
 
 # from .ast import () Empty currently
+from .cache import StyleCache
 from .cascade import (
+    CompiledBlock,
+    CompiledStylesheet,
     _apply_block,  # type: ignore [private]
     _handle_background,  # type: ignore [private]
     _handle_background_image,  # type: ignore [private]
@@ -34,9 +37,9 @@ from .cascade import (
     _handle_transform,  # type: ignore [private]
     _handle_width,  # type: ignore [private]
     _handle_word_spacing,  # type: ignore [private]
-    _matches_component,  # type: ignore [private]
     _resolve_color,  # type: ignore [private]
     _split_tokens,  # type: ignore [private]
+    compile_stylesheet,
     resolve_stylesheet,
 )
 from .diag import (
@@ -61,6 +64,9 @@ from .grammar import (
 # from .values import () Empty currently
 
 __all__ = [
+    "CompiledBlock",
+    "CompiledStylesheet",
+    "StyleCache",
     "StyleEngine",
     "_Parser",
     "_apply_block",
@@ -93,17 +99,18 @@ __all__ = [
     "_handle_transform",
     "_handle_width",
     "_handle_word_spacing",
-    "_matches_component",
     "_merge_styles",
     "_resolve_color",
     "_safe_call",
     "_split_tokens",
     "clear",
+    "compile_stylesheet",
     "error",
     "last_errors",
     "last_warnings",
     "parse_stylesheet",
     "resolve_stylesheet",
+    "cache",
     "cascade",
     "diag",
     "engine",
@@ -0,0 +1,175 @@
+"""Bounded, thread-safe cache of resolved styles."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from ornata.api.exports.definitions import STYLING_CACHE_LIMIT
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from ornata.api.exports.definitions import CacheKey, ResolvedStyle
+
+# (cache generation, component generation, style)
+type _Entry = tuple[int, int, ResolvedStyle]
+
+
+class StyleCache:
+    """Two-level LRU cache used by :class:`StyleEngine` and :class:`StylingRuntime`.
+
+    The first level maps a component name to its stateless base style; the
+    second maps full :class:`CacheKey` values to resolved styles. Both levels
+    are bounded and evict the least recently used entry.
+
+    Entries are tagged with the cache generation and their component's
+    generation when stored. :meth:`invalidate` bumps one of those counters
+    instead of walking the store, and stale entries are dropped lazily when
+    they are next looked up or evicted.
+
+    The engine and the runtime build their :class:`CacheKey` values
+    differently, so each owns a separate instance; sharing one would let
+    their keys collide and count a single lookup twice.
+    """
+
+    __slots__ = (
+        "_styles",
+        "_components",
+        "_max_size",
+        "_max_components",
+        "_generation",
+        "_component_generations",
+        "_version",
+        "_lock",
+        "hits",
+        "misses",
+        "evictions",
+    )
+
+    def __init__(self, max_size: int = STYLING_CACHE_LIMIT, max_components: int = 1024) -> None:
+        """Create a cache holding at most ``max_size`` styles and ``max_components`` base styles."""
+        self._styles: OrderedDict[CacheKey, _Entry] = OrderedDict()
+        self._components: OrderedDict[str, _Entry] = OrderedDict()
+        self._max_size = max(1, max_size)
+        self._max_components = max(1, max_components)
+        self._generation = 0
+        self._component_generations: dict[str, int] = {}
+        self._version = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def generation(self) -> int:
+        """Current cache-wide generation."""
+        return self._generation
+
+    @property
+    def version(self) -> int:
+        """Counter bumped by every invalidation, global or per component."""
+        return self._version
+
+    def get(self, key: CacheKey) -> ResolvedStyle | None:
+        """Return the style cached under ``key`` or ``None`` on a miss."""
+        with self._lock:
+            return self._lookup(self._styles, key, key.component)
+
+    def set(self, key: CacheKey, style: ResolvedStyle) -> None:
+        """Store ``style`` under ``key``."""
+        with self._lock:
+            self._store(self._styles, key, key.component, style, self._max_size)
+
+    def get_component(self, component: str) -> ResolvedStyle | None:
+        """Return the cached stateless base style of ``component``."""
+        with self._lock:
+            return self._lookup(self._components, component, component)
+
+    def set_component(self, component: str, style: ResolvedStyle) -> None:
+        """Store the stateless base style of ``component``."""
+        with self._lock:
+            self._store(self._components, component, component, style, self._max_components)
+
+    def invalidate(self, component: str | None = None) -> None:
+        """Retire every entry, or only those of ``component``."""
+        with self._lock:
+            self._version += 1
+            if component is None:
+                self._generation += 1
+                self._component_generations.clear()
+            else:
+                self._component_generations[component] = self._component_generations.get(component, 0) + 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._styles.clear()
+            self._components.clear()
+            self._component_generations.clear()
+            self._generation += 1
+            self._version += 1
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def get_stats(self) -> dict[str, int]:
+        """Return sizes, capacity, generation and hit/miss/eviction counters."""
+        with self._lock:
+            return {
+                "cache_size": len(self._styles),
+                "cache_max_size": self._max_size,
+                "component_cache_size": len(self._components),
+                "cache_generation": self._generation,
+                "cache_hits": self.hits,
+                "cache_misses": self.misses,
+                "cache_evictions": self.evictions,
+            }
+
+    # Dict-like ----------------------------------------------
+
+    def __getitem__(self, key: CacheKey) -> ResolvedStyle:
+        style = self.get(key)
+        if style is None:
+            raise KeyError(key)
+        return style
+
+    def __setitem__(self, key: CacheKey, style: ResolvedStyle) -> None:
+        self.set(key, style)
+
+    def __contains__(self, key: CacheKey) -> bool:
+        with self._lock:
+            entry = self._styles.get(key)
+            return entry is not None and entry[0] == self._generation and entry[1] == self._component_generations.get(key.component, 0)
+
+    def __len__(self) -> int:
+        return len(self._styles)
+
+    def _lookup(self, store: OrderedDict[Any, _Entry], key: Hashable, component: str) -> ResolvedStyle | None:
+        entry = store.get(key)
+        if entry is not None:
+            if entry[0] == self._generation and entry[1] == self._component_generations.get(component, 0):
+                store.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            del store[key]
+        self.misses += 1
+        return None
+
+    def _store(
+        self,
+        store: OrderedDict[Any, _Entry],
+        key: Hashable,
+        component: str,
+        style: ResolvedStyle,
+        limit: int,
+    ) -> None:
+        store[key] = (self._generation, self._component_generations.get(component, 0), style)
+        store.move_to_end(key)
+        while len(store) > limit:
+            store.popitem(last=False)
+            self.evictions += 1
+
+
+__all__ = ["StyleCache"]
@@ -2,67 +2,195 @@
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from collections.abc import Mapping
+from dataclasses import dataclass, fields
+from functools import cache
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Mapping
 
-    from ornata.api.exports.definitions import ComponentRule, ResolvedStyle, StateBlock, Stylesheet
-    
-
-def resolve_stylesheet(
-    sheet: Stylesheet,
-    component: str,
-    states: frozenset[str],
-    colors: Mapping[str, str],
-    fonts: Mapping[str, Any],
-) -> ResolvedStyle:
-    """Resolve ``component`` for ``states`` using ``sheet``."""
-    from ornata.api.exports.definitions import ResolvedStyle
-
-    resolved = ResolvedStyle()
-    resolved.keyframes = dict(sheet.keyframes)
-    custom_properties: dict[str, str] = {}
-    extras: dict[str, Any] = {}
-
-    applicable_rules = [rule for rule in sheet.rules if _matches_component(rule, component)]
-    if not applicable_rules:
+    from ornata.api.exports.definitions import BoxShadow, FontDef, ResolvedStyle, StateBlock, Stylesheet
+
+# Fields a block never sets directly: they are accumulated across blocks
+# or assigned once per resolution.
+_ACCUMULATED_FIELDS = frozenset({"box_shadow", "component_extras", "custom_properties", "keyframes"})
+_COMPILED_CACHE_LIMIT = 64
+
+
+@dataclass(slots=True, frozen=True)
+class CompiledBlock:
+    """A state block whose properties were parsed once at compile time.
+
+    ``values`` holds the ``ResolvedStyle`` assignments the block makes, with
+    colour and font tokens already resolved against the owning sheet.
+    Blocks whose properties fail to parse are marked ``deferred`` and are
+    applied from ``source`` at resolution time so errors surface as before.
+    """
+
+    source: StateBlock
+    states: frozenset[str]
+    always: bool
+    values: tuple[tuple[str, Any], ...] = ()
+    box_shadow: tuple[BoxShadow, ...] = ()
+    custom_properties: tuple[tuple[str, str], ...] = ()
+    extras: tuple[tuple[str, str], ...] = ()
+    deferred: bool = False
+
+    def matches(self, active_states: frozenset[str]) -> bool:
+        """Return ``True`` when this block applies to ``active_states``."""
+        return self.always or self.states <= active_states
+
+
+@dataclass(slots=True, frozen=True)
+class CompiledStylesheet:
+    """Stylesheet indexed by lower-cased component selector.
+
+    ``components`` maps each selector to the universal blocks followed by
+    the selector's own blocks, i.e. the full cascade for that component;
+    components without rules of their own use ``universal``.
+    """
+
+    sheet: Stylesheet
+    colors: dict[str, str]
+    universal: tuple[CompiledBlock, ...]
+    components: dict[str, tuple[CompiledBlock, ...]]
+
+    def blocks_for(self, component: str) -> tuple[CompiledBlock, ...]:
+        """Return the blocks that apply to ``component`` in cascade order."""
+        return self.components.get(component.lower(), self.universal)
+
+    def resolve(
+        self,
+        component: str,
+        states: frozenset[str],
+        colors: Mapping[str, str] | None = None,
+        fonts: Mapping[str, Any] | None = None,
+    ) -> ResolvedStyle:
+        """Resolve ``component`` for ``states`` from the precompiled blocks.
+
+        Passing ``colors`` or ``fonts`` that differ from the sheet's own
+        re-parses the matching blocks against them instead.
+        """
+        from ornata.api.exports.definitions import ResolvedStyle
+
+        resolved = ResolvedStyle()
+        resolved.keyframes = dict(self.sheet.keyframes)
+        blocks = self.blocks_for(component)
+        if not blocks:
+            return resolved
+
+        reparse = (colors is not None and colors != self.colors) or (fonts is not None and fonts != self.sheet.fonts)
+        colors = self.colors if colors is None else colors
+        fonts = self.sheet.fonts if fonts is None else fonts
+        custom_properties: dict[str, str] = {}
+        extras: dict[str, Any] = {}
+        for block in blocks:
+            if not block.matches(states):
+                continue
+            if reparse or block.deferred:
+                _apply_block(resolved, block.source, colors, fonts, custom_properties, extras)
+                continue
+            for name, value in block.values:
+                setattr(resolved, name, value)
+            if block.box_shadow:
+                resolved.box_shadow = [*(resolved.box_shadow or ()), *block.box_shadow]
+            custom_properties.update(block.custom_properties)
+            for name, value in block.extras:
+                extras.setdefault(name, []).append(value)
+
+        resolved.custom_properties = custom_properties or None
+        resolved.component_extras = extras or None
         return resolved
 
-    # Sort rules by specificity (universal rules first, then component-specific)
-    # This ensures proper cascade order without redundant processing
-    applicable_rules.sort(key=lambda r: 0 if r.component == "*" else 1)
 
-    # Early termination: if we have a universal rule and no component-specific rules,
-    # we can skip further processing for this component
-    has_universal = any(r.component == "*" for r in applicable_rules)
-    has_specific = any(r.component != "*" for r in applicable_rules)
-    if has_universal and not has_specific:
-        # Only process universal rules for this component
-        applicable_rules = [r for r in applicable_rules if r.component == "*"]
+_compiled_sheets: OrderedDict[int, CompiledStylesheet] = OrderedDict()
+_compiled_lock = threading.Lock()
+
+
+def compile_stylesheet(sheet: Stylesheet) -> CompiledStylesheet:
+    """Return the compiled rule index for ``sheet``, building it on first use.
+
+    Compiled sheets are memoised by identity, so callers can compile at load
+    time and every later resolution of the same sheet reuses the index.
+    """
+    key = id(sheet)
+    with _compiled_lock:
+        compiled = _compiled_sheets.get(key)
+        if compiled is not None and compiled.sheet is sheet:
+            _compiled_sheets.move_to_end(key)
+            return compiled
+
+    colors = {name: token.value for name, token in sheet.colors.items()}
+    universal: list[CompiledBlock] = []
+    specific: dict[str, list[CompiledBlock]] = {}
+    for rule in sheet.rules:
+        blocks = [_compile_block(block, colors, sheet.fonts) for block in rule.blocks]
+        selector = rule.component.strip()
+        if selector == "*":
+            universal.extend(blocks)
+        else:
+            specific.setdefault(selector.lower(), []).extend(blocks)
+
+    universal_blocks = tuple(universal)
+    compiled = CompiledStylesheet(
+        sheet=sheet,
+        colors=colors,
+        universal=universal_blocks,
+        components={selector: universal_blocks + tuple(blocks) for selector, blocks in specific.items()},
+    )
+    with _compiled_lock:
+        _compiled_sheets[key] = compiled
+        while len(_compiled_sheets) > _COMPILED_CACHE_LIMIT:
+            _compiled_sheets.popitem(last=False)
+    return compiled
 
-    # Pre-resolve color lookups for faster access
-    color_cache = dict(colors)
 
-    for rule in applicable_rules:
-        for block in rule.blocks:
-            if not block.matches(states):
-                continue
-            _apply_block(resolved, block, color_cache, fonts, custom_properties, extras)
+def _compile_block(block: StateBlock, colors: Mapping[str, str], fonts: Mapping[str, FontDef]) -> CompiledBlock:
+    """Parse ``block`` once into the assignments it makes."""
+    from ornata.api.exports.definitions import ResolvedStyle
 
-    resolved.custom_properties = custom_properties or None
-    resolved.component_extras = extras or None
-    return resolved
+    states = block.states
+    always = not states or states == frozenset({"default"})
+    probe = ResolvedStyle()
+    custom_properties: dict[str, str] = {}
+    extras: dict[str, Any] = {}
+    try:
+        _apply_block(probe, block, colors, fonts, custom_properties, extras)
+    except Exception:
+        return CompiledBlock(source=block, states=states, always=always, deferred=True)
+
+    values = tuple(
+        (name, value)
+        for name in _resolved_field_names()
+        if name not in _ACCUMULATED_FIELDS and (value := getattr(probe, name)) is not None
+    )
+    return CompiledBlock(
+        source=block,
+        states=states,
+        always=always,
+        values=values,
+        box_shadow=tuple(probe.box_shadow or ()),
+        custom_properties=tuple(custom_properties.items()),
+        extras=tuple((name, value) for name, entries in extras.items() for value in entries),
+    )
 
 
-def _matches_component(rule: ComponentRule, component: str) -> bool:
-    """Return ``True`` when ``rule`` applies to ``component``."""
+def resolve_stylesheet(
+    sheet: Stylesheet,
+    component: str,
+    states: frozenset[str],
+    colors: Mapping[str, str],
+    fonts: Mapping[str, Any],
+) -> ResolvedStyle:
+    """Resolve ``component`` for ``states`` using ``sheet``.
 
-    selector = rule.component.strip()
-    if selector == "*":
-        return True
-    return selector.lower() == component.lower()
+    Rule selection and property parsing come from the sheet's compiled
+    index (see :func:`compile_stylesheet`).
+    """
+    return compile_stylesheet(sheet).resolve(component, states, colors, fonts)
 
 
 def _apply_block(
@@ -409,4 +537,12 @@ _property_handlers: dict[str, Any] = {
     "align-items": _layout_setter("align_items"),
 }
 
-__all__ = ["resolve_stylesheet"]
+@cache
+def _resolved_field_names() -> tuple[str, ...]:
+    """Return the ``ResolvedStyle`` field names (resolved lazily to avoid import cycles)."""
+    from ornata.api.exports.definitions import ResolvedStyle
+
+    return tuple(field.name for field in fields(ResolvedStyle))
+
+
+__all__ = ["CompiledBlock", "CompiledStylesheet", "compile_stylesheet", "resolve_stylesheet"]
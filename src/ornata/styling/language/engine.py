@@ -7,30 +7,32 @@ from dataclasses import fields
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from ornata.api.exports.definitions import STYLING_CACHE_LIMIT
-from ornata.api.exports.utils import ThreadSafeLRUCache, get_logger
+from ornata.api.exports.utils import get_logger
+from ornata.styling.language.cache import StyleCache
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
-    from ornata.api.exports.definitions import CacheKey, FontDef, ResolvedStyle, Stylesheet
+    from ornata.api.exports.definitions import FontDef, ResolvedStyle, Stylesheet
 
 
 class StyleEngine:
     """Parse, cache, and resolve Ornata Style (OSTS) stylesheets."""
 
-    def __init__(self) -> None:
+    def __init__(self, cache: StyleCache | None = None) -> None:
         self._lock = threading.RLock()
-        self._cache: ThreadSafeLRUCache[CacheKey, ResolvedStyle] = ThreadSafeLRUCache(max_size=STYLING_CACHE_LIMIT)
+        self._cache = cache if cache is not None else StyleCache()
         self._sheets: list[Stylesheet] = []
         self._default_sheet: Stylesheet | None = None
         self._use_default = True
         self._version = 0
         self._logger = get_logger(__name__)
-        # Incremental resolution cache for repeated component types
-        self._component_cache: dict[str, ResolvedStyle] = {}
         self._load_default_stylesheet()
 
+    @property
+    def cache(self) -> StyleCache:
+        return self._cache
+
     @property
     def theme_version(self) -> int:
         return self._version
@@ -44,6 +46,7 @@ class StyleEngine:
     def load_stylesheet_text(self, name: str, text: str) -> None:
         """Load a stylesheet from raw OSTS source."""
         from ornata.styling.language import diag
+        from ornata.styling.language.cascade import compile_stylesheet
         from ornata.styling.language.grammar import parse_stylesheet
         self._logger.debug(f"Parsing stylesheet '{name}' ({len(text)} chars)")
         diag.clear()
@@ -51,6 +54,7 @@ class StyleEngine:
         warnings = diag.last_warnings()
         for message in warnings:
             self._logger.warning(f"{name}: {message}")
+        compile_stylesheet(sheet)
 
         with self._lock:
             self._sheets.append(sheet)
@@ -94,17 +98,16 @@ class StyleEngine:
                 theme_version=self._version,
                 caps_signature=caps_signature,
             )
-            cached: Any = self._cache.get(key)  # Any justified for dynamic cache data
+            cached = self._cache.get(key)
             if cached is not None:
                 self._logger.debug("Style cache hit for %s (states=%s)", component, sorted(active_states))
                 return cached
 
             # Check incremental cache for base component style (no states)
-            base_component = self._component_cache.get(component)
-            if base_component is not None and not active_states:
+            base_component = self._cache.get_component(component) if not active_states else None
+            if base_component is not None:
                 self._logger.debug("Incremental cache hit for %s", component)
-                with self._lock:
-                    self._cache[key] = base_component
+                self._cache.set(key, base_component)
                 return base_component
 
             default_sheet = self._default_sheet if self._use_default else None
@@ -127,10 +130,10 @@ class StyleEngine:
             caps=caps,
         )
 
-        self._cache[key] = resolved
+        self._cache.set(key, resolved)
         # Cache base component style for incremental resolution
         if not active_states:
-            self._component_cache[component] = resolved
+            self._cache.set_component(component, resolved)
         return resolved
 
     def get_registered_fonts(self) -> dict[str, FontDef]:
@@ -157,9 +160,9 @@ class StyleEngine:
         caps: Any,
     ) -> ResolvedStyle:
         from ornata.api.exports.definitions import ResolvedStyle
+        from ornata.styling.language.cascade import compile_stylesheet
+
         resolved = ResolvedStyle()
-        inherited_custom_props: dict[str, str] = {}
-        accumulated_keyframes: dict[str, Any] = {}
 
         active_sheets: list[Stylesheet] = []
         if default_sheet is not None:
@@ -167,22 +170,8 @@ class StyleEngine:
         active_sheets.extend(sheets)
 
         for sheet in active_sheets:
-            # build plain color map (token name -> hex/string)
-            colors_map = {name: tok.value for name, tok in sheet.colors.items()}
-            fonts_map = sheet.fonts  # FontDef instances are fine as-is
-            from ornata.styling.language.cascade import resolve_stylesheet
-
-            partial = resolve_stylesheet(
-                sheet=sheet,
-                component=component,
-                states=active_states,
-                colors=colors_map,
-                fonts=fonts_map,
-            )
-            if partial.custom_properties:
-                inherited_custom_props.update(partial.custom_properties)
-            if partial.keyframes:
-                accumulated_keyframes.update(partial.keyframes)
+            # Sheets are compiled when loaded; this is an index lookup.
+            partial = compile_stylesheet(sheet).resolve(component, active_states)
             resolved = _merge_styles(resolved, partial)
 
         return resolved
@@ -201,12 +190,14 @@ class StyleEngine:
 
         self._logger.debug("Loading built-in theme from %s", path.name)
         from ornata.styling.language import diag
+        from ornata.styling.language.cascade import compile_stylesheet
         from ornata.styling.language.grammar import parse_stylesheet
         diag.clear()
         sheet = parse_stylesheet(path.name, text)
         warnings = diag.last_warnings()
         for message in warnings:
             self._logger.warning(f"{path.name}: {message}")
+        compile_stylesheet(sheet)
 
         with self._lock:
             self._default_sheet = sheet
@@ -215,8 +206,7 @@ class StyleEngine:
             self._invalidate_cache_unlocked()
 
     def _invalidate_cache_unlocked(self) -> None:
-        self._cache.clear()
-        self._component_cache.clear()
+        self._cache.invalidate()
 
     # ADD no-op compatibility methods used by the public facade
     def set_theme(self, theme_name: str) -> None:
@@ -5,6 +5,7 @@ from __future__ import annotations
 from . import borders, runtime, typography
 from .borders import StylingBorders
 from .runtime import (
+    StyleBatchStats,
     StylingRuntime,
     get_styling_runtime,
     resolve_backend_component_style,
@@ -14,6 +15,7 @@ from .typography import TypographyEngine
 
 __all__ = [
     "StylingBorders",
+    "StyleBatchStats",
     "StylingRuntime",
     "TypographyEngine",
     "get_styling_runtime",
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import os
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
+from ornata.api.exports.definitions import STYLING_CACHE_LIMIT
 from ornata.api.exports.utils import get_logger
 from ornata.definitions.enums import BackendTarget
 
@@ -16,6 +20,21 @@ if TYPE_CHECKING:
     from ornata.definitions.dataclasses.styling import BackendStylePayload
     from ornata.styling.language.engine import StyleEngine
 
+# Below this many unique misses a batch is resolved on the calling thread.
+_PARALLEL_MIN_MISSES = 32
+
+
+@dataclass(slots=True)
+class StyleBatchStats:
+    """Counters describing the most recent batch resolution."""
+
+    contexts: int = 0
+    unique_keys: int = 0
+    hits: int = 0
+    misses: int = 0
+    workers: int = 0
+
+
 class _ResolutionCounter:
     # local defined counter
     _resolution_counter = 0
@@ -28,18 +47,28 @@ class _ResolutionCounter:
 class StylingRuntime:
     """Facade around :class:`StyleEngine` providing caching, theming, and stats."""
 
-    def __init__(self) -> None:
-        """Create a styling subsystem instance."""
+    def __init__(self, cache_size: int = STYLING_CACHE_LIMIT) -> None:
+        """Create a styling subsystem instance.
+
+        Args:
+            cache_size (int): Maximum number of resolved styles kept in the runtime's cache and in the engine's.
+        """
+        from ornata.styling.language.cache import StyleCache
         from ornata.styling.language.engine import StyleEngine
         from ornata.styling.theming.manager import get_theme_manager
         self.logger = get_logger(__name__)
-        self._engine = StyleEngine()
+        # The facade and the engine key their entries differently, so each has its own cache.
+        self._cache = StyleCache(cache_size)
+        self._engine = StyleEngine(cache=StyleCache(cache_size))
         self._theme_manager = get_theme_manager()
-        self._cache: dict[CacheKey, ResolvedStyle] = {}
         self._font_registry: dict[str, FontDef] = {}
         self._font_registry_version = -1
         self._font_registry_lock = threading.RLock()
         self._resolution_counter = _ResolutionCounter()
+        self._last_batch_stats = StyleBatchStats()
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_workers = 0
+        self._executor_lock = threading.Lock()
 
         # Register for theme change notifications to invalidate caches
         self._theme_manager.register_cache_invalidator(self.invalidate_cache)
@@ -53,25 +82,33 @@ class StylingRuntime:
         Returns:
             ResolvedStyle: Resolved style produced by the engine.
         """
+        key = self._make_cache_key(context)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self.logger.debug("style cache hit for %s states=%s", key.component, sorted(key.states))
+            return cached
+
+        resolved = self._resolve_uncached(context)
+        self._cache.set(key, resolved)
+        return resolved
+
+    def _make_cache_key(self, context: StylingContext) -> CacheKey:
+        """Build the cache key identifying ``context``'s resolved style."""
         from ornata.api.exports.definitions import CacheKey
 
         overrides = context.theme_overrides or {}
         overrides_items = tuple(sorted((str(key), str(value)) for key, value in overrides.items()))
-        caps_signature = _caps_signature(context.caps)
-        key = CacheKey(
+        return CacheKey(
             component=context.component_name,
             states=context.active_states(),
             overrides=overrides_items,
             style_version=self._engine.theme_version,
             theme_version=self._theme_manager.version,
-            caps_signature=caps_signature
+            caps_signature=_caps_signature(context.caps),
         )
 
-        cached = self._cache.get(key)
-        if cached is not None:
-            self.logger.debug("style cache hit for %s states=%s", key.component, sorted(key.states))
-            return cached
-
+    def _resolve_uncached(self, context: StylingContext) -> ResolvedStyle:
+        """Resolve ``context`` through the engine, bypassing the runtime cache."""
         resolved = self._engine.resolve(
             node={"component_name": context.component_name},
             state=context.state or {},
@@ -79,8 +116,6 @@ class StylingRuntime:
             overrides=context.theme_overrides,
         )
         self._resolution_counter.increment()
-
-        self._cache[key] = resolved
         return resolved
 
     def resolve_backend_style(self, context: StylingContext) -> BackendStylePayload:
@@ -114,6 +149,40 @@ class StylingRuntime:
             extras={},
         )
 
+    def resolve_backend_styles(self, contexts: Sequence[StylingContext]) -> list[BackendStylePayload]:
+        """Resolve backend payloads for ``contexts`` as one batch.
+
+        Styles are resolved through :meth:`resolve_styles_parallel` and each
+        distinct style is converted for its backend once, so contexts sharing
+        a style also share the payload.
+
+        Args:
+            contexts (Sequence[StylingContext]): Styling contexts with backend targets.
+
+        Returns:
+            list[BackendStylePayload]: Backend-conditioned payloads in input order.
+        """
+        from ornata.definitions.dataclasses.styling import BackendStylePayload
+
+        resolved_styles = self.resolve_styles_parallel(contexts)
+        converted: dict[tuple[int, BackendTarget, int], BackendStylePayload] = {}
+        payloads: list[BackendStylePayload] = []
+        for context, resolved in zip(contexts, resolved_styles, strict=True):
+            memo_key = (id(resolved), context.backend, id(context.caps))
+            payload = converted.get(memo_key)
+            if payload is None:
+                filtered_style = self._filter_style_for_backend(resolved, context.backend)
+                payload = BackendStylePayload(
+                    backend=context.backend,
+                    style=filtered_style,
+                    renderer_metadata=self._build_renderer_metadata(filtered_style, context.backend, context.caps),
+                    layout_style=self._build_layout_style(filtered_style, context.backend),
+                    extras={},
+                )
+                converted[memo_key] = payload
+            payloads.append(payload)
+        return payloads
+
     def _filter_style_for_backend(self, style: ResolvedStyle, backend: BackendTarget) -> ResolvedStyle:
         """Filter and convert style fields based on backend capabilities.
 
@@ -240,18 +309,18 @@ class StylingRuntime:
     def invalidate_cache(self, component_name: str | None = None) -> None:
         """Invalidate cached styles.
 
+        Entries of both the runtime's and the engine's caches are retired
+        by version tag and dropped lazily rather than cleared, so this is
+        constant time.
+
         Args:
-            component_name (str | None): When provided, only entries for the component are removed.
+            component_name (str | None): When provided, only entries for the component are retired.
 
         Returns:
             None
         """
-        if component_name is None:
-            self._cache.clear()
-            return
-        to_remove = [key for key in self._cache if key.component == component_name]
-        for key in to_remove:
-            del self._cache[key]
+        self._cache.invalidate(component_name)
+        self._engine.cache.invalidate(component_name)
 
     def set_theme(self, theme_name: str) -> None:
         """Activate ``theme_name`` and invalidate caches.
@@ -298,27 +367,125 @@ class StylingRuntime:
         self._engine.clear_extra_stylesheets()
         self.invalidate_cache()
 
-    def resolve_styles_parallel(self, contexts: Sequence[StylingContext]) -> list[ResolvedStyle]:
-        """Resolve styles for ``contexts`` using sequential fallback.
+    def resolve_styles_parallel(
+        self,
+        contexts: Sequence[StylingContext],
+        *,
+        max_workers: int | None = None,
+    ) -> list[ResolvedStyle]:
+        """Resolve styles for ``contexts`` as one batch.
+
+        Contexts are first collapsed onto their cache keys so that each
+        distinct style is looked up once. Unique keys missing from the cache
+        are resolved once each, on a thread pool when there are enough of
+        them, and every context then receives the style of its key. Counters
+        for the batch are available from :attr:`last_batch_stats`.
 
         Args:
             contexts (Sequence[StylingContext]): Styling contexts to resolve.
+            max_workers (int | None): Thread pool size; ``1`` resolves on the
+                calling thread. Defaults to the CPU count.
 
         Returns:
             list[ResolvedStyle]: Resolved styles in input order.
         """
 
-        return [self.resolve_style(context) for context in contexts]
+        keys = [self._make_cache_key(context) for context in contexts]
+        unique: dict[CacheKey, StylingContext] = {}
+        for key, context in zip(keys, contexts, strict=True):
+            unique.setdefault(key, context)
+
+        results: dict[CacheKey, ResolvedStyle] = {}
+        misses: list[tuple[CacheKey, StylingContext]] = []
+        for key, context in unique.items():
+            cached = self._cache.get(key)
+            if cached is None:
+                misses.append((key, context))
+            else:
+                results[key] = cached
+
+        workers = 0
+        if len(misses) >= _PARALLEL_MIN_MISSES and max_workers != 1:
+            workers = min(len(misses), max_workers or os.cpu_count() or 1)
+        if workers > 1:
+            # One task per worker keeps the batch within ``workers`` threads of the shared pool.
+            pending = [context for _, context in misses]
+            chunk = -(-len(pending) // workers)
+            chunks = [pending[start : start + chunk] for start in range(0, len(pending), chunk)]
+            resolved_styles = [
+                style for styles in self._get_executor(workers).map(self._resolve_chunk, chunks) for style in styles
+            ]
+        else:
+            workers = 0
+            resolved_styles = [self._resolve_uncached(context) for _, context in misses]
+
+        for (key, _), resolved in zip(misses, resolved_styles, strict=True):
+            self._cache.set(key, resolved)
+            results[key] = resolved
+
+        self._last_batch_stats = StyleBatchStats(
+            contexts=len(keys),
+            unique_keys=len(unique),
+            hits=len(unique) - len(misses),
+            misses=len(misses),
+            workers=workers,
+        )
+        return [results[key] for key in keys]
+
+    def _resolve_chunk(self, contexts: list[StylingContext]) -> list[ResolvedStyle]:
+        return [self._resolve_uncached(context) for context in contexts]
+
+    def _get_executor(self, workers: int) -> ThreadPoolExecutor:
+        """Return the worker pool, starting it on first use and growing it to ``workers``."""
+
+        with self._executor_lock:
+            if self._executor is None or self._executor_workers < workers:
+                # A replaced pool is dropped rather than shut down: a batch on another
+                # thread may still be submitting to it, and its idle threads exit once
+                # it is collected.
+                self._executor_workers = max(workers, os.cpu_count() or 1)
+                self._executor = ThreadPoolExecutor(max_workers=self._executor_workers, thread_name_prefix="ornata-style")
+            return self._executor
+
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started."""
+
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+            self._executor_workers = 0
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    @property
+    def last_batch_stats(self) -> StyleBatchStats:
+        """Return the counters of the most recent :meth:`resolve_styles_parallel` call."""
+
+        return self._last_batch_stats
+
+    @property
+    def style_version(self) -> tuple[int, int, int]:
+        """Return a token that changes whenever previously resolved styles may be stale.
+
+        It combines the cache invalidation counter with the stylesheet and
+        theme versions, so callers retaining styles across frames can compare
+        it instead of re-resolving.
+        """
+
+        return (self._cache.version, self._engine.theme_version, self._theme_manager.version)
 
     def get_style_stats(self) -> dict[str, int]:
         """Return statistics about the styling subsystem cache.
 
         Returns:
-            dict[str, int]: Statistics including cache size, theme version, and resolution count.
+            dict[str, int]: Statistics including cache size, hit/miss/eviction counters,
+                theme version, and resolution count. The engine's cache counters
+                follow under ``engine_``-prefixed names.
         """
 
+        engine_stats = self._engine.cache.get_stats()
         return {
-            "cache_size": len(self._cache),
+            **self._cache.get_stats(),
+            **{f"engine_{name}": value for name, value in engine_stats.items()},
             "total_resolutions": self._resolution_counter.get(),
             "theme_version": self._theme_manager.version,
             "style_version": self._engine.theme_version,
@@ -558,6 +725,7 @@ def resolve_backend_component_style(
 
 
 __all__ = [
+    "StyleBatchStats",
     "StylingRuntime",
     "resolve_component_style",
     "resolve_backend_component_style",
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from . import cache, lock, logging, memory
+from . import cache, lock, logging, memory, unicode_width
 from .cache import (
     LFUCache,
     LRUCache,
@@ -27,12 +27,14 @@ from .memory import (
     ThreadSafeMemoryPool,
     ThreadSafeSlabAllocator,
 )
+from .unicode_width import char_width, char_widths, clip_to_width, codepoint_width, fit_to_width, text_width
 
 __all__ = [
     "cache",
     "lock",
     "logging",
     "memory",
+    "unicode_width",
     "LFUCache",
     "LRUCache",
     "SimpleCache",
@@ -54,4 +56,10 @@ __all__ = [
     "ThreadSafeArenaAllocator",
     "ThreadSafeMemoryPool",
     "ThreadSafeSlabAllocator",
+    "char_width",
+    "char_widths",
+    "clip_to_width",
+    "codepoint_width",
+    "fit_to_width",
+    "text_width",
 ]
@@ -68,9 +68,8 @@ def _recompute_node_hash(node: VDOMNode) -> None:
         node.normalized_props = normalized
         node.props_hash = hash(normalized)
         node.props_dirty = False
-    child_hash = 0
-    for child in node.children:
-        child_hash ^= getattr(child, "subtree_hash", 0)
+    # Ordered, so that reordering children changes the hash and is not skipped.
+    child_hash = hash(tuple(getattr(child, "subtree_hash", 0) for child in node.children))
     node.child_hash = child_hash
     node.subtree_hash = hash((node.component_name, node.props_hash, child_hash))
 
@@ -30,7 +30,7 @@ from .object_pool import (
 )
 from .optimization import PatchOptimizer
 from .patcher import TreePatcher
-from .reconciler import TreeReconciler
+from .reconciler import TreeReconciler, plan_keyed_moves
 from .scheduler import EffectScheduler, get_scheduler
 
 __all__ = [
@@ -62,6 +62,7 @@ __all__ = [
     "optimization",
     "pooled_patch",
     "patcher",
+    "plan_keyed_moves",
     "reconciler",
     "scheduler",
 ]
@@ -89,11 +89,12 @@ class PatchOptimizer:
     def _sort_patches(self, patches: list[Patch]) -> list[Patch]:
         """Sort patches for optimal application order."""
         from ornata.api.exports.definitions import PatchType
-        # Sort by operation type priority
+        # Sort by operation type priority. Keyed moves target the child list
+        # as it is after removals and before insertions, so they go in between.
         priority = {
             PatchType.REMOVE_NODE: 0,
-            PatchType.ADD_NODE: 1,
-            PatchType.MOVE_NODE: 2,
+            PatchType.MOVE_NODE: 1,
+            PatchType.ADD_NODE: 2,
             PatchType.UPDATE_PROPS: 3,
             PatchType.REPLACE_ROOT: 4,
         }
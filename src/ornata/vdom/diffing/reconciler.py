@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import threading
+from bisect import bisect_left
 from typing import TYPE_CHECKING, Any
 
 from ornata.api.exports.utils import get_logger
@@ -19,6 +20,87 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+def _longest_increasing_run(sequence: list[int]) -> bytearray:
+    """Mark the members of one longest strictly increasing subsequence of ``sequence``."""
+    tails: list[int] = []
+    tail_positions: list[int] = []
+    previous = [-1] * len(sequence)
+    for position, value in enumerate(sequence):
+        length = bisect_left(tails, value)
+        if length == len(tails):
+            tails.append(value)
+            tail_positions.append(position)
+        else:
+            tails[length] = value
+            tail_positions[length] = position
+        previous[position] = tail_positions[length - 1] if length else -1
+
+    marked = bytearray(len(sequence))
+    position = tail_positions[-1] if tail_positions else -1
+    while position >= 0:
+        marked[position] = 1
+        position = previous[position]
+    return marked
+
+
+def plan_keyed_moves(order: list[int]) -> list[tuple[int, int]]:
+    """Return the fewest ``(target, insert_at)`` moves that put retained children in order.
+
+    ``order[t]`` is the old position, among the children kept by both lists,
+    of the child that ends up at ``t``. Children on a longest increasing run
+    of ``order`` stay where they are and every other child is moved once.
+
+    Moves are meant to be applied in the returned order, after removals and
+    before insertions, with ``MOVE_NODE`` semantics (take the child out, then
+    insert it at ``insert_at``). ``insert_at`` is ``t`` plus the movers not
+    yet applied that still sit in front of the slot, which a Fenwick tree
+    over "stable children seen so far" counts in O(log n).
+    """
+    size = len(order)
+    stable = _longest_increasing_run(order)
+    stable_count = sum(stable)
+    if stable_count == size:
+        return []
+
+    stable_at_old = bytearray(size)
+    for target in range(size):
+        if stable[target]:
+            stable_at_old[order[target]] = 1
+    # A child's anchor is the number of stable children in front of it in the old order.
+    anchors = [0] * size
+    seen = 0
+    for position in range(size):
+        anchors[position] = seen
+        seen += stable_at_old[position]
+
+    tree = [0] * (stable_count + 2)
+    tree_size = len(tree)
+    for target in range(size):
+        if not stable[target]:
+            i = anchors[order[target]] + 1
+            while i < tree_size:
+                tree[i] += 1
+                i += i & -i
+
+    moves: list[tuple[int, int]] = []
+    placed = 0
+    for target in range(size):
+        if stable[target]:
+            placed += 1
+            continue
+        i = anchors[order[target]] + 1
+        while i < tree_size:
+            tree[i] -= 1
+            i += i & -i
+        pending = 0
+        i = placed
+        while i > 0:
+            pending += tree[i]
+            i -= i & -i
+        moves.append((target, target + pending))
+    return moves
+
+
 class TreeReconciler:
     """Reconciles VDOM trees to find differences."""
 
@@ -115,6 +197,8 @@ class TreeReconciler:
         old_dirty = bool(getattr(old_node, "props_dirty", False))
         new_dirty = bool(getattr(new_node, "props_dirty", False))
 
+        # Clean nodes carry up-to-date normalized props; equal snapshots mean
+        # equal props, different ones still need the per-key comparison below.
         old_norm = getattr(old_node, "normalized_props", None)
         new_norm = getattr(new_node, "normalized_props", None)
         if (
@@ -126,9 +210,6 @@ class TreeReconciler:
         ):
             return diffs
 
-        if not old_dirty and not new_dirty:
-            return diffs
-
         # Find changed and added properties
         for key, new_value in new_props.items():
             if key not in old_props or old_props[key] != new_value:
@@ -167,7 +248,7 @@ class TreeReconciler:
     ) -> list[Patch]:
         from ornata.api.exports.definitions import Patch
         if self._cython_keyed_fast is not None:
-            patches = self._cython_keyed_fast(
+            fast_patches: list[Patch] = self._cython_keyed_fast(
                 old_children,
                 new_children,
                 Patch.add_node,
@@ -176,44 +257,127 @@ class TreeReconciler:
                 self._reconcile_internal,
             )
             if trace_enabled:
-                self._log_keyed_events(patches)
-            return patches
+                self._log_keyed_events(fast_patches)
+            return fast_patches
         if self._cython_keyed_plan is not None:
             plan = self._cython_keyed_plan(old_children, new_children)
             return self._apply_keyed_plan(plan, trace_enabled)
 
         patches: list[Patch] = []
-        old_map: dict[str, tuple[int, VDOMNode]] = {
-            child.key: (idx, child) for idx, child in enumerate(old_children) if child.key is not None
-        }
-        seen: set[str] = set()
+        start, end_old, end_new, suffix_patches = self._trim_matching_ends(old_children, new_children, patches)
+        if start < end_old or start < end_new:
+            patches.extend(
+                self._reconcile_keyed_range(
+                    old_children[start:end_old], new_children[start:end_new], start, trace_enabled
+                )
+            )
+        for patch_list in reversed(suffix_patches):
+            patches.extend(patch_list)
+        return patches
 
-        for idx, new_child in enumerate(new_children):
-            key = new_child.key
-            if key is None:
-                continue
-            info = old_map.get(key)
-            if info is None:
-                patches.append(Patch.add_node(new_child))
-                if trace_enabled:
-                    logger.log(5, "Adding node '%s'", key)
-                continue
+    def _same_slot(self, old_child: VDOMNode, new_child: VDOMNode) -> bool:
+        """Return True when two children at matching ends of their lists are the same child."""
+        if old_child.key is None or new_child.key is None:
+            return old_child.key is None and new_child.key is None and old_child.component_name == new_child.component_name
+        return old_child.key == new_child.key
 
-            old_idx, old_child = info
-            seen.add(key)
-            if old_idx != idx:
-                patches.append(Patch.move_node(key, idx))
-                if trace_enabled:
-                    logger.log(5, "Moving node '%s' from %d to %d", key, old_idx, idx)
+    def _trim_matching_ends(
+        self,
+        old_children: list[VDOMNode],
+        new_children: list[VDOMNode],
+        patches: list[Patch],
+    ) -> tuple[int, int, int, list[list[Patch]]]:
+        """Diff the common head and tail of two child lists in place.
+
+        Head diffs are appended to ``patches``; tail diffs are returned
+        innermost first so callers can emit them after the middle.
+
+        Returns:
+            ``(start, end_old, end_new, suffix_patches)`` bounding the middle
+            sections that still need reconciling.
+        """
+        old_len = len(old_children)
+        new_len = len(new_children)
+        start = 0
+        while start < old_len and start < new_len:
+            old_child = old_children[start]
+            new_child = new_children[start]
+            if not self._same_slot(old_child, new_child):
+                break
             if self._nodes_differ(old_child, new_child):
                 patches.extend(self._reconcile_internal(old_child, new_child))
+            start += 1
+
+        suffix_patches: list[list[Patch]] = []
+        end_old = old_len
+        end_new = new_len
+        while end_old > start and end_new > start:
+            old_child = old_children[end_old - 1]
+            new_child = new_children[end_new - 1]
+            if not self._same_slot(old_child, new_child):
+                break
+            if self._nodes_differ(old_child, new_child):
+                suffix_patches.append(self._reconcile_internal(old_child, new_child))
+            end_old -= 1
+            end_new -= 1
+        return start, end_old, end_new, suffix_patches
+
+    def _reconcile_keyed_range(
+        self,
+        old_children: list[VDOMNode],
+        new_children: list[VDOMNode],
+        offset: int,
+        trace_enabled: bool,
+    ) -> list[Patch]:
+        """Reconcile keyed middle sections with the fewest moves.
 
-        for key, (_, _) in old_map.items():
-            if key not in seen:
+        Patches come out as removals, moves, insertions and then child
+        diffs, the order :func:`plan_keyed_moves` expects. ``offset`` is the
+        index of the first middle child within the parent.
+        """
+        from ornata.api.exports.definitions import Patch
+        patches: list[Patch] = []
+        new_keys = {child.key for child in new_children}
+        retained: dict[str | None, int] = {}
+        old_by_key: dict[str | None, VDOMNode] = {}
+        for old_child in old_children:
+            key = old_child.key
+            if key in new_keys:
+                retained[key] = len(retained)
+                old_by_key[key] = old_child
+            elif key is not None:
                 patches.append(Patch.remove_node(key))
                 if trace_enabled:
                     logger.log(5, "Removing node '%s'", key)
 
+        order: list[int] = []
+        kept: list[VDOMNode] = []
+        added: list[VDOMNode] = []
+        for new_child in new_children:
+            position = retained.get(new_child.key)
+            if position is None:
+                added.append(new_child)
+            else:
+                order.append(position)
+                kept.append(new_child)
+
+        for target, insert_at in plan_keyed_moves(order):
+            key = kept[target].key
+            if key is None:
+                continue
+            patches.append(Patch.move_node(key, offset + insert_at))
+            if trace_enabled:
+                logger.log(5, "Moving node '%s' from %d to %d", key, offset + order[target], offset + target)
+
+        for new_child in added:
+            patches.append(Patch.add_node(new_child))
+            if trace_enabled:
+                logger.log(5, "Adding node '%s'", new_child.key)
+
+        for new_child in kept:
+            old_child = old_by_key[new_child.key]
+            if self._nodes_differ(old_child, new_child):
+                patches.extend(self._reconcile_internal(old_child, new_child))
         return patches
 
     def _apply_keyed_plan(self, plan: list[tuple[Any, ...]], trace_enabled: bool) -> list[Patch]:
@@ -258,42 +422,30 @@ class TreeReconciler:
         new_children: list[VDOMNode],
         trace_enabled: bool,
     ) -> list[Patch]:
-        """Legacy reconciliation path for mixes of keyed/unkeyed nodes."""
+        """Reconciliation path for mixes of keyed/unkeyed nodes.
+
+        Matching heads and tails are trimmed first, pairing unkeyed children
+        of the same component by position. When only keyed children remain
+        in the middle they get the keyed move planner; otherwise the middle
+        falls back to set-based matching.
+        """
         from ornata.api.exports.definitions import Patch
         patches: list[Patch] = []
         append_patch = patches.append
 
-        old_len = len(old_children)
-        new_len = len(new_children)
-        start = 0
-
-        while start < old_len and start < new_len:
-            old_child = old_children[start]
-            new_child = new_children[start]
-            if old_child.key is None or new_child.key is None or old_child.key != new_child.key:
-                break
-            if self._nodes_differ(old_child, new_child):
-                patches.extend(self._reconcile_internal(old_child, new_child))
-            start += 1
-
-        if start == old_len and start == new_len:
+        start, end_old, end_new, suffix_patches = self._trim_matching_ends(old_children, new_children, patches)
+        if start == end_old and start == end_new:
+            for patch_list in reversed(suffix_patches):
+                patches.extend(patch_list)
             return patches
 
-        suffix_patches: list[list[Patch]] = []
-        end_old = old_len
-        end_new = new_len
-        while end_old > start and end_new > start:
-            old_child = old_children[end_old - 1]
-            new_child = new_children[end_new - 1]
-            if old_child.key is None or new_child.key is None or old_child.key != new_child.key:
-                break
-            if self._nodes_differ(old_child, new_child):
-                suffix_patches.append(self._reconcile_internal(old_child, new_child))
-            end_old -= 1
-            end_new -= 1
-
         trimmed_old = old_children[start:end_old]
         trimmed_new = new_children[start:end_new]
+        if all(child.key is not None for group in (trimmed_old, trimmed_new) for child in group):
+            patches.extend(self._reconcile_keyed_range(trimmed_old, trimmed_new, start, trace_enabled))
+            for patch_list in reversed(suffix_patches):
+                patches.extend(patch_list)
+            return patches
 
         oldkey_map: dict[str, VDOMNode] = {}
         newkey_map: dict[str, VDOMNode] = {}
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from types import SimpleNamespace
+from typing import TYPE_CHECKING
 
 import pytest
 
@@ -16,8 +17,12 @@ from ornata.definitions.dataclasses.layout import LayoutResult
 from ornata.definitions.dataclasses.rendering import GuiNode, RenderOutput
 from ornata.definitions.dataclasses.vdom import VDOMTree
 from ornata.rendering.backends.cli.input import CLIInputPipeline
+from ornata.rendering.backends.cli.scheduler import FrameScheduler
 from ornata.rendering.core.base_renderer import Renderer
 
+if TYPE_CHECKING:
+    from ornata.rendering.backends.cli.terminal_app import TerminalApp
+
 
 def _component(name: str) -> Component:
     component = Component(component_name=name)
@@ -159,6 +164,57 @@ def test_application_mount_accepts_component_instance(runtime_spy: list[object])
     assert app._builder() is component
 
 
+def test_application_cli_session_idles_until_invalidated(monkeypatch: pytest.MonkeyPatch, runtime_spy: list[object]) -> None:
+    """An idle CLI session renders nothing until state changes request a frame."""
+
+    app = Application()
+    app.mount(lambda: _component("Idle"))
+    frames: list[int] = []
+    scheduler = FrameScheduler(lambda: frames.append(1), fps=1000)
+    observed: dict[str, object] = {}
+
+    class FakeSession:
+        def __init__(self, stream: object) -> None:
+            self.stream = stream
+
+        def run(self, terminal_app: TerminalApp, *, fps: float) -> None:
+            observed["refresh_interval"] = terminal_app.refresh_interval
+            for _ in range(5):
+                scheduler.run_once(timeout=0.01)
+            observed["idle_frames"] = len(frames)
+            app.add_stylesheet("sheet.osts")
+            app.request_frame()
+            scheduler.run_once(timeout=0.01)
+
+        def request_frame(self) -> None:
+            scheduler.request_frame()
+
+        def stop(self) -> None:
+            return None
+
+    monkeypatch.setattr(application_module, "TerminalSession", FakeSession)
+    try:
+        app.run_loop(fps=60)
+    finally:
+        scheduler.close()
+
+    assert observed["refresh_interval"] is None
+    assert observed["idle_frames"] == 0
+    assert frames == [1]
+
+
+def test_application_mount_refresh_interval_is_opt_in(runtime_spy: list[object]) -> None:
+    """Only factories mounted with a refresh interval are redrawn periodically."""
+
+    app = Application()
+    app.mount(lambda: _component("Clock"), refresh_interval=0.5)
+    assert app._refresh_interval == 0.5  # noqa: SLF001
+    app.mount(lambda: _component("Static"))
+    assert app._refresh_interval is None  # noqa: SLF001
+    with pytest.raises(ValueError, match="refresh_interval"):
+        app.mount(lambda: _component("Bad"), refresh_interval=0)
+
+
 def test_application_run_loop_cli_stops_after_single_iteration(monkeypatch: pytest.MonkeyPatch, runtime_spy: list[object]) -> None:
     app = Application()
     component = _component("LoopRoot")
@@ -236,3 +236,76 @@ def test_runtime_iter_components_depth_first() -> None:
 
     sequence = [component.component_name for component in runtime._iter_components(root)]
     assert sequence == ["root", "child", "grandchild"]
+
+
+def _dashboard(status: str, rows: int = 3) -> Component:
+    """Build a fresh, unkeyed component tree like an application builder would."""
+
+    root = _component("Column")
+    for index in range(rows):
+        root.children.append(_component("Text", text=status if index == 1 else f"row {index}"))
+    return root
+
+
+def test_runtime_skips_frames_without_patches() -> None:
+    """Rebuilding an identical tree reuses the previous frame."""
+
+    runtime = OrnataRuntime(AppConfig())
+    first = runtime.run(_dashboard("idle"))
+    assert runtime.last_frame_stats.full_rebuild
+    assert runtime.last_frame_stats.restyled == 4
+
+    root = _dashboard("idle")
+    second = runtime.run(root)
+
+    assert second.unchanged
+    assert second.root is root
+    assert second.gui_tree is first.gui_tree
+    assert second.layout == first.layout
+    assert set(second.styles) == {id(component) for component in runtime._iter_components(root)}
+    stats = runtime.last_frame_stats
+    assert (stats.patches, stats.restyled, stats.dirty_layout_nodes, stats.gui_nodes_built) == (0, 0, 0, 0)
+
+
+def test_runtime_keeps_positional_keys_off_components() -> None:
+    """Positional keys live in the runtime, so application components are left untouched."""
+
+    runtime = OrnataRuntime(AppConfig())
+    runtime.run(_dashboard("idle"))
+    root = _dashboard("idle")
+
+    assert runtime.run(root).unchanged
+    assert all(component.key is None for component in runtime._iter_components(root))
+    assert runtime.vdom_tree.root is not None
+    assert [child.key for child in runtime.vdom_tree.root.children] == ["root/0", "root/1", "root/2"]
+
+
+def test_runtime_rebuilds_only_patched_subtrees() -> None:
+    """A changed component is restyled, relaid out and rebuilt on its own."""
+
+    runtime = OrnataRuntime(AppConfig())
+    first = runtime.run(_dashboard("idle"))
+    first_rows = list(first.gui_tree.children)
+
+    second = runtime.run(_dashboard("busy"))
+
+    assert not second.unchanged
+    stats = runtime.last_frame_stats
+    assert not stats.full_rebuild
+    assert (stats.patches, stats.restyled, stats.dirty_layout_nodes, stats.gui_nodes_built) == (1, 1, 1, 1)
+    assert second.gui_tree is first.gui_tree
+    assert second.gui_tree.children[1].text == "busy"
+    assert second.gui_tree.children[1] is not first_rows[1]
+    assert second.gui_tree.children[0] is first_rows[0]
+
+    # Appending a row only builds the new row.
+    runtime.run(_dashboard("busy", rows=4))
+    assert runtime.last_frame_stats.restyled == 1
+    assert len(runtime.last_gui_tree.children) == 4  # type: ignore[union-attr]
+
+    # A resized viewport relays out without restyling.
+    runtime._config.viewport_width = 60
+    resized = runtime.run(_dashboard("busy", rows=4))
+    assert not resized.unchanged
+    assert runtime.last_frame_stats.restyled == 0
+    assert resized.layout.width == 60
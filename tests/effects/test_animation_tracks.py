@@ -0,0 +1,141 @@
+"""Unit coverage for batched animation tracks and easing lookup tables."""
+
+from __future__ import annotations
+
+import gc
+import weakref
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ornata.api.exports.definitions import AnimationDirection, PatchType
+from ornata.api.exports.effects import (
+    AnimationEngine,
+    AnimationTracks,
+    ease_in_out_circ,
+    ease_in_out_cubic,
+    ease_out_bounce,
+    easing_lut,
+    easing_table,
+    sample_lut,
+)
+from ornata.effects.animation import easing as easing_module
+
+if TYPE_CHECKING:
+    from ornata.api.exports.definitions import Patch
+
+
+def _values(patches: list[Patch]) -> dict[tuple[str | None, str], float]:
+    return {(patch.key, prop): value for patch in patches for prop, value in patch.data.items()}
+
+
+@pytest.mark.parametrize("easing", [ease_in_out_cubic, ease_out_bounce])
+def test_easing_lut_matches_the_analytic_curve(easing) -> None:
+    """Interpolated table samples stay close to the easing function and are shared."""
+
+    table = easing_lut(easing)
+    assert easing_lut(easing) is table
+    for i in range(101):
+        t = i / 100
+        assert sample_lut(table, t) == pytest.approx(easing(t), abs=1e-3)
+    assert (sample_lut(table, -1.0), sample_lut(table, 2.0)) == (table[0], table[-1])
+
+
+_BUILTIN_EASINGS = {name: value for name, value in vars(easing_module).items() if name.startswith("ease_") or name == "linear_easing"}
+
+
+@pytest.mark.parametrize("name", sorted(_BUILTIN_EASINGS))
+def test_builtin_easings_animate_within_tolerance(name: str) -> None:
+    """Every built-in curve gets a table within 1e-3 of the function, or is left analytic because it cannot."""
+
+    easing = _BUILTIN_EASINGS[name]
+    lut = easing_lut(easing)
+    samples = [i / 4000 for i in range(4001)]
+    lut_error = max(abs(sample_lut(lut, t) - easing(t)) for t in samples)
+    assert (easing_table(easing) is None) == (lut_error > 1e-3)
+
+
+def test_tracks_evaluate_analytic_easings_exactly() -> None:
+    """Curves without a table are sampled from the easing function itself."""
+
+    tracks = AnimationTracks(tolerance=0.0)
+    tracks.add("card", "opacity", 0.0, 1.0, 1.0, easing=ease_in_out_circ)
+    patches = tracks.update(0.001)
+    assert patches[0].data["opacity"] == ease_in_out_circ(0.001)
+
+def test_easing_lut_cache_releases_old_easings() -> None:
+    """One-off easing lambdas are evicted from the table cache instead of kept alive."""
+
+    easing = lambda t: t * t  # noqa: E731
+    watcher = weakref.ref(easing)
+    easing_lut(easing)
+    del easing
+    for power in range(100):
+        easing_lut(lambda t, power=power: t**power)
+    gc.collect()
+    assert watcher() is None
+
+
+def test_update_emits_only_changed_values_grouped_per_component() -> None:
+    """Moving properties are patched together; delayed and settled ones are not."""
+
+    tracks = AnimationTracks()
+    tracks.add("card", "opacity", 0.0, 1.0, 1.0)
+    tracks.add("card", "translate_x", 10.0, 10.0, 1.0)  # never moves after its first frame
+    tracks.add("badge", "scale_x", 1.0, 2.0, 1.0, delay=0.5)
+
+    first = tracks.update(0.25)
+    assert [(patch.patch_type, patch.key) for patch in first] == [(PatchType.UPDATE_PROPS, "card")]
+    assert first[0].data == pytest.approx({"opacity": 0.25, "translate_x": 10.0})
+
+    second = tracks.update(0.5)
+    assert _values(second) == pytest.approx({("card", "opacity"): 0.75, ("badge", "scale_x"): 1.25})
+
+    final = tracks.update(1.0)
+    assert _values(final) == pytest.approx({("card", "opacity"): 1.0, ("badge", "scale_x"): 2.0})
+    assert len(tracks) == 0
+    assert tracks.update(0.1) == []
+
+
+def test_directions_loops_and_keyframe_stops() -> None:
+    """Reversed and alternating loops mirror progress; stops interpolate piecewise."""
+
+    tracks = AnimationTracks()
+    pulse = tracks.add("dot", "opacity", 0.0, 1.0, 1.0, loop=True, direction=AnimationDirection.ALTERNATE)
+    tracks.add("dot", "rotate", 0.0, 90.0, 1.0, direction=AnimationDirection.REVERSE)
+    tracks.add_keyframes("bar", "translate_y", [(1.0, 0.0), (0.0, 0.0), (0.5, 20.0)], 2.0)
+
+    expected = {("dot", "opacity"): 0.5, ("dot", "rotate"): 45.0, ("bar", "translate_y"): 10.0}
+    assert _values(tracks.update(0.5)) == pytest.approx(expected)
+    # 1.5 s in: the pulse is mirrored back to 0.5 and the bar descends to 10 again, so only the
+    # finished rotation is emitted.
+    assert _values(tracks.update(1.0)) == pytest.approx({("dot", "rotate"): 0.0})
+    tracks.update(1.0)
+    assert pulse in tracks and len(tracks) == 1
+
+
+def test_retargeting_and_cancelling_tracks() -> None:
+    """A new track on the same property replaces the old one; cancel drops a component's tracks."""
+
+    tracks = AnimationTracks()
+    old = tracks.add("row", "opacity", 0.0, 1.0, 1.0)
+    new = tracks.add("row", "opacity", 1.0, 0.0, 1.0)
+    tracks.add("row", "scale_y", 0.0, 1.0, 1.0)
+    tracks.add("other", "scale_y", 0.0, 1.0, 1.0)
+    assert old not in tracks and new in tracks and len(tracks) == 3
+
+    assert tracks.cancel("row") == 2
+    assert [patch.key for patch in tracks.update(0.5)] == ["other"]
+    assert tracks.cancel("other", "opacity") == 0
+    assert tracks.remove(new) is False
+    with pytest.raises(ValueError):
+        tracks.add("row", "opacity", 0.0, 1.0, 0.0)
+
+
+def test_engine_update_returns_track_patches() -> None:
+    """The animation engine advances its batched tracks alongside keyframe animations."""
+
+    engine = AnimationEngine()
+    engine.tracks.add("panel", "opacity", 0.0, 1.0, 0.2)
+    patches = engine.update_animations(0.1)
+    assert _values(patches) == pytest.approx({("panel", "opacity"): 0.5})
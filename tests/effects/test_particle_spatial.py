@@ -0,0 +1,83 @@
+"""Unit coverage for the particle spatial hash grid."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from ornata.api.exports.effects import ParticleOptimization, ParticlePhysics, ParticleStore, SpatialHashGrid
+
+
+def _scatter(store: ParticleStore, count: int, rng: random.Random) -> None:
+    for _ in range(count):
+        store.add(rng.uniform(-50, 150), rng.uniform(-50, 150), rng.uniform(-40, 40), rng.uniform(-40, 40), rng.uniform(0.1, 1.0))
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_grid_queries_match_brute_force_as_particles_move(vectorized: bool) -> None:
+    """Incremental syncs after motion and swap-removes answer like a full scan."""
+
+    if vectorized:
+        pytest.importorskip("numpy")
+    rng = random.Random(11)
+    store = ParticleStore(vectorized=vectorized)
+    _scatter(store, 400, rng)
+    grid = SpatialHashGrid(cell_size=10.0)
+    assert grid.sync(store) == 400
+    assert grid.sync(store) == 0  # unchanged store version
+
+    for _ in range(5):
+        store.age(0.1)
+        store.compact()
+        store.integrate(0.1)
+        _scatter(store, 20, rng)
+        xs, ys = list(store.column("x")), list(store.column("y"))
+
+        rect = (rng.uniform(-40, 80), rng.uniform(-40, 80), rng.uniform(0, 60), rng.uniform(0, 60))
+        left, top, width, height = rect
+        assert grid.query_rect(store, rect) == [i for i in range(len(store)) if left <= xs[i] <= left + width and top <= ys[i] <= top + height]
+        assert 0 < grid.stats().moved < len(store)
+
+        center, radius = (rng.uniform(0, 100), rng.uniform(0, 100)), rng.uniform(1, 30)
+        expected = [i for i in range(len(store)) if (xs[i] - center[0]) ** 2 + (ys[i] - center[1]) ** 2 <= radius * radius]
+        assert grid.query_radius(store, center, radius) == expected
+
+    stats = grid.stats()
+    assert stats.particles == len(store) == len(grid)
+    assert stats.occupied_cells > 0 and stats.max_per_cell >= stats.mean_per_cell
+    assert ParticleOptimization().cull_store(store, (0, 0, 100, 100), grid) == ParticleOptimization().cull_store(store, (0, 0, 100, 100))
+
+
+def test_radius_limited_repulsion_only_touches_nearby_particles() -> None:
+    """A mouse-style repulsor moves particles in range and leaves the rest alone."""
+
+    store = ParticleStore()
+    near = store.add(12.0, 10.0)
+    far = store.add(80.0, 80.0)
+    physics = ParticlePhysics({})
+    physics.apply_repulsion(store, (10.0, 10.0), 100.0, 0.1, radius=5.0)
+
+    assert store.particle(near).vx > 0 and store.particle(near).vy == 0
+    assert (store.particle(far).vx, store.particle(far).vy) == (0.0, 0.0)
+    assert physics.grid is not None and physics.grid.cell_size == 5.0
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_collisions_separate_overlapping_particles(vectorized: bool) -> None:
+    """Approaching discs are pushed apart and bounce back along the contact normal."""
+
+    if vectorized:
+        pytest.importorskip("numpy")
+    store = ParticleStore(vectorized=vectorized)
+    store.add(10.0, 10.0, vx=5.0, life=10.0)
+    store.add(11.0, 10.0, vx=-5.0, life=10.0)
+    store.add(40.0, 40.0, vx=1.0, life=10.0)
+    physics = ParticlePhysics({"collision_radius": 1.0})
+    physics.apply_physics(store, 0.0)
+
+    a, b, lone = store.to_particles()
+    assert b.x - a.x == pytest.approx(2.0)
+    assert (a.vx, b.vx) == pytest.approx((-5.0, 5.0))
+    assert (lone.x, lone.vx) == (40.0, 1.0)
+    assert physics.grid is not None and physics.grid.stats().particles == 3
@@ -0,0 +1,117 @@
+"""Unit coverage for the particle simulation worker and its snapshots."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from ornata.api.exports.definitions import BackendTarget
+from ornata.api.exports.effects import ParticleEngine, ParticleSimulationWorker, ParticleSystemConfig
+
+
+def _engine() -> tuple[ParticleEngine, str]:
+    engine = ParticleEngine()
+    config = ParticleSystemConfig(position=(0.0, 0.0), emission_rate=100.0, max_particles=50, lifetime=5.0, speed=(10.0, 0.0))
+    return engine, engine.create_system(config)
+
+
+def test_fixed_steps_accumulate_and_snapshots_interpolate() -> None:
+    """Elapsed time runs whole steps, and the remainder drives interpolation."""
+
+    engine, system_id = _engine()
+    worker = ParticleSimulationWorker(engine, step=0.01)
+    assert worker.latest() is None
+    assert worker.advance(0.004) == 0
+    assert worker.advance(0.021) == 2
+
+    snapshot = worker.latest()
+    assert snapshot is not None
+    assert (snapshot.tick, snapshot.count) == (2, 2)
+    assert snapshot.time == pytest.approx(0.02)
+    assert snapshot.remainder == pytest.approx(0.005)
+    assert snapshot.alpha(snapshot.published_at) == pytest.approx(0.5)
+    assert snapshot.alpha(snapshot.published_at + 1.0) == 1.0
+    assert snapshot.systems == ((system_id, 0, 2),)
+
+    xs, _ = snapshot.positions(1.0)
+    assert xs == pytest.approx([0.2, 0.1])
+    halfway = snapshot.particles(0.5)
+    assert [p.x for p in halfway] == pytest.approx([0.15, 0.05])
+    with pytest.raises((TypeError, ValueError)):
+        snapshot.columns["x"][0] = 1.0  # type: ignore[index]
+
+    # A long stall is clamped to max_steps instead of snowballing.
+    assert worker.advance(10.0) == worker.max_steps
+
+
+def test_pinned_snapshot_is_never_overwritten() -> None:
+    """While the renderer holds a snapshot the worker keeps simulating but skips publishing over it."""
+
+    engine, _ = _engine()
+    worker = ParticleSimulationWorker(engine, step=0.01)
+    worker.advance(0.01)
+    with worker.read() as pinned:
+        assert pinned is not None
+        frozen = list(pinned.columns["x"])
+        worker.advance(0.01)  # publishes into the other buffer
+        worker.advance(0.01)  # would reuse the pinned buffer: skipped
+        assert worker.skipped == 1
+        assert list(pinned.columns["x"]) == frozen
+        assert worker.latest() is not pinned
+    worker.advance(0.01)
+    latest = worker.latest()
+    assert latest is not None and latest.tick == 4
+    assert worker.published == 3
+
+
+def test_publish_copies_particles_emitted_after_counting(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Particles emitted from another thread between counting and copying still land in the snapshot."""
+
+    engine, first = _engine()
+    second = engine.create_system(ParticleSystemConfig(position=(5.0, 0.0), emission_rate=100.0, max_particles=50, lifetime=5.0))
+    worker = ParticleSimulationWorker(engine, step=0.01)
+    worker.advance(0.01)
+    worker.advance(0.01)  # both buffers now back a published snapshot
+    update_systems = engine.update_systems
+
+    def _update_then_race(delta_time: float) -> None:
+        update_systems(delta_time)
+        # Every emitter grows right after the worker counts it.
+        for _, emitter in engine.systems():
+            counted = emitter.get_particle_count
+
+            def _count_then_emit(emitter=emitter, counted=counted) -> int:
+                count = counted()
+                for _ in range(40):
+                    emitter._emit_particle()  # noqa: SLF001
+                return count
+
+            monkeypatch.setattr(emitter, "get_particle_count", _count_then_emit)
+
+    monkeypatch.setattr(engine, "update_systems", _update_then_race)
+    worker.advance(0.01)
+
+    snapshot = worker.latest()
+    assert snapshot is not None
+    assert snapshot.count == 86
+    assert snapshot.systems == ((first, 0, 43), (second, 43, 86))
+    assert list(snapshot.columns["x"][:43]) == pytest.approx([0.3, 0.2, 0.1] + [0.0] * 40)
+    assert set(snapshot.columns["x"][43:]) == {5.0}
+
+
+def test_engine_renders_from_worker_snapshots_while_running() -> None:
+    """Auto-update simulates on the worker thread and rendering reads its snapshots."""
+
+    engine, _ = _engine()
+    engine.start_auto_update(update_rate=200.0)
+    try:
+        deadline = time.monotonic() + 2.0
+        output = engine.render_particles(BackendTarget.GUI)
+        while output.metadata.get("particle_count", 0) == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+            output = engine.render_particles(BackendTarget.GUI)
+        assert output.metadata["particle_count"] > 0
+    finally:
+        engine.stop_auto_update()
+    assert engine._worker is None
@@ -0,0 +1,99 @@
+"""Coverage for the GPU memory block sub-allocator."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from ornata.api.exports.definitions import GPUMemoryError
+from ornata.api.exports.gpu import Allocator
+
+
+def _assert_disjoint(allocator: Allocator) -> None:
+    spans = sorted([(address, allocator._reserved[address]) for address in allocator._memory_blocks] + list(allocator._free_starts.items()))
+    for (start, size), (next_start, _) in zip(spans[:-1], spans[1:], strict=True):
+        assert start + size <= next_start
+
+
+def test_freed_space_is_reused_and_neighbours_coalesce() -> None:
+    """Freed ranges serve later requests and merge back into larger ranges."""
+
+    allocator = Allocator()
+    a, b, c, d = (allocator.allocate(256) for _ in range(4))
+    allocator.deallocate(a)
+    allocator.deallocate(c)
+    stats = allocator.get_stats()
+    assert (stats["freed_blocks"], stats["free_memory"], stats["fragmentation"]) == (2, 512, 50.0)
+
+    allocator.deallocate(b)  # joins a and c into one 768-byte range
+    stats = allocator.get_stats()
+    assert (stats["freed_blocks"], stats["largest_free_block"], stats["fragmentation"]) == (1, 768, 0.0)
+
+    e = allocator.allocate(700)
+    assert e.address == a.address
+    assert allocator.get_stats()["reused_allocations"] == 1
+    assert allocator.get_stats()["high_water_mark"] == 1024
+
+    allocator.deallocate(d)
+    allocator.deallocate(e)
+    stats = allocator.get_stats()
+    assert (stats["total_blocks"], stats["address_space"], stats["current_memory_usage"]) == (0, 0, 0)
+
+
+def test_alignment_padding_is_returned_to_the_free_lists() -> None:
+    """Aligned blocks respect their alignment and the padding before them stays usable."""
+
+    allocator = Allocator()
+    small = allocator.allocate(16)
+    aligned = allocator.allocate(64, alignment=256)
+    assert aligned.address is not None and aligned.address % 256 == 0
+    filler = allocator.allocate(200)
+    assert small.address is not None and filler.address == small.address + 16
+    with pytest.raises(GPUMemoryError):
+        allocator.allocate(64, alignment=24)
+
+
+def test_double_free_and_stale_blocks_are_rejected() -> None:
+    """A block cannot be freed twice, even after its address was handed out again."""
+
+    allocator = Allocator()
+    block = allocator.allocate(64)
+    allocator.deallocate(block)
+    replacement = allocator.allocate(64)
+    assert replacement.address == block.address
+    assert replacement.id != block.id
+    with pytest.raises(GPUMemoryError, match="already freed"):
+        allocator.deallocate(block)
+    allocator.deallocate(replacement)
+
+
+def test_random_churn_keeps_the_address_space_bounded() -> None:
+    """Long alloc/free churn stays near its peak usage instead of growing without bound."""
+
+    allocator = Allocator()
+    rng = random.Random(7)
+    live = []
+    for _ in range(5000):
+        if live and rng.random() < 0.5:
+            allocator.deallocate(live.pop(rng.randrange(len(live))))
+        else:
+            live.append(allocator.allocate(rng.randint(1, 4096), rng.choice((4, 16, 64, 256))))
+    _assert_disjoint(allocator)
+    assert all(block.address % block.alignment == 0 for block in live)
+
+    stats = allocator.get_stats()
+    assert stats["high_water_mark"] < 2 * stats["peak_memory_usage"]
+    assert stats["total_memory_allocated"] > 20 * stats["high_water_mark"]
+
+    moved = allocator.defragment()
+    _assert_disjoint(allocator)
+    assert moved and all(block.address % block.alignment == 0 for block in live)
+    packed = allocator.get_stats()
+    # Only alignment padding is left free between the packed blocks.
+    assert packed["address_space"] < stats["address_space"]
+    assert packed["free_memory"] < 256 * len(live)
+
+    for block in live:
+        allocator.deallocate(block)
+    assert allocator.get_stats()["address_space"] == 0
@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import json
+import random
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 import pytest
 
 from ornata.definitions.dataclasses.components import Component, ComponentMeasurement
 from ornata.definitions.dataclasses.layout import Bounds, LayoutStyle
+from ornata.definitions.dataclasses.vdom import VDOMTree
 from ornata.definitions.enums import BackendTarget
-from ornata.layout.engine.engine import LayoutEngine, LayoutNode, compute_layout
+from ornata.layout.algorithms.flex import FlexLayout
+from ornata.layout.engine.engine import LayoutEngine, LayoutNode, compute_layout, layout_fingerprint, relayout, sync_layout_node
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -113,6 +117,202 @@ def test_compute_layout_handles_positioning(layout_scenarios: dict[str, Any]) ->
     assert relative_result.y == relative_input["style"]["top"]
 
 
+def _snapshot(node: LayoutNode) -> list[tuple[int, int, int, int]]:
+    """Flatten the boxes of ``node`` and its descendants in tree order."""
+
+    boxes = [(node.layout.x, node.layout.y, node.layout.width, node.layout.height)]
+    for child in node.children:
+        boxes.extend(_snapshot(child))
+    return boxes
+
+
+def _build_table(texts: list[list[str]], calls: list[int]) -> LayoutNode:
+    """Build a column of rows whose cells measure the given texts."""
+
+    def make_measure(row: int, column: int) -> Any:
+        def measure(_: int | None, __: int | None) -> tuple[int, int]:
+            calls[0] += 1
+            text = texts[row][column]
+            return len(text), 1 + len(text) // 8
+
+        return measure
+
+    table = LayoutNode(LayoutStyle(direction="column"))
+    for row in range(len(texts)):
+        row_node = table.add(LayoutNode(LayoutStyle(direction="row", gap=1, align="start")))
+        for column in range(len(texts[row])):
+            row_node.add(LayoutNode(LayoutStyle(), measure=make_measure(row, column)))
+    return table
+
+
+def test_relayout_recomputes_only_dirty_paths() -> None:
+    """Editing one cell re-measures its row only and matches a full layout."""
+
+    texts = [[f"r{row}c{column}" for column in range(3)] for row in range(50)]
+    calls = [0]
+    table = _build_table(texts, calls)
+    compute_layout(table, 80, None)
+    assert not table.is_dirty
+
+    # Same width: the row keeps its size, so the table is not touched.
+    texts[10][1] = "R10C1"
+    table.children[10].children[1].mark_dirty()
+    assert table.is_dirty
+    calls[0] = 0
+    relayout(table, 80, None)
+    assert calls[0] == 2
+    assert not table.is_dirty
+
+    # Taller cell: the change propagates and later rows move down.
+    texts[20][0] = "a much longer cell"
+    table.children[20].children[0].mark_dirty()
+    calls[0] = 0
+    relayout(table, 80, None)
+    assert calls[0] == 2
+
+    reference = _build_table(texts, [0])
+    compute_layout(reference, 80, None)
+    assert _snapshot(table) == _snapshot(reference)
+    assert table.children[21].layout.y == reference.children[21].layout.y == 23
+
+
+def test_relayout_handles_structure_and_constraint_changes() -> None:
+    """Added children and new constraints fall back to recomputation."""
+
+    root = LayoutNode(LayoutStyle(direction="row"))
+    first = root.add(LayoutNode(LayoutStyle(width=4, height=1)))
+    compute_layout(root, 20, 5)
+
+    second = root.add(LayoutNode(LayoutStyle(width=6, height=2)))
+    assert second.parent is root
+    relayout(root, 20, 5)
+    assert (second.layout.x, second.layout.width) == (4, 6)
+
+    root.remove(first)
+    assert first.parent is None
+    relayout(root, 30, 5)
+    assert (second.layout.x, root.layout.width) == (0, 30)
+
+    second.set_style(LayoutStyle(width=9, height=2))
+    relayout(root, 30, 5)
+    assert second.layout.width == 9
+
+
+def test_relayout_reuses_unchanged_flexed_children() -> None:
+    """Flexed children are measured and resized by their parent without being recomputed."""
+
+    header_text = ["hi"]
+    panel_calls = [0]
+
+    def header_measure(_: int | None, __: int | None) -> tuple[int, int]:
+        return len(header_text[0]), 1
+
+    def panel_measure(_: int | None, __: int | None) -> tuple[int, int]:
+        panel_calls[0] += 1
+        return 3, 1
+
+    def build() -> LayoutNode:
+        root = LayoutNode(LayoutStyle(direction="column"))
+        root.add(LayoutNode(LayoutStyle(), measure=header_measure))
+        for _ in range(2):
+            panel = root.add(LayoutNode(LayoutStyle(direction="row", flex_grow=1)))
+            panel.add(LayoutNode(LayoutStyle(), measure=panel_measure))
+        return root
+
+    root = build()
+    header = root.children[0]
+    compute_layout(root, 40, 20)
+    assert all(panel._flexed for panel in root.children[1:])  # noqa: SLF001
+
+    # A wider header changes the root's size, so the root lays out its children again.
+    for text in ("hello", "hello there"):
+        header_text[0] = text
+        header.mark_dirty()
+        panel_calls[0] = 0
+        relayout(root, 40, 20)
+        assert panel_calls[0] == 0
+        reference = build()
+        compute_layout(reference, 40, 20)
+        assert _snapshot(root) == _snapshot(reference)
+
+
+def test_relayout_recomputes_flexed_child_sized_like_its_container() -> None:
+    """A flexed child whose new size equals the container size is laid out again, not just resized."""
+
+    def build(sizes: list[tuple[int, int]]) -> LayoutNode:
+        root = LayoutNode(LayoutStyle(direction="row", flex_grow=1, padding=1))
+        root.add(LayoutNode(LayoutStyle(flex_grow=2), measure=lambda _w, _h: sizes[0]))
+        column = root.add(LayoutNode(LayoutStyle(direction="column", flex_grow=1, height=20, gap=1, padding=1)))
+        column.add(LayoutNode(LayoutStyle(), measure=lambda _w, _h: sizes[1]))
+        return root
+
+    sizes = [(1, 0), (7, 3)]
+    root = build(sizes)
+    compute_layout(root, 15, 10)
+    sizes[0] = (2, 3)
+    root.children[0].mark_dirty()
+    relayout(root, 15, 10)
+
+    reference = build(sizes)
+    compute_layout(reference, 15, 10)
+    assert _snapshot(root) == _snapshot(reference)
+    assert root.children[1].children[0].layout.width == 15
+
+
+def _random_tree(rng: random.Random, depth: int, leaves: list[tuple[LayoutNode, list[int]]]) -> LayoutNode:
+    """Build a random flex tree; each leaf measures the mutable size recorded beside it in ``leaves``."""
+
+    if depth == 0 or rng.random() < 0.35:
+        size = [rng.randint(0, 9), rng.randint(0, 5)]
+
+        def measure(width: int | None, _: int | None) -> tuple[int, int]:
+            # Text-like leaves wrap onto more lines when narrowed.
+            columns = size[0] if width is None else min(size[0], width)
+            return columns, -(-size[0] * size[1] // max(1, columns))
+
+        leaf = LayoutNode(LayoutStyle(flex_grow=rng.choice([0, 0, 1, 2]), flex_shrink=rng.choice([0, 1])), measure=measure)
+        leaves.append((leaf, size))
+        return leaf
+    style = LayoutStyle(
+        direction=rng.choice(["row", "column"]),
+        flex_grow=rng.choice([0, 1, 2]),
+        flex_shrink=rng.choice([0, 1]),
+        gap=rng.randint(0, 2),
+        padding=rng.randint(0, 1),
+        width=rng.choice([None, None, rng.randint(5, 30)]),
+        height=rng.choice([None, None, rng.randint(5, 30)]),
+        justify=rng.choice(["start", "center", "space-between"]),
+        align=rng.choice(["start", "center", "stretch"]),
+    )
+    node = LayoutNode(style)
+    for _ in range(rng.randint(1, 4)):
+        node.add(_random_tree(rng, depth - 1, leaves))
+    return node
+
+
+@pytest.mark.parametrize("seed", range(60))
+def test_relayout_matches_full_layout_on_random_trees(seed: int) -> None:
+    """Relayout after random leaf edits gives the same boxes as laying out a fresh tree."""
+
+    leaves: list[tuple[LayoutNode, list[int]]] = []
+    root = _random_tree(random.Random(seed), 4, leaves)
+    rng = random.Random(-seed - 1)
+    width, height = rng.randint(5, 40), rng.choice([None, rng.randint(5, 30)])
+    compute_layout(root, width, height)
+
+    for _ in range(4):
+        for leaf, size in rng.sample(leaves, min(len(leaves), rng.randint(1, 2))):
+            size[:] = [rng.randint(0, 9), rng.randint(0, 5)]
+            leaf.mark_dirty()
+        relayout(root, width, height)
+
+        reference_leaves: list[tuple[LayoutNode, list[int]]] = []
+        reference = _random_tree(random.Random(seed), 4, reference_leaves)
+        for (_, target), (_, source) in zip(reference_leaves, leaves, strict=True):
+            target[:] = source
+        compute_layout(reference, width, height)
+        assert _snapshot(root) == _snapshot(reference)
+
 class SyntheticComponent(Component):
     """Concrete component used to exercise :class:`LayoutEngine`."""
 
@@ -190,6 +390,96 @@ def test_layout_engine_caches_results() -> None:
     assert stats_after_second["cache_size"] == 1
 
 
+def _build_tree(label_width: int) -> SyntheticComponent:
+    """Return a fresh two-level tree whose label measures ``label_width`` cells."""
+
+    label = SyntheticComponent("Label", LayoutStyle(), measurement=ComponentMeasurement(width=label_width, height=1))
+    button = SyntheticComponent("Button", LayoutStyle(width=8, height=1))
+    return SyntheticComponent("Root", LayoutStyle(direction="column", gap=1), children=[label, button])
+
+
+def test_layout_engine_cache_is_structural() -> None:
+    """Rebuilt but equivalent trees hit; style or text changes miss."""
+
+    engine = LayoutEngine()
+    bounds = Bounds(0, 0, 80, 24)
+
+    first = engine.calculate_layout(_build_tree(5), bounds, BackendTarget.CLI)
+    assert engine.calculate_layout(_build_tree(5), bounds, BackendTarget.CLI) is first
+    stats = engine.get_layout_stats()
+    assert (stats["cache_hits"], stats["cache_misses"], stats["cache_size"]) == (1, 1, 1)
+
+    engine.calculate_layout(_build_tree(6), bounds, BackendTarget.CLI)
+    tree = _build_tree(5)
+    tree.children[1].get_layout_style().height = 3
+    engine.calculate_layout(tree, bounds, BackendTarget.CLI)
+    assert engine.get_layout_stats()["cache_misses"] == 3
+
+    # Registering a constraint starts a new generation.
+    engine.add_constraint(TrackingConstraint())
+    engine.calculate_layout(_build_tree(5), bounds, BackendTarget.CLI)
+    stats = engine.get_layout_stats()
+    assert (stats["cache_generation"], stats["cache_misses"]) == (1, 4)
+
+
+def test_layout_engine_cache_evicts_least_recently_used() -> None:
+    """The cache stays bounded and evicts the oldest untouched entry."""
+
+    engine = LayoutEngine(cache_size=2)
+    component = SyntheticComponent("Sized", LayoutStyle(width=4, height=2))
+    for width in (10, 20, 10, 30):
+        engine.calculate_layout(component, Bounds(0, 0, width, 5), BackendTarget.CLI)
+
+    stats = engine.get_layout_stats()
+    assert (stats["cache_size"], stats["cache_max_size"], stats["cache_evictions"]) == (2, 2, 1)
+    engine.calculate_layout(component, Bounds(0, 0, 10, 5), BackendTarget.CLI)
+    assert engine.get_layout_stats()["cache_hits"] == 2
+
+    engine.clear_cache()
+    assert engine.get_layout_stats()["cache_size"] == 0
+
+
+def test_layout_fingerprint_is_memoized_until_marked_dirty() -> None:
+    """Repeated probes reuse fingerprints; a dirty leaf only re-fingerprints its own path."""
+
+    calls: list[int] = []
+
+    def _leaf(index: int) -> LayoutNode:
+        def _measure(_: int | None, __: int | None) -> tuple[int, int]:
+            calls.append(index)
+            return (index + 1, 1)
+
+        return LayoutNode(style=LayoutStyle(), measure=_measure)
+
+    def _tree() -> LayoutNode:
+        return LayoutNode(
+            style=LayoutStyle(direction="column"),
+            children=[LayoutNode(style=LayoutStyle(), children=[_leaf(0), _leaf(1)]), _leaf(2)],
+        )
+
+    root = _tree()
+    first = layout_fingerprint(root)
+    assert sorted(calls) == [0, 1, 2]
+    assert layout_fingerprint(root) is first
+    assert sorted(calls) == [0, 1, 2]
+
+    calls.clear()
+    root.children[0].children[1].mark_dirty()
+    assert layout_fingerprint(root) == first
+    assert calls == [1]
+
+    root.children[1].style.width = 4
+    root.children[1].mark_dirty()
+    assert layout_fingerprint(root) != first
+    calls.clear()
+    assert layout_fingerprint(_tree()) == first
+
+    component = _build_tree(5)
+    before = layout_fingerprint(component)
+    component.children[1].get_layout_style().height = 3
+    assert layout_fingerprint(component) != before
+
+
 def test_layout_engine_applies_constraints() -> None:
     """Registered constraints must mutate the final layout result."""
 
@@ -205,3 +495,120 @@ def test_layout_engine_applies_constraints() -> None:
     assert constraint.apply_calls == 1
     assert result.width == (style.width or 0) + constraint.delta_width
     assert result.height == (style.height or 0) + constraint.delta_height
+
+
+def _toolbar(buttons: int, hidden: int | None = None) -> SyntheticComponent:
+    """Return a row of fixed-size buttons spread with ``space-between``."""
+
+    children = [SyntheticComponent(f"Button{index}", LayoutStyle(width=4 + index, height=1)) for index in range(buttons)]
+    if hidden is not None:
+        children[hidden].get_layout_style().display = "none"
+    return SyntheticComponent("Toolbar", LayoutStyle(direction="row", justify="space-between", gap=1), children=children)
+
+
+def test_flex_layout_reuses_nodes_and_leaves_styles_untouched() -> None:
+    """Repeated layouts reuse each component's node and produce identical results."""
+
+    flex = FlexLayout()
+    toolbar = _toolbar(4, hidden=1)
+    bounds = Bounds(0, 0, 480, 80)  # 60x5 cells
+
+    first = flex.calculate(toolbar, bounds, BackendTarget.CLI)
+    node = sync_layout_node(toolbar)
+    positions = [(child.layout.x, child.layout.width) for child in node.children if child.style.display != "none"]
+    second = flex.calculate(toolbar, bounds, BackendTarget.CLI)
+
+    assert sync_layout_node(toolbar) is node
+    assert (first.width, first.height) == (second.width, second.height)
+    assert [(child.layout.x, child.layout.width) for child in node.children if child.style.display != "none"] == positions
+    # Justify spacing no longer accumulates into the style's gap.
+    assert toolbar.get_layout_style().gap == 1
+    # The hidden button is skipped without shifting its siblings' styles.
+    assert positions == [(0, 4), (25, 6), (52, 7)]
+
+    toolbar.children.append(SyntheticComponent("Extra", LayoutStyle(width=2, height=1)))
+    flex.calculate(toolbar, bounds, BackendTarget.CLI)
+    assert sync_layout_node(toolbar) is node
+    assert len(node.children) == 5
+
+
+def test_sync_layout_node_keeps_nodes_out_of_component_props() -> None:
+    """Persistent nodes live beside components, so VDOM props are unaffected by layout."""
+
+    toolbar = _toolbar(3)
+    before = VDOMTree()._component_to_node(toolbar).props  # noqa: SLF001
+    node = sync_layout_node(toolbar)
+
+    assert VDOMTree()._component_to_node(toolbar).props.keys() == before.keys()  # noqa: SLF001
+    assert all(value is not node for value in vars(toolbar).values())
+    assert sync_layout_node(toolbar) is node
+
+
+def test_flex_layout_solves_independent_trees_concurrently() -> None:
+    """One shared instance lays out disjoint trees from many threads."""
+
+    flex = FlexLayout()
+    bounds = Bounds(0, 0, 640, 160)
+    trees = [_toolbar(3 + index % 5) for index in range(32)]
+    expected = [flex.calculate(_toolbar(3 + index % 5), bounds, BackendTarget.CLI) for index in range(32)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda tree: flex.calculate(tree, bounds, BackendTarget.CLI), trees))
+
+    assert [(r.width, r.height) for r in results] == [(r.width, r.height) for r in expected]
+    for index, tree in enumerate(trees):
+        reference = _toolbar(3 + index % 5)
+        flex.calculate(reference, bounds, BackendTarget.CLI)
+        assert [child.layout.x for child in sync_layout_node(tree).children] == [child.layout.x for child in sync_layout_node(reference).children]
+
+
+def _dashboard(panels: int) -> LayoutNode:
+    """Return a column of flexible panels, each holding a row of three cells."""
+
+    root = LayoutNode(LayoutStyle(direction="column", gap=1))
+    for index in range(panels):
+        cells = [LayoutNode(LayoutStyle(width=3 + (index + cell) % 4, height=1 + cell, flex_grow=cell)) for cell in range(3)]
+        root.add(LayoutNode(LayoutStyle(direction="row", gap=1, padding=1, flex_grow=index % 2), children=cells))
+    return root
+
+
+def _boxes(node: LayoutNode) -> list[tuple[int, int, int, int]]:
+    """Return every node's box in depth-first order."""
+
+    boxes = [(node.layout.x, node.layout.y, node.layout.width, node.layout.height)]
+    for child in node.children:
+        boxes.extend(_boxes(child))
+    return boxes
+
+
+def test_layout_engine_parallel_pass_matches_serial_layout() -> None:
+    """Independent subtrees fan out to workers and produce the serial result."""
+
+    serial_tree = _dashboard(200)
+    compute_layout(serial_tree, 120, 2000)
+
+    engine = LayoutEngine(parallel=True, max_workers=4, min_parallel_subtree=32)
+    try:
+        tree = _dashboard(200)
+        result = engine.layout_tree(tree, 120, 2000)
+        assert _boxes(tree) == _boxes(serial_tree)
+        assert (result.width, result.height) == (serial_tree.layout.width, serial_tree.layout.height)
+        stats = engine.pass_stats
+        # One batch for the panels' natural sizes, one for the flexed panels.
+        assert stats.parallel_batches == 2
+        assert stats.parallel_tasks > 2
+        assert stats.passes == 1 and stats.last_seconds > 0
+
+        tree.children[3].children[0].style = LayoutStyle(width=9, height=1)
+        tree.children[3].children[0].mark_dirty()
+        engine.layout_tree(tree, 120, 2000, incremental=True)
+        serial_tree.children[3].children[0].style = LayoutStyle(width=9, height=1)
+        compute_layout(serial_tree, 120, 2000)
+        assert _boxes(tree) == _boxes(serial_tree)
+
+        # Trees below twice the minimum task size never leave the calling thread.
+        engine.layout_tree(_dashboard(10), 120, 200)
+        assert (engine.pass_stats.parallel_batches, engine.pass_stats.parallel_passes) == (0, 2)
+        assert engine.get_layout_stats()["layout_passes"] == 3
+    finally:
+        engine.close()
@@ -0,0 +1,80 @@
+"""Unit coverage for variable-height virtual scrolling."""
+
+from __future__ import annotations
+
+import random
+
+from ornata.api.exports.definitions import LayoutStyle, VirtualScrollConfig
+from ornata.api.exports.layout import HeightIndex, LayoutNode, VirtualScrollContainer, create_virtual_scroll_node
+
+
+def test_height_index_matches_naive_prefix_sums() -> None:
+    """Offsets, lookups, updates and resizes agree with a plain list of heights."""
+
+    rng = random.Random(7)
+    heights = [rng.randint(0, 4) for _ in range(300)]
+    index = HeightIndex(len(heights), default_height=2)
+    for position, height in enumerate(heights):
+        index.set(position, height)
+
+    for _ in range(200):
+        if rng.random() < 0.3:
+            position = rng.randrange(len(heights))
+            heights[position] = rng.randint(0, 4)
+            index.set(position, heights[position])
+        elif rng.random() < 0.1:
+            size = rng.randint(0, 400)
+            heights = heights[:size] + [2] * max(0, size - len(heights))
+            index.resize(size)
+        assert len(index) == len(heights)
+        assert index.total == sum(heights)
+        probe = rng.randint(0, len(heights))
+        assert index.offset_of(probe) == sum(heights[:probe])
+        if heights and sum(heights):
+            offset = rng.randrange(sum(heights))
+            found = index.index_at(offset)
+            assert sum(heights[:found]) <= offset < sum(heights[: found + 1])
+
+    assert HeightIndex().index_at(5) == 0
+
+
+def test_variable_heights_scroll_a_million_items() -> None:
+    """Visible ranges follow measured heights and nodes are recycled, not rebuilt."""
+
+    def height_of(index: int) -> int:
+        return 1 + index % 3
+
+    built: list[int] = []
+
+    def render(_: object, index: int) -> LayoutNode:
+        built.append(index)
+        return LayoutNode(style=LayoutStyle(height=height_of(index)))
+
+    def recycle(node: LayoutNode, index: int) -> LayoutNode:
+        node.style.height = height_of(index)
+        return node
+
+    config = VirtualScrollConfig(viewport_height=12, overscan=0, total_items=1_000_000)
+    container = VirtualScrollContainer(config, render, item_recycler=recycle)
+    container.update_config()
+    # Twelve items are rendered at the estimated height, then measured: 1+2+3+1+2+3 fill the viewport.
+    assert container.get_visible_range() == (0, 6)
+    assert container.get_total_height() == 1_000_000 - 12 + 24
+
+    container.scroll_to(600_000)
+    start, end = container.get_visible_range()
+    assert (start, end) == (600_000, 600_006)
+    assert container.get_scroll_offset_height() == 600_000 - 12 + 24
+    assert len(built) == 12  # every later item reused a pooled node
+
+    node = create_virtual_scroll_node(container)
+    assert [child.layout.y for child in node.children] == [0, 1, 3, 6, 7, 9]
+
+    container.set_item_height(600_001, 10)
+    assert container.get_visible_range() == (600_000, 600_003)
+    container.scroll_to_offset(container.get_item_offset(999_999))
+    assert container.get_visible_range() == (999_999, 1_000_000)
+    container.set_scroll_position(0.0)
+    assert container.get_visible_range()[0] == 0
+    container.set_scroll_position(1.0)
+    assert container.get_visible_range()[1] == 1_000_000
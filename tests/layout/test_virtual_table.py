@@ -0,0 +1,185 @@
+"""Unit coverage for virtualized table rows."""
+
+from __future__ import annotations
+
+import pytest
+
+from ornata.api.exports.definitions import GuiNode, RowProvider
+from ornata.api.exports.layout import TableRowSource, VirtualTable
+from ornata.components.table import TableComponent
+from ornata.core.runtime import OrnataRuntime
+from ornata.definitions.dataclasses.components import Component, ComponentContent
+from ornata.definitions.dataclasses.core import AppConfig
+from ornata.rendering.backends.cli.rasterizer import NodeRasterizer
+
+
+class _Fetcher:
+    """Callable row source over a million synthetic rows that records each fetch."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[int, int]] = []
+
+    def __call__(self, start: int, stop: int) -> list[list[object]]:
+        self.calls.append((start, stop))
+        return [[index, f"row {index}"] for index in range(start, stop)]
+
+
+def test_virtual_table_fetches_and_formats_only_visible_rows() -> None:
+    """A million-row source is read one window at a time and formatted lines are cached."""
+
+    fetch = _Fetcher()
+    table = VirtualTable(fetch, length=1_000_000, viewport_rows=10, overscan=5)
+    assert len(table) == 1_000_000
+    assert isinstance(table.source, RowProvider)
+
+    lines = table.visible_lines(8, 17)
+    assert len(lines) == 10
+    assert lines[0] == "0        row 0   "
+    assert fetch.calls == [(0, 15)]
+
+    table.scroll_to(500_000)
+    lines = table.visible_lines(8, 17)
+    assert (lines[0], lines[-1]) == ("500000   row 5000", "500009   row 5000")
+    assert fetch.calls[-1] == (499_995, 500_015)
+    assert table.rows_fetched == 35
+    assert table.rows_formatted == 20
+
+    # Scrolling back reuses formatted lines without touching the source.
+    table.scroll_to(0)
+    assert table.visible_lines(8, 17)[0] == "0        row 0   "
+    assert len(fetch.calls) == 2
+    assert table.rows_formatted == 20
+
+    # The last page is clamped to the end of the data.
+    table.scroll_to(2_000_000)
+    assert table.visible_range() == (999_999, 1_000_000)
+    assert table.visible_lines(8, 17) == ["999999   row 9999"]
+
+
+def test_row_sources_adapt_sequences_iterators_and_growing_callables() -> None:
+    """Iterators are consumed lazily and callable lengths are re-read on refresh."""
+
+    consumed: list[int] = []
+
+    def generate():
+        for index in range(100):
+            consumed.append(index)
+            yield (index,)
+
+    source = TableRowSource(generate(), length=100)
+    assert source.fetch(2, 4) == [(2,), (3,)]
+    assert len(consumed) == 4
+    assert source.fetch(0, 1) == [(0,)]
+    assert len(consumed) == 4
+
+    assert TableRowSource([[1], [2], [3]]).fetch(1, 10) == [[2], [3]]
+    with pytest.raises(ValueError):
+        TableRowSource(iter(()))
+    with pytest.raises(TypeError):
+        TableRowSource(42)  # type: ignore[arg-type]
+
+    log: list[list[str]] = [["boot"]]
+    table = VirtualTable(lambda start, stop: log[start:stop], length=lambda: len(log), viewport_rows=3)
+    assert table.visible_lines(6, 6) == ["boot  "]
+    log.extend([["ready"], ["serve"]])
+    table.refresh()
+    assert table.visible_lines(6, 6) == ["boot  ", "ready ", "serve "]
+
+
+def test_rasterizer_draws_visible_rows_of_a_virtual_table() -> None:
+    """The CLI rasterizer sizes the viewport from the node and draws only what fits."""
+
+    fetch = _Fetcher()
+    table = TableComponent(columns=["id", "name"], row_source=fetch, row_count=1_000_000).virtual_rows
+    assert table is not None
+    table.scroll_to(41)
+    node = GuiNode(component_name="Table", columns=["id", "name"], virtual_rows=table, x=0, y=0, width=22, height=8)
+    buffer = NodeRasterizer(22, 8).rasterize(node)
+
+    def line(y: int) -> str:
+        return "".join(buffer.get_cell(x, y).char for x in range(1, 21)).rstrip()  # type: ignore[union-attr]
+
+    assert line(1) == "id        name"
+    assert [line(y) for y in range(3, 7)] == [f"{index:<9} row {index}" for index in range(41, 45)]
+    assert table.visible_range() == (41, 45)
+    assert table.rows_formatted == 4
+
+
+
+def test_rasterizer_skips_the_body_of_a_table_with_no_room_for_rows() -> None:
+    """A table only tall enough for its header draws no rows and fetches nothing."""
+
+    fetch = _Fetcher()
+    table = TableComponent(columns=["id", "name"], row_source=fetch, row_count=1_000_000).virtual_rows
+    assert table is not None
+    node = GuiNode(component_name="Table", columns=["id", "name"], virtual_rows=table, x=0, y=0, width=22, height=4)
+    buffer = NodeRasterizer(22, 8).rasterize(node)
+
+    def line(y: int) -> str:
+        return "".join(buffer.get_cell(x, y).char for x in range(1, 21)).rstrip()  # type: ignore[union-attr]
+
+    assert line(1) == "id        name"
+    assert [line(y) for y in range(4, 8)] == [""] * 4
+    assert fetch.calls == []
+    assert table.rows_formatted == 0
+
+def test_builder_tables_reconcile_without_patches_and_keep_their_viewport() -> None:
+    """Wrapping the same rows in a new table each frame is a no-op that keeps scroll state."""
+
+    rows: list[list[object]] = [[index, f"row {index}"] for index in range(100)]
+
+    def build() -> Component:
+        status = Component(component_name="Text")
+        status.content = ComponentContent(text="idle")
+        root = Component(component_name="Column")
+        root.children.extend([status, TableComponent(columns=["id", "name"], row_source=rows)])
+        return root
+
+    runtime = OrnataRuntime(AppConfig())
+    table = runtime.run(build()).gui_tree.children[1].virtual_rows
+    assert table is not None
+    assert TableComponent(row_source=rows).virtual_rows == table
+    table.scroll_to(40)
+
+    assert runtime.run(build()).unchanged
+    stats = runtime.last_frame_stats
+    assert (stats.patches, stats.restyled, stats.dirty_layout_nodes, stats.gui_nodes_built) == (0, 0, 0, 0)
+
+    # Appended rows change the table's props; the rebuilt node keeps the retained table.
+    rows.append([100, "row 100"])
+    frame = runtime.run(build())
+    assert not frame.unchanged
+    assert frame.gui_tree.children[1].virtual_rows is table
+    assert table.scroll_offset == 40
+    assert len(table.visible_lines(8, 17)) == 20
+    assert len(table) == 101
+    table.scroll_to(100)
+    assert table.visible_lines(8, 17)[-1] == "100      row 100 "
+
+
+def test_bumped_revision_reformats_rows_edited_in_place() -> None:
+    """An in-place edit patches the table once the builder bumps the revision."""
+
+    rows: list[list[object]] = [[index, f"row {index}"] for index in range(10)]
+    revision = 0
+
+    def build() -> Component:
+        root = Component(component_name="Column")
+        root.children.append(TableComponent(columns=["id", "name"], row_source=rows, row_revision=revision))
+        return root
+
+    runtime = OrnataRuntime(AppConfig())
+    table = runtime.run(build()).gui_tree.children[0].virtual_rows
+    assert table is not None
+    assert table.visible_lines(8, 17)[3] == "3        row 3   "
+
+    rows[3][1] = "edited"
+    assert TableComponent(row_source=rows).virtual_rows == table
+    revision += 1
+    assert TableComponent(row_source=rows, row_revision=revision).virtual_rows != table
+
+    frame = runtime.run(build())
+    assert not frame.unchanged
+    assert frame.gui_tree.children[0].virtual_rows is table
+    assert table.revision == 1
+    assert table.visible_lines(8, 17)[3] == "3        edited  "
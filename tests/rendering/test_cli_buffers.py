@@ -0,0 +1,271 @@
+"""Unit coverage for CLI cell buffers and their ANSI output."""
+
+from __future__ import annotations
+
+from ornata.definitions.dataclasses.styling import ANSIColor, BackendStylePayload, ResolvedStyle
+from ornata.definitions.enums import BackendTarget
+from ornata.definitions.flags import CellAttribute
+from ornata.rendering.backends.cli.ansi.colors import (
+    ANSI_256_PALETTE,
+    nearest_ansi_16,
+    nearest_ansi_256,
+    parse_ansi_color,
+    quantize_color,
+)
+from ornata.rendering.backends.cli.ansi_diff import ANSIDiffRenderer
+from ornata.rendering.backends.cli.ansi_renderer import ANSIRenderer
+from ornata.rendering.backends.cli.cells import (
+    WIDE_CONTINUATION,
+    Cell,
+    CellBuffer,
+    PackedCellBuffer,
+    Segment,
+    create_cell_buffer,
+    pack_attributes,
+)
+from ornata.rendering.backends.cli.rasterizer import RasterContext
+from ornata.rendering.backends.tty.vt100 import get_text_width
+from ornata.utils.unicode_width import char_widths, clip_to_width, fit_to_width, text_width
+
+RED = ANSIColor(255, 0, 0)
+BLUE = ANSIColor(0, 0, 255)
+BLACK = ANSIColor(0, 0, 0)
+
+
+def _paint(buffer: CellBuffer | PackedCellBuffer) -> None:
+    """Apply the same drawing operations to ``buffer``."""
+
+    buffer.clear(BLACK)
+    buffer.fill_rect(1, 1, 6, 2, char=".", fg=BLUE, bg=RED)
+    buffer.write_segment(2, 0, Segment("Hello", fg=RED, bold=True, underline=True))
+    buffer.write_segment(8, 3, Segment("clipped text", italic=True), inherited_bg=BLUE)
+    buffer.set_cell(0, 4, Cell("#", fg=BLUE, bg=BLACK, reverse=True))
+
+
+def test_packed_cell_buffer_matches_object_grid() -> None:
+    """``PackedCellBuffer`` should expose the same cells as ``CellBuffer``."""
+
+    grid = CellBuffer(12, 5, default_bg=BLACK)
+    packed = PackedCellBuffer(12, 5, default_bg=BLACK)
+    _paint(grid)
+    _paint(packed)
+
+    for y in range(5):
+        for x in range(12):
+            assert packed.get_cell(x, y) == grid.get_cell(x, y)
+    assert packed.get_cell(12, 0) is None
+    assert packed.get_dirty_spans() == grid.get_dirty_spans()
+    assert [(x, y) for x, y, _ in packed.get_dirty_cells()] == [(x, y) for x, y, _ in grid.get_dirty_cells()]
+    assert ANSIRenderer().render(packed).text == ANSIRenderer().render(grid).text
+
+
+def test_packed_cell_buffer_interns_colors_and_packs_attributes() -> None:
+    """Colors are stored once in the palette and attributes as bitflags."""
+
+    packed = PackedCellBuffer(4, 2)
+    packed.write_segment(0, 0, Segment("ab", fg=RED, bg=BLUE, bold=True, strikethrough=True))
+    packed.write_segment(0, 1, Segment("cd", fg=ANSIColor(255, 0, 0)))
+
+    assert packed.intern_color(RED) == packed.intern_color(ANSIColor(255, 0, 0))
+    assert packed.intern_color(None) == 0
+    assert packed.palette_color(packed.intern_color(BLUE)) == BLUE
+    assert pack_attributes(Segment("x", bold=True, strikethrough=True)) == CellAttribute.BOLD | CellAttribute.STRIKETHROUGH
+
+    cell = packed.get_cell(1, 0)
+    assert cell is not None
+    assert (cell.char, cell.fg, cell.bg, cell.bold, cell.strikethrough, cell.italic) == ("b", RED, BLUE, True, True, False)
+
+    # Views are snapshots; mutating them does not touch the arrays.
+    cell.char = "z"
+    assert packed.get_cell(1, 0) == Cell("b", fg=RED, bg=BLUE, bold=True, strikethrough=True)
+
+
+def test_packed_cell_buffer_resize_and_negative_writes() -> None:
+    """Resizing preserves content and writes clip at both edges."""
+
+    packed = create_cell_buffer(4, 2, packed=True)
+    assert isinstance(packed, PackedCellBuffer)
+    assert packed.write_segment(-2, 0, Segment("xyABCDEF")) == 4
+    assert "".join(packed.get_cell(x, 0).char for x in range(4)) == "ABCD"  # type: ignore[union-attr]
+
+    packed.resize(6, 3)
+    assert (packed.width, packed.height) == (6, 3)
+    assert packed.get_cell(3, 0) == Cell("D")
+    assert packed.get_cell(5, 2) == Cell(" ")
+    assert isinstance(create_cell_buffer(2, 2), CellBuffer)
+
+
+def test_dirty_spans_track_rows_not_cells() -> None:
+    """Writes extend one span per row; clearing resets tracking."""
+
+    buffer = PackedCellBuffer(20, 4)
+    assert not buffer.is_dirty()
+    buffer.write_segment(5, 1, Segment("abc"))
+    buffer.set_cell(2, 1, Cell("x"))
+    buffer.fill_rect(10, 2, 4, 2, char="#")
+    assert buffer.get_dirty_spans() == [(1, 2, 8), (2, 10, 14), (3, 10, 14)]
+
+    buffer.clear_dirty()
+    assert not buffer.is_dirty()
+    buffer.resize(20, 2)
+    assert buffer.get_dirty_spans() == [(0, 0, 20), (1, 0, 20)]
+
+
+def test_text_width_counts_terminal_columns() -> None:
+    """Wide, combining, joined and control characters get their terminal widths."""
+
+    assert text_width("plain") == 5
+    assert text_width("日本語") == 6
+    assert text_width("cafe\u0301") == 4
+    assert text_width("\U0001f468\u200d\U0001f469\u200d\U0001f467") == 2
+    assert text_width("\U0001f44d\U0001f3fd") == 2
+    assert text_width("\U0001f468\U0001f3fd\u200d\U0001f4bb") == 2
+    assert text_width("\u26a0\ufe0f") == 2
+    assert char_widths("\u26a0\ufe0fx") == [2, 0, 1]
+    assert text_width("a\tb") == 2
+    assert char_widths("Ａ\u200bx") == [2, 0, 1]
+    assert get_text_width("\x1b[1;31m漢字\x1b[0m!") == 5
+
+    assert clip_to_width("ab漢字", 3) == "ab"
+    assert fit_to_width("漢字", 3) == "漢 "
+    assert fit_to_width("ok", 4) == "ok  "
+    assert text_width(fit_to_width("表格テスト", 7)) == 7
+
+
+def test_wide_glyphs_take_two_cells_in_both_buffers() -> None:
+    """Wide characters write a continuation cell; cut halves become spaces."""
+
+    for buffer in (CellBuffer(6, 2), PackedCellBuffer(6, 2)):
+        assert buffer.write_segment(0, 0, Segment("a日本語")) == 6
+        row = [buffer.get_cell(x, 0).char for x in range(6)]  # type: ignore[union-attr]
+        assert row == ["a", "日", WIDE_CONTINUATION, "本", WIDE_CONTINUATION, " "]
+
+        # Overwriting the right half of 日 blanks its left half as well.
+        buffer.set_cell(2, 0, Cell("x"))
+        assert [buffer.get_cell(x, 0).char for x in range(3)] == ["a", " ", "x"]  # type: ignore[union-attr]
+
+        # A glyph cut by the left edge leaves a space; accents compose.
+        assert buffer.write_segment(-1, 1, Segment("語e\u0301")) == 2
+        assert [buffer.get_cell(x, 1).char for x in range(2)] == [" ", "é"]  # type: ignore[union-attr]
+
+        # VS16 widens a text-style symbol; its reserved column stays blank.
+        assert buffer.write_segment(3, 1, Segment("\u26a0\ufe0f!")) == 3
+        assert [buffer.get_cell(x, 1).char for x in range(3, 6)] == ["\u26a0", " ", "!"]  # type: ignore[union-attr]
+
+    diff = ANSIDiffRenderer()
+    packed = PackedCellBuffer(8, 1)
+    diff.render(packed)
+    packed.write_segment(1, 0, Segment("漢字!"))
+    assert diff.render(packed) == "\x1b[1;2H漢字!"
+    assert ANSIRenderer().render(packed).text.startswith(" 漢字! ")
+
+    # A changed wide glyph advances the terminal cursor two columns even when its right half is unchanged.
+    packed = PackedCellBuffer(16, 1)
+    packed.write_segment(2, 0, Segment("你"))
+    diff.render(packed)
+    packed.write_segment(2, 0, Segment("好"))
+    packed.write_segment(12, 0, Segment("X"))
+    assert diff.render(packed) == "\x1b[1;3H好\x1b[8CX"
+
+
+def test_diff_renderer_emits_only_changed_runs() -> None:
+    """After the first full frame only changed cells are written."""
+
+    diff = ANSIDiffRenderer()
+    buffer = PackedCellBuffer(40, 10, default_bg=BLACK)
+    buffer.clear()
+    first = diff.render(buffer)
+    assert diff.last_stats.full_redraw
+    assert diff.last_stats.cells_changed == 400
+    assert not buffer.is_dirty()
+
+    # Re-rasterizing identical content produces no output at all.
+    buffer.clear()
+    assert diff.render(buffer) == ""
+    assert diff.last_stats.cells_changed == 0
+
+    buffer.write_segment(3, 2, Segment("ok", fg=RED, bg=BLACK))
+    frame = diff.render(buffer)
+    assert frame == "\x1b[3;4H\x1b[38;2;255;0;0;48;2;0;0;0mok\x1b[0m"
+    assert diff.last_stats.runs == 1
+    assert diff.last_stats.bytes_written < len(first) // 10
+
+
+def test_diff_renderer_merges_gaps_and_coalesces_sgr() -> None:
+    """Nearby runs share one cursor move and SGR only changes what differs."""
+
+    diff = ANSIDiffRenderer()
+    buffer = CellBuffer(30, 3)
+    diff.render(buffer)
+
+    buffer.write_segment(0, 0, Segment("ab", fg=RED, bold=True))
+    buffer.write_segment(4, 0, Segment("cd", fg=RED))
+    buffer.write_segment(20, 0, Segment("e", fg=BLUE))
+    buffer.write_segment(0, 1, Segment("f", fg=BLUE))
+    frame = diff.render(buffer)
+
+    assert diff.last_stats.runs == 3
+    # The gap is bridged in place, the jump to column 21 is relative and the
+    # next row is reached with CR LF rather than an absolute move.
+    assert frame == (
+        "\x1b[H\x1b[1;38;2;255;0;0mab\x1b[0m  \x1b[38;2;255;0;0mcd"
+        "\x1b[14C\x1b[38;2;0;0;255me\r\nf\x1b[0m"
+    )
+
+    # Dropping one attribute while keeping colors uses its SGR off code.
+    buffer.write_segment(0, 2, Segment("gh", fg=RED, bold=True, italic=True))
+    buffer.write_segment(2, 2, Segment("i", fg=RED, bold=True))
+    assert "\x1b[23mi" in diff.render(buffer)
+
+
+def _distance(a: ANSIColor, b: ANSIColor) -> int:
+    """Return the squared RGB distance between two colors."""
+    return (a.red - b.red) ** 2 + (a.green - b.green) ** 2 + (a.blue - b.blue) ** 2
+
+
+def test_ansi_color_tables_parse_and_quantize() -> None:
+    """Escape sequences decode through the tables; truecolor maps to the nearest entry."""
+
+    assert parse_ansi_color("\x1b[38;2;1;2;3m") == ANSIColor(1, 2, 3)
+    assert parse_ansi_color("\x1b[48;5;196m") == ANSIColor(255, 0, 0)
+    assert parse_ansi_color("\x1b[38;5;232m") == ANSIColor(8, 8, 8)
+    assert parse_ansi_color("\x1b[91m") == ANSIColor(255, 85, 85)
+    assert parse_ansi_color("\x1b[38;5;300m") is None
+    assert parse_ansi_color("#ff0000") is None
+    assert parse_ansi_color("\x1b[48;5;196m") is parse_ansi_color("\x1b[48;5;196m")
+
+    samples = [ANSIColor(r, g, b) for r in range(0, 256, 37) for g in range(0, 256, 41) for b in range(0, 256, 43)]
+    for color in samples:
+        best = min(range(16, 256), key=lambda index: _distance(color, ANSI_256_PALETTE[index]))
+        assert _distance(color, ANSI_256_PALETTE[nearest_ansi_256(color)]) == _distance(color, ANSI_256_PALETTE[best])
+    assert nearest_ansi_256(ANSIColor(128, 128, 128)) == 244
+    assert nearest_ansi_16(ANSIColor(250, 10, 10)) == 1
+    assert nearest_ansi_16(ANSIColor(250, 80, 80)) == 9
+    assert quantize_color(ANSIColor(250, 10, 10), "256") == ANSIColor(255, 0, 0)
+    assert quantize_color(RED, "truecolor") is RED
+
+    # Without truecolor the renderers emit the nearest palette index.
+    buffer = CellBuffer(1, 1)
+    buffer.set_cell(0, 0, Cell("x", fg=ANSIColor(130, 130, 130)))
+    assert "38;5;244" in ANSIRenderer(use_truecolor=False).render(buffer).text
+
+
+def test_ansi_256_palette_uses_xterm_cube_levels() -> None:
+    """Cube and gray entries quantize back to their own index."""
+
+    assert ANSI_256_PALETTE[22] == ANSIColor(0, 95, 0)
+    assert nearest_ansi_256(ANSIColor(0, 100, 0)) == 22
+    for index in range(16, 256):
+        assert nearest_ansi_256(ANSI_256_PALETTE[index]) == index
+
+
+def test_raster_context_is_shared_when_style_changes_nothing() -> None:
+    """Children whose styles repeat the parent's reuse its context."""
+
+    root = RasterContext(inherited_bg=BLACK)
+    assert root.with_style(None) is root
+
+    red = ResolvedStyle(color="\x1b[38;2;255;0;0m")
+    child = root.with_style(BackendStylePayload(backend=BackendTarget.CLI, style=red))
+    assert (child.inherited_fg, child.inherited_bg) == (RED, BLACK)
+    assert child.with_style(BackendStylePayload(backend=BackendTarget.CLI, style=red)) is child
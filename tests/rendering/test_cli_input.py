@@ -0,0 +1,117 @@
+"""Unit coverage for the incremental CLI input parser and chunked stdin reader."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from ornata.definitions.dataclasses.events import KeyEvent, MouseEvent
+from ornata.definitions.enums import MouseEventType
+from ornata.rendering.backends.cli.input import StdinReader
+from ornata.rendering.backends.cli.input_parser import PASTE_END, PASTE_START, InputParser, coalesce_motion
+
+
+def _keys(items: list[object]) -> list[str]:
+    """Return the key tokens of the key events in ``items``."""
+    return [item.key for item in items if isinstance(item, KeyEvent)]
+
+
+def test_parser_decodes_keys_modifiers_and_shares_events() -> None:
+    """CSI, SS3, control and alt sequences map to tokens; events are interned."""
+
+    parser = InputParser()
+    items = parser.feed("aA \r\x7f\t\x03\x1b[A\x1b[1;5C\x1b[3~\x1b[5;2~\x1bOP\x1b[15~\x1b[Z\x1bx")
+    assert _keys(items) == [
+        "a", "A", "space", "enter", "backspace", "tab", "ctrl+c",
+        "up", "ctrl+right", "delete", "shift+page_up", "f1", "f5", "shift+tab", "alt+x",
+    ]
+    ctrl_right = items[8]
+    assert isinstance(ctrl_right, KeyEvent)
+    assert ctrl_right.ctrl and not ctrl_right.shift and ctrl_right.modifiers == frozenset({"ctrl"})
+    assert parser.feed("a")[0] is items[0]
+    assert not parser.pending
+
+
+def test_parser_resumes_sequences_split_across_reads() -> None:
+    """Every split point of a sequence yields the same result; a lone ESC waits for flush."""
+
+    data = "\x1b[1;5A\x1b[<0;10;5M\x1bOQ"
+    expected = InputParser().feed(data)
+    for split in range(1, len(data)):
+        parser = InputParser()
+        assert parser.feed(data[:split]) + parser.feed(data[split:]) == expected
+
+    parser = InputParser()
+    assert parser.feed("\x1b") == []
+    assert parser.pending
+    assert _keys(parser.flush()) == ["escape"]
+    assert parser.flush() == []
+
+
+def test_parser_decodes_sgr_mouse_and_coalesces_motion() -> None:
+    """SGR reports become mouse events; runs of moves collapse to the last one."""
+
+    parser = InputParser()
+    moves = "".join(f"\x1b[<35;{x};3M" for x in range(1, 201))
+    items = parser.feed("\x1b[<0;5;2M" + moves + "\x1b[<0;5;2m\x1b[<65;1;1M\x1b[<16;2;2M")
+    assert len(items) == 204
+
+    press = items[0]
+    assert isinstance(press, MouseEvent)
+    assert (press.event_type, press.x, press.y, press.button_name) == (MouseEventType.BUTTON_DOWN, 4, 1, "mouse_left")
+
+    batch = coalesce_motion(items)
+    assert len(batch) == 5
+    move = batch[1]
+    assert isinstance(move, MouseEvent)
+    assert (move.event_type, move.x, move.y) == (MouseEventType.MOVE, 199, 2)
+    assert [item.event_type for item in batch[2:] if isinstance(item, MouseEvent)] == [
+        MouseEventType.BUTTON_UP,
+        MouseEventType.SCROLL_DOWN,
+        MouseEventType.BUTTON_DOWN,
+    ]
+    assert batch[4].modifiers == frozenset({"ctrl"})  # type: ignore[union-attr]
+
+
+def test_bracketed_paste_is_one_item_even_when_split() -> None:
+    """Pasted text, including escape bytes, arrives as one string."""
+
+    body = ("line \x1b[A\n" * 1200)[:10_000]
+    data = "x" + PASTE_START + body + PASTE_END + "y"
+    for split in (3, 8, len(data) - 4, len(data) - 2):
+        parser = InputParser()
+        items = parser.feed(data[:split])
+        assert parser.in_paste or split < len(PASTE_START) + 1
+        items += parser.feed(data[split:])
+        assert items[1] == body
+        assert _keys([items[0], items[2]]) == ["x", "y"]
+        assert len(items) == 3
+
+
+def test_stdin_reader_drains_a_burst_in_one_call() -> None:
+    """A 10 KB paste plus keys written at once is decoded by a single read_events call."""
+
+    if os.name == "nt":
+        pytest.skip("chunked stdin reading needs POSIX pipes")
+    read_fd, write_fd = os.pipe()
+    try:
+        reader = StdinReader(read_fd, chunk_size=4096)
+        body = "é" * 5000
+        os.write(write_fd, (PASTE_START + body + PASTE_END + "q\x1b").encode())
+        items = reader.read_events()
+        assert items[0] == body
+        assert _keys(items[1:]) == ["q"]
+        assert reader.pending
+        assert _keys(reader.flush()) == ["escape"]
+        assert reader.bytes_read == len(body.encode()) + 14
+        assert reader.read_events() == []
+
+        os.close(write_fd)
+        write_fd = -1
+        with pytest.raises(EOFError):
+            reader.read_events()
+    finally:
+        os.close(read_fd)
+        if write_fd >= 0:
+            os.close(write_fd)
@@ -0,0 +1,177 @@
+"""Unit coverage for the event-driven CLI frame scheduler."""
+
+from __future__ import annotations
+
+import io
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from ornata.rendering.backends.cli.scheduler import FrameScheduler
+
+
+class _Clock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_frame_requests_are_coalesced_and_paced() -> None:
+    """Many requests yield one frame, and frames respect the frame rate."""
+
+    clock = _Clock()
+    frames: list[float] = []
+    scheduler = FrameScheduler(lambda: frames.append(clock.now), fps=10, clock=clock)
+    try:
+        assert not scheduler.run_once(timeout=0)
+        for _ in range(5):
+            scheduler.request_frame()
+        assert scheduler.run_once(timeout=0)
+        assert frames == [100.0]
+
+        scheduler.request_frame()
+        assert not scheduler.run_once(timeout=0)
+        clock.now += 0.1
+        assert scheduler.run_once(timeout=0)
+        assert frames == [100.0, 100.1]
+        assert not scheduler.frame_pending
+        assert scheduler.stats.frames == 2
+    finally:
+        scheduler.close()
+
+
+def test_idle_scheduler_blocks_until_woken_from_another_thread() -> None:
+    """An idle loop sleeps in the selector and wakes on a cross-thread request."""
+
+    frames: list[int] = []
+    scheduler = FrameScheduler(lambda: frames.append(1), fps=60)
+    try:
+        assert not scheduler.run_once(timeout=0.01)
+        timer = threading.Timer(0.05, scheduler.request_frame)
+        timer.start()
+        rendered = False
+        for _ in range(3):
+            rendered = scheduler.run_once(timeout=5.0) or rendered
+            if rendered:
+                break
+        timer.join()
+        assert rendered
+        assert frames == [1]
+    finally:
+        scheduler.close()
+
+
+def test_animation_frames_timers_and_overruns() -> None:
+    """rAF callbacks run once before render; slow frames are reported."""
+
+    clock = _Clock()
+    order: list[str] = []
+    overruns: list[tuple[float, float]] = []
+
+    def render() -> None:
+        order.append("render")
+        clock.now += 0.05
+
+    scheduler = FrameScheduler(render, fps=50, on_overrun=lambda elapsed, budget: overruns.append((elapsed, budget)), clock=clock)
+    try:
+        scheduler.request_animation_frame(lambda timestamp: order.append(f"raf@{timestamp}"))
+        cancelled = scheduler.request_animation_frame(lambda timestamp: order.append("cancelled"))
+        scheduler.cancel_animation_frame(cancelled)
+        assert scheduler.run_once(timeout=0)
+        assert order == ["raf@100.0", "render"]
+        assert scheduler.stats.overruns == 1
+        assert overruns and overruns[0][1] == scheduler.frame_budget
+
+        ticks: list[float] = []
+        handle = scheduler.call_later(0.5, lambda: ticks.append(clock.now), interval=0.5)
+        clock.now += 0.5
+        scheduler.run_once(timeout=0)
+        clock.now += 0.5
+        scheduler.run_once(timeout=0)
+        handle.cancel()
+        clock.now += 0.5
+        scheduler.run_once(timeout=0)
+        assert len(ticks) == 2
+        assert scheduler.stats.frames == 1
+    finally:
+        scheduler.close()
+
+
+def test_terminal_session_renders_only_requested_frames() -> None:
+    """The session renders on its refresh timer and stops when the app quits."""
+
+    # The session imports console bindings that fail to load on some hosts.
+    try:
+        from ornata.rendering.backends.cli import terminal_app
+    except Exception as exc:  # pragma: no cover - depends on the host
+        pytest.skip(f"terminal session unavailable: {exc}")
+
+    class CountingApp(terminal_app.TerminalApp):
+        def __init__(self) -> None:
+            super().__init__()
+            self.renders = 0
+            self.refresh_interval = 0.01
+
+        def render(self) -> str:
+            self.renders += 1
+            if self.renders == 4:
+                self.should_quit = True
+            return f"frame {self.renders}"
+
+    stream = io.StringIO()
+    session = terminal_app.TerminalSession(stream)
+    app = CountingApp()
+    session.run(app, fps=200)
+
+    output = stream.getvalue()
+    assert app.renders == 4
+    assert "frame 1" in output and "frame 4" in output
+    assert session.scheduler is None
+    assert output.endswith("\x1b[?1049l")
+
+
+@pytest.mark.parametrize("script", [None, "x\nq\n"], ids=["dev-null", "file"])
+def test_terminal_session_runs_with_redirected_stdin(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, script: str | None) -> None:
+    """A stdin that is not a terminal is polled line by line instead of crashing the session."""
+
+    try:
+        from ornata.rendering.backends.cli import terminal_app
+    except Exception as exc:  # pragma: no cover - depends on the host
+        pytest.skip(f"terminal session unavailable: {exc}")
+
+    class KeyApp(terminal_app.TerminalApp):
+        def __init__(self) -> None:
+            super().__init__()
+            self.keys: list[str] = []
+            self.renders = 0
+            self.refresh_interval = 0.01
+
+        def on_key(self, key: str) -> None:
+            self.keys.append(key)
+            if key == "q":
+                self.should_quit = True
+
+        def render(self) -> str:
+            self.renders += 1
+            if self.renders == 30:
+                self.should_quit = True
+            return f"frame {self.renders}"
+
+    path = Path(os.devnull)
+    if script is not None:
+        path = tmp_path / "keys.txt"
+        path.write_text(script)
+    with open(path) as stdin:
+        monkeypatch.setattr("sys.stdin", stdin)
+        stream = io.StringIO()
+        app = KeyApp()
+        terminal_app.TerminalSession(stream).run(app, fps=200)
+
+    assert app.keys == ([] if script is None else ["x", "q"])
+    assert stream.getvalue().endswith("\x1b[?1049l")
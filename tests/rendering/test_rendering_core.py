@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import random
 from collections import deque
 from typing import Any
 
@@ -146,6 +147,145 @@ def test_compositor_blend_modes_track_dirty_regions() -> None:
     compositor.clear_all_layers()
 
 
+def _make_noise_surface(width: int, height: int, seed: int) -> PixelSurface:
+    """Return a ``PixelSurface`` filled with deterministic pseudo-random pixels."""
+
+    rng = random.Random(seed)
+    data = [[tuple(rng.randrange(256) for _ in range(4)) for _ in range(width)] for _ in range(height)]
+    return PixelSurface(width=width, height=height, data=data)  # type: ignore[arg-type]
+
+
+def test_compositor_blends_pixels_without_aliasing_sources() -> None:
+    """The bottom layer is copied, blends apply and sources stay untouched."""
+
+    compositor = CoreCompositor(width=1, height=1, vectorized=False)
+    base = _make_pixel_surface((10, 10, 10, 255))
+    compositor.add_layer(Layer(name="base", surface=base, blend_mode=BlendMode.ALPHA, z_index=0))
+    compositor.add_layer(Layer(name="add", surface=_make_pixel_surface((5, 0, 0, 255)), blend_mode=BlendMode.ADD, z_index=1))
+
+    result = compositor.compose()
+    assert isinstance(result, PixelSurface)
+    assert result.get_pixel(0, 0) == (15, 10, 10, 255)
+    assert base.get_pixel(0, 0) == (10, 10, 10, 255)
+
+
+def test_compositor_vectorized_blends_match_fallback() -> None:
+    """NumPy blending should reproduce the per-pixel path exactly."""
+
+    pytest.importorskip("numpy")
+    modes = [BlendMode.ALPHA, BlendMode.ADD, BlendMode.REPLACE, BlendMode.MULTIPLY, BlendMode.SCREEN, BlendMode.OVERLAY]
+
+    results = []
+    for vectorized in (False, True):
+        compositor = CoreCompositor(width=9, height=7, vectorized=vectorized)
+        assert compositor.vectorized is vectorized
+        compositor.add_layer(Layer(name="base", surface=_make_noise_surface(9, 7, 0), z_index=0))
+        for index, mode in enumerate(modes, start=1):
+            layer = Layer(name=f"layer-{index}", surface=_make_noise_surface(8, 6, index), blend_mode=mode, z_index=index)
+            layer.transform.opacity = 1.0 if index % 2 else 0.6  # type: ignore[union-attr]
+            compositor.add_layer(layer)
+        result = compositor.compose()
+        assert isinstance(result, PixelSurface)
+        results.append([[result.get_pixel(x, y) for x in range(9)] for y in range(7)])
+
+    assert results[0] == results[1]
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_compositor_recomposites_only_damaged_regions(vectorized: bool) -> None:
+    """Surface damage is re-blended in place and matches a full composition."""
+
+    if vectorized:
+        pytest.importorskip("numpy")
+
+    def build() -> tuple[CoreCompositor, PixelSurface]:
+        compositor = CoreCompositor(width=12, height=8, vectorized=vectorized)
+        compositor.add_layer(Layer(name="base", surface=_make_noise_surface(12, 8, 1), z_index=0))
+        overlay = _make_noise_surface(10, 8, 2)
+        compositor.add_layer(Layer(name="overlay", surface=overlay, blend_mode=BlendMode.OVERLAY, z_index=1))
+        compositor.compose()
+        assert compositor.last_stats.full
+        assert compositor.last_stats.pixels_recomposited == 96
+        return compositor, overlay
+
+    compositor, overlay = build()
+    first = compositor.compose()
+    assert compositor.last_stats.pixels_skipped == 96
+
+    # A blinking cursor touches two neighbouring pixels; they merge into one rect.
+    overlay.set_pixel(3, 2, (200, 10, 10, 255))
+    overlay.set_pixel(4, 2, (10, 200, 10, 128))
+    result = compositor.compose()
+    stats = compositor.last_stats
+    assert result is first
+    assert (stats.full, stats.regions, stats.pixels_recomposited, stats.pixels_skipped) == (False, 1, 2, 94)
+
+    reference, reference_overlay = build()
+    reference_overlay.data = overlay.data
+    reference.invalidate_region(0, 0, 12, 8)
+    expected = reference.compose()
+    assert reference.last_stats.regions == 1
+    pixels = [[result.get_pixel(x, y) for x in range(12)] for y in range(8)]  # type: ignore[attr-defined]
+    assert pixels == [[expected.get_pixel(x, y) for x in range(12)] for y in range(8)]  # type: ignore[attr-defined]
+
+    compositor.set_layer_visibility("overlay", False)
+    compositor.compose()
+    assert compositor.last_stats.pixels_recomposited == 80
+    assert compositor.get_dirty_regions() == []
+
+
+
+def test_compositor_vectorized_converts_only_the_dirty_region(monkeypatch: pytest.MonkeyPatch) -> None:
+    """List-backed layers are sliced to the damaged rect before NumPy conversion."""
+
+    pytest.importorskip("numpy")
+    from ornata.rendering.core import compositor as compositor_module
+
+    converted: list[tuple[int, ...]] = []
+    pixel_array = compositor_module._pixel_array
+
+    def spy(surface: PixelSurface, bounds: tuple[int, int, int, int]) -> Any:
+        array = pixel_array(surface, bounds)
+        converted.append(array.shape)
+        return array
+
+    compositor = CoreCompositor(width=64, height=32, vectorized=True)
+    compositor.add_layer(Layer(name="base", surface=_make_noise_surface(64, 32, 1), z_index=0))
+    overlay = _make_noise_surface(64, 32, 2)
+    compositor.add_layer(Layer(name="overlay", surface=overlay, blend_mode=BlendMode.ALPHA, z_index=1))
+    compositor.compose()
+
+    monkeypatch.setattr(compositor_module, "_pixel_array", spy)
+    overlay.set_pixel(10, 5, (200, 10, 10, 255))
+    overlay.set_pixel(11, 5, (10, 200, 10, 128))
+    compositor.compose()
+
+    assert compositor.last_stats.pixels_recomposited == 2
+    assert converted == [(1, 2, 4), (1, 2, 4)]
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_compositor_clear_all_layers_drops_previous_pixels(vectorized: bool) -> None:
+    """Clearing the layers invalidates the cached composition."""
+
+    if vectorized:
+        pytest.importorskip("numpy")
+
+    compositor = CoreCompositor(width=4, height=2, vectorized=vectorized)
+    red = PixelSurface(width=4, height=2, data=[[(255, 0, 0, 255)] * 4 for _ in range(2)])  # type: ignore[arg-type]
+    compositor.add_layer(Layer(name="red", surface=red, z_index=0))
+    compositor.compose()
+
+    compositor.clear_all_layers()
+    assert compositor.get_dirty_regions() == [(0, 0, 4, 2)]
+    small = PixelSurface(width=2, height=1, data=[[(0, 0, 255, 255)] * 2])  # type: ignore[arg-type]
+    compositor.add_layer(Layer(name="small", surface=small, z_index=0))
+    result = compositor.compose()
+
+    assert isinstance(result, PixelSurface)
+    assert result.get_pixel(0, 0) == (0, 0, 255, 255)
+    assert result.get_pixel(3, 1) == (0, 0, 0, 0)
+
+
 def test_render_pipeline_renders_and_tracks_metrics(monkeypatch: pytest.MonkeyPatch) -> None:
     """``RenderPipeline`` should orchestrate layout, render, and composition stages."""
 
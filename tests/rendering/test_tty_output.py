@@ -0,0 +1,94 @@
+"""Unit coverage for frame-buffered terminal output."""
+
+from __future__ import annotations
+
+import io
+import os
+
+import pytest
+
+from ornata.definitions.enums import BackendTarget
+from ornata.rendering.backends.tty.output import FrameWriter
+from ornata.rendering.backends.tty.renderer import TTYRenderer
+
+
+class _CountingStream(io.StringIO):
+    """In-memory stream that counts write calls."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        return super().write(text)
+
+
+def test_frame_is_written_once_and_synchronized() -> None:
+    """Writes inside a frame are joined, wrapped in mode 2026 and written once."""
+
+    stream = _CountingStream()
+    writer = FrameWriter(stream, synchronized=True)
+    with writer.frame():
+        writer.write("\x1b[1;1H")
+        with writer.frame():
+            writer.write("héllo")
+        writer.flush()
+        assert stream.writes == 0
+    assert stream.getvalue() == "\x1b[?2026h\x1b[1;1Hhéllo\x1b[?2026l"
+    assert stream.writes == 1
+    assert writer.stats.last_syscalls == 1
+    assert writer.stats.last_bytes == len(stream.getvalue().encode())
+
+    # Plain flushes outside a frame are not wrapped, and empty flushes write nothing.
+    writer.write("x")
+    writer.flush()
+    writer.flush()
+    assert stream.getvalue().endswith("\x1b[?2026lx")
+    assert writer.stats.frames == 2
+
+
+def test_descriptor_streams_get_one_os_write_per_frame() -> None:
+    """File-backed streams are written with a single os.write per frame."""
+
+    if os.name == "nt":
+        pytest.skip("pipe-backed text streams are POSIX only in this test")
+    read_fd, write_fd = os.pipe()
+    stream = os.fdopen(write_fd, "w", encoding="utf-8")
+    try:
+        writer = FrameWriter(stream)
+        stream.write("before ")
+        with writer.frame():
+            for row in range(50):
+                writer.write(f"\x1b[{row + 1};1Hrow {row} ✓")
+        assert writer.stats.last_syscalls == 1
+        data = os.read(read_fd, 65536).decode()
+        assert data.startswith("before \x1b[1;1Hrow 0 ✓")
+        assert len(data.encode()) == writer.stats.last_bytes + len("before ")
+    finally:
+        stream.close()
+        os.close(read_fd)
+
+
+def test_tty_renderer_batches_calls_inside_a_frame(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Cursor moves and text written inside ``frame()`` reach the stream together."""
+
+    class StubTerminalController:
+        def __init__(self, stream: io.StringIO) -> None:
+            self.stream = stream
+
+    monkeypatch.setattr("ornata.rendering.backends.tty.termios.TerminalController", StubTerminalController)
+    stream = _CountingStream()
+    renderer = TTYRenderer(BackendTarget.TTY, stream=stream, use_alt_screen=False, synchronized_updates=True)
+    with renderer.frame():
+        for row in range(1, 11):
+            renderer.write_at(row, 1, f"line {row}")
+        renderer.set_cursor_position(1, 1)
+    assert stream.writes == 1
+    value = stream.getvalue()
+    assert value.startswith("\x1b[?2026h\x1b[1;1Hline 1")
+    assert value.endswith("\x1b[1;1H\x1b[?2026l")
+    assert renderer.output_stats.frames == 1
+
+    renderer.write_at(2, 2, "now")
+    assert stream.writes == 2
@@ -1,11 +1,12 @@
 """Integration tests for the OSTS parser and style engine."""
 from __future__ import annotations
 
+from dataclasses import replace
 from typing import TYPE_CHECKING
 
 import pytest
 
-from ornata.api.exports.styling import StyleEngine, diag, parse_stylesheet
+from ornata.api.exports.styling import StyleEngine, compile_stylesheet, diag, parse_stylesheet, resolve_stylesheet
 from ornata.definitions.dataclasses.styling import Length
 
 if TYPE_CHECKING:
@@ -144,6 +145,46 @@ def test_style_engine_tracks_versions(style_engine: StyleEngine, osts_text: str)
     assert style_engine.theme_version == initial_version + 2
 
 
+def test_compiled_stylesheet_indexes_rules_by_component() -> None:
+    """Compiled sheets keep cascade order and are memoised per sheet."""
+
+    parsed = parse_stylesheet(
+        "compiled.osts",
+        """
+        @colors { primary: #112233; }
+        Any { color: #ffffff; box-shadow: 0px 1px 2px #000000; }
+        Button {
+            color: primary;
+            box-shadow: 0px 2px 4px primary;
+            [hover] { background: primary; }
+        }
+        """,
+    )
+    # The grammar has no universal selector; programmatic sheets may use one.
+    universal = replace(parsed.rules[0], component="*")
+    sheet = replace(parsed, rules=[universal, *parsed.rules[1:]])
+    compiled = compile_stylesheet(sheet)
+    assert compile_stylesheet(sheet) is compiled
+    assert compiled.blocks_for("BUTTON") is compiled.blocks_for("button")
+    assert compiled.blocks_for("Label") == compiled.universal
+
+    button = compiled.resolve("Button", frozenset())
+    assert button.color == "#112233"
+    assert button.background is None
+    assert button.box_shadow is not None
+    assert [shadow.color for shadow in button.box_shadow] == ["#000000", "#112233"]
+    assert compiled.resolve("Button", frozenset({"hover"})).background == "#112233"
+    assert compiled.resolve("Label", frozenset()).color == "#ffffff"
+
+    # Shared compiled values never leak between resolutions.
+    button.box_shadow.clear()
+    assert len(compiled.resolve("Button", frozenset()).box_shadow or ()) == 2
+
+    # Overriding the palette re-parses the affected blocks.
+    themed = resolve_stylesheet(sheet, "Button", frozenset({"hover"}), {"primary": "#abcdef"}, sheet.fonts)
+    assert (themed.color, themed.background) == ("#abcdef", "#abcdef")
+
+
 def test_diag_helpers_collect_errors_and_warnings() -> None:
     """Diagnostics module should collect warnings emitted during parsing."""
 
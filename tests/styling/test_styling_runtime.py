@@ -0,0 +1,120 @@
+"""Unit tests for the StylingRuntime facade and its style cache."""
+from __future__ import annotations
+
+from ornata.definitions.dataclasses.styling import StylingContext
+from ornata.styling.language.cache import StyleCache
+from ornata.styling.runtime.runtime import StylingRuntime
+
+_SHEET = """
+Row {
+    color: #ffffff;
+    [selected] {
+        background: #0000ff;
+    }
+}
+
+Cell {
+    color: #00ff00;
+}
+"""
+
+
+def _runtime() -> StylingRuntime:
+    """Return a runtime seeded with a small stylesheet."""
+    runtime = StylingRuntime()
+    runtime.load_stylesheet_text("runtime.osts", _SHEET)
+    return runtime
+
+
+def _contexts(count: int) -> list[StylingContext]:
+    """Build ``count`` contexts that collapse onto four distinct styles."""
+    contexts: list[StylingContext] = []
+    for index in range(count):
+        component = "Row" if index % 2 else "Cell"
+        contexts.append(StylingContext(component, {"selected": index % 3 == 0}))
+    return contexts
+
+
+def test_batch_resolution_deduplicates_cache_keys() -> None:
+    """Each distinct key is resolved once and results follow input order."""
+
+    runtime = _runtime()
+    contexts = _contexts(1000)
+    styles = runtime.resolve_styles_parallel(contexts)
+
+    stats = runtime.last_batch_stats
+    assert (stats.contexts, stats.unique_keys, stats.hits, stats.misses) == (1000, 4, 0, 4)
+    assert runtime.get_style_stats()["total_resolutions"] == 4
+    assert styles == [runtime.resolve_style(context) for context in contexts]
+    assert styles[3].background == "#0000ff"
+    assert styles[1].background is None
+    assert styles[0] is styles[6]
+
+    runtime.resolve_styles_parallel(contexts[:10])
+    assert (runtime.last_batch_stats.hits, runtime.last_batch_stats.misses) == (4, 0)
+
+
+def test_batch_resolution_uses_worker_threads_for_many_misses() -> None:
+    """Large batches of unique misses are spread over a thread pool."""
+
+    runtime = _runtime()
+    contexts = [StylingContext("Row", {f"state-{index}": True}) for index in range(64)]
+    styles = runtime.resolve_styles_parallel(contexts, max_workers=4)
+
+    assert runtime.last_batch_stats.workers == 4
+    assert runtime.last_batch_stats.misses == 64
+    assert all(style.color == "#ffffff" for style in styles)
+
+    # Later batches reuse the same pool instead of starting threads per call.
+    executor = runtime._executor  # noqa: SLF001
+    runtime.invalidate_cache()
+    assert runtime.resolve_styles_parallel(contexts, max_workers=2) == styles
+    assert runtime.last_batch_stats.workers == 2
+    assert executor is not None and runtime._executor is executor  # noqa: SLF001
+
+    runtime.invalidate_cache()
+    runtime.resolve_styles_parallel(contexts, max_workers=1)
+    assert runtime.last_batch_stats.workers == 0
+    runtime.close()
+
+
+def test_style_cache_is_bounded_and_separate_from_engine() -> None:
+    """Per-row overrides evict old entries instead of growing without bound."""
+
+    runtime = StylingRuntime(cache_size=16)
+    runtime.load_stylesheet_text("runtime.osts", _SHEET)
+    assert isinstance(runtime.get_engine().cache, StyleCache)
+    assert runtime.get_engine().cache is not runtime._cache
+
+    for index in range(200):
+        runtime.resolve_style(StylingContext("Row", {}, {"row": str(index)}))
+
+    stats = runtime.get_style_stats()
+    assert stats["cache_size"] == 16
+    assert stats["cache_evictions"] > 0
+    # Every override is a distinct runtime key, so each lookup is counted once, as a miss.
+    assert (stats["cache_hits"], stats["cache_misses"]) == (0, 200)
+    # The engine resolves "Row" once, missing its key and base style; later overrides reuse the entry.
+    assert (stats["engine_cache_hits"], stats["engine_cache_misses"]) == (199, 2)
+    assert stats["engine_component_cache_size"] == 1
+
+
+def test_style_cache_invalidates_by_version_tag() -> None:
+    """Invalidation retires entries lazily, per component or globally."""
+
+    runtime = _runtime()
+    row = StylingContext("Row", {})
+    cell = StylingContext("Cell", {})
+    first_row = runtime.resolve_style(row)
+    first_cell = runtime.resolve_style(cell)
+    size = runtime.get_style_stats()["cache_size"]
+
+    runtime.invalidate_cache("Row")
+    assert runtime.get_style_stats()["cache_size"] == size
+    assert runtime.resolve_style(cell) is first_cell
+    assert runtime.resolve_style(row) is not first_row
+
+    generation = runtime.get_style_stats()["cache_generation"]
+    runtime.invalidate_cache()
+    assert runtime.get_style_stats()["cache_generation"] == generation + 1
+    assert runtime.resolve_style(cell) is not first_cell
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import asyncio
+import random
 import threading
+from bisect import bisect_left
 from collections.abc import Callable, Coroutine
 from typing import Any
 
@@ -115,7 +117,8 @@ def test_tree_reconciler_handles_keyed_and_prop_changes() -> None:
     patch_types = {patch.patch_type for patch in patches}
     assert PatchType.UPDATE_PROPS in patch_types
     assert PatchType.ADD_NODE in patch_types
-    assert PatchType.MOVE_NODE in patch_types
+    # Inserting a sibling in front of "a" shifts it without a move patch.
+    assert PatchType.MOVE_NODE not in patch_types
     assert any(patch.data.get("value") == 2 for patch in patches if patch.patch_type == PatchType.UPDATE_PROPS)
 
     skipped_old = _make_node("Static", "root")
@@ -490,6 +493,68 @@ def test_tree_reconciler_children_fallback_handles_mixed_nodes() -> None:
     assert PatchType.UPDATE_PROPS in patch_types
 
 
+def _replay(keys: list[str | None], patches: list[Patch]) -> list[str | None]:
+    """Apply child-list patches to a list of keys the way VDOMTree applies them."""
+    result = list(keys)
+    for patch in patches:
+        if patch.patch_type == PatchType.REMOVE_NODE:
+            result.remove(patch.key)
+        elif patch.patch_type == PatchType.MOVE_NODE:
+            result.remove(patch.key)
+            result.insert(patch.data, patch.key)
+        elif patch.patch_type == PatchType.ADD_NODE:
+            result.insert(patch.data.child_index, patch.key)
+    return result
+
+
+def _list_node(keys: list[str | None]) -> VDOMNode:
+    """Build a list node with one keyed row per key and an unkeyed divider per ``None``."""
+    return _make_node("List", "list", children=[_make_node("Row" if key else "Divider", key) for key in keys])
+
+
+def test_tree_reconciler_keyed_children_replay_to_new_order() -> None:
+    """Random keyed reorders, removals and insertions replay onto the old keys as the new order."""
+    rng = random.Random(3)
+    reconciler = TreeReconciler()
+    optimizer = PatchOptimizer()
+    for _ in range(300):
+        old_keys: list[str | None] = [f"k{i}" for i in range(rng.randint(0, 12))]
+        new_keys: list[str | None] = [key for key in old_keys if rng.random() < 0.8]
+        new_keys += [f"n{i}" for i in range(rng.randint(0, 3))]
+        rng.shuffle(new_keys)
+        if rng.random() < 0.5:
+            # Unkeyed dividers at both ends are trimmed before the keyed middle is planned.
+            old_keys = [None, *old_keys, None]
+            new_keys = [None, *new_keys, None]
+        patches = reconciler._reconcile_children(_list_node(old_keys), _list_node(new_keys), trace_enabled=False)
+        assert _replay(old_keys, patches) == new_keys
+        assert _replay(old_keys, optimizer._sort_patches(patches)) == new_keys
+
+
+def test_tree_reconciler_sorting_10k_rows_moves_only_unsorted_rows() -> None:
+    """Sorting 10k keyed rows moves only rows outside the longest already-sorted run."""
+    rng = random.Random(11)
+    values = [rng.randrange(1_000_000) for _ in range(10_000)]
+    old_keys: list[str | None] = [f"row{i}" for i in range(len(values))]
+    new_keys: list[str | None] = [old_keys[i] for i in sorted(range(len(values)), key=values.__getitem__)]
+
+    patches = TreeReconciler()._reconcile_children(_list_node(old_keys), _list_node(new_keys), trace_enabled=False)
+    moves = [patch for patch in patches if patch.patch_type == PatchType.MOVE_NODE]
+
+    # Rows already in sorted order relative to each other (a longest increasing run) stay put.
+    tails: list[int] = []
+    for value in (int(key[3:]) for key in new_keys if key):
+        position = bisect_left(tails, value)
+        tails[position : position + 1] = [value]
+    assert len(moves) == len(values) - len(tails)
+    assert _replay(old_keys, patches) == new_keys
+
+    # Moving one row to the end is a single patch.
+    rotated = old_keys[1:] + old_keys[:1]
+    patches = TreeReconciler()._reconcile_children(_list_node(old_keys), _list_node(rotated), trace_enabled=False)
+    assert [(patch.patch_type, patch.key, patch.data) for patch in patches] == [(PatchType.MOVE_NODE, "row0", 9_999)]
+
+
 def test_tree_reconciler_node_difference_checks() -> None:
     reconciler = TreeReconciler()
 
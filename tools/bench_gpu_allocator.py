@@ -0,0 +1,107 @@
+"""
+Ornata GPU Allocator Churn Benchmark
+
+Drives the GPU memory block allocator through allocation/free patterns
+seen in long GUI sessions and reports throughput, the peak bytes in use,
+the address-space high-water mark and the final fragmentation. A bounded
+allocator keeps the high-water mark close to the peak usage however many
+operations run.
+
+Patterns:
+    steady   same-sized buffers freed and reallocated in random order
+    mixed    random sizes and alignments with random frees
+    frames   per-frame transient buffers over a set of long-lived ones
+    ramp     repeated grow-to-peak then free-every-other-block cycles
+
+Run with:
+    python -m tools.bench_gpu_allocator [--ops 200000] [--seed 0]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import random
+import time
+from collections.abc import Callable
+
+from ornata.api.exports.definitions import MemoryBlock
+from ornata.api.exports.gpu import Allocator
+
+
+def _steady(allocator: Allocator, ops: int, rng: random.Random) -> None:
+    live = [allocator.allocate(4096) for _ in range(256)]
+    for _ in range(ops // 2):
+        allocator.deallocate(live.pop(rng.randrange(len(live))))
+        live.append(allocator.allocate(4096))
+
+
+def _mixed(allocator: Allocator, ops: int, rng: random.Random) -> None:
+    live: list[MemoryBlock] = []
+    for _ in range(ops):
+        if live and (len(live) > 2048 or rng.random() < 0.5):
+            allocator.deallocate(live.pop(rng.randrange(len(live))))
+        else:
+            live.append(allocator.allocate(rng.randint(16, 64 * 1024), rng.choice((16, 64, 256))))
+
+
+def _frames(allocator: Allocator, ops: int, rng: random.Random) -> None:
+    resident = [allocator.allocate(rng.randint(1024, 256 * 1024)) for _ in range(64)]
+    done = 0
+    while done < ops:
+        transient = [allocator.allocate(rng.randint(64, 16 * 1024)) for _ in range(rng.randint(50, 150))]
+        if rng.random() < 0.1:
+            allocator.deallocate(resident.pop(rng.randrange(len(resident))))
+            resident.append(allocator.allocate(rng.randint(1024, 256 * 1024)))
+        for block in transient:
+            allocator.deallocate(block)
+        done += 2 * len(transient)
+
+
+def _ramp(allocator: Allocator, ops: int, rng: random.Random) -> None:
+    live: list[MemoryBlock] = []
+    done = 0
+    while done < ops:
+        for _ in range(1000):
+            live.append(allocator.allocate(rng.randint(256, 8192)))
+        for block in live[::2]:
+            allocator.deallocate(block)
+        done += 1000 + len(live[::2])
+        live = live[1::2]
+
+
+PATTERNS: dict[str, Callable[[Allocator, int, random.Random], None]] = {
+    "steady": _steady,
+    "mixed": _mixed,
+    "frames": _frames,
+    "ramp": _ramp,
+}
+
+
+def run(pattern: str, ops: int, seed: int) -> tuple[float, dict[str, int | float]]:
+    """Return the operations per second and final allocator statistics for one pattern."""
+    allocator = Allocator()
+    started = time.perf_counter()
+    PATTERNS[pattern](allocator, ops, random.Random(seed))
+    elapsed = time.perf_counter() - started
+    return ops / elapsed, allocator.get_stats()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ops", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    # Per-block debug logging would dominate the timings.
+    logging.getLogger("ornata.gpu.memory.allocator").setLevel(logging.WARNING)
+
+    print(f"{'pattern':<9}{'kops/s':>9}{'peak KiB':>11}{'high water KiB':>16}{'overhead':>10}{'frag %':>8}")
+    for pattern in PATTERNS:
+        rate, stats = run(pattern, args.ops, args.seed)
+        peak, high_water = stats["peak_memory_usage"], stats["high_water_mark"]
+        overhead = high_water / peak if peak else 0.0
+        print(f"{pattern:<9}{rate / 1000:>9.1f}{peak / 1024:>11.0f}{high_water / 1024:>16.0f}{overhead:>9.2f}x{stats['fragmentation']:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Ornata Keyed Reorder Benchmark
+
+Times TreeReconciler on large keyed child lists for common reorders
+(sorting a table, reversing it, moving one row) and reports how many
+patches each produces and how long they take to apply to a VDOMTree.
+
+Only the diff is repeated. The patches are applied once, because
+VDOMTree.move_node still scans, reindexes and rehashes the parent's
+children on every move, so replaying a reorder is O(n) per move and
+quadratic overall for large shuffles.
+
+Run with:
+    python -m tools.bench_keyed_reorder [--size 2000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from ornata.api.exports.definitions import PatchType, VDOMNode, VDOMTree
+from ornata.api.exports.vdom import TreeReconciler
+
+if TYPE_CHECKING:
+    from ornata.api.exports.definitions import Patch
+
+# -------------------------------
+# Scenarios
+# -------------------------------
+
+Reorder = Callable[[list[str], random.Random], list[str]]
+
+
+def _sort(keys: list[str], rng: random.Random) -> list[str]:
+    weights = {key: rng.random() for key in keys}
+    return sorted(keys, key=weights.__getitem__)
+
+
+def _nearly_sorted(keys: list[str], rng: random.Random) -> list[str]:
+    result = list(keys)
+    for _ in range(max(1, len(keys) // 100)):
+        i, j = rng.randrange(len(result)), rng.randrange(len(result))
+        result[i], result[j] = result[j], result[i]
+    return result
+
+
+def _churn(keys: list[str], rng: random.Random) -> list[str]:
+    dropped = set(rng.sample(keys, len(keys) // 100))
+    result = [key for key in keys if key not in dropped]
+    for index in range(len(dropped)):
+        result.insert(rng.randrange(len(result) + 1), f"new{index}")
+    return result
+
+
+SCENARIOS: dict[str, Reorder] = {
+    "sort": _sort,
+    "reverse": lambda keys, rng: keys[::-1],
+    "nearly_sorted": _nearly_sorted,
+    "move_first_to_end": lambda keys, rng: keys[1:] + keys[:1],
+    "insert_remove_1pct": _churn,
+}
+
+
+# -------------------------------
+# Helpers
+# -------------------------------
+
+
+def _tree(keys: list[str]) -> tuple[VDOMTree, VDOMNode]:
+    root = VDOMNode(component_name="Table", key="table")
+    for index, key in enumerate(keys):
+        root.children.append(VDOMNode(component_name="Row", props={"id": key}, key=key, parent_key="table", child_index=index))
+    tree = VDOMTree()
+    tree.attach_node(root, parent_key=None, position=0, mark_dirty=False)
+    return tree, root
+
+
+def _apply(tree: VDOMTree, patches: list[Patch]) -> None:
+    for patch in patches:
+        if patch.patch_type == PatchType.REMOVE_NODE and patch.key is not None:
+            tree.detach_subtree(patch.key)
+        elif patch.patch_type == PatchType.MOVE_NODE and patch.key is not None:
+            tree.move_node(patch.key, patch.data)
+        elif patch.patch_type == PatchType.ADD_NODE:
+            node = patch.data
+            tree.attach_node(node.clone(parent_key="table", index=node.child_index), parent_key="table", position=node.child_index, mark_dirty=False)
+
+
+def run_scenario(name: str, size: int, repeat: int, seed: int = 0) -> dict[str, float | int]:
+    """Diff one reorder of ``size`` rows ``repeat`` times, keeping the best, then apply it once."""
+    rng = random.Random(seed)
+    old_keys = [f"row{index}" for index in range(size)]
+    new_keys = SCENARIOS[name](old_keys, rng)
+    _, new_root = _tree(new_keys)
+
+    best_diff = float("inf")
+    patches: list[Patch] = []
+    for _ in range(max(1, repeat)):
+        _, old_root = _tree(old_keys)
+        reconciler = TreeReconciler()
+        started = time.perf_counter()
+        patches = reconciler.reconcile(old_root, new_root)
+        best_diff = min(best_diff, time.perf_counter() - started)
+
+    tree, old_root = _tree(old_keys)
+    started = time.perf_counter()
+    _apply(tree, patches)
+    apply_time = time.perf_counter() - started
+    assert [child.key for child in old_root.children] == new_keys, f"{name}: patches did not reproduce the new order"
+
+    return {
+        "patches": len(patches),
+        "moves": sum(1 for patch in patches if patch.patch_type == PatchType.MOVE_NODE),
+        "diff_ms": best_diff * 1000.0,
+        "apply_ms": apply_time * 1000.0,
+    }
+
+
+# -------------------------------
+# Main entry
+# -------------------------------
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=2_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"{'scenario':<20}{'patches':>9}{'moves':>8}{'diff ms':>10}{'apply ms':>10}")
+    for name in SCENARIOS:
+        result = run_scenario(name, args.size, args.repeat)
+        print(f"{name:<20}{result['patches']:>9}{result['moves']:>8}{result['diff_ms']:>10.1f}{result['apply_ms']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
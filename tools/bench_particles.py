@@ -0,0 +1,62 @@
+"""
+Ornata Particle Benchmark
+
+Times one simulation frame (aging, compaction, gravity, damping, bounds
+and one attractor) over a ParticleStore of live particles, for the NumPy
+columns and for the array('f') fallback, against the 16.7 ms budget of a
+60 fps frame.
+
+Run with:
+    python -m tools.bench_particles [--count 100000] [--frames 60]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from ornata.api.exports.effects import ParticlePhysics, ParticleStore
+
+FRAME_BUDGET_MS = 1000.0 / 60.0
+
+
+def _fill(store: ParticleStore, count: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    for _ in range(count):
+        store.add(rng.uniform(0, 800), rng.uniform(0, 600), rng.uniform(-50, 50), rng.uniform(-50, 50), rng.uniform(5.0, 10.0))
+
+
+def run(count: int, frames: int, vectorized: bool) -> float:
+    """Return the mean frame time in milliseconds."""
+    store = ParticleStore(capacity=count, vectorized=vectorized)
+    _fill(store, count)
+    physics = ParticlePhysics({"gravity": (0.0, 98.0), "damping": 0.05, "bounce": 0.7, "friction": 0.1, "bounds": (0.0, 0.0, 800.0, 600.0)})
+    delta_time = 1.0 / 60.0
+
+    started = time.perf_counter()
+    for _ in range(frames):
+        store.age(delta_time)
+        store.compact()
+        physics.apply_physics(store, delta_time)
+        physics.apply_attraction(store, (400.0, 300.0), 5000.0, delta_time)
+    return (time.perf_counter() - started) * 1000.0 / frames
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--frames", type=int, default=60)
+    args = parser.parse_args(argv)
+
+    print(f"{'backend':<10}{'particles':>11}{'ms/frame':>10}{'60 fps':>8}")
+    for name, vectorized in (("numpy", True), ("array", False)):
+        if vectorized and not ParticleStore(vectorized=None).vectorized:
+            print(f"{name:<10}{'NumPy not installed':>29}")
+            continue
+        mean = run(args.count, args.frames, vectorized)
+        print(f"{name:<10}{args.count:>11}{mean:>10.2f}{'yes' if mean <= FRAME_BUDGET_MS else 'no':>8}")
+
+
+if __name__ == "__main__":
+    main()